@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Microbenchmark de serialización: PacketBuilder incremental vs PacketCodec.
+
+Compara, para paquetes representativos del hot path (movimiento, stats,
+mensajes de consola, slots de inventario), el armado campo por campo con
+``PacketBuilder`` contra los builders ``msg_*`` actuales basados en
+``PacketCodec`` (structs precompilados).
+
+Uso:
+    uv run python scripts/benchmark_packet_codec.py [--number 200000]
+"""
+
+import argparse
+import logging
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+# Agregar el directorio raíz al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.network.msg_character import build_character_move_response
+from src.network.msg_console import build_console_msg_response
+from src.network.msg_inventory import build_change_inventory_slot_response
+from src.network.msg_player_stats import build_update_user_stats_response
+from src.network.packet_builder import PacketBuilder
+from src.network.packet_id import ServerPacketID
+
+logger = logging.getLogger(__name__)
+
+
+def legacy_character_move() -> bytes:
+    """CHARACTER_MOVE armado con PacketBuilder."""
+    packet = PacketBuilder()
+    packet.add_byte(ServerPacketID.CHARACTER_MOVE)
+    packet.add_int16(1234)
+    packet.add_byte(50)
+    packet.add_byte(51)
+    return packet.to_bytes()
+
+
+def legacy_user_stats() -> bytes:
+    """UPDATE_USER_STATS armado con PacketBuilder."""
+    packet = PacketBuilder()
+    packet.add_byte(ServerPacketID.UPDATE_USER_STATS)
+    for value in (300, 250, 1000, 800, 400, 390):
+        packet.add_int16(value)
+    packet.add_int32(50000)
+    packet.add_byte(20)
+    packet.add_int32(120000)
+    packet.add_int32(90000)
+    return packet.to_bytes()
+
+
+def legacy_console_msg() -> bytes:
+    """CONSOLE_MSG armado con PacketBuilder (con el log de debug que calculaba el hex)."""
+    message = "Has golpeado a la criatura por 25 puntos de daño."
+    packet = PacketBuilder()
+    packet.add_byte(ServerPacketID.CONSOLE_MSG)
+    packet.add_unicode_string(message)
+    packet.add_byte(7)
+    result = packet.to_bytes()
+    logger.debug(
+        "build_console_msg_response: message='%s', len=%d, font_color=%d, packet_hex=%s",
+        message,
+        len(message),
+        7,
+        result.hex(),
+    )
+    return result
+
+
+def legacy_inventory_slot() -> bytes:
+    """CHANGE_INVENTORY_SLOT armado con PacketBuilder."""
+    packet = PacketBuilder()
+    packet.add_byte(ServerPacketID.CHANGE_INVENTORY_SLOT)
+    packet.add_byte(5)
+    packet.add_int16(38)
+    packet.add_unicode_string("Espada Larga")
+    packet.add_int16(1)
+    packet.add_byte(1)
+    packet.add_int16(500)
+    packet.add_byte(2)
+    packet.add_int16(10)
+    packet.add_int16(5)
+    packet.add_int16(0)
+    packet.add_int16(0)
+    packet.add_float(120.0)
+    return packet.to_bytes()
+
+
+CASES: list[tuple[str, Callable[[], bytes], Callable[[], bytes]]] = [
+    (
+        "CHARACTER_MOVE",
+        legacy_character_move,
+        lambda: build_character_move_response(1234, 50, 51),
+    ),
+    (
+        "UPDATE_USER_STATS",
+        legacy_user_stats,
+        lambda: build_update_user_stats_response(
+            300, 250, 1000, 800, 400, 390, 50000, 20, 120000, 90000
+        ),
+    ),
+    (
+        "CONSOLE_MSG",
+        legacy_console_msg,
+        lambda: build_console_msg_response("Has golpeado a la criatura por 25 puntos de daño.", 7),
+    ),
+    (
+        "CHANGE_INVENTORY_SLOT",
+        legacy_inventory_slot,
+        lambda: build_change_inventory_slot_response(
+            5, 38, "Espada Larga", 1, True, 500, 2, 10, 5, 0, 0, 120.0
+        ),
+    ),
+]
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime ns por paquete y speedup."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000, help="Paquetes por medición")
+    parser.add_argument("--repeat", type=int, default=5, help="Mediciones (se toma la mejor)")
+    args = parser.parse_args()
+
+    print(f"{'paquete':<24}{'builder ns':>12}{'codec ns':>12}{'speedup':>10}")
+    for name, legacy, codec in CASES:
+        if legacy() != codec():
+            print(f"{name}: los bytes no coinciden")
+            sys.exit(1)
+        legacy_ns = min(timeit.repeat(legacy, number=args.number, repeat=args.repeat))
+        codec_ns = min(timeit.repeat(codec, number=args.number, repeat=args.repeat))
+        legacy_ns *= 1e9 / args.number
+        codec_ns *= 1e9 / args.number
+        print(f"{name:<24}{legacy_ns:>12.0f}{codec_ns:>12.0f}{legacy_ns / codec_ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
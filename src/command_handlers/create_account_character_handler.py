@@ -160,7 +160,9 @@ class CreateAccountCharacterHandler:
         Args:
             user_id: ID del usuario.
         """
-        inventory_repo = InventoryRepository(self.player_repo.redis)
+        inventory_repo = InventoryRepository(
+            self.player_repo.redis, cache=self.player_repo.inventory_cache
+        )
 
         # Pociones - 30 de cada tipo (6 tipos principales)
         # Poción Amarilla (Agilidad)
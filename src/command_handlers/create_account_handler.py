@@ -15,7 +15,7 @@ from src.command_handlers.create_account_validation_handler import (
 from src.commands.base import Command, CommandHandler, CommandResult
 from src.commands.create_account_command import CreateAccountCommand
 from src.services.game.balance_service import get_balance_service
-from src.utils.password_utils import hash_password
+from src.utils.password_utils import PasswordPoolBusyError, hash_password_async
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
@@ -131,8 +131,14 @@ class CreateAccountCommandHandler(CommandHandler):
         if not await self.validation_handler.validate_account_fields(username, password, email):
             return CommandResult.error("Campos de cuenta inválidos")
 
-        # Hash de la contraseña
-        password_hash = hash_password(password)
+        # Hash de la contraseña (en el pool de contraseñas, fuera del event loop)
+        try:
+            password_hash = await hash_password_async(password)
+        except PasswordPoolBusyError:
+            await self.message_sender.send_error_msg(
+                "Servidor ocupado, intenta nuevamente en unos segundos"
+            )
+            return CommandResult.error("Pool de contraseñas saturado")
 
         # Obtener atributos de dados de la sesión
         stats_data = self.character_handler.get_dice_attributes_from_session(self.session_data)
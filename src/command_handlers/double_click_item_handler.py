@@ -50,7 +50,9 @@ class DoubleClickItemHandler:
             logger.error("inventory_repo no disponible")
             return False, "Error interno: repositorio no disponible", None
 
-        inventory_repo = InventoryRepository(player_redis)
+        inventory_repo = InventoryRepository(
+            player_redis, cache=getattr(self.player_repo, "inventory_cache", None)
+        )
         slot_data = await inventory_repo.get_slot(user_id, slot)
 
         if not slot_data:
@@ -60,7 +60,9 @@ class EquipItemCommandHandler(CommandHandler):
 
         try:
             # Crear servicio de equipamiento
-            inventory_repo = InventoryRepository(self.player_repo.redis)
+            inventory_repo = InventoryRepository(
+                self.player_repo.redis, cache=self.player_repo.inventory_cache
+            )
             equipment_service = EquipmentService(self.equipment_repo, inventory_repo)
 
             # Equipar o desequipar el item
@@ -62,7 +62,9 @@ class InventoryClickCommandHandler(CommandHandler):
 
         try:
             # Obtener el inventario
-            inventory_repo = InventoryRepository(self.player_repo.redis)
+            inventory_repo = InventoryRepository(
+                self.player_repo.redis, cache=self.player_repo.inventory_cache
+            )
             slot_data = await inventory_repo.get_slot(user_id, slot)
 
             if not slot_data:
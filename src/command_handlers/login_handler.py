@@ -138,6 +138,9 @@ class LoginCommandHandler(CommandHandler):
         # Configurar sesión
         self._setup_session(user_id, username)
 
+        # Cargar el estado del jugador en memoria (write-behind a Redis)
+        await self.player_repo.load_player_state(user_id)
+
         # Enviar paquetes iniciales y obtener posición
         position = await self.init_handler.send_login_packets(user_id, user_class)
 
@@ -88,11 +88,10 @@ class QuitCommandHandler(CommandHandler):
             if self.summon_service and self.npc_service:
                 try:
                     pet_instance_ids = await self.summon_service.remove_all_player_pets(user_id)
-                    # Remover cada mascota del mundo
+                    # Remover cada mascota del mundo (búsqueda O(1) en el espejo en memoria)
                     for pet_instance_id in pet_instance_ids:
-                        all_npcs = await self.npc_service.npc_repository.get_all_npcs()
-                        pet_npc = next(
-                            (npc for npc in all_npcs if npc.instance_id == pet_instance_id), None
+                        pet_npc = self.npc_service.map_manager.get_npc_by_instance_id(
+                            pet_instance_id
                         )
                         if pet_npc:
                             await self.npc_service.remove_npc(pet_npc)
@@ -18,9 +18,11 @@ if TYPE_CHECKING:
     from src.repositories.account_repository import AccountRepository
     from src.repositories.player_repository import PlayerRepository
     from src.services.clan_service import ClanService
+    from src.services.map.player_map_service import PlayerMapService
     from src.services.npc.npc_service import NPCService
     from src.services.npc.summon_service import SummonService
     from src.services.trade_service import TradeService
+    from src.tasks.task_factory import TaskFactory
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +50,8 @@ class TalkCommandHandler(CommandHandler):
         npc_service: NPCService | None = None,
         summon_service: SummonService | None = None,
         session_data: dict[str, dict[str, int] | int | str] | None = None,
+        player_map_service: PlayerMapService | None = None,
+        task_factory: TaskFactory | None = None,
     ) -> None:
         """Inicializa el handler.
 
@@ -62,6 +66,8 @@ class TalkCommandHandler(CommandHandler):
             npc_service: Servicio de NPCs (opcional, para comandos de mascotas).
             summon_service: Servicio de invocación (opcional, para comandos de mascotas).
             session_data: Datos de sesión compartidos.
+            player_map_service: Servicio de entrada a mapas (opcional, para /METRICS).
+            task_factory: Factory de tasks (opcional, métricas de dispatch en /METRICS).
         """
         self.player_repo = player_repo
         self.account_repo = account_repo
@@ -78,6 +84,8 @@ class TalkCommandHandler(CommandHandler):
         self.metrics_handler = TalkMetricsHandler(
             game_tick=game_tick,
             message_sender=message_sender,
+            player_map_service=player_map_service,
+            task_factory=task_factory,
         )
 
         self.trade_handler = TalkTradeHandler(
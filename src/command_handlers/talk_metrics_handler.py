@@ -1,11 +1,13 @@
 """Handler especializado para comandos de métricas."""
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from src.game.game_tick import GameTick
     from src.messaging.message_sender import MessageSender
+    from src.services.map.player_map_service import PlayerMapService
+    from src.tasks.task_factory import TaskFactory
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +19,21 @@ class TalkMetricsHandler:
         self,
         game_tick: GameTick | None,
         message_sender: MessageSender,
+        player_map_service: PlayerMapService | None = None,
+        task_factory: TaskFactory | None = None,
     ) -> None:
         """Inicializa el handler de métricas.
 
         Args:
             game_tick: Sistema de GameTick para comandos de métricas.
             message_sender: Enviador de mensajes.
+            player_map_service: Servicio de entrada a mapas (opcional, time-to-playable).
+            task_factory: Factory de tasks (opcional, latencia de dispatch de packets).
         """
         self.game_tick = game_tick
         self.message_sender = message_sender
+        self.player_map_service = player_map_service
+        self.task_factory = task_factory
 
     async def handle_metrics_command(self, user_id: int) -> None:
         """Maneja el comando /METRICS para mostrar métricas de rendimiento.
@@ -48,9 +56,34 @@ class TalkMetricsHandler:
             "=== MÉTRICAS DE RENDIMIENTO ===",
             f"Total ticks: {metrics['total_ticks']}",
             f"Tiempo promedio: {metrics['avg_tick_time_ms']:.2f}ms",
+            (
+                f"Percentiles: p50={metrics['p50_tick_time_ms']:.2f}ms, "
+                f"p95={metrics['p95_tick_time_ms']:.2f}ms, "
+                f"p99={metrics['p99_tick_time_ms']:.2f}ms"
+            ),
             f"Tiempo máximo: {metrics['max_tick_time_ms']:.2f}ms",
+            (
+                f"Presupuesto: {metrics['tick_budget_ms']:.0f}ms "
+                f"(excedido {metrics['overruns']} veces)"
+            ),
+            (
+                f"Ticks saltados: {metrics['skipped_ticks']}, "
+                f"efectos diferidos: {metrics['deferred_effects']}"
+            ),
+            f"Retraso de arranque: p99={metrics['lag']['p99_ms']:.2f}ms",
         ]
 
+        # Métricas por fase del tick
+        if metrics.get("phases"):
+            lines.append("\n--- Por Fase ---")
+            for phase, phase_metrics in metrics["phases"].items():
+                lines.append(
+                    f"{phase}: avg={phase_metrics['avg_time_ms']:.2f}ms, "
+                    f"p95={phase_metrics['p95_ms']:.2f}ms, "
+                    f"p99={phase_metrics['p99_ms']:.2f}ms, "
+                    f"max={phase_metrics['max_time_ms']:.2f}ms"
+                )
+
         # Métricas por efecto
         if metrics.get("effects"):
             lines.append("\n--- Por Efecto ---")
@@ -58,6 +91,7 @@ class TalkMetricsHandler:
                 lines.append(
                     f"{effect_name}: {effect_metrics['count']} calls, "
                     f"avg={effect_metrics['avg_time_ms']:.2f}ms, "
+                    f"p99={effect_metrics['p99_ms']:.2f}ms, "
                     f"max={effect_metrics['max_time_ms']:.2f}ms"
                 )
 
@@ -77,8 +111,153 @@ class TalkMetricsHandler:
                 )
                 break
 
+        # Métricas de residencia de mapas (carga a demanda)
+        for effect in self.game_tick.effects:
+            if effect.get_name() == "MapResidency" and hasattr(effect, "get_metrics"):
+                map_metrics = effect.get_metrics()
+                lines.extend(
+                    (
+                        "\n--- Mapas residentes ---",
+                        (
+                            f"Residentes: {map_metrics['resident_maps']}"
+                            f"/{map_metrics['max_resident_maps']}, "
+                            f"activos: {map_metrics['active_maps']}"
+                        ),
+                        (
+                            f"Cargas: {map_metrics['loads']} "
+                            f"(prefetch {map_metrics['prefetches']}, "
+                            f"avg {map_metrics['avg_load_ms']:.2f}ms)"
+                        ),
+                        (
+                            f"Descargas: {map_metrics['unloads']} "
+                            f"(desalojos LRU {map_metrics['evictions']})"
+                        ),
+                    )
+                )
+                break
+
+        # Métricas de ground items (vencimiento y persistencia)
+        for effect in self.game_tick.effects:
+            if effect.get_name() == "GroundItemExpiry" and hasattr(effect, "get_metrics"):
+                ground_metrics = effect.get_metrics()
+                lines.extend(
+                    (
+                        "\n--- Ground items ---",
+                        (
+                            f"Tiles con items: {ground_metrics['tiles_with_items']} "
+                            f"en {ground_metrics['maps_with_items']} mapas"
+                        ),
+                        (
+                            f"Vencidos: {ground_metrics['expired_items']}, "
+                            f"agendados: {ground_metrics['scheduled_expiries']}"
+                        ),
+                        (
+                            f"Tiles persistidos: {ground_metrics['tiles_flushed']} "
+                            f"(pendientes {ground_metrics['dirty_tiles']})"
+                        ),
+                    )
+                )
+                break
+
+        # Métricas del scheduler de timers del mundo
+        for effect in self.game_tick.effects:
+            if effect.get_name() == "TimerScheduler" and hasattr(effect, "get_metrics"):
+                timer_metrics = effect.get_metrics()
+                lines.extend(
+                    (
+                        "\n--- Timers ---",
+                        (
+                            f"Pendientes: {timer_metrics['pending']}, "
+                            f"ejecutados: {timer_metrics['executed']} "
+                            f"(errores {timer_metrics['errors']})"
+                        ),
+                        (
+                            f"Retraso: avg={timer_metrics['lateness_avg_ms']:.2f}ms, "
+                            f"p99={timer_metrics['lateness_p99_ms']:.2f}ms, "
+                            f"max={timer_metrics['lateness_max_ms']:.2f}ms"
+                        ),
+                    )
+                )
+                break
+
+        lines.extend(self._map_entry_lines())
+        lines.extend(self._dispatch_lines())
+
         # Enviar métricas línea por línea
         message = "\n".join(lines)
         await self.message_sender.send_multiline_console_msg(message)
 
         logger.info("Métricas solicitadas por user_id %d", user_id)
+
+    def _map_entry_lines(self) -> list[str]:
+        """Líneas de time-to-playable al entrar a un mapa (login o transición).
+
+        Returns:
+            Líneas a agregar al reporte (vacío sin ``player_map_service``).
+        """
+        if self.player_map_service is None:
+            return []
+        entry_metrics = self.player_map_service.get_metrics()
+        return [
+            "\n--- Entrada a mapas ---",
+            (
+                f"Time-to-playable: {entry_metrics['count']} entradas, "
+                f"p50={entry_metrics['p50_ms']:.2f}ms, "
+                f"p95={entry_metrics['p95_ms']:.2f}ms, "
+                f"p99={entry_metrics['p99_ms']:.2f}ms, "
+                f"max={entry_metrics['max_time_ms']:.2f}ms"
+            ),
+            f"Bytes de snapshots: {entry_metrics['snapshot_bytes']}",
+            *self._transition_lines(self.player_map_service),
+        ]
+
+    def _dispatch_lines(self) -> list[str]:
+        """Líneas de dispatch de packets (fast path vs. Task) y su latencia.
+
+        Returns:
+            Líneas a agregar al reporte (vacío sin ``task_factory``).
+        """
+        if self.task_factory is None:
+            return []
+        dispatch_metrics = self.task_factory.get_dispatch_metrics()
+        latency = cast("dict[str, dict[str, float]]", dispatch_metrics["latency"])
+        lines = [
+            "\n--- Dispatch de packets ---",
+            (
+                f"Fast path: {dispatch_metrics['fast_path_hits']}, "
+                f"con Task: {dispatch_metrics['fallbacks']}"
+            ),
+        ]
+        lines.extend(
+            f"{packet_name}: {packet_metrics['count']} packets, "
+            f"p50={packet_metrics['p50_ms']:.2f}ms, "
+            f"p99={packet_metrics['p99_ms']:.2f}ms, "
+            f"max={packet_metrics['max_time_ms']:.2f}ms"
+            for packet_name, packet_metrics in latency.items()
+        )
+        return lines
+
+    @staticmethod
+    def _transition_lines(player_map_service: PlayerMapService) -> list[str]:
+        """Líneas de latencia por paso de las transiciones de mapa.
+
+        Args:
+            player_map_service: Servicio de entrada a mapas.
+
+        Returns:
+            Rollbacks y, por fase (``prepare``, cada paso y ``total``), su latencia.
+        """
+        transition_metrics = player_map_service.get_transition_metrics()
+        latency = cast("dict[str, dict[str, float]]", transition_metrics["latency"])
+        lines = [
+            "\n--- Transiciones de mapa ---",
+            f"Rollbacks: {transition_metrics['rollbacks']}",
+        ]
+        lines.extend(
+            f"{name}: {step_metrics['count']} veces, "
+            f"avg={step_metrics['avg_time_ms']:.2f}ms, "
+            f"p99={step_metrics['p99_ms']:.2f}ms, "
+            f"max={step_metrics['max_time_ms']:.2f}ms"
+            for name, step_metrics in latency.items()
+        )
+        return lines
@@ -3,6 +3,9 @@
 import logging
 from typing import TYPE_CHECKING
 
+from src.messaging.packet_fanout import fan_out_packet
+from src.network.msg_console import build_console_msg_response
+
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
     from src.messaging.message_sender import MessageSender
@@ -68,8 +71,7 @@ class TalkPublicHandler:
 
         # Enviar a todos los jugadores en el mapa (incluyendo el emisor)
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
-        for sender in all_senders:
-            await sender.send_console_msg(formatted_message)
+        await fan_out_packet(build_console_msg_response(formatted_message), all_senders)
 
         logger.debug(
             "Mensaje de chat de user %d enviado a %d jugadores en mapa %d",
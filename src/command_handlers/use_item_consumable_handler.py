@@ -4,11 +4,13 @@ import logging
 import random
 import time
 from collections.abc import Awaitable, Callable
+from itertools import starmap
 from typing import TYPE_CHECKING
 
 from src.commands.base import CommandResult
 from src.models.item_types import TipoPocion
 from src.models.items_catalog import get_item
+from src.network.msg_inventory import build_change_inventory_slot_response
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
@@ -209,7 +211,19 @@ class UseItemConsumableHandler:
     async def _update_inventory_slot_after_consumption(
         self, user_id: int, item_id: int, slot: int, inventory_repo: InventoryRepository
     ) -> None:
-        """Actualiza el slot del inventario después de consumir un ítem."""
+        """Actualiza el slot del inventario después de consumir un ítem.
+
+        Con el inventario en memoria se envían solo los slots que cambiaron,
+        concatenados en una única escritura; si no, se relee el slot consumido.
+        """
+        changed_slots = inventory_repo.pop_changed_slots(user_id)
+        if changed_slots is not None:
+            if changed_slots:
+                await self.message_sender.send_packets(
+                    b"".join(starmap(_build_inventory_slot_packet, changed_slots))
+                )
+            return
+
         updated_slot = await inventory_repo.get_slot(user_id, slot)
 
         if not updated_slot:
@@ -451,3 +465,41 @@ class UseItemConsumableHandler:
             )
 
         await self.message_sender.send_console_msg("Te has vuelto invisible.")
+
+
+def _build_inventory_slot_packet(slot: int, item_id: int, quantity: int, equipped: bool) -> bytes:
+    """Construye el packet CHANGE_INVENTORY_SLOT de un slot con datos del catálogo.
+
+    Returns:
+        Bytes del packet (slot vacío si ``quantity`` es 0).
+    """
+    if not quantity:
+        return build_change_inventory_slot_response(
+            slot=slot,
+            item_id=0,
+            name="",
+            amount=0,
+            equipped=False,
+            grh_id=0,
+            item_type=0,
+            max_hit=0,
+            min_hit=0,
+            max_def=0,
+            min_def=0,
+            sale_price=0.0,
+        )
+    catalog_item = get_item(item_id)
+    return build_change_inventory_slot_response(
+        slot=slot,
+        item_id=item_id,
+        name=catalog_item.name if catalog_item else "Item",
+        amount=quantity,
+        equipped=equipped,
+        grh_id=catalog_item.graphic_id if catalog_item else item_id,
+        item_type=catalog_item.item_type.to_client_type() if catalog_item else 1,
+        max_hit=catalog_item.max_damage if catalog_item and catalog_item.max_damage else 0,
+        min_hit=catalog_item.min_damage if catalog_item and catalog_item.min_damage else 0,
+        max_def=catalog_item.defense if catalog_item and catalog_item.defense else 0,
+        min_def=catalog_item.defense if catalog_item and catalog_item.defense else 0,
+        sale_price=float(catalog_item.value) if catalog_item else 0.0,
+    )
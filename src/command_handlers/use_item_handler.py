@@ -110,7 +110,9 @@ class UseItemCommandHandler(CommandHandler):
             logger.error("PlayerRepository no está disponible para usar item")
             return CommandResult.error("Error interno: repositorio no disponible")
 
-        inventory_repo = InventoryRepository(self.player_repo.redis)
+        inventory_repo = InventoryRepository(
+            self.player_repo.redis, cache=self.player_repo.inventory_cache
+        )
         slot_data = await inventory_repo.get_slot(user_id, slot)
 
         if not slot_data:
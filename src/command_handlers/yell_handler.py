@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 
 from src.commands.base import Command, CommandHandler, CommandResult
 from src.commands.yell_command import YellCommand
+from src.messaging.packet_fanout import fan_out_packet
+from src.network.msg_console import build_console_msg_response
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
@@ -76,8 +78,7 @@ class YellCommandHandler(CommandHandler):
         formatted_message = f"¡{username} grita!: {message}"
 
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
-        for sender in all_senders:
-            await sender.send_console_msg(formatted_message, font_color=4)
+        await fan_out_packet(build_console_msg_response(formatted_message, 4), all_senders)
 
         logger.info(
             "YELL de user_id %d: '%s' enviado a %d jugadores en mapa %d",
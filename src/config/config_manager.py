@@ -140,12 +140,21 @@ class ConfigManager:
                 "port": self._game_config.server.port,
                 "max_connections": self._game_config.server.max_connections,
                 "buffer_size": self._game_config.server.buffer_size,
+                "send_high_watermark": self._game_config.server.send_high_watermark,
+                "password_hash_workers": self._game_config.server.password_hash_workers,
+                "password_hash_max_pending": self._game_config.server.password_hash_max_pending,
             },
             "game": {
                 "max_players_per_map": self._game_config.game.max_players_per_map,
                 "respawn_check_interval": self._game_config.game.respawn_check_interval,
                 "npc_respawn_base_time": self._game_config.game.npc_respawn_base_time,
                 "npc_respawn_random_variance": self._game_config.game.npc_respawn_random_variance,
+                "npc_pursuit_mode": self._game_config.game.npc_pursuit_mode,
+                "map_loading": self._game_config.game.map_loading,
+                "map_idle_ttl_seconds": self._game_config.game.map_idle_ttl_seconds,
+                "max_resident_maps": self._game_config.game.max_resident_maps,
+                "ground_item_ttl_seconds": self._game_config.game.ground_item_ttl_seconds,
+                "ground_gold_ttl_seconds": self._game_config.game.ground_gold_ttl_seconds,
                 "combat": {
                     "melee_range": self._game_config.game.combat.melee_range,
                     "base_critical_chance": self._game_config.game.combat.base_critical_chance,
@@ -191,6 +200,10 @@ class ConfigManager:
                     "percentage": self._game_config.game.gold_decay.percentage,
                     "interval_seconds": self._game_config.game.gold_decay.interval_seconds,
                 },
+                "tick": {
+                    "interval_seconds": self._game_config.game.tick.interval_seconds,
+                    "budget_ms": self._game_config.game.tick.budget_ms,
+                },
                 "inventory": {
                     "max_slots": self._game_config.game.inventory.max_slots,
                 },
@@ -215,6 +228,7 @@ class ConfigManager:
                 "port": self._game_config.redis.port,
                 "db": self._game_config.redis.db,
                 "max_connections": self._game_config.redis.max_connections,
+                "write_behind_interval_ms": self._game_config.redis.write_behind_interval_ms,
             },
         }
 
@@ -231,12 +245,21 @@ class ConfigManager:
                 "port": 7666,
                 "max_connections": 1000,
                 "buffer_size": 4096,
+                "send_high_watermark": 65536,
+                "password_hash_workers": 2,
+                "password_hash_max_pending": 256,
             },
             "game": {
                 "max_players_per_map": 100,
                 "respawn_check_interval": 5.0,
                 "npc_respawn_base_time": 30.0,
                 "npc_respawn_random_variance": 15.0,
+                "npc_pursuit_mode": "astar",
+                "map_loading": "eager",
+                "map_idle_ttl_seconds": 300.0,
+                "max_resident_maps": 64,
+                "ground_item_ttl_seconds": 900.0,
+                "ground_gold_ttl_seconds": 600.0,
                 "combat": {
                     "melee_range": 1,
                     "base_critical_chance": 0.15,
@@ -281,6 +304,10 @@ class ConfigManager:
                         "percentage": 1.0,
                         "interval_seconds": 60.0,
                     },
+                    "tick": {
+                        "interval_seconds": 0.5,
+                        "budget_ms": 400.0,
+                    },
                 },
                 "inventory": {
                     "max_slots": 30,
@@ -301,7 +328,13 @@ class ConfigManager:
                 "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
                 "file": "logs/server.log",
             },
-            "redis": {"host": "localhost", "port": 6379, "db": 0, "max_connections": 20},
+            "redis": {
+                "host": "localhost",
+                "port": 6379,
+                "db": 0,
+                "max_connections": 20,
+                "write_behind_interval_ms": 100,
+            },
         }
 
     def _load_env_overrides(self) -> None:
@@ -3,7 +3,7 @@
 import logging
 import tomllib
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -21,6 +21,19 @@ class ServerConfig(BaseModel):
     port: int = Field(default=7666, ge=1024, le=65535, description="Puerto del servidor")
     max_connections: int = Field(default=1000, ge=1, description="Máximo de conexiones simultáneas")
     buffer_size: int = Field(default=4096, ge=1024, description="Tamaño del buffer de red")
+    send_high_watermark: int = Field(
+        default=65536,
+        ge=1024,
+        description="Bytes salientes pendientes por conexión antes de aplicar backpressure",
+    )
+    password_hash_workers: int = Field(
+        default=2, ge=1, description="Hilos dedicados a hashear/verificar contraseñas (Argon2)"
+    )
+    password_hash_max_pending: int = Field(
+        default=256,
+        ge=1,
+        description="Operaciones de contraseña en espera antes de rechazar logins por saturación",
+    )
 
 
 class CombatConfig(BaseModel):
@@ -111,6 +124,17 @@ class GoldDecayConfig(BaseModel):
     interval_seconds: float = Field(default=60.0, ge=1.0, description="Intervalo en segundos")
 
 
+class TickConfig(BaseModel):
+    """Configuración del scheduler del GameTick."""
+
+    interval_seconds: float = Field(
+        default=0.5, ge=0.05, description="Período base del tick en segundos"
+    )
+    budget_ms: float = Field(
+        default=400.0, ge=1.0, description="Presupuesto de trabajo por tick en milisegundos"
+    )
+
+
 class InventoryConfig(BaseModel):
     """Configuración de inventario."""
 
@@ -150,11 +174,32 @@ class GameConfigSection(BaseModel):
     npc_respawn_random_variance: float = Field(
         default=15.0, ge=0.0, description="Varianza aleatoria en respawns"
     )
+    npc_pursuit_mode: Literal["astar", "flow_field"] = Field(
+        default="astar",
+        description="Persecución de NPCs: A* por NPC o campo de flujo compartido por objetivo",
+    )
+    map_loading: Literal["eager", "lazy"] = Field(
+        default="eager",
+        description="Carga de mapas: todos al arrancar o a demanda con descarga por inactividad",
+    )
+    map_idle_ttl_seconds: float = Field(
+        default=300.0, ge=0.0, description="Segundos sin jugadores antes de descargar un mapa"
+    )
+    max_resident_maps: int = Field(
+        default=64, ge=1, description="Máximo de mapas residentes en modo lazy (LRU)"
+    )
+    ground_item_ttl_seconds: float = Field(
+        default=900.0, ge=0.0, description="Segundos que dura un item en el suelo (0 = no vence)"
+    )
+    ground_gold_ttl_seconds: float = Field(
+        default=600.0, ge=0.0, description="Segundos que dura el oro en el suelo (0 = no vence)"
+    )
     combat: CombatConfig = Field(default_factory=CombatConfig)
     work: WorkConfig = Field(default_factory=WorkConfig)
     stamina: StaminaConfig = Field(default_factory=StaminaConfig)
     hunger_thirst: HungerThirstConfig = Field(default_factory=HungerThirstConfig)
     gold_decay: GoldDecayConfig = Field(default_factory=GoldDecayConfig)
+    tick: TickConfig = Field(default_factory=TickConfig)
     inventory: InventoryConfig = Field(default_factory=InventoryConfig)
     bank: BankConfig = Field(default_factory=BankConfig)
     character: CharacterConfig = Field(default_factory=CharacterConfig)
@@ -182,6 +227,11 @@ class RedisConfig(BaseModel):
     port: int = Field(default=6379, ge=1, le=65535, description="Puerto de Redis")
     db: int = Field(default=0, ge=0, description="Base de datos de Redis")
     max_connections: int = Field(default=20, ge=1, description="Máximo de conexiones a Redis")
+    write_behind_interval_ms: int = Field(
+        default=100,
+        ge=10,
+        description="Intervalo (ms) del flush write-behind del estado de jugadores online",
+    )
 
 
 class GameConfig(BaseSettings):
@@ -256,6 +306,12 @@ class GameConfig(BaseSettings):
                 "respawn_check_interval": game_data.get("respawn_check_interval", 5.0),
                 "npc_respawn_base_time": game_data.get("npc_respawn_base_time", 30.0),
                 "npc_respawn_random_variance": game_data.get("npc_respawn_random_variance", 15.0),
+                "npc_pursuit_mode": game_data.get("npc_pursuit_mode", "astar"),
+                "map_loading": game_data.get("map_loading", "eager"),
+                "map_idle_ttl_seconds": game_data.get("map_idle_ttl_seconds", 300.0),
+                "max_resident_maps": game_data.get("max_resident_maps", 64),
+                "ground_item_ttl_seconds": game_data.get("ground_item_ttl_seconds", 900.0),
+                "ground_gold_ttl_seconds": game_data.get("ground_gold_ttl_seconds", 600.0),
                 "combat": game_data.get("combat", {}),
                 "work": game_data.get("work", {}),
                 "stamina": game_data.get("stamina", {}),
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.game.game_tick import GameTick
     from src.game.map_manager import MapManager
+    from src.game.timer_scheduler import TimerScheduler
     from src.models.item_catalog import ItemCatalog
     from src.models.npc_catalog import NPCCatalog
     from src.models.spell_catalog import SpellCatalog
@@ -41,6 +42,7 @@ if TYPE_CHECKING:
     from src.services.player.spell_service import SpellService
     from src.services.player.stamina_service import StaminaService
     from src.services.trade_service import TradeService
+    from src.tasks.task_factory import TaskFactory
     from src.utils.redis_client import RedisClient
 
 
@@ -94,8 +96,12 @@ class DependencyContainer:
     map_manager: MapManager
     game_tick: GameTick
     session_manager: SessionManager
+    timer_scheduler: TimerScheduler
 
     # Catálogos
     npc_catalog: NPCCatalog
     spell_catalog: SpellCatalog
     item_catalog: ItemCatalog
+
+    # Se asigna al arrancar el servidor (el factory se construye con este contenedor)
+    task_factory: TaskFactory | None = None
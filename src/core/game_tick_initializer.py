@@ -3,16 +3,17 @@
 import logging
 from typing import TYPE_CHECKING
 
+from src.config.config_manager import ConfigManager, config_manager
 from src.effects.effect_attribute_modifiers import AttributeModifiersEffect
 from src.effects.effect_gold_decay import GoldDecayEffect
+from src.effects.effect_ground_item_expiry import GroundItemExpiryEffect
 from src.effects.effect_hunger_thirst import HungerThirstEffect
-from src.effects.effect_morph_expiry import MorphExpiryEffect
+from src.effects.effect_map_residency import MapResidencyEffect
 from src.effects.effect_npc_movement import NPCMovementEffect
-from src.effects.effect_npc_poison import NPCPoisonEffect
 from src.effects.effect_pet_follow import PetFollowEffect
 from src.effects.effect_poison import PoisonEffect
 from src.effects.effect_stamina_regen import StaminaRegenEffect
-from src.effects.effect_summon_expiry import SummonExpiryEffect
+from src.effects.effect_timer_scheduler import TimerSchedulerEffect
 from src.effects.meditation_effect import MeditationEffect
 from src.effects.npc_ai_effect import NPCAIEffect
 from src.game.game_tick import GameTick
@@ -20,6 +21,7 @@ from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
+    from src.game.timer_scheduler import TimerScheduler
     from src.repositories.account_repository import AccountRepository
     from src.repositories.player_repository import PlayerRepository
     from src.repositories.server_repository import ServerRepository
@@ -42,6 +44,7 @@ class GameTickInitializer:
         npc_ai_service: NPCAIService,
         stamina_service: StaminaService,
         account_repo: AccountRepository | None = None,
+        timer_scheduler: TimerScheduler | None = None,
     ) -> None:
         """Inicializa el inicializador de Game Tick.
 
@@ -52,7 +55,8 @@ class GameTickInitializer:
             npc_service: Servicio de NPCs.
             npc_ai_service: Servicio de IA de NPCs.
             stamina_service: Servicio de stamina.
-            account_repo: Repositorio de cuentas (opcional, necesario para mimetismo).
+            account_repo: Repositorio de cuentas (opcional).
+            timer_scheduler: Scheduler de timers del mundo (opcional).
         """
         self.player_repo = player_repo
         self.server_repo = server_repo
@@ -61,6 +65,7 @@ class GameTickInitializer:
         self.npc_ai_service = npc_ai_service
         self.stamina_service = stamina_service
         self.account_repo = account_repo
+        self.timer_scheduler = timer_scheduler
 
     async def initialize(self) -> GameTick:
         """Crea e inicializa el sistema de Game Tick con sus efectos.
@@ -70,11 +75,16 @@ class GameTickInitializer:
         """
         logger.info("Inicializando sistema de Game Tick...")
 
-        # Crear sistema de tick
+        # Crear sistema de tick (período base y presupuesto desde configuración)
         game_tick = GameTick(
             player_repo=self.player_repo,
             map_manager=self.map_manager,
-            tick_interval=0.5,  # 0.5 segundos por tick
+            tick_interval=ConfigManager.as_float(
+                config_manager.get("game.tick.interval_seconds", 0.5), 0.5
+            ),
+            tick_budget_ms=ConfigManager.as_float(
+                config_manager.get("game.tick.budget_ms", 400.0), 400.0
+            ),
         )
 
         # Agregar efectos según configuración
@@ -85,12 +95,21 @@ class GameTickInitializer:
 
     async def _add_effects(self, game_tick: GameTick) -> None:
         """Agrega efectos al sistema de tick según configuración."""
+        # Hambre/sed, oro y stamina avanzan un paso por aplicación (contadores y
+        # puntos por vez): corren en cada tick base, como antes del scheduler,
+        # para que su ritmo por segundo no dependa del intervalo declarado.
+        # La IA y el movimiento de NPCs también corrían en cada tick base; el
+        # ritmo de ataque ya lo limita el attack_cooldown de cada NPC.
+        step_interval = game_tick.tick_interval
+
         # Efecto de hambre y sed
         hunger_thirst_enabled = await self.server_repo.get_effect_config_bool(
             RedisKeys.CONFIG_HUNGER_THIRST_ENABLED, default=True
         )
         if hunger_thirst_enabled:
-            game_tick.add_effect(HungerThirstEffect(self.server_repo))
+            game_tick.add_effect(
+                HungerThirstEffect(self.server_repo, interval_seconds=step_interval)
+            )
             logger.info("✓ Efecto de hambre/sed habilitado")
 
         # Efecto de reducción de oro
@@ -98,7 +117,7 @@ class GameTickInitializer:
             RedisKeys.CONFIG_GOLD_DECAY_ENABLED, default=True
         )
         if gold_decay_enabled:
-            game_tick.add_effect(GoldDecayEffect(self.server_repo))
+            game_tick.add_effect(GoldDecayEffect(self.server_repo, interval_seconds=step_interval))
             logger.info("✓ Efecto de reducción de oro habilitado")
 
         # Efecto de meditación (siempre habilitado)
@@ -106,44 +125,50 @@ class GameTickInitializer:
         logger.info("✓ Efecto de meditación habilitado")
 
         # Efecto de movimiento de NPCs
-        game_tick.add_effect(NPCMovementEffect(self.npc_service, interval_seconds=5.0))
+        game_tick.add_effect(NPCMovementEffect(self.npc_service, interval_seconds=step_interval))
         logger.info("✓ Efecto de movimiento de NPCs habilitado")
 
         # Efecto de IA de NPCs
-        # Intervalo aumentado a 3.5s para evitar spam de ataques con múltiples NPCs
         game_tick.add_effect(
-            NPCAIEffect(self.npc_service, self.npc_ai_service, interval_seconds=3.5)
+            NPCAIEffect(self.npc_service, self.npc_ai_service, interval_seconds=step_interval)
         )
-        logger.info("✓ Efecto de IA de NPCs habilitado (intervalo: 3.5s)")
+        logger.info("✓ Efecto de IA de NPCs habilitado (intervalo: %.1fs)", step_interval)
 
         # Efecto de regeneración de stamina (siempre habilitado)
-        game_tick.add_effect(StaminaRegenEffect(self.stamina_service))
+        game_tick.add_effect(
+            StaminaRegenEffect(self.stamina_service, interval_seconds=step_interval)
+        )
         logger.info("✓ Efecto de regeneración de stamina habilitado")
 
         # Efecto de envenenamiento para jugadores (siempre habilitado)
         game_tick.add_effect(PoisonEffect(interval_seconds=2.0))
         logger.info("✓ Efecto de envenenamiento (jugadores) habilitado")
 
-        # Efecto de envenenamiento para NPCs (siempre habilitado)
-        game_tick.add_effect(NPCPoisonEffect(self.npc_service, interval_seconds=2.0))
-        logger.info("✓ Efecto de envenenamiento (NPCs) habilitado")
-
         # Efecto de limpieza de modificadores de atributos (siempre habilitado)
         game_tick.add_effect(AttributeModifiersEffect(interval_seconds=10.0))
         logger.info("✓ Efecto de limpieza de modificadores de atributos habilitado")
 
-        # Efecto de expiración de invocaciones (siempre habilitado)
-        game_tick.add_effect(SummonExpiryEffect(self.npc_service, interval_seconds=5.0))
-        logger.info("✓ Efecto de expiración de invocaciones habilitado")
-
         # Efecto de seguimiento de mascotas (siempre habilitado)
-        game_tick.add_effect(PetFollowEffect(self.npc_service, interval_seconds=2.0))
-        logger.info("✓ Efecto de seguimiento de mascotas habilitado")
-
-        # Efecto de expiración de mimetismo (siempre habilitado)
         game_tick.add_effect(
-            MorphExpiryEffect(
-                self.player_repo, self.map_manager, self.account_repo, interval_seconds=5.0
+            PetFollowEffect(
+                self.npc_service,
+                interval_seconds=2.0,
+                flow_field_service=self.npc_ai_service.flow_field_service,
             )
         )
-        logger.info("✓ Efecto de expiración de mimetismo habilitado")
+        logger.info("✓ Efecto de seguimiento de mascotas habilitado")
+
+        # Timers del mundo: respawns, vencimiento de invocaciones y mimetismo, veneno de NPCs
+        if self.timer_scheduler is not None:
+            game_tick.add_effect(TimerSchedulerEffect(self.timer_scheduler, interval_seconds=0.5))
+            logger.info("✓ Scheduler de timers del mundo habilitado")
+
+        # Descarga de mapas inactivos (solo con carga de mapas a demanda)
+        if self.map_manager.lazy_loading:
+            game_tick.add_effect(MapResidencyEffect(self.map_manager, interval_seconds=30.0))
+            logger.info("✓ Efecto de descarga de mapas inactivos habilitado")
+
+        # Vencimiento individual de items en el suelo
+        if self.map_manager.ground_item_expiry:
+            game_tick.add_effect(GroundItemExpiryEffect(self.map_manager, interval_seconds=1.0))
+            logger.info("✓ Efecto de vencimiento de ground items habilitado")
@@ -3,6 +3,7 @@
 import logging
 from typing import TYPE_CHECKING, Any
 
+from src.config.config_manager import ConfigManager, config_manager
 from src.repositories.account_repository import AccountRepository
 from src.repositories.bank_repository import BankRepository
 from src.repositories.clan_repository import ClanRepository
@@ -42,12 +43,24 @@ class RepositoryInitializer:
         """
         logger.info("Inicializando repositorios...")
 
+        write_behind_ms = ConfigManager.as_int(
+            config_manager.get("redis.write_behind_interval_ms", 100)
+        )
+
+        player_repo = PlayerRepository(
+            self.redis_client, flush_interval_seconds=write_behind_ms / 1000
+        )
+
         repositories = {
-            "player_repo": PlayerRepository(self.redis_client),
+            "player_repo": player_repo,
             "account_repo": AccountRepository(self.redis_client),
             "server_repo": ServerRepository(self.redis_client),
-            "inventory_repo": InventoryRepository(self.redis_client),
-            "equipment_repo": EquipmentRepository(self.redis_client),
+            "inventory_repo": InventoryRepository(
+                self.redis_client, cache=player_repo.inventory_cache
+            ),
+            "equipment_repo": EquipmentRepository(
+                self.redis_client, inventory_cache=player_repo.inventory_cache
+            ),
             "merchant_repo": MerchantRepository(self.redis_client),
             "bank_repo": BankRepository(self.redis_client),
             "door_repo": DoorRepository(self.redis_client),
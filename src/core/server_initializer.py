@@ -3,7 +3,9 @@
 import logging
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from src.config.config_manager import ConfigManager, config_manager
 from src.core.dependency_container import DependencyContainer
 from src.core.game_tick_initializer import GameTickInitializer
 from src.core.redis_initializer import RedisInitializer
@@ -12,6 +14,10 @@ from src.core.service_initializer import ServiceInitializer
 from src.game.map_manager import MapManager
 from src.network.session_manager import SessionManager
 from src.repositories.ground_items_repository import GroundItemsRepository
+from src.services.map.world_snapshot import METADATA_RANGES, load_world_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -35,23 +41,23 @@ class ServerInitializer:
             return
 
         loaded_maps = 0
-        ranges = [
-            (1, 51, "metadata_001-051.json"),
-            (52, 101, "metadata_052-101.json"),
-            (102, 151, "metadata_102-151.json"),
-            (152, 201, "metadata_152-201.json"),
-            (202, 251, "metadata_202-251.json"),
-            (252, 290, "metadata_252-290.json"),
-        ]
-
-        for start_id, end_id, filename in ranges:
-            metadata_path = map_data_dir / filename
-            if not metadata_path.exists():
-                continue
-
-            for map_id in range(start_id, end_id + 1):
-                map_manager.load_map_data(map_id, metadata_path)
-                loaded_maps += 1
+        snapshot = load_world_snapshot(map_data_dir)
+        if snapshot is not None:
+            for map_id in snapshot.map_ids():
+                snapshot_map = snapshot.get_map(map_id)
+                if snapshot_map is not None:
+                    map_manager.load_map_snapshot(snapshot_map)
+                    loaded_maps += 1
+            logger.info("Mapas cargados desde el snapshot binario %s", snapshot.path)
+        else:
+            for start_id, end_id, filename in METADATA_RANGES:
+                metadata_path = map_data_dir / filename
+                if not metadata_path.exists():
+                    continue
+
+                for map_id in range(start_id, end_id + 1):
+                    map_manager.load_map_data(map_id, metadata_path)
+                    loaded_maps += 1
 
         elapsed_time = time.perf_counter() - start_time
         logger.info(
@@ -60,6 +66,54 @@ class ServerInitializer:
             elapsed_time,
         )
 
+    @staticmethod
+    def _build_map_loader(map_manager: MapManager, map_data_dir: Path) -> Callable[[int], bool]:
+        """Crea el loader de un mapa para la carga a demanda.
+
+        Usa el snapshot binario del mundo si está al día y, si no, la metadata JSON.
+
+        Args:
+            map_manager: Instancia del MapManager.
+            map_data_dir: Directorio ``map_data``.
+
+        Returns:
+            Función que carga un mapa y retorna False si no existe.
+        """
+        snapshot = load_world_snapshot(map_data_dir)
+
+        def load_map(map_id: int) -> bool:
+            if snapshot is not None:
+                snapshot_map = snapshot.get_map(map_id)
+                if snapshot_map is None:
+                    return False
+                map_manager.load_map_snapshot(snapshot_map)
+                return True
+
+            for start_id, end_id, filename in METADATA_RANGES:
+                metadata_path = map_data_dir / filename
+                if start_id <= map_id <= end_id and metadata_path.exists():
+                    map_manager.load_map_data(map_id, metadata_path)
+                    return True
+            return False
+
+        return load_map
+
+    @staticmethod
+    def _enable_lazy_map_loading(map_manager: MapManager) -> None:
+        """Configura la carga de mapas a demanda (``game.map_loading = "lazy"``).
+
+        Args:
+            map_manager: Instancia del MapManager.
+        """
+        map_manager.enable_lazy_loading(
+            ServerInitializer._build_map_loader(map_manager, Path("map_data")),
+            idle_ttl=ConfigManager.as_float(
+                config_manager.get("game.map_idle_ttl_seconds", 300.0), 300.0
+            ),
+            max_resident=ConfigManager.as_int(config_manager.get("game.max_resident_maps", 64), 64),
+        )
+        logger.info("✓ Carga de mapas a demanda habilitada")
+
     @staticmethod
     async def initialize_all() -> tuple[DependencyContainer, str, int]:
         """Inicializa todos los componentes del servidor.
@@ -83,17 +137,35 @@ class ServerInitializer:
         repo_init = RepositoryInitializer(redis_client)
         repositories = repo_init.initialize_all()
 
+        # Indexar por user_id las cuentas creadas antes del índice inverso
+        await repositories["account_repo"].backfill_user_id_index()
+
         # 3. Inicializar MapManager y ground items
         ground_items_repo = GroundItemsRepository(redis_client)
         map_manager = MapManager(ground_items_repo)
         logger.info("✓ MapManager inicializado")
 
-        # Cargar tiles bloqueados y datos de todos los mapas
-        ServerInitializer._load_map_tiles(map_manager)
-
-        # Cargar ground items del mapa principal
-        await map_manager.load_ground_items(1)
-        logger.info("✓ Ground items cargados para mapa 1")
+        loot_ttl = ConfigManager.as_float(
+            config_manager.get("game.ground_item_ttl_seconds", 900.0), 900.0
+        )
+        gold_ttl = ConfigManager.as_float(
+            config_manager.get("game.ground_gold_ttl_seconds", 600.0), 600.0
+        )
+        if loot_ttl > 0 or gold_ttl > 0:
+            map_manager.enable_ground_item_expiry(loot_ttl, gold_ttl)
+
+        if config_manager.get("game.map_loading", "eager") == "lazy":
+            # Cada mapa se carga al primer acceso o al entrar un jugador
+            ServerInitializer._enable_lazy_map_loading(map_manager)
+        else:
+            # Cargar tiles bloqueados y datos de todos los mapas
+            ServerInitializer._load_map_tiles(map_manager)
+
+            # Cargar los ground items de todos los mapas: así se ven y se agenda
+            # su vencimiento (las claves en Redis no tienen TTL)
+            logger.info(
+                "✓ Ground items cargados de %d mapas", await map_manager.load_all_ground_items()
+            )
 
         # 4. Inicializar servicios
         service_init = ServiceInitializer(repositories, map_manager)
@@ -108,6 +180,7 @@ class ServerInitializer:
             services["npc_ai_service"],
             services["stamina_service"],
             repositories["account_repo"],
+            timer_scheduler=services["timer_scheduler"],
         )
         game_tick = await game_tick_init.initialize()
 
@@ -156,6 +229,7 @@ class ServerInitializer:
             map_manager=map_manager,
             game_tick=game_tick,
             session_manager=session_manager,
+            timer_scheduler=services["timer_scheduler"],
             # Catálogos
             npc_catalog=services["npc_catalog"],
             spell_catalog=services["spell_catalog"],
@@ -3,6 +3,8 @@
 import logging
 from typing import TYPE_CHECKING, Any
 
+from src.config.config_manager import config_manager
+from src.game.timer_scheduler import TimerScheduler
 from src.messaging.message_sender import MessageSender
 from src.models.item_catalog import ItemCatalog
 from src.models.items_catalog import ITEMS_CATALOG
@@ -13,6 +15,7 @@ from src.services.combat.combat_service import CombatService
 from src.services.commerce_service import CommerceService
 from src.services.game.npc_world_manager import NPCWorldManager
 from src.services.map.door_service import DoorService
+from src.services.map.flow_field_service import FlowFieldService
 from src.services.map.map_resources_service import MapResourcesService
 from src.services.map.pathfinding_service import PathfindingService
 from src.services.map.player_map_service import PlayerMapService
@@ -20,11 +23,13 @@ from src.services.multiplayer_broadcast_service import MultiplayerBroadcastServi
 from src.services.npc.loot_table_service import LootTableService
 from src.services.npc.npc_ai_service import NPCAIService
 from src.services.npc.npc_death_service import NPCDeathService
+from src.services.npc.npc_poison_service import NPCPoisonService
 from src.services.npc.npc_respawn_service import NPCRespawnService
 from src.services.npc.npc_service import NPCService
 from src.services.npc.random_spawn_service import RandomSpawnService
 from src.services.npc.summon_service import SummonService
 from src.services.party_service import PartyService
+from src.services.player.morph_expiry_service import MorphExpiryService
 from src.services.player.player_death_service import PlayerDeathService
 from src.services.player.spell_service import SpellService
 from src.services.player.stamina_service import StaminaService
@@ -77,16 +82,41 @@ class ServiceInitializer:
             self.map_manager,
             broadcast_service,
         )
-        await npc_service.initialize_world_npcs()
+        await npc_service.initialize_world_npcs(lazy=self.map_manager.lazy_loading)
+        if self.map_manager.lazy_loading:
+            self.map_manager.add_map_lifecycle_hooks(
+                on_load=npc_service.spawn_map_npcs, on_unload=npc_service.despawn_map_npcs
+            )
         logger.info("✓ Sistema de NPCs inicializado")
 
+        # Scheduler de timers del mundo (respawns, vencimientos, veneno de NPCs)
+        timer_scheduler = TimerScheduler()
+
         # Servicio de respawn de NPCs
-        npc_respawn_service = NPCRespawnService(npc_service)
+        npc_respawn_service = NPCRespawnService(npc_service, timer_scheduler)
+        if self.map_manager.lazy_loading:
+            self.map_manager.add_map_lifecycle_hooks(
+                on_unload=npc_respawn_service.cancel_map_respawns
+            )
         logger.info("✓ Sistema de respawn de NPCs inicializado")
 
+        # Servicio de veneno de NPCs
+        npc_poison_service = NPCPoisonService(npc_service, timer_scheduler)
+        npc_service.add_removal_hook(npc_poison_service.untrack)
+
+        # Servicio de vencimiento de mimetismo
+        morph_expiry_service = MorphExpiryService(
+            self.repositories["player_repo"],
+            self.map_manager,
+            timer_scheduler,
+            self.repositories["account_repo"],
+        )
+
         # Servicio de spawns aleatorios dinámicos
         random_spawn_service = RandomSpawnService(npc_service, self.map_manager)
         random_spawn_service.load_random_spawn_configs("data/world/map_npcs.toml")
+        if self.map_manager.lazy_loading:
+            self.map_manager.add_map_lifecycle_hooks(on_unload=random_spawn_service.on_map_unloaded)
         logger.info("✓ Sistema de spawns aleatorios dinámicos inicializado")
 
         # Servicio de NPCs del mundo
@@ -142,6 +172,7 @@ class ServiceInitializer:
             npc_respawn_service,
             party_service,  # Agregar party_service para distribución de experiencia
             random_spawn_service,  # Para notificar muerte de NPCs random
+            npc_service=npc_service,  # Hooks de eliminación (rutas, timers)
         )
         logger.info("✓ Sistema de muerte de NPCs inicializado (con distribución de exp a party)")
 
@@ -149,6 +180,8 @@ class ServiceInitializer:
         summon_service = SummonService(
             self.repositories["npc_repo"],
             self.repositories["player_repo"],
+            npc_service=npc_service,
+            timer_scheduler=timer_scheduler,
         )
         logger.info("✓ Servicio de invocación (mascotas) inicializado")
 
@@ -163,6 +196,8 @@ class ServiceInitializer:
             broadcast_service=broadcast_service,  # Para invisibilidad
             npc_service=npc_service,  # Para invocación
             summon_service=summon_service,  # Para invocación
+            npc_poison_service=npc_poison_service,  # Para veneno de NPCs
+            morph_expiry_service=morph_expiry_service,  # Para mimetismo
         )
         logger.info(
             "✓ Sistema de magia inicializado (con NPCDeathService, invisibilidad e invocación)"
@@ -189,8 +224,15 @@ class ServiceInitializer:
 
         # Servicio de pathfinding
         pathfinding_service = PathfindingService(self.map_manager)
+        npc_service.add_removal_hook(pathfinding_service.forget)
         logger.info("✓ Servicio de pathfinding inicializado")
 
+        # Campos de flujo para persecución compartida (opcional)
+        flow_field_service = None
+        if config_manager.get("game.npc_pursuit_mode", "astar") == "flow_field":
+            flow_field_service = FlowFieldService(self.map_manager)
+            logger.info("✓ Persecución por campos de flujo habilitada")
+
         # Servicio de muerte de jugadores
         player_death_service = PlayerDeathService(
             map_manager=self.map_manager,
@@ -199,6 +241,7 @@ class ServiceInitializer:
             inventory_repo=self.repositories["inventory_repo"],
             item_catalog=item_catalog,
             account_repo=self.repositories["account_repo"],
+            morph_expiry_service=morph_expiry_service,
         )
         logger.info("✓ Servicio de muerte de jugadores inicializado")
 
@@ -211,6 +254,7 @@ class ServiceInitializer:
             broadcast_service,
             pathfinding_service,
             player_death_service,
+            flow_field_service,
         )
         logger.info("✓ Servicio de IA de NPCs inicializado (con pathfinding A*)")
 
@@ -239,7 +283,10 @@ class ServiceInitializer:
         services = {
             "broadcast_service": broadcast_service,
             "npc_service": npc_service,
+            "timer_scheduler": timer_scheduler,
             "npc_respawn_service": npc_respawn_service,
+            "npc_poison_service": npc_poison_service,
+            "morph_expiry_service": morph_expiry_service,
             "random_spawn_service": random_spawn_service,
             "npc_world_manager": npc_world_manager,
             "npc_death_service": npc_death_service,
@@ -4,7 +4,7 @@ import logging
 import time
 from typing import TYPE_CHECKING
 
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import TickEffect, TickPriority
 
 if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
@@ -77,6 +77,14 @@ class AttributeModifiersEffect(TickEffect):
         """
         return self.interval_seconds
 
+    def get_priority(self) -> TickPriority:
+        """Es tarea de mantenimiento: se difiere si el tick excede el presupuesto.
+
+        Returns:
+            Prioridad baja.
+        """
+        return TickPriority.LOW
+
     def get_name(self) -> str:
         """Retorna el nombre del efecto.
 
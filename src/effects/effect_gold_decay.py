@@ -3,10 +3,12 @@
 import logging
 from typing import TYPE_CHECKING
 
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import TickEffect, TickPriority
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from src.messaging.message_sender import MessageSender
     from src.repositories.player_repository import PlayerRepository
     from src.repositories.server_repository import ServerRepository
@@ -20,16 +22,33 @@ class GoldDecayEffect(TickEffect):
     Las constantes se leen desde Redis y pueden ser modificadas sin reiniciar el servidor.
     """
 
-    def __init__(self, server_repo: ServerRepository) -> None:
+    def __init__(self, server_repo: ServerRepository, interval_seconds: float = 1.0) -> None:
         """Inicializa el efecto de reducción de oro.
 
         Args:
             server_repo: Repositorio del servidor para leer configuración.
+            interval_seconds: Intervalo entre aplicaciones; cada una avanza un paso
+                de los contadores del efecto.
         """
         self.server_repo = server_repo
+        self.interval_seconds = interval_seconds
         # Contadores por jugador: {user_id: ticks_elapsed}
         self._counters: dict[int, int] = {}
 
+    async def _load_config(self) -> tuple[float, float]:
+        """Lee la configuración del efecto desde Redis.
+
+        Returns:
+            Tupla (porcentaje, intervalo_segundos).
+        """
+        percentage = await self.server_repo.get_effect_config_float(
+            RedisKeys.CONFIG_GOLD_DECAY_PERCENTAGE, 1.0
+        )
+        interval_seconds = await self.server_repo.get_effect_config_float(
+            RedisKeys.CONFIG_GOLD_DECAY_INTERVAL, 60.0
+        )
+        return (percentage, interval_seconds)
+
     async def apply(
         self,
         user_id: int,
@@ -37,14 +56,46 @@ class GoldDecayEffect(TickEffect):
         message_sender: MessageSender | None,
     ) -> None:
         """Aplica la reducción de oro."""
-        # Leer configuración desde Redis
-        percentage = await self.server_repo.get_effect_config_float(
-            RedisKeys.CONFIG_GOLD_DECAY_PERCENTAGE, 1.0
-        )
-        interval_seconds = await self.server_repo.get_effect_config_float(
-            RedisKeys.CONFIG_GOLD_DECAY_INTERVAL, 60.0
+        percentage, interval_seconds = await self._load_config()
+        await self._apply_to_player(
+            user_id, percentage, interval_seconds, player_repo, message_sender
         )
 
+    async def apply_batch(
+        self,
+        user_ids: Sequence[int],
+        player_repo: PlayerRepository,
+        message_senders: Mapping[int, MessageSender | None],
+    ) -> None:
+        """Aplica la reducción a todos los jugadores leyendo la configuración una vez.
+
+        Args:
+            user_ids: IDs de los jugadores conectados.
+            player_repo: Repositorio de jugadores.
+            message_senders: MessageSender de cada jugador.
+        """
+        percentage, interval_seconds = await self._load_config()
+        for user_id in user_ids:
+            try:
+                await self._apply_to_player(
+                    user_id,
+                    percentage,
+                    interval_seconds,
+                    player_repo,
+                    message_senders.get(user_id),
+                )
+            except Exception:
+                logger.exception("Error aplicando reducción de oro a user_id %d", user_id)
+
+    async def _apply_to_player(
+        self,
+        user_id: int,
+        percentage: float,
+        interval_seconds: float,
+        player_repo: PlayerRepository,
+        message_sender: MessageSender | None,
+    ) -> None:
+        """Aplica la reducción de oro a un jugador con la configuración dada."""
         # Inicializar contador si no existe
         if user_id not in self._counters:
             self._counters[user_id] = 0
@@ -89,12 +140,20 @@ class GoldDecayEffect(TickEffect):
                 )
 
     def get_interval_seconds(self) -> float:
-        """Retorna 1 segundo (se ejecuta cada segundo para contar intervalos).
+        """Retorna el intervalo entre aplicaciones (un paso de contador cada una).
 
         Returns:
             Intervalo en segundos.
         """
-        return 1.0
+        return self.interval_seconds
+
+    def get_priority(self) -> TickPriority:
+        """Es tarea de mantenimiento: se difiere si el tick excede el presupuesto.
+
+        Returns:
+            Prioridad baja.
+        """
+        return TickPriority.LOW
 
     def get_name(self) -> str:
         """Retorna el nombre del efecto.
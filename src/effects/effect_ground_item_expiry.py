@@ -0,0 +1,101 @@
+"""Efecto periódico que retira del suelo los items vencidos."""
+
+import logging
+from typing import TYPE_CHECKING
+
+from src.effects.tick_effect import TickPriority, WorldTickEffect
+from src.messaging.packet_fanout import fan_out_packet
+from src.network.msg_map import build_object_create_response, build_object_delete_response
+
+if TYPE_CHECKING:
+    from src.game.map_manager import MapManager
+    from src.messaging.message_sender import MessageSender
+    from src.repositories.player_repository import PlayerRepository
+
+logger = logging.getLogger(__name__)
+
+
+class GroundItemExpiryEffect(WorldTickEffect):
+    """Efecto que vence ground items y avisa a los jugadores de cada mapa.
+
+    Los cambios de un mapa se envían en un único buffer: ``OBJECT_DELETE`` para
+    los tiles que quedaron vacíos y ``OBJECT_CREATE`` del item visible (el último
+    de la lista) para los que aún tienen items.
+    """
+
+    def __init__(self, map_manager: MapManager, interval_seconds: float = 1.0) -> None:
+        """Inicializa el efecto de vencimiento de ground items.
+
+        Args:
+            map_manager: Gestor de mapas con vencimiento de ground items habilitado.
+            interval_seconds: Intervalo en segundos entre barridos (default: 1s).
+        """
+        self.map_manager = map_manager
+        self.interval_seconds = interval_seconds
+
+    async def apply(
+        self,
+        _user_id: int,
+        _player_repo: PlayerRepository,
+        _message_sender: MessageSender | None,
+    ) -> None:
+        """Retira los items vencidos y notifica a los jugadores de cada mapa.
+
+        Args:
+            _user_id: ID del usuario (no usado, requerido por TickEffect).
+            _player_repo: Repositorio de jugadores (no usado, requerido por TickEffect).
+            _message_sender: Enviador de mensajes (no usado, requerido por TickEffect).
+        """
+        for map_id, tiles in self.map_manager.expire_ground_items().items():
+            senders = self.map_manager.get_all_message_senders_in_map(map_id)
+            if not senders:
+                continue
+
+            packets: list[bytes] = []
+            for x, y in tiles:
+                items = self.map_manager.get_ground_items(map_id, x, y)
+                grh_index = items[-1].get("grh_index") if items else None
+                if isinstance(grh_index, int) and grh_index:
+                    packets.append(build_object_create_response(x, y, grh_index))
+                else:
+                    packets.append(build_object_delete_response(x, y))
+
+            await fan_out_packet(b"".join(packets), senders)
+            logger.debug(
+                "Ground items vencidos en mapa %d: %d tiles, %d jugadores notificados",
+                map_id,
+                len(tiles),
+                len(senders),
+            )
+
+    def get_metrics(self) -> dict[str, int]:
+        """Métricas de ground items.
+
+        Returns:
+            Diccionario de ``MapManager.get_ground_items_metrics``.
+        """
+        return self.map_manager.get_ground_items_metrics()
+
+    def get_interval_seconds(self) -> float:
+        """Retorna el intervalo en segundos entre aplicaciones del efecto.
+
+        Returns:
+            Intervalo en segundos.
+        """
+        return self.interval_seconds
+
+    def get_priority(self) -> TickPriority:
+        """Es tarea de mantenimiento: se difiere si el tick excede el presupuesto.
+
+        Returns:
+            Prioridad baja.
+        """
+        return TickPriority.LOW
+
+    def get_name(self) -> str:
+        """Retorna el nombre del efecto.
+
+        Returns:
+            Nombre del efecto.
+        """
+        return "GroundItemExpiry"
@@ -8,6 +8,8 @@ from src.effects.tick_effect import TickEffect
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from src.messaging.message_sender import MessageSender
     from src.repositories.player_repository import PlayerRepository
     from src.repositories.server_repository import ServerRepository
@@ -21,26 +23,27 @@ class HungerThirstEffect(TickEffect):
     Las constantes se leen desde Redis y pueden ser modificadas sin reiniciar el servidor.
     """
 
-    def __init__(self, server_repo: ServerRepository) -> None:
+    def __init__(self, server_repo: ServerRepository, interval_seconds: float = 1.0) -> None:
         """Inicializa el efecto de hambre/sed.
 
         Args:
             server_repo: Repositorio del servidor para leer configuración.
+            interval_seconds: Intervalo entre aplicaciones; cada una avanza un paso
+                de los contadores del efecto.
         """
         self.server_repo = server_repo
+        self.interval_seconds = interval_seconds
         # Contadores por jugador: {user_id: {"water": int, "hunger": int}}
         self._counters: dict[int, dict[str, int]] = {}
         # Cache de configuración (se recarga en cada apply)
         self._config_cache: dict[str, int] = {}
 
-    async def apply(
-        self,
-        user_id: int,
-        player_repo: PlayerRepository,
-        message_sender: MessageSender | None,
-    ) -> None:
-        """Aplica la reducción de hambre y sed."""
-        # Leer configuración desde Redis, usando defaults desde ConfigManager
+    async def _load_config(self) -> tuple[int, int, int, int]:
+        """Lee la configuración del efecto desde Redis (con defaults del ConfigManager).
+
+        Returns:
+            Tupla (intervalo_sed, intervalo_hambre, reduccion_agua, reduccion_hambre).
+        """
         default_intervalo_sed = ConfigManager.as_int(
             config_manager.get("game.effects.hunger_thirst.interval_sed", 180)
         )
@@ -70,6 +73,49 @@ class HungerThirstEffect(TickEffect):
             RedisKeys.CONFIG_HUNGER_THIRST_REDUCCION_HAMBRE,
             default_reduccion_hambre,
         )
+        return (intervalo_sed, intervalo_hambre, reduccion_agua, reduccion_hambre)
+
+    async def apply(
+        self,
+        user_id: int,
+        player_repo: PlayerRepository,
+        message_sender: MessageSender | None,
+    ) -> None:
+        """Aplica la reducción de hambre y sed."""
+        config = await self._load_config()
+        await self._apply_to_player(user_id, config, player_repo, message_sender)
+
+    async def apply_batch(
+        self,
+        user_ids: Sequence[int],
+        player_repo: PlayerRepository,
+        message_senders: Mapping[int, MessageSender | None],
+    ) -> None:
+        """Aplica la reducción a todos los jugadores leyendo la configuración una vez.
+
+        Args:
+            user_ids: IDs de los jugadores conectados.
+            player_repo: Repositorio de jugadores.
+            message_senders: MessageSender de cada jugador.
+        """
+        config = await self._load_config()
+        for user_id in user_ids:
+            try:
+                await self._apply_to_player(
+                    user_id, config, player_repo, message_senders.get(user_id)
+                )
+            except Exception:
+                logger.exception("Error aplicando hambre/sed a user_id %d", user_id)
+
+    async def _apply_to_player(
+        self,
+        user_id: int,
+        config: tuple[int, int, int, int],
+        player_repo: PlayerRepository,
+        message_sender: MessageSender | None,
+    ) -> None:
+        """Aplica la reducción de hambre y sed a un jugador con la configuración dada."""
+        intervalo_sed, intervalo_hambre, reduccion_agua, reduccion_hambre = config
 
         # Obtener datos actuales
         hunger_thirst = await player_repo.get_hunger_thirst(user_id)
@@ -150,12 +196,12 @@ class HungerThirstEffect(TickEffect):
                 )
 
     def get_interval_seconds(self) -> float:
-        """Retorna 1 segundo (se ejecuta cada segundo para contar intervalos).
+        """Retorna el intervalo entre aplicaciones (un paso de contador cada una).
 
         Returns:
             Intervalo en segundos.
         """
-        return 1.0
+        return self.interval_seconds
 
     def get_name(self) -> str:
         """Retorna el nombre del efecto.
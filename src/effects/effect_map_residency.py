@@ -0,0 +1,74 @@
+"""Efecto periódico para descargar mapas inactivos (carga de mapas a demanda)."""
+
+import logging
+from typing import TYPE_CHECKING
+
+from src.effects.tick_effect import TickPriority, WorldTickEffect
+
+if TYPE_CHECKING:
+    from src.game.map_manager import MapManager
+    from src.messaging.message_sender import MessageSender
+    from src.repositories.player_repository import PlayerRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MapResidencyEffect(WorldTickEffect):
+    """Efecto que descarga los mapas sin jugadores vencidos por TTL o por el límite LRU."""
+
+    def __init__(self, map_manager: MapManager, interval_seconds: float = 30.0) -> None:
+        """Inicializa el efecto de residencia de mapas.
+
+        Args:
+            map_manager: Gestor de mapas con carga a demanda habilitada.
+            interval_seconds: Intervalo en segundos entre barridos (default: 30s).
+        """
+        self.map_manager = map_manager
+        self.interval_seconds = interval_seconds
+
+    async def apply(
+        self,
+        _user_id: int,
+        _player_repo: PlayerRepository,
+        _message_sender: MessageSender | None,
+    ) -> None:
+        """Descarga los mapas inactivos.
+
+        Args:
+            _user_id: ID del usuario (no usado, requerido por TickEffect).
+            _player_repo: Repositorio de jugadores (no usado, requerido por TickEffect).
+            _message_sender: Enviador de mensajes (no usado, requerido por TickEffect).
+        """
+        await self.map_manager.unload_idle_maps()
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Métricas de residencia de mapas.
+
+        Returns:
+            Diccionario de ``MapManager.get_residency_metrics``.
+        """
+        return self.map_manager.get_residency_metrics()
+
+    def get_interval_seconds(self) -> float:
+        """Retorna el intervalo en segundos entre aplicaciones del efecto.
+
+        Returns:
+            Intervalo en segundos.
+        """
+        return self.interval_seconds
+
+    def get_priority(self) -> TickPriority:
+        """Es tarea de mantenimiento: se difiere si el tick excede el presupuesto.
+
+        Returns:
+            Prioridad baja.
+        """
+        return TickPriority.LOW
+
+    def get_name(self) -> str:
+        """Retorna el nombre del efecto.
+
+        Returns:
+            Nombre del efecto.
+        """
+        return "MapResidency"
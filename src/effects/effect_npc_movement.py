@@ -7,7 +7,7 @@ import time
 from typing import TYPE_CHECKING
 
 from src.constants.gameplay import DEFAULT_MAX_NPCS_PER_TICK, DEFAULT_NPC_CHUNK_SIZE
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import WorldTickEffect
 
 if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_CHUNK_SIZE = DEFAULT_NPC_CHUNK_SIZE
 
 
-class NPCMovementEffect(TickEffect):
+class NPCMovementEffect(WorldTickEffect):
     """Efecto que hace que los NPCs se muevan aleatoriamente."""
 
     def __init__(
@@ -43,7 +43,6 @@ class NPCMovementEffect(TickEffect):
         self.interval_seconds = interval_seconds
         self.max_npcs_per_tick = max_npcs_per_tick
         self.chunk_size = chunk_size
-        self._already_executed_this_tick = False
         self._player_repo: PlayerRepository | None = None
         # Métricas
         self._metrics = {
@@ -78,7 +77,7 @@ class NPCMovementEffect(TickEffect):
         """Aplica el efecto de movimiento aleatorio a los NPCs.
 
         Nota: Este efecto ignora los parámetros de jugador ya que opera sobre NPCs globalmente.
-        Solo se ejecuta una vez por tick, no por cada jugador.
+        El GameTick lo ejecuta una vez cada ``interval_seconds``, no por cada jugador.
 
         Args:
             user_id: ID del usuario (ignorado).
@@ -89,15 +88,6 @@ class NPCMovementEffect(TickEffect):
         if self._player_repo is None:
             self._player_repo = player_repo
 
-        # Solo ejecutar una vez por tick, no por cada jugador
-        if self._already_executed_this_tick:
-            return
-
-        self._already_executed_this_tick = True
-
-        # Resetear el flag después de un breve delay para el próximo tick
-        self._reset_task = asyncio.create_task(self._reset_execution_flag())
-
         # Iniciar profiling
         start_time = time.perf_counter()
 
@@ -361,12 +351,6 @@ class NPCMovementEffect(TickEffect):
         except Exception:
             logger.exception("Error al mover NPC %s", npc.name)
 
-    async def _reset_execution_flag(self) -> None:
-        """Resetea el flag de ejecución después de un breve delay."""
-        # Breve delay para asegurar que todos los jugadores fueron procesados
-        await asyncio.sleep(0.1)
-        self._already_executed_this_tick = False
-
     def get_metrics(self) -> dict[str, float | int]:
         """Obtiene las métricas de rendimiento del efecto.
 
@@ -5,12 +5,13 @@ import time
 from typing import TYPE_CHECKING
 
 from src.constants.gameplay import MAX_PET_FOLLOW_DISTANCE
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import WorldTickEffect
 
 if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
     from src.models.npc import NPC
     from src.repositories.player_repository import PlayerRepository
+    from src.services.map.flow_field_service import FlowFieldService
     from src.services.npc.npc_service import NPCService
 
 logger = logging.getLogger(__name__)
@@ -19,21 +20,26 @@ logger = logging.getLogger(__name__)
 MAX_FOLLOW_DISTANCE = MAX_PET_FOLLOW_DISTANCE
 
 
-class PetFollowEffect(TickEffect):
+class PetFollowEffect(WorldTickEffect):
     """Efecto que hace que las mascotas sigan a su dueño."""
 
-    _last_check_time: float = 0.0  # Timestamp de última verificación (clase)
-    _execution_lock: bool = False  # Lock para evitar ejecuciones concurrentes (clase)
-
-    def __init__(self, npc_service: NPCService, interval_seconds: float = 2.0) -> None:
+    def __init__(
+        self,
+        npc_service: NPCService,
+        interval_seconds: float = 2.0,
+        flow_field_service: FlowFieldService | None = None,
+    ) -> None:
         """Inicializa el efecto de seguimiento de mascotas.
 
         Args:
             npc_service: Servicio de NPCs para mover mascotas.
             interval_seconds: Intervalo en segundos entre verificaciones (default: 2s).
+            flow_field_service: Campos de flujo compartidos con la IA de NPCs
+                (opcional; sin él la mascota avanza en línea recta).
         """
         self.npc_service = npc_service
         self.interval_seconds = interval_seconds
+        self.flow_field_service = flow_field_service
 
     async def apply(
         self,
@@ -43,83 +49,65 @@ class PetFollowEffect(TickEffect):
     ) -> None:
         """Hace que las mascotas sigan a su dueño si están muy lejos.
 
-        Nota: Este efecto se ejecuta una vez por jugador, pero solo procesa
-        si han pasado suficientes segundos desde la última verificación global.
+        Nota: El GameTick lo ejecuta una vez cada ``interval_seconds`` para
+        todo el mundo, no por cada jugador.
 
         Args:
             _user_id: ID del usuario (no usado, requerido por TickEffect).
             player_repo: Repositorio de jugadores.
             _message_sender: Enviador de mensajes (no usado, requerido por TickEffect).
         """
-        current_time = time.time()
+        # Obtener todos los NPCs del mundo
+        all_npcs = await self.npc_service.npc_repository.get_all_npcs()
 
-        # Solo ejecutar si han pasado suficientes segundos desde la última verificación
-        if current_time - PetFollowEffect._last_check_time < self.interval_seconds:
-            return
+        # Filtrar solo mascotas invocadas
+        pets = [npc for npc in all_npcs if npc.summoned_by_user_id > 0 and npc.summoned_until > 0.0]
 
-        # Prevenir ejecuciones concurrentes (este efecto puede ser llamado desde múltiples threads)
-        if PetFollowEffect._execution_lock:
+        if not pets:
             return
 
-        # Bloquear ejecución y actualizar timestamp
-        PetFollowEffect._execution_lock = True
-        PetFollowEffect._last_check_time = current_time
-
-        try:
-            # Obtener todos los NPCs del mundo
-            all_npcs = await self.npc_service.npc_repository.get_all_npcs()
-
-            # Filtrar solo mascotas invocadas
-            pets = [
-                npc for npc in all_npcs if npc.summoned_by_user_id > 0 and npc.summoned_until > 0.0
-            ]
-
-            if not pets:
-                return
-
-            # Procesar cada mascota
-            for pet in pets:
-                owner_id = pet.summoned_by_user_id
-
-                # Obtener posición del dueño
-                owner_position = await player_repo.get_position(owner_id)
-                if not owner_position:
-                    # Dueño no conectado o no encontrado, saltar
-                    continue
-
-                # Verificar que están en el mismo mapa
-                if owner_position["map"] != pet.map_id:
-                    # Mascota está en otro mapa, saltar (no puede seguir entre mapas)
-                    continue
-
-                owner_x = owner_position["x"]
-                owner_y = owner_position["y"]
-
-                # Calcular distancia Manhattan
-                distance = abs(pet.x - owner_x) + abs(pet.y - owner_y)
-
-                # Si la mascota está muy lejos, hacerla seguir al dueño
-                if distance > MAX_FOLLOW_DISTANCE:
-                    logger.debug(
-                        "Mascota %s (inst:%s) está a %d tiles de su dueño "
-                        "(user_id %d), siguiendo...",
-                        pet.name,
-                        pet.instance_id,
-                        distance,
-                        owner_id,
-                    )
-                    await self._move_pet_towards_owner(pet, owner_x, owner_y)
-        finally:
-            # Desbloquear ejecución
-            PetFollowEffect._execution_lock = False
-
-    async def _move_pet_towards_owner(self, pet: NPC, owner_x: int, owner_y: int) -> None:
+        # Procesar cada mascota
+        for pet in pets:
+            owner_id = pet.summoned_by_user_id
+
+            # Obtener posición del dueño
+            owner_position = await player_repo.get_position(owner_id)
+            if not owner_position:
+                # Dueño no conectado o no encontrado, saltar
+                continue
+
+            # Verificar que están en el mismo mapa
+            if owner_position["map"] != pet.map_id:
+                # Mascota está en otro mapa, saltar (no puede seguir entre mapas)
+                continue
+
+            owner_x = owner_position["x"]
+            owner_y = owner_position["y"]
+
+            # Calcular distancia Manhattan
+            distance = abs(pet.x - owner_x) + abs(pet.y - owner_y)
+
+            # Si la mascota está muy lejos, hacerla seguir al dueño
+            if distance > MAX_FOLLOW_DISTANCE:
+                logger.debug(
+                    "Mascota %s (inst:%s) está a %d tiles de su dueño (user_id %d), siguiendo...",
+                    pet.name,
+                    pet.instance_id,
+                    distance,
+                    owner_id,
+                )
+                await self._move_pet_towards_owner(pet, owner_x, owner_y, owner_id)
+
+    async def _move_pet_towards_owner(
+        self, pet: NPC, owner_x: int, owner_y: int, owner_id: int | None = None
+    ) -> None:
         """Mueve una mascota un paso hacia su dueño.
 
         Args:
             pet: Instancia de la mascota.
             owner_x: Coordenada X del dueño.
             owner_y: Coordenada Y del dueño.
+            owner_id: ID del dueño (clave del campo de flujo).
         """
         # Verificar si la mascota está paralizada
         current_time = time.time()
@@ -131,6 +119,15 @@ class PetFollowEffect(TickEffect):
             )
             return
 
+        # Con campos de flujo, la mascota comparte el BFS hacia su dueño
+        if self.flow_field_service is not None:
+            step = self.flow_field_service.get_next_step(
+                pet.map_id, pet.x, pet.y, owner_x, owner_y, target_id=owner_id
+            )
+            if step is not None:
+                await self._step_pet(pet, *step)
+                return
+
         # Calcular dirección hacia el dueño
         dx = owner_x - pet.x
         dy = owner_y - pet.y
@@ -164,6 +161,10 @@ class PetFollowEffect(TickEffect):
         if self.npc_service.map_manager.is_tile_occupied(pet.map_id, new_x, new_y):
             return
 
+        await self._step_pet(pet, new_x, new_y, new_heading)
+
+    async def _step_pet(self, pet: NPC, new_x: int, new_y: int, new_heading: int) -> None:
+        """Mueve la mascota a un tile ya validado."""
         # Guardar coordenadas anteriores para el log
         old_x = pet.x
         old_y = pet.y
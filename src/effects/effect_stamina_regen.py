@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 # Constantes de regeneración
 STAMINA_REGEN_RATE = ConfigManager.as_int(
     config_manager.get("game.stamina.regen_tick", 2)
-)  # Puntos regenerados por tick (cada 1 segundo)
+)  # Puntos regenerados por aplicación (una por tick base)
 
 
 class StaminaRegenEffect(TickEffect):
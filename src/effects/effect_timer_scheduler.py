@@ -0,0 +1,104 @@
+"""Efecto que avanza el scheduler de timers del mundo en cada tick."""
+
+import logging
+from typing import TYPE_CHECKING
+
+from src.effects.tick_effect import WorldTickEffect
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from src.game.timer_scheduler import TimerScheduler
+    from src.messaging.message_sender import MessageSender
+    from src.repositories.player_repository import PlayerRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TimerSchedulerEffect(WorldTickEffect):
+    """Efecto que ejecuta los timers vencidos del ``TimerScheduler``.
+
+    Respawns de NPCs, vencimiento de invocaciones y de mimetismo y los ticks de
+    veneno de NPCs se agendan como timers: este efecto los ejecuta en lote una
+    vez por intervalo en lugar de que cada sistema recorra el mundo buscando
+    vencimientos.
+    """
+
+    def __init__(self, scheduler: TimerScheduler, interval_seconds: float = 0.5) -> None:
+        """Inicializa el efecto.
+
+        Args:
+            scheduler: Scheduler de timers del mundo.
+            interval_seconds: Intervalo en segundos entre ejecuciones (default: 0.5s).
+        """
+        self.scheduler = scheduler
+        self.interval_seconds = interval_seconds
+
+    async def apply(
+        self,
+        _user_id: int,
+        _player_repo: PlayerRepository,
+        _message_sender: MessageSender | None,
+    ) -> None:
+        """Ejecuta los timers vencidos.
+
+        Args:
+            _user_id: ID del usuario (no usado, requerido por TickEffect).
+            _player_repo: Repositorio de jugadores (no usado, requerido por TickEffect).
+            _message_sender: Enviador de mensajes (no usado, requerido por TickEffect).
+        """
+        await self._run_due()
+
+    async def apply_batch(
+        self,
+        _user_ids: Sequence[int],
+        _player_repo: PlayerRepository,
+        _message_senders: Mapping[int, MessageSender | None],
+    ) -> None:
+        """Ejecuta los timers vencidos, aunque no haya jugadores conectados.
+
+        Args:
+            _user_ids: IDs de los jugadores conectados (no usado, puede estar vacío).
+            _player_repo: Repositorio de jugadores (no usado).
+            _message_senders: MessageSender de cada jugador (no usado).
+        """
+        await self._run_due()
+
+    def runs_without_players(self) -> bool:
+        """Los timers corren con el servidor vacío.
+
+        Así los respawns vencen a su hora y no todos juntos al primer login.
+
+        Returns:
+            Siempre ``True``.
+        """
+        return True
+
+    async def _run_due(self) -> None:
+        executed = await self.scheduler.run_due()
+        if executed:
+            logger.debug("Timers ejecutados: %d (pendientes: %d)", executed, len(self.scheduler))
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Métricas del scheduler.
+
+        Returns:
+            Diccionario de ``TimerScheduler.get_metrics``.
+        """
+        return self.scheduler.get_metrics()
+
+    def get_interval_seconds(self) -> float:
+        """Retorna el intervalo en segundos entre aplicaciones del efecto.
+
+        Returns:
+            Intervalo en segundos.
+        """
+        return self.interval_seconds
+
+    def get_name(self) -> str:
+        """Retorna el nombre del efecto.
+
+        Returns:
+            Nombre del efecto.
+        """
+        return "TimerScheduler"
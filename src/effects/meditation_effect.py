@@ -30,8 +30,6 @@ class MeditationEffect(TickEffect):
             interval_seconds: Intervalo en segundos entre recuperaciones (default: 3s).
         """
         self.interval_seconds = interval_seconds
-        # Contadores por jugador: {user_id: ticks_elapsed}
-        self._tick_counters: dict[int, int] = {}
 
     def get_interval_seconds(self) -> float:
         """Retorna el intervalo en segundos entre aplicaciones del efecto.
@@ -57,6 +55,9 @@ class MeditationEffect(TickEffect):
     ) -> None:
         """Aplica recuperación de mana si el jugador está meditando.
 
+        El GameTick lo ejecuta una vez cada ``interval_seconds``: cada ejecución
+        con el jugador meditando recupera mana.
+
         Args:
             user_id: ID del usuario.
             player_repo: Repositorio de jugadores.
@@ -70,36 +71,8 @@ class MeditationEffect(TickEffect):
             logger.debug("user_id %d - is_meditating: %s", user_id, is_meditating)
 
             if not is_meditating:
-                # Resetear contador si no está meditando
-                if user_id in self._tick_counters:
-                    logger.debug("user_id %d dejó de meditar, reseteando contador", user_id)
-                    del self._tick_counters[user_id]
-                return
-
-            # Incrementar contador de ticks
-            if user_id not in self._tick_counters:
-                self._tick_counters[user_id] = 0
-
-            self._tick_counters[user_id] += 1
-
-            # Calcular cuántos ticks necesitamos (GameTick corre cada 0.5s)
-            # Para 3 segundos con tick de 0.5s: 3 / 0.5 = 6 ticks
-            ticks_needed = int(self.interval_seconds / 0.5)  # 0.5s es el tick_interval del GameTick
-
-            logger.debug(
-                "user_id %d meditando - tick %d/%d",
-                user_id,
-                self._tick_counters[user_id],
-                ticks_needed,
-            )
-
-            # Solo aplicar efecto cuando alcancemos los ticks necesarios
-            if self._tick_counters[user_id] < ticks_needed:
                 return
 
-            # Resetear contador
-            self._tick_counters[user_id] = 0
-
             logger.info("user_id %d: aplicando recuperación de maná", user_id)
 
             # Obtener mana actual y máximo
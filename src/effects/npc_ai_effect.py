@@ -4,7 +4,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING
 
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import WorldTickEffect
 
 if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class NPCAIEffect(TickEffect):
+class NPCAIEffect(WorldTickEffect):
     """Efecto que procesa la IA de NPCs hostiles cada tick."""
 
     def __init__(
@@ -86,9 +86,18 @@ class NPCAIEffect(TickEffect):
             )
             return
 
+        # Un snapshot de jugadores vivos por mapa, compartido por todos sus NPCs
+        snapshots = {
+            map_id: await self.npc_ai_service.build_player_snapshot(map_id)
+            for map_id in {npc.map_id for npc in active_npcs}
+        }
+
         # Procesar NPCs en paralelo usando asyncio.gather
         # Esto permite que múltiples NPCs procesen su IA simultáneamente
-        tasks = [self.npc_ai_service.process_hostile_npc(npc) for npc in active_npcs]
+        tasks = [
+            self.npc_ai_service.process_hostile_npc(npc, snapshots[npc.map_id])
+            for npc in active_npcs
+        ]
 
         # gather con return_exceptions=True para que un error en un NPC no afecte a los demás
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,12 +1,30 @@
 """Clase base abstracta para efectos de tick del juego."""
 
+import logging
 from abc import ABC, abstractmethod
+from enum import IntEnum
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
     from src.messaging.message_sender import MessageSender
     from src.repositories.player_repository import PlayerRepository
 
+logger = logging.getLogger(__name__)
+
+
+class TickPriority(IntEnum):
+    """Prioridad de un efecto cuando el tick excede su presupuesto.
+
+    Los efectos ``LOW`` se difieren al tick siguiente si los de mayor prioridad
+    ya consumieron el presupuesto del tick.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
 
 class TickEffect(ABC):
     """Clase base abstracta para efectos de tick."""
@@ -26,10 +44,80 @@ class TickEffect(ABC):
             message_sender: MessageSender del jugador (puede ser None).
         """
 
+    async def apply_batch(
+        self,
+        user_ids: Sequence[int],
+        player_repo: PlayerRepository,
+        message_senders: Mapping[int, MessageSender | None],
+    ) -> None:
+        """Aplica el efecto a todos los jugadores conectados en una sola pasada.
+
+        Implementación por defecto: adaptador que recorre los jugadores y llama a
+        ``apply`` para cada uno. Un error en un jugador se registra y no corta
+        el resto del lote. Los efectos que pueden compartir trabajo entre
+        jugadores (configuración, lecturas) lo sobrescriben.
+
+        Args:
+            user_ids: IDs de los jugadores conectados.
+            player_repo: Repositorio de jugadores.
+            message_senders: MessageSender de cada jugador (puede faltar o ser None).
+        """
+        for user_id in user_ids:
+            try:
+                await self.apply(user_id, player_repo, message_senders.get(user_id))
+            except Exception:
+                logger.exception("Error aplicando efecto %s a user_id %d", self.get_name(), user_id)
+
     @abstractmethod
     def get_interval_seconds(self) -> float:
-        """Retorna el intervalo en segundos entre aplicaciones del efecto."""
+        """Retorna el intervalo en segundos entre aplicaciones del efecto.
+
+        El ``GameTick`` agenda cada efecto con este intervalo: ``apply_batch`` se
+        llama una vez por intervalo, no una vez por tick.
+        """
+
+    def get_priority(self) -> TickPriority:
+        """Retorna la prioridad del efecto frente al presupuesto del tick.
+
+        Returns:
+            Prioridad del efecto (``NORMAL`` por defecto).
+        """
+        return TickPriority.NORMAL
+
+    def runs_without_players(self) -> bool:
+        """Indica si el efecto corre aunque no haya jugadores conectados.
+
+        Returns:
+            ``False`` por defecto: sin jugadores el efecto queda pendiente.
+        """
+        return False
 
     @abstractmethod
     def get_name(self) -> str:
         """Retorna el nombre del efecto para logging."""
+
+
+class WorldTickEffect(TickEffect):
+    """Efecto que opera sobre el mundo (NPCs, mascotas) y no sobre cada jugador.
+
+    En el tick por lotes se aplica una sola vez, independientemente de cuántos
+    jugadores haya conectados.
+    """
+
+    async def apply_batch(
+        self,
+        user_ids: Sequence[int],
+        player_repo: PlayerRepository,
+        message_senders: Mapping[int, MessageSender | None],
+    ) -> None:
+        """Aplica el efecto una única vez para todo el lote.
+
+        Args:
+            user_ids: IDs de los jugadores conectados (solo se usa el primero).
+            player_repo: Repositorio de jugadores.
+            message_senders: MessageSender de cada jugador.
+        """
+        if not user_ids:
+            return
+        first_user_id = user_ids[0]
+        await self.apply(first_user_id, player_repo, message_senders.get(first_user_id))
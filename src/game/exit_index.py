@@ -37,6 +37,18 @@ class ExitIndex:
         """
         return {key[0] for key in self._exit_tiles}
 
+    def get_neighbor_maps(self, map_id: int) -> set[int]:
+        """Mapas destino de los exits de un mapa (aristas del grafo de exits).
+
+        Returns:
+            set[int]: map_ids alcanzables desde ``map_id`` (sin incluirlo).
+        """
+        return {
+            target["to_map"]
+            for (exit_map_id, _, _), target in self._exit_tiles.items()
+            if exit_map_id == map_id and target["to_map"] != map_id
+        }
+
     def clear_map(self, map_id: int) -> None:
         """Limpia exits de un mapa."""
         keys: Iterable[tuple[int, int, int]] = [k for k in self._exit_tiles if k[0] == map_id]
@@ -2,17 +2,34 @@
 
 Sistema configurable que permite aplicar diferentes efectos periódicos
 a los jugadores conectados (hambre, sed, reducción de oro, etc.).
+
+Cada tick toma un snapshot de los jugadores conectados y entrega el lote
+completo a cada efecto (``TickEffect.apply_batch``): una tarea por efecto en
+lugar de una por efecto y jugador.
+
+Scheduler de paso fijo:
+
+- Los ticks arrancan en deadlines absolutos (``inicio + n * tick_interval``),
+  así el tiempo de trabajo no desplaza el período. Si un tick llega tarde el
+  siguiente corre de inmediato, y si se perdieron períodos completos se
+  saltan (sin ráfagas de recuperación) y se cuentan en ``skipped_ticks``.
+- Cada efecto corre a su propio intervalo (``get_interval_seconds``) alineado
+  a la grilla de ticks; no todos los efectos corren en cada tick.
+- Si los efectos ``HIGH``/``NORMAL`` consumen el presupuesto del tick, los
+  ``LOW`` se difieren al tick siguiente (como máximo ``MAX_CONSECUTIVE_DEFERRALS``
+  veces seguidas, para que no queden postergados indefinidamente).
 """
 
 import asyncio
 import contextlib
 import logging
 import time
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from src.effects.effect_gold_decay import GoldDecayEffect
 from src.effects.effect_hunger_thirst import HungerThirstEffect
-from src.effects.tick_effect import TickEffect
+from src.effects.tick_effect import TickEffect, TickPriority
+from src.utils.latency_histogram import LatencyHistogram
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
@@ -21,6 +38,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Fracción del período usada como presupuesto si no se especifica uno
+DEFAULT_TICK_BUDGET_RATIO = 0.8
+
+# Veces seguidas que un efecto LOW puede diferirse antes de forzar su ejecución
+MAX_CONSECUTIVE_DEFERRALS = 4
+
+# Tolerancia al comparar deadlines (errores de redondeo al acumular intervalos)
+_DEADLINE_EPSILON = 1e-6
+
 
 class GameTick:
     """Sistema de tick genérico que aplica efectos periódicos a jugadores conectados."""
@@ -31,6 +57,7 @@ class GameTick:
         map_manager: MapManager,
         effects: list[TickEffect] | None = None,
         tick_interval: float = 1.0,
+        tick_budget_ms: float | None = None,
     ) -> None:
         """Inicializa el sistema de tick.
 
@@ -39,20 +66,31 @@ class GameTick:
             map_manager: Gestor de mapas para obtener jugadores conectados.
             effects: Lista de efectos a aplicar (por defecto vacía).
             tick_interval: Intervalo del tick en segundos (por defecto 1 segundo).
+            tick_budget_ms: Presupuesto de trabajo por tick en milisegundos
+                (por defecto el 80% del intervalo).
         """
         self.player_repo = player_repo
         self.map_manager = map_manager
         self.effects = effects or []
         self.tick_interval = tick_interval
+        self.tick_budget_ms = (
+            tick_budget_ms
+            if tick_budget_ms is not None
+            else tick_interval * 1000 * DEFAULT_TICK_BUDGET_RATIO
+        )
         self._task: asyncio.Task[None] | None = None
         self._running = False
+        # Agenda por efecto: próximo deadline y veces diferido seguidas
+        self._next_due: dict[TickEffect, float] = {}
+        self._deferrals: dict[TickEffect, int] = {}
         # Métricas de rendimiento
-        self._metrics: dict[str, Any] = {
-            "total_ticks": 0,
-            "total_time_ms": 0.0,
-            "max_tick_time_ms": 0.0,
-            "effect_metrics": {},  # {effect_name: {total_time_ms, count, max_time_ms}}
-        }
+        self._tick_times = LatencyHistogram()
+        self._tick_lag = LatencyHistogram()
+        self._phase_times: dict[str, LatencyHistogram] = {}
+        self._effect_times: dict[str, LatencyHistogram] = {}
+        self._overruns = 0
+        self._skipped_ticks = 0
+        self._deferred_effects = 0
 
     def add_effect(self, effect: TickEffect) -> None:
         """Agrega un efecto al sistema de tick.
@@ -64,199 +102,240 @@ class GameTick:
         logger.info("Efecto agregado: %s", effect.get_name())
 
     async def _tick_loop(self) -> None:
-        """Loop principal del tick que procesa todos los jugadores conectados."""
+        """Loop principal: ejecuta un tick en cada deadline absoluto."""
         logger.info(
-            "Sistema de tick iniciado (intervalo: %.1fs, efectos: %d)",
+            "Sistema de tick iniciado (intervalo: %.1fs, presupuesto: %.0fms, efectos: %d)",
             self.tick_interval,
+            self.tick_budget_ms,
             len(self.effects),
         )
 
+        epoch = time.monotonic()
+        tick_number = 0
         while self._running:
             try:
-                # Iniciar profiling del tick completo
-                tick_start_time = time.perf_counter()
-
-                # Obtener todos los user_ids conectados
-                connected_user_ids = self.map_manager.get_all_connected_user_ids()
-
-                if not connected_user_ids:
-                    # No hay jugadores conectados, solo esperar
-                    await asyncio.sleep(self.tick_interval)
-                    continue
-
-                # Crear todas las tareas para procesar en paralelo
-                # Esto permite que todos los efectos de todos los jugadores
-                # se procesen simultáneamente
-                tasks = []
-                for effect in self.effects:
-                    for user_id in connected_user_ids:
-                        message_sender = self.map_manager.get_message_sender(user_id)
-                        # Crear tarea con manejo de excepciones incluido y profiling
-                        task = self._apply_effect_safe_with_metrics(effect, user_id, message_sender)
-                        tasks.append(task)
-
-                # Ejecutar todas las tareas en paralelo
-                # return_exceptions=True para que un error no detenga todo el tick
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Calcular tiempo del tick completo
-                tick_elapsed_ms = (time.perf_counter() - tick_start_time) * 1000
-                self._metrics["total_ticks"] = cast("int", self._metrics["total_ticks"]) + 1
-                self._metrics["total_time_ms"] = (
-                    cast("float", self._metrics["total_time_ms"]) + tick_elapsed_ms
-                )
-                self._metrics["max_tick_time_ms"] = max(
-                    cast("float", self._metrics["max_tick_time_ms"]), tick_elapsed_ms
-                )
-
-                # Log de métricas cada 50 ticks
-                if cast("int", self._metrics["total_ticks"]) % 50 == 0:
-                    self._log_metrics()
-
-                # Esperar hasta el próximo tick
-                await asyncio.sleep(self.tick_interval)
+                deadline = epoch + tick_number * self.tick_interval
+                self._tick_lag.record((time.monotonic() - deadline) * 1000)
+                await self._run_tick(deadline)
+
+                # Próximo deadline: si ya pasaron períodos completos se saltan
+                tick_number += 1
+                now = time.monotonic()
+                behind = now - (epoch + tick_number * self.tick_interval)
+                if behind >= self.tick_interval:
+                    missed = int(behind / self.tick_interval)
+                    tick_number += missed
+                    self._skipped_ticks += missed
+                await asyncio.sleep(max(0.0, epoch + tick_number * self.tick_interval - now))
 
             except asyncio.CancelledError:
                 logger.info("Tick del juego cancelado")
                 break
             except Exception:
                 logger.exception("Error en el loop de tick del juego")
+                tick_number += 1
                 await asyncio.sleep(self.tick_interval)
 
-    async def _apply_effect_safe(
+    async def _run_tick(self, now: float) -> None:
+        """Ejecuta un tick: aplica los efectos cuyo deadline venció.
+
+        Args:
+            now: Deadline del tick (reloj monotónico); los efectos se agendan
+                relativos a él y no a la hora real de ejecución.
+        """
+        tick_start_time = time.perf_counter()
+
+        # Obtener todos los user_ids conectados
+        connected_user_ids = self.map_manager.get_all_connected_user_ids()
+
+        due = [
+            effect
+            for effect in self.effects
+            if self._next_due.get(effect, now) <= now + _DEADLINE_EPSILON
+        ]
+        if not connected_user_ids:
+            # No hay jugadores conectados: solo corren los efectos del mundo que
+            # no pueden esperar (timers); el resto queda pendiente
+            due = [effect for effect in due if effect.runs_without_players()]
+        if not due:
+            return
+
+        # Fase 1: snapshot de jugadores y senders (una vez por tick)
+        message_senders = {
+            user_id: self.map_manager.get_message_sender(user_id) for user_id in connected_user_ids
+        }
+        effects_start_time = time.perf_counter()
+        self._record(self._phase_times, "collect", (effects_start_time - tick_start_time) * 1000)
+
+        # Fase 2: efectos vencidos, primero los de mayor prioridad. Los efectos
+        # corren en paralelo; dentro de cada uno el lote se procesa en un loop.
+        urgent = [effect for effect in due if effect.get_priority() < TickPriority.LOW]
+        await self._run_effects(urgent, now, connected_user_ids, message_senders)
+
+        low = [effect for effect in due if effect.get_priority() >= TickPriority.LOW]
+        if low:
+            if (time.perf_counter() - tick_start_time) * 1000 > self.tick_budget_ms:
+                low = self._defer_low_priority(low)
+            await self._run_effects(low, now, connected_user_ids, message_senders)
+        effects_elapsed_ms = (time.perf_counter() - effects_start_time) * 1000
+        self._record(self._phase_times, "effects", effects_elapsed_ms)
+
+        # Calcular tiempo del tick completo
+        tick_elapsed_ms = (time.perf_counter() - tick_start_time) * 1000
+        self._tick_times.record(tick_elapsed_ms)
+        if tick_elapsed_ms > self.tick_budget_ms:
+            self._overruns += 1
+            logger.warning(
+                "Tick excedió el presupuesto: %.1fms > %.0fms",
+                tick_elapsed_ms,
+                self.tick_budget_ms,
+            )
+
+        # Log de métricas cada 50 ticks
+        if self._tick_times.count % 50 == 0:
+            self._log_metrics()
+
+    def _defer_low_priority(self, effects: list[TickEffect]) -> list[TickEffect]:
+        """Difiere los efectos de baja prioridad de un tick excedido.
+
+        Args:
+            effects: Efectos LOW vencidos en este tick.
+
+        Returns:
+            Efectos que igual deben correr (diferidos demasiadas veces seguidas).
+        """
+        runnable = []
+        for effect in effects:
+            deferrals = self._deferrals.get(effect, 0)
+            if deferrals >= MAX_CONSECUTIVE_DEFERRALS:
+                runnable.append(effect)
+                continue
+            self._deferrals[effect] = deferrals + 1
+            self._deferred_effects += 1
+            logger.debug("Efecto %s diferido (tick sobre presupuesto)", effect.get_name())
+        return runnable
+
+    async def _run_effects(
         self,
-        effect: TickEffect,
-        user_id: int,
-        message_sender: MessageSender | None,
+        effects: list[TickEffect],
+        now: float,
+        user_ids: list[int],
+        message_senders: dict[int, MessageSender | None],
     ) -> None:
-        """Aplica un efecto a un jugador con manejo de excepciones.
+        """Aplica efectos en paralelo y agenda su próxima ejecución.
 
         Args:
-            effect: Efecto a aplicar.
-            user_id: ID del jugador.
-            message_sender: MessageSender del jugador.
+            effects: Efectos a aplicar.
+            now: Deadline del tick actual.
+            user_ids: IDs de los jugadores conectados.
+            message_senders: MessageSender de cada jugador.
         """
-        try:
-            await effect.apply(user_id, self.player_repo, message_sender)
-        except Exception:
-            logger.exception(
-                "Error aplicando efecto %s a user_id %d",
-                effect.get_name(),
-                user_id,
-            )
+        if not effects:
+            return
+        for effect in effects:
+            # Próximo deadline en la grilla del efecto; si se atrasó más de un
+            # intervalo se reagenda desde ahora en lugar de acumular ejecuciones
+            interval = effect.get_interval_seconds()
+            next_due = self._next_due.get(effect, now) + interval
+            self._next_due[effect] = next_due if next_due > now else now + interval
+            self._deferrals.pop(effect, None)
+        await asyncio.gather(
+            *(
+                self._apply_batch_with_metrics(effect, user_ids, message_senders)
+                for effect in effects
+            ),
+            return_exceptions=True,
+        )
 
-    async def _apply_effect_safe_with_metrics(
+    async def _apply_batch_with_metrics(
         self,
         effect: TickEffect,
-        user_id: int,
-        message_sender: MessageSender | None,
+        user_ids: list[int],
+        message_senders: dict[int, MessageSender | None],
     ) -> None:
-        """Aplica un efecto a un jugador con métricas de rendimiento.
+        """Aplica un efecto al lote de jugadores con métricas de rendimiento.
 
         Args:
             effect: Efecto a aplicar.
-            user_id: ID del jugador.
-            message_sender: MessageSender del jugador.
+            user_ids: IDs de los jugadores conectados.
+            message_senders: MessageSender de cada jugador.
         """
         effect_name = effect.get_name()
         start_time = time.perf_counter()
 
         try:
-            await effect.apply(user_id, self.player_repo, message_sender)
+            await effect.apply_batch(user_ids, self.player_repo, message_senders)
         except Exception:
-            logger.exception(
-                "Error aplicando efecto %s a user_id %d",
-                effect_name,
-                user_id,
-            )
+            logger.exception("Error aplicando efecto %s", effect_name)
         finally:
             # Actualizar métricas del efecto
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            effect_metrics_dict = cast(
-                "dict[str, dict[str, float | int]]", self._metrics["effect_metrics"]
-            )
-            if effect_name not in effect_metrics_dict:
-                effect_metrics_dict[effect_name] = {
-                    "total_time_ms": 0.0,
-                    "count": 0,
-                    "max_time_ms": 0.0,
-                }
-            effect_metrics = effect_metrics_dict[effect_name]
-            effect_metrics["total_time_ms"] = (
-                cast("float", effect_metrics["total_time_ms"]) + elapsed_ms
-            )
-            effect_metrics["count"] = cast("int", effect_metrics["count"]) + 1
-            effect_metrics["max_time_ms"] = max(
-                cast("float", effect_metrics["max_time_ms"]), elapsed_ms
-            )
+            self._record(self._effect_times, effect_name, (time.perf_counter() - start_time) * 1000)
+
+    @staticmethod
+    def _record(histograms: dict[str, LatencyHistogram], name: str, elapsed_ms: float) -> None:
+        """Registra una medición en el histograma de ``name``."""
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = LatencyHistogram()
+        histogram.record(elapsed_ms)
 
     def _log_metrics(self) -> None:
         """Registra las métricas de rendimiento."""
-        total_ticks = cast("int", self._metrics["total_ticks"])
-        total_time_ms = cast("float", self._metrics["total_time_ms"])
-        max_tick_time_ms = cast("float", self._metrics["max_tick_time_ms"])
-
-        avg_tick_time_ms = total_time_ms / total_ticks if total_ticks > 0 else 0.0
-
+        metrics = self.get_metrics()
         logger.info(
-            "GameTick metrics: %d ticks, avg=%.2fms, max=%.2fms",
-            total_ticks,
-            avg_tick_time_ms,
-            max_tick_time_ms,
-        )
-
-        # Log de métricas por efecto
-        effect_metrics_dict = cast(
-            "dict[str, dict[str, float | int]]", self._metrics["effect_metrics"]
+            "GameTick metrics: %d ticks, avg=%.2fms, p50=%.2fms, p95=%.2fms, p99=%.2fms, "
+            "max=%.2fms, overruns=%d, skipped=%d, deferred=%d",
+            metrics["total_ticks"],
+            metrics["avg_tick_time_ms"],
+            metrics["p50_tick_time_ms"],
+            metrics["p95_tick_time_ms"],
+            metrics["p99_tick_time_ms"],
+            metrics["max_tick_time_ms"],
+            metrics["overruns"],
+            metrics["skipped_ticks"],
+            metrics["deferred_effects"],
         )
-        for effect_name, metrics in effect_metrics_dict.items():
-            count = cast("int", metrics["count"])
-            if count > 0:
-                total_effect_time_ms = cast("float", metrics["total_time_ms"])
-                avg_effect_time_ms = total_effect_time_ms / count
-                max_effect_time_ms = cast("float", metrics["max_time_ms"])
-                logger.info(
-                    "  Effect '%s': %d calls, avg=%.2fms, max=%.2fms",
-                    effect_name,
-                    count,
-                    avg_effect_time_ms,
-                    max_effect_time_ms,
-                )
+        for phase, phase_metrics in metrics["phases"].items():
+            logger.info(
+                "  Fase '%s': avg=%.2fms, p99=%.2fms, max=%.2fms",
+                phase,
+                phase_metrics["avg_time_ms"],
+                phase_metrics["p99_ms"],
+                phase_metrics["max_time_ms"],
+            )
+        for effect_name, effect_metrics in metrics["effects"].items():
+            logger.info(
+                "  Effect '%s': %d calls, avg=%.2fms, p99=%.2fms, max=%.2fms",
+                effect_name,
+                effect_metrics["count"],
+                effect_metrics["avg_time_ms"],
+                effect_metrics["p99_ms"],
+                effect_metrics["max_time_ms"],
+            )
 
     def get_metrics(self) -> dict[str, Any]:
         """Obtiene las métricas de rendimiento del GameTick.
 
         Returns:
-            Diccionario con métricas de rendimiento.
+            Diccionario con tiempos del tick (avg/p50/p95/p99/max), retraso de
+            arranque respecto del deadline, overruns, ticks saltados, efectos
+            diferidos y los resúmenes por fase y por efecto.
         """
-        total_ticks = cast("int", self._metrics["total_ticks"])
-        total_time_ms = cast("float", self._metrics["total_time_ms"])
-        max_tick_time_ms = cast("float", self._metrics["max_tick_time_ms"])
-
-        avg_tick_time_ms = total_time_ms / total_ticks if total_ticks > 0 else 0.0
-
-        effect_metrics_summary: dict[str, dict[str, float | int]] = {}
-        effect_metrics_dict = cast(
-            "dict[str, dict[str, float | int]]", self._metrics["effect_metrics"]
-        )
-        for effect_name, metrics in effect_metrics_dict.items():
-            count = cast("int", metrics["count"])
-            if count > 0:
-                total_effect_time_ms = cast("float", metrics["total_time_ms"])
-                avg_effect_time_ms = total_effect_time_ms / count
-                max_effect_time_ms = cast("float", metrics["max_time_ms"])
-                effect_metrics_summary[effect_name] = {
-                    "count": count,
-                    "avg_time_ms": avg_effect_time_ms,
-                    "max_time_ms": max_effect_time_ms,
-                }
-
         return {
-            "total_ticks": total_ticks,
-            "avg_tick_time_ms": avg_tick_time_ms,
-            "max_tick_time_ms": max_tick_time_ms,
-            "effects": effect_metrics_summary,
+            "total_ticks": self._tick_times.count,
+            "avg_tick_time_ms": self._tick_times.mean_ms,
+            "max_tick_time_ms": self._tick_times.max_ms,
+            "p50_tick_time_ms": self._tick_times.percentile(50),
+            "p95_tick_time_ms": self._tick_times.percentile(95),
+            "p99_tick_time_ms": self._tick_times.percentile(99),
+            "tick_interval_ms": self.tick_interval * 1000,
+            "tick_budget_ms": self.tick_budget_ms,
+            "overruns": self._overruns,
+            "skipped_ticks": self._skipped_ticks,
+            "deferred_effects": self._deferred_effects,
+            "lag": self._tick_lag.summary(),
+            "phases": {name: hist.summary() for name, hist in self._phase_times.items()},
+            "effects": {name: hist.summary() for name, hist in self._effect_times.items()},
         }
 
     def start(self) -> None:
@@ -4,31 +4,67 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING
 
+from src.game.timing_wheel import TimingWheel
+from src.models.item_constants import GOLD_ITEM_ID
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.repositories.ground_items_repository import GroundItemsRepository
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_FLUSH_DELAY_SECONDS = 0.5
+
 
 class GroundItemIndex:
-    """Gestiona items en el suelo agrupados por mapa y posición."""
+    """Gestiona items en el suelo agrupados por mapa y posición.
+
+    Además del storage plano ``{(map_id, x, y): [items]}`` mantiene los tiles
+    con items de cada mapa, así que contar, limpiar o persistir un mapa cuesta
+    O(tiles del mapa) y no O(items del mundo). Los cambios se persisten con
+    write-behind: cada alta/baja marca su tile como sucio y un flush diferido
+    (``flush_delay``) escribe solo los tiles sucios en Redis.
+
+    Con ``enable_expiry`` cada item recibe su ``spawn_time`` (epoch, persiste en
+    Redis) y se agenda en una timing wheel según su TTL (oro o loot);
+    ``collect_expired`` los retira con costo O(vencidos).
+    """
 
     def __init__(
         self,
         max_items_per_tile: int,
         ground_items_repo: GroundItemsRepository | None = None,
+        flush_delay: float = DEFAULT_FLUSH_DELAY_SECONDS,
     ) -> None:
         """Inicializa el índice.
 
         Args:
             max_items_per_tile: Límite de items por tile.
             ground_items_repo: Repo opcional para persistencia en Redis.
+            flush_delay: Segundos que se agrupan cambios antes de persistirlos.
         """
         self.max_items_per_tile = max_items_per_tile
         self.ground_items_repo = ground_items_repo
+        self.flush_delay = flush_delay
         self._ground_items: dict[tuple[int, int, int], list[dict[str, int | str | None]]] = {}
+        self._tiles_by_map: dict[int, set[tuple[int, int]]] = {}
+
+        # Tiles modificados pendientes de persistir: {map_id: {(x, y)}}
+        self._dirty: dict[int, set[tuple[int, int]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flushes = 0
+        self._tiles_flushed = 0
+
+        # Vencimiento por item (deshabilitado hasta enable_expiry)
+        self._expiry: TimingWheel[tuple[int, int, int, dict[str, int | str | None]]] | None = None
+        self._loot_ttl = 0.0
+        self._gold_ttl = 0.0
+        self._clock: Callable[[], float] = time.time
+        self._expired_items = 0
 
     @property
     def ground_items(self) -> dict[tuple[int, int, int], list[dict[str, int | str | None]]]:
@@ -54,6 +90,9 @@ class GroundItemIndex:
             return
 
         self._ground_items[key].append(item)
+        self._tiles_by_map.setdefault(map_id, set()).add((x, y))
+        if self._expiry is not None:
+            self._schedule_expiry(map_id, x, y, item)
         logger.debug(
             "Item agregado al suelo: mapa=%d pos=(%d,%d) item_id=%s cantidad=%s",
             map_id,
@@ -63,9 +102,7 @@ class GroundItemIndex:
             item.get("quantity"),
         )
 
-        if self.ground_items_repo:
-            task = asyncio.create_task(self.persist_ground_items(map_id))
-            task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
+        self._mark_dirty(map_id, x, y)
 
     def get_ground_items(self, map_id: int, x: int, y: int) -> list[dict[str, int | str | None]]:
         """Obtiene todos los items en un tile específico.
@@ -75,6 +112,20 @@ class GroundItemIndex:
         """
         return self._ground_items.get((map_id, x, y), [])
 
+    def get_map_tiles(
+        self, map_id: int
+    ) -> dict[tuple[int, int], list[dict[str, int | str | None]]]:
+        """Obtiene los tiles con items de un mapa.
+
+        Returns:
+            Diccionario {(x, y): [items]} (las listas son las del índice).
+        """
+        return {
+            (x, y): self._ground_items[map_id, x, y]
+            for x, y in self._tiles_by_map.get(map_id, ())
+            if (map_id, x, y) in self._ground_items
+        }
+
     def remove_ground_item(
         self, map_id: int, x: int, y: int, item_index: int = 0
     ) -> dict[str, int | str | None] | None:
@@ -100,7 +151,7 @@ class GroundItemIndex:
 
         item = items.pop(item_index)
         if not items:
-            del self._ground_items[key]
+            self._drop_tile(map_id, x, y)
 
         logger.debug(
             "Item removido del suelo: mapa=%d pos=(%d,%d) item_id=%s",
@@ -110,23 +161,23 @@ class GroundItemIndex:
             item.get("item_id"),
         )
 
-        if self.ground_items_repo:
-            task = asyncio.create_task(self.persist_ground_items(map_id))
-            task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
+        self._mark_dirty(map_id, x, y)
 
         return item
 
     def clear_ground_items(self, map_id: int) -> int:
-        """Limpia todos los items de un mapa.
+        """Limpia todos los items de un mapa (solo en memoria).
 
         Returns:
             int: Cantidad de items removidos.
         """
-        keys_to_remove = [key for key in self._ground_items if key[0] == map_id]
-        total_items = sum(len(self._ground_items[key]) for key in keys_to_remove)
-
-        for key in keys_to_remove:
-            del self._ground_items[key]
+        tiles = self._tiles_by_map.pop(map_id, set())
+        total_items = 0
+        for x, y in tiles:
+            items = self._ground_items.pop((map_id, x, y), None)
+            if items:
+                total_items += len(items)
+        self._dirty.pop(map_id, None)
 
         if total_items > 0:
             logger.info("Limpiados %d items del mapa %d", total_items, map_id)
@@ -139,19 +190,121 @@ class GroundItemIndex:
         Returns:
             int: Total de items.
         """
-        return sum(len(items) for key, items in self._ground_items.items() if key[0] == map_id)
+        return sum(len(items) for items in self.get_map_tiles(map_id).values())
 
     async def persist_ground_items(self, map_id: int) -> None:
-        """Persiste los ground items de un mapa en Redis."""
+        """Persiste todos los ground items de un mapa en Redis (reemplazo completo)."""
         if not self.ground_items_repo:
             return
 
-        map_items: dict[tuple[int, int], list[dict[str, int | str | None]]] = {}
-        for (item_map_id, x, y), items in self._ground_items.items():
-            if item_map_id == map_id:
-                map_items[x, y] = items
+        self._dirty.pop(map_id, None)
+        await self.ground_items_repo.save_ground_items(map_id, self.get_map_tiles(map_id))
+
+    async def flush(self) -> int:
+        """Persiste los tiles modificados desde el último flush.
+
+        Returns:
+            int: Cantidad de tiles escritos.
+        """
+        if not self.ground_items_repo or not self._dirty:
+            return 0
+
+        dirty, self._dirty = self._dirty, {}
+        flushed = 0
+        for map_id, coords in dirty.items():
+            tiles = {(x, y): self._ground_items.get((map_id, x, y), []) for x, y in coords}
+            try:
+                await self.ground_items_repo.save_tiles(map_id, tiles)
+            except Exception:
+                logger.exception("Error persistiendo ground items del mapa %d", map_id)
+                # Reintentar en el próximo flush
+                self._dirty.setdefault(map_id, set()).update(coords)
+                continue
+            flushed += len(coords)
+
+        self._flushes += 1
+        self._tiles_flushed += flushed
+        return flushed
+
+    def get_metrics(self) -> dict[str, int]:
+        """Métricas del índice para diagnóstico.
+
+        Returns:
+            Diccionario con mapas y tiles con items, flushes, tiles escritos y
+            tiles pendientes de persistir.
+        """
+        return {
+            "maps_with_items": len(self._tiles_by_map),
+            "tiles_with_items": len(self._ground_items),
+            "flushes": self._flushes,
+            "tiles_flushed": self._tiles_flushed,
+            "dirty_tiles": sum(len(coords) for coords in self._dirty.values()),
+            "scheduled_expiries": len(self._expiry) if self._expiry is not None else 0,
+            "expired_items": self._expired_items,
+        }
+
+    def enable_expiry(
+        self,
+        loot_ttl: float,
+        gold_ttl: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Habilita el vencimiento individual de items en el suelo.
+
+        Args:
+            loot_ttl: Segundos que dura un item en el suelo (0 = no vence).
+            gold_ttl: Segundos que dura el oro en el suelo (0 = no vence).
+            clock: Reloj de pared en segundos (``spawn_time`` se persiste).
+        """
+        self._loot_ttl = loot_ttl
+        self._gold_ttl = gold_ttl
+        self._clock = clock
+        self._expiry = TimingWheel(clock())
+        for (map_id, x, y), items in self._ground_items.items():
+            for item in items:
+                self._schedule_expiry(map_id, x, y, item)
+
+    @property
+    def expiry_enabled(self) -> bool:
+        """True si los items vencen individualmente."""
+        return self._expiry is not None
+
+    def collect_expired(self) -> dict[int, list[tuple[int, int]]]:
+        """Retira del suelo los items vencidos.
+
+        Las entradas de items que ya no están (recogidos o de mapas descargados)
+        se descartan. Los tiles afectados quedan marcados para persistir.
 
-        await self.ground_items_repo.save_ground_items(map_id, map_items)
+        Returns:
+            Diccionario {map_id: [(x, y)]} con los tiles que perdieron items.
+        """
+        if self._expiry is None:
+            return {}
+
+        touched: dict[int, set[tuple[int, int]]] = {}
+        for map_id, x, y, item in self._expiry.advance(self._clock()):
+            items = self._ground_items.get((map_id, x, y))
+            if not items:
+                continue
+            for index, candidate in enumerate(items):
+                if candidate is item:
+                    del items[index]
+                    break
+            else:
+                continue
+
+            if not items:
+                self._drop_tile(map_id, x, y)
+            self._mark_dirty(map_id, x, y)
+            touched.setdefault(map_id, set()).add((x, y))
+            self._expired_items += 1
+
+        if touched:
+            logger.debug(
+                "Ground items vencidos en %d tiles",
+                sum(len(coords) for coords in touched.values()),
+            )
+        return {map_id: sorted(coords) for map_id, coords in touched.items()}
 
     async def load_ground_items(self, map_id: int) -> None:
         """Carga los ground items de un mapa desde Redis."""
@@ -159,9 +312,69 @@ class GroundItemIndex:
             return
 
         map_items = await self.ground_items_repo.load_ground_items(map_id)
+        tiles = self._tiles_by_map.setdefault(map_id, set())
         for (x, y), items in map_items.items():
             self._ground_items[map_id, x, y] = items
+            tiles.add((x, y))
+            if self._expiry is not None:
+                for item in items:
+                    self._schedule_expiry(map_id, x, y, item)
 
         if map_items:
             total_items = sum(len(items) for items in map_items.values())
             logger.info("Cargados %d items del mapa %d desde Redis", total_items, map_id)
+        elif not tiles:
+            del self._tiles_by_map[map_id]
+
+    async def load_all_ground_items(self) -> int:
+        """Carga los ground items de todos los mapas con items persistidos.
+
+        Returns:
+            Cantidad de mapas cargados.
+        """
+        if not self.ground_items_repo:
+            return 0
+
+        map_ids = await self.ground_items_repo.get_persisted_map_ids()
+        for map_id in map_ids:
+            await self.load_ground_items(map_id)
+        return len(map_ids)
+
+    def _drop_tile(self, map_id: int, x: int, y: int) -> None:
+        self._ground_items.pop((map_id, x, y), None)
+        tiles = self._tiles_by_map.get(map_id)
+        if tiles is not None:
+            tiles.discard((x, y))
+            if not tiles:
+                del self._tiles_by_map[map_id]
+
+    def _schedule_expiry(
+        self, map_id: int, x: int, y: int, item: dict[str, int | str | None]
+    ) -> None:
+        ttl = self._gold_ttl if item.get("item_id") == GOLD_ITEM_ID else self._loot_ttl
+        if ttl <= 0 or self._expiry is None:
+            return
+
+        spawn_time = item.get("spawn_time")
+        if not isinstance(spawn_time, int):
+            spawn_time = int(self._clock())
+            item["spawn_time"] = spawn_time
+        self._expiry.schedule(spawn_time + ttl, (map_id, x, y, item))
+
+    def _mark_dirty(self, map_id: int, x: int, y: int) -> None:
+        if not self.ground_items_repo:
+            return
+
+        self._dirty.setdefault(map_id, set()).add((x, y))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_delay())
+            self._flush_task.add_done_callback(
+                lambda t: t.exception() if not t.cancelled() else None
+            )
+
+    async def _flush_after_delay(self) -> None:
+        # Repetir mientras queden tiles sucios: los marcados durante un flush en
+        # curso o re-marcados tras un error no agendan otra tarea por sí solos.
+        while self._dirty:
+            await asyncio.sleep(self.flush_delay)
+            await self.flush()
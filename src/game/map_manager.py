@@ -1,5 +1,6 @@
 """Gestor de mapas y jugadores para broadcast multijugador."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,14 +10,24 @@ from src.game.exit_index import ExitIndex
 from src.game.ground_item_index import GroundItemIndex
 from src.game.map_manager_spatial import SpatialIndexMixin
 from src.game.map_metadata_loader import MapMetadataLoader
+from src.game.map_residency import (
+    DEFAULT_IDLE_TTL_SECONDS,
+    DEFAULT_MAX_RESIDENT_MAPS,
+    MapResidency,
+)
 from src.game.npc_index import NpcIndex
 from src.game.player_index import PlayerIndex
 from src.game.tile_occupation import TileOccupation
+from src.game.walkability_grid import WalkabilityGrid
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, MutableMapping
+    from collections.abc import Set as AbstractSet
+
     from src.messaging.message_sender import MessageSender
     from src.models.npc import NPC
     from src.repositories.ground_items_repository import GroundItemsRepository
+    from src.services.map.world_snapshot import SnapshotMap
 
 
 logger = logging.getLogger(__name__)
@@ -48,7 +59,9 @@ class MapManager(SpatialIndexMixin):
         """
         # Índice espacial para colisiones
         self._tile_occupation_store = TileOccupation()
-        self._tile_occupation: dict[tuple[int, int, int], str] = self._tile_occupation_store.data
+        self._tile_occupation: MutableMapping[tuple[int, int, int], str] = (
+            self._tile_occupation_store.data
+        )
 
         # Índice de jugadores (mantiene compatibilidad con _players_by_map)
         self._player_index = PlayerIndex(self._tile_occupation_store)
@@ -58,8 +71,8 @@ class MapManager(SpatialIndexMixin):
         self._npc_index = NpcIndex(self._tile_occupation_store)
         self._npcs_by_map = self._npc_index.npcs_by_map
 
-        # Tiles bloqueados por mapa (paredes, agua, etc.)
-        self._blocked_tiles: dict[int, set[tuple[int, int]]] = {}
+        # Tiles bloqueados por mapa (paredes, agua, etc.); sets o vistas del snapshot
+        self._blocked_tiles: dict[int, AbstractSet[tuple[int, int]]] = {}
 
         # Puertas cerradas
         self._door_state = DoorState()
@@ -72,6 +85,9 @@ class MapManager(SpatialIndexMixin):
         # Tamaños de mapas: {map_id: (width, height)}
         self._map_sizes: dict[int, tuple[int, int]] = {}
 
+        # Grillas planas de transitabilidad estática (se arman a demanda)
+        self._walkability: dict[int, WalkabilityGrid] = {}
+
         # Ground items index (compatibilidad con _ground_items)
         self._ground_items_repo = ground_items_repo
         self._ground_index = GroundItemIndex(self.MAX_ITEMS_PER_TILE, ground_items_repo)
@@ -87,6 +103,12 @@ class MapManager(SpatialIndexMixin):
         # Repositorio para persistencia
         self.ground_items_repo = ground_items_repo
 
+        # Residencia de mapas a demanda (None = todos cargados al arrancar)
+        self._residency: MapResidency | None = None
+        self._activation_lock = asyncio.Lock()
+        self._map_load_hooks: list[Callable[[int], Awaitable[object]]] = []
+        self._map_unload_hooks: list[Callable[[int], Awaitable[object]]] = []
+
     def add_player(
         self, map_id: int, user_id: int, message_sender: MessageSender, username: str = ""
     ) -> None:
@@ -100,6 +122,11 @@ class MapManager(SpatialIndexMixin):
         """
         self._player_index.add_player(map_id, user_id, message_sender, username)
 
+        # Entradas que no pasaron por activate_map (muerte, teleports): activar en segundo plano
+        if self._residency is not None and not self._residency.is_active(map_id):
+            task = asyncio.create_task(self.activate_map(map_id))
+            task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
+
     def remove_player(self, map_id: int, user_id: int) -> None:
         """Remueve un jugador de un mapa.
 
@@ -121,6 +148,37 @@ class MapManager(SpatialIndexMixin):
         """
         return self._player_index.get_players_in_map(map_id, exclude_user_id)
 
+    def get_players_in_range(
+        self, map_id: int, x: int, y: int, radius: int, exclude_user_id: int | None = None
+    ) -> list[int]:
+        """Obtiene los user_ids a distancia de Chebyshev <= radius de (x, y).
+
+        Usa la grilla espacial en memoria (mantenida por ``update_player_tile``):
+        el costo es proporcional a los jugadores cercanos, no a los del mapa.
+
+        Args:
+            map_id: ID del mapa.
+            x: Coordenada X del centro.
+            y: Coordenada Y del centro.
+            radius: Radio en tiles (inclusive).
+            exclude_user_id: ID de usuario a excluir (opcional).
+
+        Returns:
+            Lista de user_ids en rango.
+        """
+        return self._player_index.get_players_in_range(map_id, x, y, radius, exclude_user_id)
+
+    def get_player_position(self, user_id: int) -> tuple[int, int, int] | None:
+        """Obtiene la posición en memoria de un jugador online.
+
+        Args:
+            user_id: ID del usuario.
+
+        Returns:
+            Tupla (map_id, x, y) o None si el jugador no tiene tile registrado.
+        """
+        return self._player_index.get_position(user_id)
+
     def get_maps_with_players(self) -> list[int]:
         """Obtiene lista de IDs de mapas que tienen jugadores.
 
@@ -289,6 +347,20 @@ class MapManager(SpatialIndexMixin):
         """
         return list(self._npc_index.get_npcs_in_map(map_id))
 
+    def get_npcs_in_range(self, map_id: int, x: int, y: int, radius: int) -> list[NPC]:
+        """Obtiene los NPCs a distancia de Chebyshev <= radius de (x, y).
+
+        Args:
+            map_id: ID del mapa.
+            x: Coordenada X del centro.
+            y: Coordenada Y del centro.
+            radius: Radio en tiles (inclusive).
+
+        Returns:
+            Lista de NPCs en rango.
+        """
+        return self._npc_index.get_npcs_in_range(map_id, x, y, radius)
+
     def get_all_npcs(self) -> list[NPC]:
         """Obtiene todos los NPCs de todos los mapas.
 
@@ -297,6 +369,17 @@ class MapManager(SpatialIndexMixin):
         """
         return list(self._npc_index.get_all_npcs())
 
+    def get_npc_by_instance_id(self, instance_id: str) -> NPC | None:
+        """Obtiene un NPC vivo por su instance_id (O(1), sin ir a Redis).
+
+        Args:
+            instance_id: ID único de la instancia del NPC.
+
+        Returns:
+            Instancia del NPC o None si no existe.
+        """
+        return self._npc_index.get_npc(instance_id)
+
     def get_npc_by_char_index(self, map_id: int, char_index: int) -> NPC | None:
         """Obtiene un NPC por su CharIndex en un mapa.
 
@@ -343,6 +426,19 @@ class MapManager(SpatialIndexMixin):
         """
         return self._ground_index.get_ground_items(map_id, x, y)
 
+    def get_map_ground_items(
+        self, map_id: int
+    ) -> dict[tuple[int, int], list[dict[str, int | str | None]]]:
+        """Obtiene los tiles con ground items de un mapa.
+
+        Args:
+            map_id: ID del mapa.
+
+        Returns:
+            Diccionario {(x, y): [items]} con costo O(tiles con items del mapa).
+        """
+        return self._ground_index.get_map_tiles(map_id)
+
     def remove_ground_item(
         self, map_id: int, x: int, y: int, item_index: int = 0
     ) -> dict[str, int | str | None] | None:
@@ -399,6 +495,44 @@ class MapManager(SpatialIndexMixin):
         """
         await self._ground_index.persist_ground_items(map_id)
 
+    async def flush_ground_items(self) -> int:
+        """Persiste en Redis los tiles con ground items modificados pendientes.
+
+        Returns:
+            Cantidad de tiles escritos.
+        """
+        return await self._ground_index.flush()
+
+    def enable_ground_item_expiry(self, loot_ttl: float, gold_ttl: float) -> None:
+        """Habilita el vencimiento individual de ground items.
+
+        Args:
+            loot_ttl: Segundos que dura un item en el suelo (0 = no vence).
+            gold_ttl: Segundos que dura el oro en el suelo (0 = no vence).
+        """
+        self._ground_index.enable_expiry(loot_ttl, gold_ttl)
+
+    @property
+    def ground_item_expiry(self) -> bool:
+        """True si los ground items vencen individualmente."""
+        return self._ground_index.expiry_enabled
+
+    def expire_ground_items(self) -> dict[int, list[tuple[int, int]]]:
+        """Retira los ground items vencidos.
+
+        Returns:
+            Diccionario {map_id: [(x, y)]} con los tiles que perdieron items.
+        """
+        return self._ground_index.collect_expired()
+
+    def get_ground_items_metrics(self) -> dict[str, int]:
+        """Métricas del índice de ground items.
+
+        Returns:
+            Métricas de ``GroundItemIndex``.
+        """
+        return self._ground_index.get_metrics()
+
     async def load_ground_items(self, map_id: int) -> None:
         """Carga los ground items de un mapa desde Redis.
 
@@ -407,11 +541,21 @@ class MapManager(SpatialIndexMixin):
         """
         await self._ground_index.load_ground_items(map_id)
 
+    async def load_all_ground_items(self) -> int:
+        """Carga los ground items de todos los mapas con items persistidos en Redis.
+
+        Returns:
+            Cantidad de mapas cargados.
+        """
+        return await self._ground_index.load_all_ground_items()
+
     def load_map_data(self, map_id: int, map_file_path: str | Path) -> None:
         """Carga metadatos y tiles bloqueados de un mapa delegando en el loader."""
         result = self._metadata_loader.load_map_data(map_id, map_file_path)
         self._map_sizes[map_id] = (result.width, result.height)
+        self._tile_occupation_store.set_map_size(map_id, result.width, result.height)
         self._blocked_tiles[map_id] = result.blocked_tiles
+        self._walkability.pop(map_id, None)
         self._exit_index.update(result.exit_tiles)
 
         logger.info(
@@ -423,6 +567,150 @@ class MapManager(SpatialIndexMixin):
             result.exit_count,
         )
 
+    def load_map_snapshot(self, snapshot_map: SnapshotMap) -> None:
+        """Carga un mapa desde el snapshot binario del mundo (sin parsear JSON).
+
+        Los tiles bloqueados quedan como vista sobre el bitplane de colisión.
+
+        Args:
+            snapshot_map: Vista del mapa dentro del snapshot.
+        """
+        map_id = snapshot_map.map_id
+        self._map_sizes[map_id] = (snapshot_map.width, snapshot_map.height)
+        self._tile_occupation_store.set_map_size(map_id, snapshot_map.width, snapshot_map.height)
+        self._blocked_tiles[map_id] = snapshot_map.layer("collision")
+        self._walkability.pop(map_id, None)
+        self._exit_index.update(snapshot_map.exits())
+
+    # Residencia de mapas (carga a demanda)
+
+    def enable_lazy_loading(
+        self,
+        loader: Callable[[int], bool],
+        *,
+        idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS,
+        max_resident: int = DEFAULT_MAX_RESIDENT_MAPS,
+    ) -> None:
+        """Activa la carga a demanda de mapas.
+
+        A partir de acá los datos estáticos de un mapa (tamaño, bloqueados,
+        exits) se cargan con ``loader`` en el primer acceso, y el contenido
+        dinámico (ground items y hooks de carga, p. ej. NPCs) al entrar el
+        primer jugador. ``unload_idle_maps`` descarga los mapas sin jugadores.
+
+        Args:
+            loader: Carga un mapa (p. ej. con ``load_map_snapshot``); retorna False
+                si el mapa no existe.
+            idle_ttl: Segundos sin jugadores antes de descargar un mapa.
+            max_resident: Máximo de mapas residentes (LRU).
+        """
+        self._residency = MapResidency(loader, idle_ttl=idle_ttl, max_resident=max_resident)
+
+    def add_map_lifecycle_hooks(
+        self,
+        on_load: Callable[[int], Awaitable[object]] | None = None,
+        on_unload: Callable[[int], Awaitable[object]] | None = None,
+    ) -> None:
+        """Registra callbacks para la activación y descarga de mapas.
+
+        Args:
+            on_load: Se llama al activar un mapa (después de cargar sus ground items).
+            on_unload: Se llama al descargar un mapa (antes de persistir sus ground items).
+        """
+        if on_load is not None:
+            self._map_load_hooks.append(on_load)
+        if on_unload is not None:
+            self._map_unload_hooks.append(on_unload)
+
+    @property
+    def lazy_loading(self) -> bool:
+        """True si los mapas se cargan a demanda."""
+        return self._residency is not None
+
+    def _ensure_map_resident(self, map_id: int) -> None:
+        if self._residency is not None and map_id not in self._map_sizes:
+            self._residency.ensure(map_id)
+
+    async def activate_map(self, map_id: int) -> None:
+        """Deja un mapa listo para recibir jugadores.
+
+        Carga sus datos estáticos y, la primera vez, sus ground items y los hooks
+        de carga; luego hace prefetch de los mapas vecinos por el grafo de exits.
+        Sin carga a demanda no hace nada.
+
+        Args:
+            map_id: ID del mapa.
+        """
+        residency = self._residency
+        if residency is None or not residency.ensure(map_id):
+            return
+
+        if not residency.is_active(map_id):
+            async with self._activation_lock:
+                if not residency.is_active(map_id):
+                    try:
+                        await self._ground_index.load_ground_items(map_id)
+                        for hook in self._map_load_hooks:
+                            await hook(map_id)
+                    except Exception:
+                        # Sin marcar activo: no se persisten items a medio cargar
+                        logger.exception("Error activando el mapa %d", map_id)
+                        return
+                    residency.mark_active(map_id)
+                    logger.info("Mapa %d activado", map_id)
+
+        residency.prefetch(self._exit_index.get_neighbor_maps(map_id))
+
+    async def unload_idle_maps(self) -> list[int]:
+        """Descarga los mapas sin jugadores vencidos por TTL o excedentes del LRU.
+
+        Returns:
+            Lista de mapas descargados.
+        """
+        residency = self._residency
+        if residency is None:
+            return []
+
+        pinned = set(self.get_maps_with_players())
+        unloaded = residency.collect_idle(pinned)
+        for map_id in unloaded:
+            await self._unload_map(map_id)
+        if unloaded:
+            logger.info("Mapas descargados por inactividad: %s", unloaded)
+        return unloaded
+
+    async def _unload_map(self, map_id: int) -> None:
+        residency = self._residency
+        if residency is None:
+            return
+
+        for hook in self._map_unload_hooks:
+            try:
+                await hook(map_id)
+            except Exception:
+                logger.exception("Error en hook de descarga del mapa %d", map_id)
+
+        # Los ground items solo se cargaron (y se pueden pisar en Redis) si el mapa estuvo activo
+        if residency.is_active(map_id) and self._ground_items_repo is not None:
+            await self._ground_index.persist_ground_items(map_id)
+            self._ground_index.clear_ground_items(map_id)
+
+        self._blocked_tiles.pop(map_id, None)
+        self._map_sizes.pop(map_id, None)
+        self._walkability.pop(map_id, None)
+        self._exit_index.clear_map(map_id)
+        residency.forget(map_id)
+
+    def get_residency_metrics(self) -> dict[str, int | float]:
+        """Métricas de residencia de mapas.
+
+        Returns:
+            Métricas de ``MapResidency`` (vacío si la carga es al arrancar).
+        """
+        if self._residency is None:
+            return {}
+        return self._residency.get_metrics()
+
     def get_map_size(self, map_id: int) -> tuple[int, int]:
         """Obtiene el tamaño de un mapa.
 
@@ -432,8 +720,35 @@ class MapManager(SpatialIndexMixin):
         Returns:
             Tupla (width, height). Si el mapa no está cargado, retorna (100, 100).
         """
+        self._ensure_map_resident(map_id)
         return self._map_sizes.get(map_id, (100, 100))
 
+    def get_walkability(self, map_id: int) -> WalkabilityGrid:
+        """Obtiene la grilla plana de transitabilidad estática de un mapa.
+
+        Se arma la primera vez a partir de los tiles bloqueados y las puertas
+        cerradas; las puertas se mantienen al día con ``block_tile``/``unblock_tile``
+        y recargar el mapa la descarta.
+
+        Args:
+            map_id: ID del mapa.
+
+        Returns:
+            WalkabilityGrid del mapa.
+        """
+        grid = self._walkability.get(map_id)
+        if grid is None:
+            self._ensure_map_resident(map_id)
+            width, height = self.get_map_size(map_id)
+            grid = WalkabilityGrid(
+                width,
+                height,
+                self._blocked_tiles.get(map_id, ()),
+                self._closed_doors.get(map_id, ()),
+            )
+            self._walkability[map_id] = grid
+        return grid
+
     def get_exit_tile(self, map_id: int, x: int, y: int) -> dict[str, int] | None:
         """Verifica si una posición es un tile de exit y retorna su destino.
 
@@ -445,6 +760,7 @@ class MapManager(SpatialIndexMixin):
         Returns:
             Dict con {to_map, to_x, to_y} si es un exit, None si no.
         """
+        self._ensure_map_resident(map_id)
         return self._exit_index.get_exit_tile(map_id, x, y)
 
     def block_tile(self, map_id: int, x: int, y: int) -> None:
@@ -456,6 +772,9 @@ class MapManager(SpatialIndexMixin):
             y: Coordenada Y.
         """
         self._door_state.block(map_id, x, y)
+        grid = self._walkability.get(map_id)
+        if grid is not None:
+            grid.set_door(x, y, closed=True)
 
     def unblock_tile(self, map_id: int, x: int, y: int) -> None:
         """Marca una puerta como abierta (permite movimiento).
@@ -466,6 +785,9 @@ class MapManager(SpatialIndexMixin):
             y: Coordenada Y.
         """
         self._door_state.unblock(map_id, x, y)
+        grid = self._walkability.get(map_id)
+        if grid is not None:
+            grid.set_door(x, y, closed=False)
 
     def is_door_closed(self, map_id: int, x: int, y: int) -> bool:
         """Verifica si hay una puerta cerrada en una posición.
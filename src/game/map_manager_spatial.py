@@ -5,7 +5,12 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Set as AbstractSet
+
+    from src.game.tile_occupation import TileOccupation
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +18,11 @@ logger = logging.getLogger(__name__)
 class SpatialIndexMixin:
     """Mixin para agregar índice espacial al MapManager."""
 
+    _tile_occupation_store: TileOccupation
+
+    def _ensure_map_resident(self, map_id: int) -> None:
+        """Hook para cargar a demanda los datos estáticos del mapa (no-op por defecto)."""
+
     def can_move_to(self, map_id: int, x: int, y: int) -> bool:
         """Verifica si se puede mover a una posición.
 
@@ -24,6 +34,7 @@ class SpatialIndexMixin:
         Returns:
             True si la posición está libre, False si está bloqueada u ocupada.
         """
+        self._ensure_map_resident(map_id)
         map_sizes = cast("dict[int, tuple[int, int]]", getattr(self, "_map_sizes", {}))
         width, height = map_sizes.get(map_id, (100, 100))
 
@@ -32,7 +43,9 @@ class SpatialIndexMixin:
             return False
 
         # Verificar tiles bloqueados (paredes, agua, etc.)
-        blocked_tiles = cast("dict[int, set[tuple[int, int]]]", getattr(self, "_blocked_tiles", {}))
+        blocked_tiles = cast(
+            "dict[int, AbstractSet[tuple[int, int]]]", getattr(self, "_blocked_tiles", {})
+        )
         if map_id in blocked_tiles and (x, y) in blocked_tiles[map_id]:
             return False
 
@@ -42,11 +55,7 @@ class SpatialIndexMixin:
             return False
 
         # Verificar si hay un jugador o NPC en esa posición
-        tile_occupation = cast(
-            "dict[tuple[int, int, int], str]", getattr(self, "_tile_occupation", {})
-        )
-        key = (map_id, x, y)
-        return key not in tile_occupation
+        return not self._tile_occupation_store.is_occupied(map_id, x, y)
 
     def is_tile_occupied(self, map_id: int, x: int, y: int) -> bool:
         """Verifica si un tile está ocupado por un jugador o NPC.
@@ -59,8 +68,7 @@ class SpatialIndexMixin:
         Returns:
             True si está ocupado, False si está libre.
         """
-        key = (map_id, x, y)
-        return key in self._tile_occupation  # type: ignore[attr-defined]
+        return self._tile_occupation_store.is_occupied(map_id, x, y)
 
     def get_tile_occupant(self, map_id: int, x: int, y: int) -> str | None:
         """Obtiene información sobre quién ocupa un tile.
@@ -73,11 +81,7 @@ class SpatialIndexMixin:
         Returns:
             String con formato 'player:user_id' o 'npc:instance_id', o None si está libre.
         """
-        tile_occupation = cast(
-            "dict[tuple[int, int, int], str]", getattr(self, "_tile_occupation", {})
-        )
-        key = (map_id, x, y)
-        return tile_occupation.get(key)
+        return self._tile_occupation_store.get_occupant(map_id, x, y)
 
     def get_tile_block_reason(self, map_id: int, x: int, y: int) -> str | None:
         """Retorna la razón por la que un tile está bloqueado.
@@ -90,25 +94,25 @@ class SpatialIndexMixin:
         Returns:
             Cadena describiendo la causa del bloqueo o ``None`` si el tile está libre.
         """
+        self._ensure_map_resident(map_id)
         map_sizes = cast("dict[int, tuple[int, int]]", getattr(self, "_map_sizes", {}))
         width, height = map_sizes.get(map_id, (100, 100))
         if x < 1 or x > width or y < 1 or y > height:
             return "fuera de límites del mapa"
 
-        blocked_tiles = cast("dict[int, set[tuple[int, int]]]", getattr(self, "_blocked_tiles", {}))
+        blocked_tiles = cast(
+            "dict[int, AbstractSet[tuple[int, int]]]", getattr(self, "_blocked_tiles", {})
+        )
         if map_id in blocked_tiles and (x, y) in blocked_tiles[map_id]:
             return "tile bloqueado del mapa (map_data)"
 
-        tile_occupation = cast(
-            "dict[tuple[int, int, int], str]", getattr(self, "_tile_occupation", {})
-        )
-        occupant = tile_occupation.get((map_id, x, y))
-        if occupant:
-            if occupant.startswith("player:"):
-                return f"ocupado por jugador {occupant.split(':', 1)[1]}"
-            if occupant.startswith("npc:"):
-                return f"ocupado por NPC {occupant.split(':', 1)[1]}"
-            return f"ocupado ({occupant})"
+        occupation = self._tile_occupation_store
+        user_id = occupation.get_player_at(map_id, x, y)
+        if user_id is not None:
+            return f"ocupado por jugador {user_id}"
+        instance_id = occupation.get_npc_at(map_id, x, y)
+        if instance_id is not None:
+            return f"ocupado por NPC {instance_id}"
 
         return None
 
@@ -125,14 +129,13 @@ class SpatialIndexMixin:
             new_x: Nueva coordenada X.
             new_y: Nueva coordenada Y.
         """
-        # Limpiar posición anterior
-        old_key = (map_id, old_x, old_y)
-        if old_key in self._tile_occupation:  # type: ignore[attr-defined]
-            del self._tile_occupation[old_key]  # type: ignore[attr-defined]
+        # Liberar posición anterior y marcar la nueva
+        self._tile_occupation_store.move_player(map_id, old_x, old_y, new_x, new_y, user_id)
 
-        # Marcar nueva posición
-        new_key = (map_id, new_x, new_y)
-        self._tile_occupation[new_key] = f"player:{user_id}"  # type: ignore[attr-defined]
+        # Mantener la grilla de interés (broadcast por rango sin Redis)
+        player_index = getattr(self, "_player_index", None)
+        if player_index is not None:
+            player_index.update_position(user_id, map_id, new_x, new_y)
 
     def update_npc_tile(
         self, instance_id: str, map_id: int, old_x: int, old_y: int, new_x: int, new_y: int
@@ -147,14 +150,12 @@ class SpatialIndexMixin:
             new_x: Nueva coordenada X.
             new_y: Nueva coordenada Y.
         """
-        # Limpiar posición anterior
-        old_key = (map_id, old_x, old_y)
-        if old_key in self._tile_occupation:  # type: ignore[attr-defined]
-            del self._tile_occupation[old_key]  # type: ignore[attr-defined]
-
-        # Marcar nueva posición
-        new_key = (map_id, new_x, new_y)
-        self._tile_occupation[new_key] = f"npc:{instance_id}"  # type: ignore[attr-defined]
+        # Liberar posición anterior y marcar la nueva
+        self._tile_occupation_store.move_npc(map_id, old_x, old_y, new_x, new_y, instance_id)
+
+        npc_index = getattr(self, "_npc_index", None)
+        if npc_index is not None:
+            npc_index.update_position(instance_id, map_id, new_x, new_y)
 
     def load_map_data(self, map_id: int, map_file: str | Path) -> None:
         """Carga datos de un mapa desde archivo JSON.
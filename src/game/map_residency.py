@@ -0,0 +1,202 @@
+"""Residencia de mapas en memoria: carga a demanda, prefetch y descarga por inactividad."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TTL_SECONDS = 300.0
+DEFAULT_MAX_RESIDENT_MAPS = 64
+
+
+class MapResidency:
+    """Registra qué mapas están cargados y elige cuáles descargar.
+
+    Los mapas residentes se guardan en orden LRU con su último uso. ``ensure``
+    carga con ``loader`` los datos estáticos de un mapa ausente y
+    ``collect_idle`` devuelve los mapas a descargar: los que llevan
+    ``idle_ttl`` segundos sin uso y, si aún sobran, los menos usados hasta
+    quedar en ``max_resident``. Los mapas fijados (con jugadores) nunca se eligen.
+
+    Un mapa "activo" además tiene cargado su contenido dinámico (ground items y
+    NPCs); eso lo gestiona ``MapManager``, acá solo se lleva la marca.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int], bool],
+        *,
+        idle_ttl: float = DEFAULT_IDLE_TTL_SECONDS,
+        max_resident: int = DEFAULT_MAX_RESIDENT_MAPS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Inicializa el registro.
+
+        Args:
+            loader: Carga los datos estáticos de un mapa; retorna False si no existe.
+            idle_ttl: Segundos sin uso antes de descargar un mapa.
+            max_resident: Máximo de mapas residentes (se desalojan los menos usados).
+            clock: Reloj monotónico (inyectable para tests).
+        """
+        self._loader = loader
+        self.idle_ttl = idle_ttl
+        self.max_resident = max(1, max_resident)
+        self._clock = clock
+
+        self._last_used: OrderedDict[int, float] = OrderedDict()
+        self._active: set[int] = set()
+        self._unknown: set[int] = set()
+
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._failed_loads = 0
+        self._prefetches = 0
+        self._unloads = 0
+        self._evictions = 0
+        self._load_time_total = 0.0
+
+    def is_resident(self, map_id: int) -> bool:
+        """Indica si los datos estáticos del mapa están cargados.
+
+        Returns:
+            True si el mapa es residente.
+        """
+        return map_id in self._last_used
+
+    def is_active(self, map_id: int) -> bool:
+        """Indica si el contenido dinámico del mapa está cargado.
+
+        Returns:
+            True si el mapa está activo.
+        """
+        return map_id in self._active
+
+    def mark_active(self, map_id: int) -> None:
+        """Marca el contenido dinámico del mapa como cargado."""
+        self._active.add(map_id)
+
+    def resident_maps(self) -> list[int]:
+        """Mapas residentes, del menos al más recientemente usado.
+
+        Returns:
+            Lista de map_ids.
+        """
+        return list(self._last_used)
+
+    def ensure(self, map_id: int) -> bool:
+        """Garantiza que el mapa esté residente, cargándolo si hace falta.
+
+        Returns:
+            True si el mapa está residente, False si el loader no lo conoce.
+        """
+        if map_id in self._last_used:
+            self._hits += 1
+            self.touch(map_id)
+            return True
+        self._misses += 1
+        return self._load(map_id)
+
+    def prefetch(self, map_ids: Iterable[int]) -> int:
+        """Carga por adelantado los mapas que todavía no son residentes.
+
+        Returns:
+            Cantidad de mapas cargados.
+        """
+        loaded = 0
+        for map_id in map_ids:
+            if map_id not in self._last_used and self._load(map_id):
+                loaded += 1
+        self._prefetches += loaded
+        return loaded
+
+    def touch(self, map_id: int) -> None:
+        """Actualiza el último uso de un mapa residente."""
+        if map_id in self._last_used:
+            self._last_used[map_id] = self._clock()
+            self._last_used.move_to_end(map_id)
+
+    def collect_idle(self, pinned: Collection[int]) -> list[int]:
+        """Elige los mapas a descargar.
+
+        Los mapas fijados cuentan como usados ahora, así que su TTL corre
+        desde que se va el último jugador.
+
+        Args:
+            pinned: Mapas que no se pueden descargar (con jugadores).
+
+        Returns:
+            Mapas vencidos por TTL seguidos de los desalojados por el límite LRU.
+        """
+        for map_id in pinned:
+            self.touch(map_id)
+
+        now = self._clock()
+        expired = [
+            map_id
+            for map_id, last_used in self._last_used.items()
+            if map_id not in pinned and now - last_used >= self.idle_ttl
+        ]
+
+        excess = len(self._last_used) - len(expired) - self.max_resident
+        evicted: list[int] = []
+        if excess > 0:
+            expired_set = set(expired)
+            for map_id in self._last_used:
+                if len(evicted) >= excess:
+                    break
+                if map_id not in pinned and map_id not in expired_set:
+                    evicted.append(map_id)
+            self._evictions += len(evicted)
+
+        return expired + evicted
+
+    def forget(self, map_id: int) -> None:
+        """Registra que el mapa fue descargado."""
+        if self._last_used.pop(map_id, None) is not None:
+            self._unloads += 1
+        self._active.discard(map_id)
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Métricas de residencia para diagnóstico.
+
+        Returns:
+            Diccionario con mapas residentes/activos, aciertos, cargas, prefetches,
+            descargas, desalojos LRU y tiempo medio de carga.
+        """
+        return {
+            "resident_maps": len(self._last_used),
+            "active_maps": len(self._active),
+            "max_resident_maps": self.max_resident,
+            "hits": self._hits,
+            "misses": self._misses,
+            "loads": self._loads,
+            "failed_loads": self._failed_loads,
+            "prefetches": self._prefetches,
+            "unloads": self._unloads,
+            "evictions": self._evictions,
+            "avg_load_ms": (self._load_time_total / self._loads * 1000) if self._loads else 0.0,
+        }
+
+    def _load(self, map_id: int) -> bool:
+        if map_id in self._unknown:
+            return False
+
+        start_time = time.perf_counter()
+        if not self._loader(map_id):
+            self._failed_loads += 1
+            self._unknown.add(map_id)
+            logger.debug("Mapa %d no disponible para carga a demanda", map_id)
+            return False
+
+        self._load_time_total += time.perf_counter() - start_time
+        self._loads += 1
+        self._last_used[map_id] = self._clock()
+        return True
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from src.game.spatial_grid import SpatialGrid
+
 if TYPE_CHECKING:
     from src.game.tile_occupation import TileOccupation
     from src.models.npc import NPC
@@ -13,17 +15,25 @@ logger = logging.getLogger(__name__)
 
 
 class NpcIndex:
-    """Gestiona NPCs agrupados por mapa y su ocupación de tiles."""
+    """Gestiona NPCs agrupados por mapa y su ocupación de tiles.
+
+    Es el espejo autoritativo en memoria de los NPCs vivos: además de la
+    agrupación por mapa mantiene índices por ``instance_id`` y por
+    ``(map_id, char_index)`` para búsquedas O(1) sin ir a Redis.
+    """
 
     def __init__(self, tile_occupation: TileOccupation) -> None:
         """Inicializa el índice.
 
         Args:
-            tile_occupation: Diccionario compartido de ocupación de tiles
-                {(map_id, x, y): "npc:<instance_id>" | "player:<user_id>"}.
+            tile_occupation: Ocupación de tiles compartida con PlayerIndex.
         """
         self._tile_occupation = tile_occupation
         self._npcs_by_map: dict[int, dict[str, NPC]] = {}
+        self._by_instance: dict[str, NPC] = {}
+        self._by_char_index: dict[tuple[int, int], NPC] = {}
+        # Posiciones en memoria por instance_id para consultas de proximidad.
+        self._grid: SpatialGrid[str] = SpatialGrid()
 
     @property
     def npcs_by_map(self) -> dict[int, dict[str, NPC]]:
@@ -36,20 +46,24 @@ class NpcIndex:
             self._npcs_by_map[map_id] = {}
 
         self._npcs_by_map[map_id][npc.instance_id] = npc
+        self._by_instance[npc.instance_id] = npc
+        char_index = getattr(npc, "char_index", None)
+        if char_index is not None:
+            self._by_char_index[map_id, char_index] = npc
         self._tile_occupation.occupy_npc(map_id, npc.x, npc.y, npc.instance_id)
+        self._grid.update(npc.instance_id, map_id, npc.x, npc.y)
         logger.debug("NPC %s agregado al mapa %d en tile (%d,%d)", npc.name, map_id, npc.x, npc.y)
 
     def move_npc(
         self, map_id: int, char_index: int, old_x: int, old_y: int, new_x: int, new_y: int
     ) -> None:
         """Mueve un NPC liberando y reasignando ocupación."""
-        if map_id not in self._npcs_by_map:
+        npc = self._by_char_index.get((map_id, char_index))
+        if npc is None:
             return
 
-        for npc in self._npcs_by_map[map_id].values():
-            if getattr(npc, "char_index", None) == char_index:
-                self._tile_occupation.move_npc(map_id, old_x, old_y, new_x, new_y, npc.instance_id)
-                break
+        self._tile_occupation.move_npc(map_id, old_x, old_y, new_x, new_y, npc.instance_id)
+        self._grid.update(npc.instance_id, map_id, new_x, new_y)
 
     def remove_npc(self, map_id: int, instance_id: str) -> None:
         """Remueve un NPC y libera su tile."""
@@ -60,18 +74,42 @@ class NpcIndex:
         if npc is None:
             return
 
-        tile_key = (map_id, npc.x, npc.y)
-        if self._tile_occupation.get_occupant(*tile_key) is not None:
-            self._tile_occupation.remove_npc(map_id, npc.x, npc.y)
-            logger.debug("Tile (%d,%d) liberado al remover NPC %s", npc.x, npc.y, npc.name)
+        # Libera los tiles de esta instancia (índice inverso, sin tocar a otros ocupantes)
+        self._tile_occupation.remove_npc_by_instance(instance_id, map_id)
+        logger.debug("Tile (%d,%d) liberado al remover NPC %s", npc.x, npc.y, npc.name)
 
         del self._npcs_by_map[map_id][instance_id]
+        if self._by_instance.get(instance_id) is npc:
+            del self._by_instance[instance_id]
+        char_index = getattr(npc, "char_index", None)
+        if char_index is not None and self._by_char_index.get((map_id, char_index)) is npc:
+            del self._by_char_index[map_id, char_index]
+        self._grid.remove(instance_id, map_id)
         logger.debug("NPC %s removido del mapa %d", npc.name, map_id)
 
         if not self._npcs_by_map[map_id]:
             del self._npcs_by_map[map_id]
             logger.debug("Mapa %d eliminado (sin NPCs)", map_id)
 
+    def update_position(self, instance_id: str, map_id: int, x: int, y: int) -> None:
+        """Registra la posición actual de un NPC en la grilla espacial."""
+        self._grid.update(instance_id, map_id, x, y)
+
+    def get_npcs_in_range(self, map_id: int, x: int, y: int, radius: int) -> list[NPC]:
+        """NPCs a distancia de Chebyshev <= radius de (x, y) en el mapa.
+
+        Returns:
+            list[NPC]: NPCs en rango.
+        """
+        npcs = self._npcs_by_map.get(map_id)
+        if not npcs:
+            return []
+        return [
+            npcs[instance_id]
+            for instance_id in self._grid.query_range(map_id, x, y, radius)
+            if instance_id in npcs
+        ]
+
     def get_npcs_in_map(self, map_id: int) -> list[NPC]:
         """Devuelve los NPCs de un mapa.
 
@@ -88,10 +126,15 @@ class NpcIndex:
         Returns:
             list[NPC | SimpleNamespace]: NPCs de todos los mapas.
         """
-        all_npcs: list[NPC] = []
-        for npcs_in_map in self._npcs_by_map.values():
-            all_npcs.extend(npcs_in_map.values())
-        return all_npcs
+        return list(self._by_instance.values())
+
+    def get_npc(self, instance_id: str) -> NPC | None:
+        """Busca un NPC por instance_id en todos los mapas.
+
+        Returns:
+            NPC | None: NPC encontrado o None si no existe.
+        """
+        return self._by_instance.get(instance_id)
 
     def get_npc_by_char_index(self, map_id: int, char_index: int) -> NPC | None:
         """Busca un NPC por char_index en un mapa.
@@ -99,10 +142,4 @@ class NpcIndex:
         Returns:
             NPC | SimpleNamespace | None: NPC encontrado o None si no existe.
         """
-        if map_id not in self._npcs_by_map:
-            return None
-
-        for npc in self._npcs_by_map[map_id].values():
-            if getattr(npc, "char_index", None) == char_index:
-                return npc
-        return None
+        return self._by_char_index.get((map_id, char_index))
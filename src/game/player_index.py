@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from src.game.spatial_grid import SpatialGrid
+
 if TYPE_CHECKING:
     from src.game.tile_occupation import TileOccupation
     from src.messaging.message_sender import MessageSender
@@ -19,10 +21,12 @@ class PlayerIndex:
         """Inicializa el índice.
 
         Args:
-            tile_occupation: Diccionario compartido de ocupación de tiles.
+            tile_occupation: Ocupación de tiles compartida con NpcIndex.
         """
         self._tile_occupation = tile_occupation
         self._players_by_map: dict[int, dict[int, tuple[MessageSender, str]]] = {}
+        # Posiciones en memoria para consultas "quién ve (x, y)" sin Redis.
+        self._grid: SpatialGrid[int] = SpatialGrid()
 
     @property
     def players_by_map(self) -> dict[int, dict[int, tuple[MessageSender, str]]]:
@@ -44,6 +48,7 @@ class PlayerIndex:
             return
 
         self._tile_occupation.remove_player(user_id, map_id)
+        self._grid.remove(user_id, map_id)
         logger.debug("Tiles liberados para jugador %d en mapa %d", user_id, map_id)
 
         del self._players_by_map[map_id][user_id]
@@ -60,6 +65,7 @@ class PlayerIndex:
             if user_id not in players:
                 continue
             self._tile_occupation.remove_player(user_id, map_id)
+            self._grid.remove(user_id, map_id)
             del players[user_id]
             logger.debug("Jugador %d removido del mapa %d", user_id, map_id)
             if not players:
@@ -69,6 +75,31 @@ class PlayerIndex:
             del self._players_by_map[map_id]
             logger.debug("Mapa %d eliminado (sin jugadores)", map_id)
 
+    def update_position(self, user_id: int, map_id: int, x: int, y: int) -> None:
+        """Registra la posición actual de un jugador en la grilla espacial."""
+        self._grid.update(user_id, map_id, x, y)
+
+    def get_position(self, user_id: int) -> tuple[int, int, int] | None:
+        """Posición en memoria de un jugador.
+
+        Returns:
+            tuple[int, int, int] | None: (map_id, x, y) o None si no está registrada.
+        """
+        return self._grid.get_position(user_id)
+
+    def get_players_in_range(
+        self, map_id: int, x: int, y: int, radius: int, exclude_user_id: int | None = None
+    ) -> list[int]:
+        """user_ids a distancia de Chebyshev <= radius de (x, y) en el mapa.
+
+        Returns:
+            list[int]: jugadores en rango, sin consultar Redis.
+        """
+        players = self._grid.query_range(map_id, x, y, radius)
+        if exclude_user_id is not None and exclude_user_id in players:
+            players.remove(exclude_user_id)
+        return players
+
     def get_players_in_map(self, map_id: int, exclude_user_id: int | None = None) -> list[int]:
         """Lista de user_ids en un mapa (opcionalmente excluyendo uno).
 
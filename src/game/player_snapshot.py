@@ -0,0 +1,67 @@
+"""Snapshot columnar de los jugadores vivos de un mapa.
+
+La IA de NPCs hostiles busca, para cada NPC, el jugador vivo más cercano dentro
+de su rango de agresión. En lugar de consultar posición y HP de cada jugador
+por cada NPC, una pasada de IA arma un snapshot por mapa (una vez) y todos los
+NPCs del mapa lo comparten. Las columnas son ``array('i')`` contiguos, así la
+búsqueda recorre enteros compactos sin diccionarios ni awaits.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+
+class MapPlayerSnapshot:
+    """Posiciones de los jugadores vivos de un mapa en columnas paralelas."""
+
+    __slots__ = ("_user_ids", "_xs", "_ys", "map_id")
+
+    def __init__(self, map_id: int) -> None:
+        """Inicializa un snapshot vacío.
+
+        Args:
+            map_id: Mapa al que pertenecen las posiciones.
+        """
+        self.map_id = map_id
+        self._user_ids = array("i")
+        self._xs = array("i")
+        self._ys = array("i")
+
+    def add(self, user_id: int, x: int, y: int) -> None:
+        """Agrega un jugador vivo al snapshot."""
+        self._user_ids.append(user_id)
+        self._xs.append(x)
+        self._ys.append(y)
+
+    def __len__(self) -> int:
+        """Cantidad de jugadores en el snapshot.
+
+        Returns:
+            Jugadores vivos registrados.
+        """
+        return len(self._user_ids)
+
+    def nearest(self, x: int, y: int, max_range: int) -> tuple[int, int, int] | None:
+        """Jugador más cercano a (x, y) por distancia Manhattan.
+
+        Ante empates gana el primero agregado.
+
+        Args:
+            x: Coordenada X de origen.
+            y: Coordenada Y de origen.
+            max_range: Distancia Manhattan máxima (inclusive).
+
+        Returns:
+            Tupla (user_id, x, y) del jugador más cercano en rango, o None.
+        """
+        best_index = -1
+        best_distance = max_range + 1
+        for index, (px, py) in enumerate(zip(self._xs, self._ys, strict=True)):
+            distance = abs(px - x) + abs(py - y)
+            if distance < best_distance:
+                best_distance = distance
+                best_index = index
+        if best_index < 0:
+            return None
+        return (self._user_ids[best_index], self._xs[best_index], self._ys[best_index])
@@ -0,0 +1,126 @@
+"""Grilla espacial en memoria para consultas de proximidad por mapa.
+
+Divide cada mapa en celdas cuadradas de ``cell_size`` tiles y guarda qué
+entidades hay en cada celda. Una consulta "entidades a distancia <= r de
+(x, y)" solo recorre las celdas que tocan el cuadrado de radio ``r`` (con el
+rango visible de 15 tiles y celdas de 16, a lo sumo 3x3 celdas), en lugar de
+todas las entidades del mapa.
+
+Las posiciones viven solo en memoria: se actualizan desde el índice espacial
+de ``MapManager`` (``update_player_tile``/``update_npc_tile``) y nunca se
+consultan a Redis.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+# Tamaño de celda por defecto: apenas mayor que VISIBLE_RANGE (15) para que
+# una consulta de rango visible cubra como máximo 3x3 celdas.
+DEFAULT_CELL_SIZE = 16
+
+
+class SpatialGrid[K: Hashable]:
+    """Buckets de entidades por (map_id, celda_x, celda_y)."""
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """Inicializa la grilla vacía.
+
+        Args:
+            cell_size: Lado de cada celda en tiles.
+        """
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int, int], set[K]] = {}
+        self._positions: dict[K, tuple[int, int, int]] = {}
+
+    def _cell_key(self, map_id: int, x: int, y: int) -> tuple[int, int, int]:
+        return (map_id, x // self._cell_size, y // self._cell_size)
+
+    def update(self, entity: K, map_id: int, x: int, y: int) -> None:
+        """Inserta o mueve una entidad a (map_id, x, y).
+
+        Args:
+            entity: Identificador de la entidad (user_id, instance_id, ...).
+            map_id: ID del mapa.
+            x: Coordenada X.
+            y: Coordenada Y.
+        """
+        new_cell = self._cell_key(map_id, x, y)
+        old_position = self._positions.get(entity)
+        if old_position is not None:
+            old_cell = self._cell_key(*old_position)
+            if old_cell != new_cell:
+                self._discard_from_cell(old_cell, entity)
+                self._cells.setdefault(new_cell, set()).add(entity)
+        else:
+            self._cells.setdefault(new_cell, set()).add(entity)
+        self._positions[entity] = (map_id, x, y)
+
+    def remove(self, entity: K, map_id: int | None = None) -> None:
+        """Quita una entidad de la grilla.
+
+        Args:
+            entity: Identificador de la entidad.
+            map_id: Si se indica, solo se quita cuando la entidad está en ese mapa
+                (evita borrar la posición nueva si el alta en el mapa destino
+                llegó antes que la baja del mapa origen).
+        """
+        position = self._positions.get(entity)
+        if position is None or (map_id is not None and position[0] != map_id):
+            return
+        del self._positions[entity]
+        self._discard_from_cell(self._cell_key(*position), entity)
+
+    def get_position(self, entity: K) -> tuple[int, int, int] | None:
+        """Devuelve (map_id, x, y) de una entidad, o None si no está registrada.
+
+        Returns:
+            Tupla (map_id, x, y) o None.
+        """
+        return self._positions.get(entity)
+
+    def query_range(self, map_id: int, x: int, y: int, radius: int) -> list[K]:
+        """Entidades del mapa a distancia de Chebyshev <= ``radius`` de (x, y).
+
+        Args:
+            map_id: ID del mapa.
+            x: Coordenada X del centro.
+            y: Coordenada Y del centro.
+            radius: Radio en tiles (inclusive).
+
+        Returns:
+            Lista de entidades en rango (sin orden definido).
+        """
+        size = self._cell_size
+        min_cx, max_cx = (x - radius) // size, (x + radius) // size
+        min_cy, max_cy = (y - radius) // size, (y + radius) // size
+        cells = self._cells
+        positions = self._positions
+
+        found: list[K] = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((map_id, cx, cy))
+                if not bucket:
+                    continue
+                for entity in bucket:
+                    _, ex, ey = positions[entity]
+                    if abs(ex - x) <= radius and abs(ey - y) <= radius:
+                        found.append(entity)
+        return found
+
+    def __len__(self) -> int:
+        """Cantidad total de entidades registradas.
+
+        Returns:
+            Número de entidades con posición en la grilla.
+        """
+        return len(self._positions)
+
+    def _discard_from_cell(self, cell: tuple[int, int, int], entity: K) -> None:
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            return
+        bucket.discard(entity)
+        if not bucket:
+            del self._cells[cell]
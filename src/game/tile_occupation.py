@@ -1,24 +1,76 @@
-"""Índice de ocupación de tiles (jugadores y NPCs)."""
+"""Índice de ocupación de tiles (jugadores y NPCs).
+
+Cada mapa guarda un ``array('i')`` plano de ``width * height`` con el código
+del ocupante de cada tile (0 = libre): los jugadores se codifican con su
+``user_id`` (> 0) y los NPCs con un código negativo asignado a su
+``instance_id`` mientras ocupan algún tile. El índice inverso
+``ocupante -> tiles`` hace O(1) las bajas por jugador o instancia (antes se
+recorría todo el mundo buscando la etiqueta) y ``clear_map`` solo recorre la
+grilla de ese mapa.
+
+Las etiquetas ``"player:<user_id>"``/``"npc:<instance_id>"`` se arman solo en
+la API de compatibilidad (``get_occupant`` y la vista ``data``).
+"""
 
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from array import array
+from collections.abc import Iterator, MutableMapping
 
 logger = logging.getLogger(__name__)
 
+# Tamaño de mapa asumido hasta que se carga el real (igual que MapManager)
+DEFAULT_MAP_SIZE = 100
+
+_PLAYER_PREFIX = "player:"
+_NPC_PREFIX = "npc:"
+
+
+class _MapCells:
+    """Grilla plana de códigos de ocupante de un mapa."""
+
+    __slots__ = ("cells", "height", "width")
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.cells = array("i", bytes(4 * width * height))
+
 
 class TileOccupation:
     """Gestiona ocupación de tiles para jugadores y NPCs."""
 
     def __init__(self) -> None:
         """Inicializa el storage interno."""
-        self._data: dict[tuple[int, int, int], str] = {}
+        self._maps: dict[int, _MapCells] = {}
+        self._map_sizes: dict[int, tuple[int, int]] = {}
+        # Tiles fuera de la grilla del mapa (coordenadas inválidas); casi siempre vacío
+        self._overflow: dict[tuple[int, int, int], int] = {}
+        self._tiles_by_occupant: dict[int, list[tuple[int, int, int]]] = {}
+        self._npc_codes: dict[str, int] = {}
+        self._npc_ids: dict[int, str] = {}
+        self._next_npc_code = -1
+        self._view = _OccupationView(self)
 
     @property
-    def data(self) -> dict[tuple[int, int, int], str]:
-        """Acceso directo al storage (compatibilidad)."""
-        return self._data
+    def data(self) -> MutableMapping[tuple[int, int, int], str]:
+        """Vista ``{(map_id, x, y): etiqueta}`` sobre la ocupación (compatibilidad)."""
+        return self._view
+
+    def set_map_size(self, map_id: int, width: int, height: int) -> None:
+        """Registra el tamaño real de un mapa (reubica la grilla si ya existía)."""
+        if self._map_sizes.get(map_id) == (width, height):
+            return
+        self._map_sizes[map_id] = (width, height)
+        grid = self._maps.pop(map_id, None)
+        if grid is None:
+            return
+        entries = list(self._iter_map(map_id, grid))
+        for key, _ in entries:
+            self._overflow.pop(key, None)
+        for (_, x, y), code in entries:
+            self._store(map_id, x, y, code)
 
     def is_occupied(self, map_id: int, x: int, y: int) -> bool:
         """Devuelve True si el tile está ocupado.
@@ -26,7 +78,7 @@ class TileOccupation:
         Returns:
             bool: True si está ocupado, False en caso contrario.
         """
-        return (map_id, x, y) in self._data
+        return self._code_at(map_id, x, y) != 0
 
     def get_occupant(self, map_id: int, x: int, y: int) -> str | None:
         """Retorna la etiqueta del ocupante o None.
@@ -34,7 +86,26 @@ class TileOccupation:
         Returns:
             str | None: Etiqueta del ocupante o None.
         """
-        return self._data.get((map_id, x, y))
+        code = self._code_at(map_id, x, y)
+        return self._label(code) if code else None
+
+    def get_player_at(self, map_id: int, x: int, y: int) -> int | None:
+        """Retorna el user_id del jugador que ocupa el tile.
+
+        Returns:
+            int | None: user_id o None si está libre u ocupado por un NPC.
+        """
+        code = self._code_at(map_id, x, y)
+        return code if code > 0 else None
+
+    def get_npc_at(self, map_id: int, x: int, y: int) -> str | None:
+        """Retorna el instance_id del NPC que ocupa el tile.
+
+        Returns:
+            str | None: instance_id o None si está libre u ocupado por un jugador.
+        """
+        code = self._code_at(map_id, x, y)
+        return self._npc_ids.get(code) if code < 0 else None
 
     def occupy_npc(self, map_id: int, x: int, y: int, instance_id: str) -> None:
         """Marca tile para un NPC, fallando si está ocupado.
@@ -42,55 +113,193 @@ class TileOccupation:
         Raises:
             ValueError: si el tile ya está ocupado.
         """
-        key = (map_id, x, y)
-        if key in self._data:
-            occupant = self._data[key]
-            msg = f"tile ya ocupado por {occupant}"
+        occupant = self._code_at(map_id, x, y)
+        if occupant:
+            msg = f"tile ya ocupado por {self._label(occupant)}"
             raise ValueError(msg)
-        self._data[key] = f"npc:{instance_id}"
+        self._place(map_id, x, y, self._npc_code(instance_id))
 
     def move_npc(
         self, map_id: int, old_x: int, old_y: int, new_x: int, new_y: int, instance_id: str
     ) -> None:
         """Mueve un NPC liberando el tile anterior."""
-        old_key = (map_id, old_x, old_y)
-        self._data.pop(old_key, None)
-        self._data[map_id, new_x, new_y] = f"npc:{instance_id}"
+        self._move(map_id, old_x, old_y, new_x, new_y, self._npc_code(instance_id))
 
     def remove_npc(self, map_id: int, x: int, y: int) -> None:
         """Libera un tile ocupado por NPC (si existe)."""
-        self._data.pop((map_id, x, y), None)
+        self._clear(map_id, x, y)
 
     def remove_npc_by_instance(self, instance_id: str, map_id: int | None = None) -> None:
         """Libera tiles ocupados por una instancia de NPC."""
-        self._remove_by_prefix(f"npc:{instance_id}", map_id)
+        code = self._npc_codes.get(instance_id)
+        if code is not None:
+            self._remove_occupant(code, map_id)
 
     def remove_player(self, user_id: int, map_id: int | None = None) -> None:
         """Libera tiles ocupados por un jugador."""
-        self._remove_by_prefix(f"player:{user_id}", map_id)
+        self._remove_occupant(user_id, map_id)
 
     def occupy_player(self, map_id: int, x: int, y: int, user_id: int) -> None:
         """Marca tile para un jugador (sobrescribe si existía)."""
-        self._data[map_id, x, y] = f"player:{user_id}"
+        self._place(map_id, x, y, user_id)
 
     def move_player(
         self, map_id: int, old_x: int, old_y: int, new_x: int, new_y: int, user_id: int
     ) -> None:
         """Mueve un jugador liberando tile previo."""
-        old_key = (map_id, old_x, old_y)
-        self._data.pop(old_key, None)
-        self._data[map_id, new_x, new_y] = f"player:{user_id}"
-
-    def _remove_by_prefix(self, prefix: str, map_id: int | None) -> None:
-        keys_to_remove: list[tuple[int, int, int]] = []
-        for key, occupant in self._data.items():
-            if (map_id is None or key[0] == map_id) and occupant == prefix:
-                keys_to_remove.append(key)
-        for key in keys_to_remove:
-            self._data.pop(key, None)
+        self._move(map_id, old_x, old_y, new_x, new_y, user_id)
 
     def clear_map(self, map_id: int) -> None:
         """Limpia todas las ocupaciones de un mapa."""
-        keys_to_remove: Iterable[tuple[int, int, int]] = [k for k in self._data if k[0] == map_id]
-        for key in list(keys_to_remove):
-            self._data.pop(key, None)
+        grid = self._maps.pop(map_id, None)
+        entries = list(self._iter_map(map_id, grid))
+        for key, code in entries:
+            self._overflow.pop(key, None)
+            self._forget_tile(code, key)
+
+    def __len__(self) -> int:
+        """Cantidad de tiles ocupados.
+
+        Returns:
+            int: Tiles ocupados en todos los mapas.
+        """
+        return sum(len(tiles) for tiles in self._tiles_by_occupant.values())
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        """Itera los tiles ocupados.
+
+        Yields:
+            Claves (map_id, x, y) ocupadas.
+        """
+        for tiles in list(self._tiles_by_occupant.values()):
+            yield from tiles
+
+    def _code_at(self, map_id: int, x: int, y: int) -> int:
+        grid = self._maps.get(map_id)
+        if grid is not None and 0 < x <= grid.width and 0 < y <= grid.height:
+            return grid.cells[(y - 1) * grid.width + (x - 1)]
+        return self._overflow.get((map_id, x, y), 0) if self._overflow else 0
+
+    def _store(self, map_id: int, x: int, y: int, code: int) -> None:
+        grid = self._maps.get(map_id)
+        if grid is None:
+            width, height = self._map_sizes.get(map_id, (DEFAULT_MAP_SIZE, DEFAULT_MAP_SIZE))
+            grid = self._maps[map_id] = _MapCells(width, height)
+        if 0 < x <= grid.width and 0 < y <= grid.height:
+            grid.cells[(y - 1) * grid.width + (x - 1)] = code
+        elif code:
+            self._overflow[map_id, x, y] = code
+        else:
+            self._overflow.pop((map_id, x, y), None)
+
+    def _place(self, map_id: int, x: int, y: int, code: int) -> None:
+        previous = self._code_at(map_id, x, y)
+        if previous == code:
+            return
+        key = (map_id, x, y)
+        if previous:
+            self._forget_tile(previous, key)
+        self._store(map_id, x, y, code)
+        self._tiles_by_occupant.setdefault(code, []).append(key)
+
+    def _clear(self, map_id: int, x: int, y: int) -> None:
+        previous = self._code_at(map_id, x, y)
+        if previous:
+            self._store(map_id, x, y, 0)
+            self._forget_tile(previous, (map_id, x, y))
+
+    def _move(self, map_id: int, old_x: int, old_y: int, new_x: int, new_y: int, code: int) -> None:
+        # Ocupar primero el destino para no liberar el código del NPC en el medio
+        self._place(map_id, new_x, new_y, code)
+        if (old_x, old_y) != (new_x, new_y):
+            self._clear(map_id, old_x, old_y)
+
+    def _remove_occupant(self, code: int, map_id: int | None) -> None:
+        for key in list(self._tiles_by_occupant.get(code, ())):
+            if map_id is None or key[0] == map_id:
+                self._clear(*key)
+
+    def _forget_tile(self, code: int, key: tuple[int, int, int]) -> None:
+        tiles = self._tiles_by_occupant.get(code)
+        if tiles is None:
+            return
+        if key in tiles:
+            tiles.remove(key)
+        if not tiles:
+            del self._tiles_by_occupant[code]
+            if code < 0:
+                # El NPC ya no ocupa nada: libera su código
+                instance_id = self._npc_ids.pop(code, None)
+                if instance_id is not None:
+                    self._npc_codes.pop(instance_id, None)
+
+    def _npc_code(self, instance_id: str) -> int:
+        code = self._npc_codes.get(instance_id)
+        if code is None:
+            code = self._next_npc_code
+            self._next_npc_code -= 1
+            self._npc_codes[instance_id] = code
+            self._npc_ids[code] = instance_id
+        return code
+
+    def _label(self, code: int) -> str:
+        if code > 0:
+            return f"{_PLAYER_PREFIX}{code}"
+        return f"{_NPC_PREFIX}{self._npc_ids.get(code, code)}"
+
+    def _iter_map(
+        self, map_id: int, grid: _MapCells | None
+    ) -> Iterator[tuple[tuple[int, int, int], int]]:
+        if grid is not None:
+            width = grid.width
+            for index, code in enumerate(grid.cells):
+                if code:
+                    y, x = divmod(index, width)
+                    yield (map_id, x + 1, y + 1), code
+        for key, code in list(self._overflow.items()):
+            if key[0] == map_id:
+                yield key, code
+
+
+class _OccupationView(MutableMapping[tuple[int, int, int], str]):
+    """Vista tipo diccionario de la ocupación con etiquetas de texto."""
+
+    __slots__ = ("_occupation",)
+
+    def __init__(self, occupation: TileOccupation) -> None:
+        self._occupation = occupation
+
+    def __getitem__(self, key: tuple[int, int, int]) -> str:
+        occupant = self._occupation.get_occupant(*key)
+        if occupant is None:
+            raise KeyError(key)
+        return occupant
+
+    def __setitem__(self, key: tuple[int, int, int], occupant: str) -> None:
+        if occupant.startswith(_PLAYER_PREFIX):
+            self._occupation.occupy_player(*key, int(occupant.removeprefix(_PLAYER_PREFIX)))
+            return
+        if occupant.startswith(_NPC_PREFIX):
+            # Como en un dict, la asignación pisa al ocupante anterior
+            self._occupation.remove_npc(*key)
+            self._occupation.occupy_npc(*key, occupant.removeprefix(_NPC_PREFIX))
+            return
+        msg = f"etiqueta de ocupante inválida: {occupant}"
+        raise ValueError(msg)
+
+    def __delitem__(self, key: tuple[int, int, int]) -> None:
+        if not self._occupation.is_occupied(*key):
+            raise KeyError(key)
+        self._occupation.remove_npc(*key)
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 3:  # noqa: PLR2004
+            return False
+        map_id, x, y = key
+        return self._occupation.is_occupied(map_id, x, y)
+
+    def __iter__(self) -> Iterator[tuple[int, int, int]]:
+        return iter(self._occupation)
+
+    def __len__(self) -> int:
+        return len(self._occupation)
@@ -0,0 +1,191 @@
+"""Scheduler de timers por deadline sobre un min-heap, avanzado por el game tick."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.utils.latency_histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Compactar el heap cuando los cancelados superan este mínimo y la mitad del heap
+COMPACT_MIN_CANCELLED = 64
+
+
+class TimerHandle:
+    """Timer agendado; permite cancelarlo antes de que venza."""
+
+    __slots__ = ("_cancelled", "_scheduler", "args", "callback", "when")
+
+    def __init__(
+        self,
+        when: float,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+        scheduler: TimerScheduler,
+    ) -> None:
+        """Inicializa el handle.
+
+        Args:
+            when: Deadline (reloj del scheduler).
+            callback: Función o corrutina a ejecutar al vencer.
+            args: Argumentos posicionales del callback.
+            scheduler: Scheduler que agendó el timer.
+        """
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self._scheduler: TimerScheduler | None = scheduler
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        """True si el timer fue cancelado."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancela el timer (no-op si ya venció o ya estaba cancelado)."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        if self._scheduler is not None:
+            self._scheduler._on_cancel()  # noqa: SLF001
+            self._scheduler = None
+
+
+class TimerScheduler:
+    """Agenda callbacks por deadline y los ejecuta en lote en cada tick.
+
+    Los timers viven en un min-heap ordenado por ``(deadline, secuencia)``:
+    agendar cuesta O(log n) y ``run_due`` saca los vencidos en O(k log n). La
+    cancelación es perezosa (el handle queda marcado y se descarta al salir del
+    heap); si los cancelados pasan a ser mayoría el heap se compacta.
+
+    Los callbacks pueden ser funciones o corrutinas: las corrutinas de un mismo
+    lote se ejecutan juntas con ``asyncio.gather`` y un error en una no afecta al
+    resto. Los timers agendados durante un lote se ejecutan en el lote siguiente.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        """Inicializa el scheduler.
+
+        Args:
+            clock: Reloj de pared en segundos (mismo reloj que los deadlines).
+        """
+        self.clock = clock
+        self._heap: list[tuple[float, int, TimerHandle]] = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+        self._executed = 0
+        self._errors = 0
+        self._lateness = LatencyHistogram()
+
+    def __len__(self) -> int:
+        """Cantidad de timers pendientes.
+
+        Returns:
+            Timers agendados que no vencieron ni fueron cancelados.
+        """
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, when: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:  # noqa: ANN401
+        """Agenda ``callback(*args)`` para el deadline ``when``.
+
+        Un deadline ya pasado se ejecuta en el próximo ``run_due``.
+
+        Returns:
+            Handle del timer.
+        """
+        handle = TimerHandle(when, callback, args, self)
+        heapq.heappush(self._heap, (when, next(self._sequence), handle))
+        return handle
+
+    def call_later(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:  # noqa: ANN401
+        """Agenda ``callback(*args)`` dentro de ``delay`` segundos.
+
+        Returns:
+            Handle del timer.
+        """
+        return self.call_at(self.clock() + delay, callback, *args)
+
+    async def run_due(self, now: float | None = None) -> int:
+        """Ejecuta los timers vencidos.
+
+        Args:
+            now: Tiempo actual (default: el reloj del scheduler).
+
+        Returns:
+            Cantidad de timers ejecutados.
+        """
+        if now is None:
+            now = self.clock()
+
+        due: list[TimerHandle] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, handle = heapq.heappop(heap)
+            if handle.cancelled:
+                self._cancelled -= 1
+                continue
+            handle._scheduler = None  # noqa: SLF001
+            due.append(handle)
+
+        if not due:
+            return 0
+
+        pending: list[Awaitable[Any]] = []
+        for handle in due:
+            self._lateness.record((now - handle.when) * 1000)
+            try:
+                result = handle.callback(*handle.args)
+            except Exception:
+                self._errors += 1
+                logger.exception("Error ejecutando timer %r", handle.callback)
+                continue
+            if inspect.isawaitable(result):
+                pending.append(result)
+
+        if pending:
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    self._errors += 1
+                    logger.error("Error ejecutando timer", exc_info=result)
+
+        self._executed += len(due)
+        return len(due)
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Métricas del scheduler para diagnóstico.
+
+        Returns:
+            Diccionario con timers pendientes, ejecutados, con error, entradas
+            canceladas aún en el heap y retraso de ejecución (ms) respecto del
+            deadline.
+        """
+        lateness = self._lateness.summary()
+        return {
+            "pending": len(self),
+            "executed": self._executed,
+            "errors": self._errors,
+            "cancelled_in_heap": self._cancelled,
+            "lateness_avg_ms": lateness["avg_time_ms"],
+            "lateness_p99_ms": lateness["p99_ms"],
+            "lateness_max_ms": lateness["max_time_ms"],
+        }
+
+    def _on_cancel(self) -> None:
+        self._cancelled += 1
+        if self._cancelled > COMPACT_MIN_CANCELLED and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
@@ -0,0 +1,126 @@
+"""Timing wheel jerárquica para vencimientos masivos con costo O(vencidos)."""
+
+from __future__ import annotations
+
+import math
+
+DEFAULT_SLOT_BITS = 6  # 64 slots por nivel
+DEFAULT_LEVELS = 3  # 64 ** 3 ticks (~73h con resolución de 1s)
+
+
+class TimingWheel[T]:
+    """Agenda valores por deadline y los devuelve al vencer.
+
+    Cada nivel tiene ``2 ** slot_bits`` slots; el nivel 0 avanza un slot por
+    tick (``resolution`` segundos) y cada nivel superior cubre un rango
+    ``2 ** slot_bits`` veces mayor. Una entrada se guarda en el nivel más bajo
+    que comparte bloque con el tick actual y baja de nivel ("cascada") cuando
+    el nivel inferior da la vuelta. Los deadlines fuera de rango esperan en una
+    lista de overflow que se reubica cada vez que el nivel superior da la vuelta.
+
+    Agendar es O(1) y ``advance`` cuesta O(ticks avanzados + vencidos +
+    entradas que bajan de nivel). No hay cancelación: quien agenda debe
+    ignorar los valores que ya no apliquen al vencer (borrado perezoso).
+    """
+
+    def __init__(
+        self,
+        start: float,
+        *,
+        resolution: float = 1.0,
+        slot_bits: int = DEFAULT_SLOT_BITS,
+        levels: int = DEFAULT_LEVELS,
+    ) -> None:
+        """Inicializa la rueda.
+
+        Args:
+            start: Tiempo inicial (mismo reloj que los deadlines).
+            resolution: Segundos por tick del nivel 0.
+            slot_bits: Log2 de la cantidad de slots por nivel.
+            levels: Cantidad de niveles.
+        """
+        self.resolution = resolution
+        self._bits = slot_bits
+        self._mask = (1 << slot_bits) - 1
+        self._levels = levels
+        self._slots: list[list[list[tuple[int, T]]]] = [
+            [[] for _ in range(1 << slot_bits)] for _ in range(levels)
+        ]
+        self._overflow: list[tuple[int, T]] = []
+        self._due: list[T] = []
+        self._tick = math.floor(start / resolution)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Cantidad de valores agendados pendientes.
+
+        Returns:
+            Entradas aún no devueltas por ``advance``.
+        """
+        return self._count
+
+    def schedule(self, deadline: float, value: T) -> None:
+        """Agenda ``value`` para que venza en ``deadline``.
+
+        Un deadline ya pasado vence en el próximo ``advance``.
+        """
+        self._count += 1
+        deadline_tick = math.ceil(deadline / self.resolution)
+        if deadline_tick <= self._tick:
+            self._due.append(value)
+            return
+        self._place(deadline_tick, value)
+
+    def advance(self, now: float) -> list[T]:
+        """Avanza la rueda hasta ``now`` y devuelve los valores vencidos.
+
+        Returns:
+            Valores cuyo deadline es <= ``now``, en orden de vencimiento.
+        """
+        expired, self._due = self._due, []
+        target = math.floor(now / self.resolution)
+        if self._count == len(expired):
+            # Rueda vacía: saltar directo sin recorrer ticks
+            self._tick = max(self._tick, target)
+            self._count = 0
+            return expired
+
+        while self._tick < target:
+            self._tick += 1
+            tick = self._tick
+            if tick & self._mask == 0:
+                self._cascade(tick)
+            slot = self._slots[0][tick & self._mask]
+            if slot:
+                expired.extend(value for _, value in slot)
+                slot.clear()
+
+        self._count -= len(expired)
+        return expired
+
+    def _cascade(self, tick: int) -> None:
+        for level in range(1, self._levels):
+            shift = self._bits * level
+            index = (tick >> shift) & self._mask
+            slot = self._slots[level][index]
+            if slot:
+                entries = slot.copy()
+                slot.clear()
+                for deadline_tick, value in entries:
+                    self._place(deadline_tick, value)
+            if index != 0:
+                return
+
+        if self._overflow:
+            entries, self._overflow = self._overflow, []
+            for deadline_tick, value in entries:
+                self._place(deadline_tick, value)
+
+    def _place(self, deadline_tick: int, value: T) -> None:
+        for level in range(self._levels):
+            shift = self._bits * (level + 1)
+            if deadline_tick >> shift == self._tick >> shift:
+                index = (deadline_tick >> (self._bits * level)) & self._mask
+                self._slots[level][index].append((deadline_tick, value))
+                return
+        self._overflow.append((deadline_tick, value))
@@ -0,0 +1,100 @@
+"""Grilla plana de transitabilidad estática de un mapa.
+
+Cada tile es un byte de un ``bytearray`` de ``width * height`` con flags
+(``BLOCKED`` para paredes/agua, ``DOOR_CLOSED`` para puertas cerradas); un
+tile es transitable si su byte es 0. Los tiles se direccionan por índice plano
+``(y - 1) * width + (x - 1)`` (coordenadas 1-based, como el resto del juego),
+así el pathfinding trabaja con enteros en lugar de tuplas y sets por mapa.
+
+La ocupación dinámica (jugadores y NPCs) no vive acá: cambia en cada paso y se
+consulta aparte en ``TileOccupation``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Flags por tile
+BLOCKED = 1
+DOOR_CLOSED = 2
+
+
+class WalkabilityGrid:
+    """Flags de transitabilidad estática de un mapa indexados por tile plano."""
+
+    __slots__ = ("cells", "height", "version", "width")
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        blocked: Iterable[tuple[int, int]] = (),
+        closed_doors: Iterable[tuple[int, int]] = (),
+    ) -> None:
+        """Construye la grilla de un mapa.
+
+        Args:
+            width: Ancho del mapa en tiles.
+            height: Alto del mapa en tiles.
+            blocked: Tiles bloqueados (x, y).
+            closed_doors: Puertas cerradas (x, y).
+        """
+        self.width = width
+        self.height = height
+        self.cells = bytearray(width * height)
+        # Se incrementa con cada cambio de puertas (invalida datos derivados)
+        self.version = 0
+        for x, y in blocked:
+            self._set_flag(x, y, BLOCKED, enabled=True)
+        for x, y in closed_doors:
+            self._set_flag(x, y, DOOR_CLOSED, enabled=True)
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Indica si (x, y) está dentro del mapa.
+
+        Returns:
+            True si la coordenada es válida.
+        """
+        return 1 <= x <= self.width and 1 <= y <= self.height
+
+    def index(self, x: int, y: int) -> int:
+        """Índice plano de un tile dentro del mapa.
+
+        Returns:
+            Índice en ``cells``.
+        """
+        return (y - 1) * self.width + (x - 1)
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """Coordenadas (x, y) de un índice plano.
+
+        Returns:
+            Tupla (x, y) 1-based.
+        """
+        y, x = divmod(index, self.width)
+        return x + 1, y + 1
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Indica si el tile está en el mapa y no tiene flags estáticos.
+
+        Returns:
+            True si es transitable ignorando la ocupación dinámica.
+        """
+        return self.in_bounds(x, y) and not self.cells[self.index(x, y)]
+
+    def set_door(self, x: int, y: int, *, closed: bool) -> None:
+        """Actualiza el estado de una puerta."""
+        self._set_flag(x, y, DOOR_CLOSED, enabled=closed)
+        self.version += 1
+
+    def _set_flag(self, x: int, y: int, flag: int, *, enabled: bool) -> None:
+        if not self.in_bounds(x, y):
+            return
+        index = self.index(x, y)
+        if enabled:
+            self.cells[index] |= flag
+        else:
+            self.cells[index] &= ~flag
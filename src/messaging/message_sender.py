@@ -59,6 +59,14 @@ class MessageSender:
         """Si la conexión usa TLS. Delega en ClientConnection."""
         return self.connection.is_ssl_enabled
 
+    async def send_packets(self, payload: bytes) -> None:
+        """Envía varios packets ya codificados y concatenados en una sola escritura.
+
+        Args:
+            payload: Bytes de los packets concatenados.
+        """
+        await self.connection.send(payload)
+
     async def disconnect(self) -> None:
         """Cierra la conexión del cliente y espera su finalización."""
         self.connection.close()
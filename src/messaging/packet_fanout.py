@@ -0,0 +1,59 @@
+"""Fan-out de un packet ya codificado a muchos destinatarios.
+
+Los broadcasts (movimientos, chat, efectos) envían el mismo packet a todos los
+observadores. En lugar de reconstruirlo con ``PacketBuilder`` una vez por
+destinatario, el caller lo codifica una sola vez y ``fan_out_packet`` entrega
+el mismo buffer a cada conexión:
+
+- Conexiones con ``coalesce_writes``: el buffer se encola sin ``await`` (se
+  escribe junto con el resto de la iteración del loop).
+- Conexiones en modo directo: los envíos corren concurrentemente con
+  ``asyncio.gather`` en lugar de esperar un ``drain`` por destinatario en serie.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+    from typing import Any
+
+    from src.messaging.message_sender import MessageSender
+
+logger = logging.getLogger(__name__)
+
+
+async def fan_out_packet(payload: bytes, senders: Iterable[MessageSender]) -> int:
+    """Envía el mismo buffer codificado a todos los destinatarios.
+
+    Un error en una conexión no interrumpe el envío al resto.
+
+    Args:
+        payload: Bytes del packet (o packets concatenados) ya codificados.
+        senders: MessageSenders de los destinatarios.
+
+    Returns:
+        Cantidad de destinatarios a los que se entregó el buffer.
+    """
+    delivered = 0
+    pending: list[Coroutine[Any, Any, None]] = []
+    for sender in senders:
+        connection = sender.connection
+        if connection.coalesce_writes:
+            connection.enqueue(payload)
+            delivered += 1
+        else:
+            pending.append(connection.send(payload))
+
+    if pending:
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error enviando broadcast a un destinatario: %s", result)
+            else:
+                delivered += 1
+
+    return delivered
@@ -1,47 +1,262 @@
-"""Manejo de conexiones de cliente."""
+"""Manejo de conexiones de cliente.
+
+Con ``coalesce_writes`` (lo que usa el servidor) los envíos no se escriben al
+socket uno por uno: ``send`` encola los bytes en una cola saliente por conexión
+y todos los packets producidos durante la misma iteración del event loop se
+escriben juntos con un único ``writer.write``. Si el cliente no consume lo que
+se le envía (buffer del transport por encima del high-watermark), la cola
+retiene los packets y descarta las posiciones que ya tienen una más nueva del
+mismo personaje en la cola; inventario, stats y el resto nunca se descartan.
+"""
 
 import asyncio
 import logging
+from collections import deque
+from collections.abc import AsyncIterator
+
+from src.config.config_manager import ConfigManager, config_manager
+from src.network.packet_framer import PacketFramer, looks_like_tls_handshake
+from src.network.packet_id import ServerPacketID
 
 logger = logging.getLogger(__name__)
 
 # Constante para el límite de bytes a mostrar en logs
 MAX_LOG_BYTES = 32
 
+# Bytes máximos por lectura del socket. Debe quedar holgadamente por debajo de
+# PacketFramer.MAX_BUFFER_BYTES para que un packet parcial pendiente más una
+# lectura completa no disparen un overflow espurio.
+RECEIVE_CHUNK_BYTES = 1024
+
+# High-watermark por defecto de bytes salientes pendientes por conexión.
+DEFAULT_SEND_HIGH_WATERMARK = 64 * 1024
+
+# Packets que solo transportan una posición absoluta: si el cliente no da
+# abasto, el más nuevo del mismo personaje reemplaza a los viejos sin perder
+# información. Se indexan por packet_id con su longitud exacta (para no
+# descartar nunca un buffer que agrupe otros packets detrás) y la longitud del
+# prefijo que identifica al personaje.
+DROPPABLE_PACKET_LENGTHS: dict[int, tuple[int, int]] = {
+    ServerPacketID.CHARACTER_MOVE: (5, 3),  # packet_id + char_index(2) + x + y
+    ServerPacketID.POS_UPDATE: (3, 1),  # packet_id + x + y (siempre el propio jugador)
+}
+
+
+def _droppable_key(data: bytes) -> bytes | None:
+    """Clave (packet_id, char_index) de un packet de posición descartable.
+
+    Returns:
+        Prefijo que identifica al personaje, o None si ``data`` no es
+        exactamente un packet de ``DROPPABLE_PACKET_LENGTHS``.
+    """
+    lengths = DROPPABLE_PACKET_LENGTHS.get(data[0])
+    if lengths is None or lengths[0] != len(data):
+        return None
+    return data[: lengths[1]]
+
 
 class ClientConnection:
     """Encapsula la conexión con un cliente y provee métodos para comunicación."""
 
-    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        coalesce_writes: bool = False,
+        send_high_watermark: int | None = None,
+    ) -> None:
         """Inicializa la conexión del cliente.
 
         Args:
             reader: Stream para leer datos del cliente.
             writer: Stream para enviar datos al cliente.
+            coalesce_writes: Si True, ``send`` encola y los packets de cada
+                iteración del loop se escriben juntos. Si False, cada ``send``
+                escribe y espera ``drain`` (modo directo).
+            send_high_watermark: Bytes salientes pendientes a partir de los cuales
+                se aplica backpressure (usa ``server.send_high_watermark`` si es None).
         """
         self.reader = reader
         self.writer = writer
         self.address = writer.get_extra_info("peername")
         self.is_ssl_enabled = writer.get_extra_info("ssl_object") is not None
+        self.framer = PacketFramer()
+        self.coalesce_writes = coalesce_writes
+        self.send_high_watermark = send_high_watermark or ConfigManager.as_int(
+            config_manager.get("server.send_high_watermark", DEFAULT_SEND_HIGH_WATERMARK)
+        )
+
+        # Cola saliente: se vacía en un único write por iteración del loop.
+        self._outbound: deque[bytes] = deque()
+        self._outbound_bytes = 0
+        self._flush_handle: asyncio.Handle | None = None
+        self._drain_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+        # Métricas de envío (ver ``get_send_metrics``).
+        self._flushes = 0
+        self._packets_sent = 0
+        self._bytes_sent = 0
+        self._max_packets_per_flush = 0
+        self._dropped_packets = 0
+        self._backpressure_waits = 0
 
     async def send(self, data: bytes) -> None:
         """Envía datos al cliente.
 
+        Con ``coalesce_writes`` no escribe al socket de inmediato: todo lo
+        encolado durante la iteración actual del event loop se escribe junto en
+        un único ``write`` (usar ``flush`` para esperar a que los bytes salgan).
+
         Args:
             data: Bytes a enviar al cliente.
         """
+        if self.coalesce_writes:
+            self.enqueue(data)
+            return
+
         self.writer.write(data)
         await self.writer.drain()
-        hex_data = " ".join(f"{byte:02X}" for byte in data[:MAX_LOG_BYTES])
-        logger.debug(
-            "Enviados %d bytes a %s: %s%s",
-            len(data),
-            self.address,
-            hex_data,
-            "..." if len(data) > MAX_LOG_BYTES else "",
-        )
+        self._record_write(data, 1)
+
+    def enqueue(self, data: bytes) -> None:
+        """Agrega bytes a la cola saliente y agenda el flush coalescido.
+
+        Si la cola supera el high-watermark se descartan los packets de posición
+        reemplazados por uno más nuevo del mismo personaje; el resto de los
+        packets (y la última posición de cada personaje) nunca se descarta.
+
+        Args:
+            data: Bytes a enviar al cliente.
+        """
+        if self._closed or not data:
+            return
+
+        self._outbound.append(data)
+        self._outbound_bytes += len(data)
+        if self._outbound_bytes > self.send_high_watermark:
+            self._shed_droppable()
+
+        if self._flush_handle is None and self._drain_task is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush_pending)
+
+    async def flush(self) -> None:
+        """Escribe de inmediato todo lo encolado y espera a que el socket drene."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._outbound and not self._closed:
+            self._write_pending()
+        await self.writer.drain()
+
+    def get_send_metrics(self) -> dict[str, int | float]:
+        """Obtiene las métricas de envío coalescido de la conexión.
+
+        Returns:
+            Diccionario con flushes, packets y bytes escritos, packets por
+            flush, packets descartados, esperas por backpressure y bytes
+            encolados.
+        """
+        return {
+            "flushes": self._flushes,
+            "packets_sent": self._packets_sent,
+            "bytes_sent": self._bytes_sent,
+            "max_packets_per_flush": self._max_packets_per_flush,
+            "avg_packets_per_flush": (
+                self._packets_sent / self._flushes if self._flushes > 0 else 0.0
+            ),
+            "dropped_packets": self._dropped_packets,
+            "backpressure_waits": self._backpressure_waits,
+            "queued_bytes": self._outbound_bytes,
+        }
 
-    async def receive(self, max_bytes: int = 1024) -> bytes:
+    def _flush_pending(self) -> None:
+        """Callback del loop: escribe la cola salvo que el cliente esté saturado."""
+        self._flush_handle = None
+        if not self._outbound or self._closed:
+            return
+
+        if self.writer.transport.get_write_buffer_size() > self.send_high_watermark:
+            # Backpressure: retener en la cola (donde se puede descartar
+            # posiciones viejas) hasta que el transport drene.
+            self._backpressure_waits += 1
+            self._drain_task = asyncio.create_task(self._drain_then_flush())
+            return
+
+        self._write_pending()
+
+    async def _drain_then_flush(self) -> None:
+        """Espera a que el transport drene y reintenta el flush."""
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            self._outbound.clear()
+            self._outbound_bytes = 0
+            return
+        finally:
+            self._drain_task = None
+        self._flush_pending()
+
+    def _write_pending(self) -> None:
+        """Escribe todos los packets encolados en un único ``write``."""
+        count = len(self._outbound)
+        payload = self._outbound[0] if count == 1 else b"".join(self._outbound)
+        self._outbound.clear()
+        self._outbound_bytes = 0
+
+        self.writer.write(payload)
+        self._record_write(payload, count)
+
+    def _record_write(self, payload: bytes, count: int) -> None:
+        """Actualiza métricas y loguea (solo en DEBUG) un write al socket."""
+        self._flushes += 1
+        self._packets_sent += count
+        self._bytes_sent += len(payload)
+        self._max_packets_per_flush = max(self._max_packets_per_flush, count)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            hex_data = " ".join(f"{byte:02X}" for byte in payload[:MAX_LOG_BYTES])
+            logger.debug(
+                "Enviados %d bytes (%d packets) a %s: %s%s",
+                len(payload),
+                count,
+                self.address,
+                hex_data,
+                "..." if len(payload) > MAX_LOG_BYTES else "",
+            )
+
+    def _shed_droppable(self) -> None:
+        """Descarta posiciones reemplazadas (las más viejas primero) hasta bajar del watermark.
+
+        Una posición solo es descartable si más adelante en la cola hay otra del
+        mismo (packet_id, char_index): la última de cada personaje siempre sale.
+        """
+        # Recorrido del más nuevo al más viejo: marca las posiciones reemplazadas
+        seen: set[bytes] = set()
+        superseded: set[int] = set()
+        for index in range(len(self._outbound) - 1, -1, -1):
+            key = _droppable_key(self._outbound[index])
+            if key is None:
+                continue
+            if key in seen:
+                superseded.add(index)
+            else:
+                seen.add(key)
+        if not superseded:
+            return
+
+        excess = self._outbound_bytes - self.send_high_watermark
+        kept: deque[bytes] = deque()
+        for index, data in enumerate(self._outbound):
+            if excess > 0 and index in superseded:
+                excess -= len(data)
+                self._outbound_bytes -= len(data)
+                self._dropped_packets += 1
+                continue
+            kept.append(data)
+        self._outbound = kept
+
+    async def receive(self, max_bytes: int = RECEIVE_CHUNK_BYTES) -> bytes:
         """Recibe datos del cliente.
 
         Args:
@@ -51,7 +266,7 @@ class ClientConnection:
             Bytes recibidos del cliente (vacío si la conexión se cerró).
         """
         data = await self.reader.read(max_bytes)
-        if data:
+        if data and logger.isEnabledFor(logging.DEBUG):
             hex_data = " ".join(f"{byte:02X}" for byte in data[:MAX_LOG_BYTES])
             logger.debug(
                 "Recibidos %d bytes de %s: %s%s",
@@ -62,8 +277,60 @@ class ClientConnection:
             )
         return data
 
+    async def iter_packets(self, max_bytes: int = RECEIVE_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """Itera los packets completos recibidos del cliente hasta que cierre.
+
+        Cada lectura del socket alimenta al ``PacketFramer`` de la conexión y
+        se drenan todos los packets completos que contenga: varios packets
+        concatenados en un mismo ``recv`` se despachan todos, y un packet
+        partido entre lecturas se entrega recién cuando está completo.
+
+        Si la primera lectura parece un ClientHello TLS (y la conexión no usa
+        SSL) se entrega cruda, sin framing, para que la capa de tasks la
+        rechace con un mensaje claro.
+
+        Un stream irrecuperable (packet_id desconocido o buffer excedido)
+        propaga ``FramingError`` del framer; el caller debe cerrar la conexión.
+
+        Args:
+            max_bytes: Número máximo de bytes por lectura del socket.
+
+        Yields:
+            Bytes de cada packet completo (incluido el packet_id).
+        """
+        first_read = True
+        while True:
+            data = await self.receive(max_bytes)
+            if not data:
+                return
+
+            if first_read:
+                first_read = False
+                if not self.is_ssl_enabled and looks_like_tls_handshake(data):
+                    yield data
+                    return
+
+            self.framer.feed(data)
+            for packet in self.framer.drain():
+                yield packet
+
     def close(self) -> None:
-        """Cierra la conexión con el cliente."""
+        """Cierra la conexión con el cliente.
+
+        Lo que quede encolado se escribe antes de cerrar (por ejemplo, un
+        mensaje de error seguido de una desconexión).
+        """
+        if self._closed:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        if self._outbound:
+            self._write_pending()
+        self._closed = True
         self.writer.close()
 
     async def wait_closed(self) -> None:
@@ -1,8 +1,11 @@
 """Construcción de mensajes de audio."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_PLAY_MIDI = SERVER_PACKET_CODECS[ServerPacketID.PLAY_MIDI]
+_PLAY_WAVE = SERVER_PACKET_CODECS[ServerPacketID.PLAY_WAVE]
+
 
 def build_play_midi_response(midi_id: int) -> bytes:
     """Construye el paquete PlayMIDI del protocolo AO estándar.
@@ -13,10 +16,7 @@ def build_play_midi_response(midi_id: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (38) + midi (1 byte).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.PLAY_MIDI)
-    packet.add_byte(midi_id)
-    return packet.to_bytes()
+    return _PLAY_MIDI.encode(midi_id)
 
 
 def build_play_wave_response(wave_id: int, x: int = 0, y: int = 0) -> bytes:
@@ -30,9 +30,4 @@ def build_play_wave_response(wave_id: int, x: int = 0, y: int = 0) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (39) + wave (1 byte) + x (1 byte) + y (1 byte).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.PLAY_WAVE)
-    packet.add_byte(wave_id)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    return packet.to_bytes()
+    return _PLAY_WAVE.encode(wave_id, x, y)
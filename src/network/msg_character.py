@@ -1,8 +1,13 @@
 """Construcción de mensajes de personajes."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_CHARACTER_REMOVE = SERVER_PACKET_CODECS[ServerPacketID.CHARACTER_REMOVE]
+_CHARACTER_CHANGE = SERVER_PACKET_CODECS[ServerPacketID.CHARACTER_CHANGE]
+_CHARACTER_CREATE = SERVER_PACKET_CODECS[ServerPacketID.CHARACTER_CREATE]
+_CHARACTER_MOVE = SERVER_PACKET_CODECS[ServerPacketID.CHARACTER_MOVE]
+
 
 def build_character_remove_response(char_index: int) -> bytes:
     """Construye el paquete CharacterRemove del protocolo AO estándar.
@@ -13,10 +18,7 @@ def build_character_remove_response(char_index: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (30) + char_index.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHARACTER_REMOVE)
-    packet.add_int16(char_index)
-    return packet.to_bytes()
+    return _CHARACTER_REMOVE.encode(char_index)
 
 
 def build_character_change_response(
@@ -46,18 +48,9 @@ def build_character_change_response(
     Returns:
         Paquete de bytes con el formato: PacketID (34) + datos del personaje.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHARACTER_CHANGE)
-    packet.add_int16(char_index)
-    packet.add_int16(body)
-    packet.add_int16(head)
-    packet.add_byte(heading)
-    packet.add_int16(weapon)
-    packet.add_int16(shield)
-    packet.add_int16(helmet)
-    packet.add_int16(fx)
-    packet.add_int16(loops)
-    return packet.to_bytes()
+    return _CHARACTER_CHANGE.encode(
+        char_index, body, head, heading, weapon, shield, helmet, fx, loops
+    )
 
 
 def build_character_create_response(
@@ -97,24 +90,22 @@ def build_character_create_response(
     Returns:
         Paquete de bytes con el formato CHARACTER_CREATE.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHARACTER_CREATE)
-    packet.add_int16(char_index)
-    packet.add_int16(body)
-    packet.add_int16(head)
-    packet.add_byte(heading)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    packet.add_int16(weapon)
-    packet.add_int16(shield)
-    packet.add_int16(helmet)
-    packet.add_int16(fx)
-    packet.add_int16(loops)
-    # Agregar nombre con longitud en bytes UTF-8
-    packet.add_unicode_string(name)
-    packet.add_byte(nick_color)
-    packet.add_byte(privileges)
-    return packet.to_bytes()
+    return _CHARACTER_CREATE.encode(
+        char_index,
+        body,
+        head,
+        heading,
+        x,
+        y,
+        weapon,
+        shield,
+        helmet,
+        fx,
+        loops,
+        name,
+        nick_color,
+        privileges,
+    )
 
 
 def build_character_move_response(char_index: int, x: int, y: int) -> bytes:
@@ -129,9 +120,4 @@ def build_character_move_response(char_index: int, x: int, y: int) -> bytes:
         Paquete de bytes con el formato: PacketID + CharIndex + X + Y.
         NOTA: Heading NO se envía porque el cliente Godot no lo lee.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHARACTER_MOVE)
-    packet.add_int16(char_index)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    return packet.to_bytes()
+    return _CHARACTER_MOVE.encode(char_index, x, y)
@@ -3,12 +3,14 @@
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
 if TYPE_CHECKING:
     from src.models.clan import Clan
 
+_CLAN_DETAILS = SERVER_PACKET_CODECS[ServerPacketID.CLAN_DETAILS]
+
 
 def build_clan_details_response(clan: Clan) -> bytes:
     """Construye el paquete CLAN_DETAILS del protocolo AO estándar.
@@ -21,57 +23,22 @@ def build_clan_details_response(clan: Clan) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (80) + datos del clan.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CLAN_DETAILS)
-
-    # GuildName (ASCII string con longitud int16)
-    packet.add_unicode_string(clan.name)
-
-    # Founder (nombre del fundador - por ahora usar leader)
-    founder_name = clan.leader_username or ""
-    packet.add_unicode_string(founder_name)
-
-    # FoundationDate (fecha de fundación)
+    founder_name = clan.leader_username or ""  # por ahora el fundador es el líder
     foundation_date = datetime.fromtimestamp(clan.created_at, tz=UTC).strftime("%d/%m/%Y")
-    packet.add_unicode_string(foundation_date)
-
-    # Leader (nombre del líder actual)
-    leader_name = clan.leader_username or ""
-    packet.add_unicode_string(leader_name)
-
-    # URL (sitio web del clan)
-    website = clan.website or ""
-    packet.add_unicode_string(website)
-
-    # MemberCount (cantidad de miembros)
-    packet.add_int32(clan.member_count)
-
-    # ElectionsOpen (si hay elecciones abiertas - siempre False por ahora)
-    elections_open = False
-    packet.add_byte(1 if elections_open else 0)
-
-    # Alignment (alineación del clan - "NEUTRO" por defecto)
-    alignment = "NEUTRO"
-    packet.add_unicode_string(alignment)
-
-    # EnemiesCount (cantidad de enemigos)
-    enemies_count = len(clan.wars)
-    packet.add_int32(enemies_count)
-
-    # AlliesCount (cantidad de aliados)
-    allies_count = len(clan.alliances)
-    packet.add_int32(allies_count)
-
-    # AntifactionPoints (puntos de antifacción - "0/5" por defecto)
-    antifaction_points = "0/5"
-    packet.add_unicode_string(antifaction_points)
-
-    # Codex (códices del clan - string vacío por ahora)
-    codex = ""
-    packet.add_unicode_string(codex)
-
-    # GuildDesc (descripción del clan)
-    description = clan.description or ""
-    packet.add_unicode_string(description)
-
-    return packet.to_bytes()
+    elections_open = False  # siempre False por ahora
+
+    return _CLAN_DETAILS.encode(
+        clan.name,  # GuildName
+        founder_name,  # Founder
+        foundation_date,  # FoundationDate
+        clan.leader_username or "",  # Leader
+        clan.website or "",  # URL
+        clan.member_count,  # MemberCount
+        1 if elections_open else 0,  # ElectionsOpen
+        "NEUTRO",  # Alignment (por defecto)
+        len(clan.wars),  # EnemiesCount
+        len(clan.alliances),  # AlliesCount
+        "0/5",  # AntifactionPoints (por defecto)
+        "",  # Codex (vacío por ahora)
+        clan.description or "",  # GuildDesc
+    )
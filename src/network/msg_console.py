@@ -2,11 +2,14 @@
 
 import logging
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
 logger = logging.getLogger(__name__)
 
+_CONSOLE_MSG = SERVER_PACKET_CODECS[ServerPacketID.CONSOLE_MSG]
+_ERROR_MSG = SERVER_PACKET_CODECS[ServerPacketID.ERROR_MSG]
+
 
 def build_console_msg_response(message: str, font_color: int = 7) -> bytes:
     """Construye el paquete ConsoleMsg del protocolo AO estándar.
@@ -18,20 +21,17 @@ def build_console_msg_response(message: str, font_color: int = 7) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (24) + longitud (int16) + mensaje + color.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CONSOLE_MSG)
-    packet.add_unicode_string(message)
-    packet.add_byte(font_color)
-    result = packet.to_bytes()
-
-    # Debug logging
-    logger.debug(
-        "build_console_msg_response: message='%s', len=%d, font_color=%d, packet_hex=%s",
-        message,
-        len(message),
-        font_color,
-        result.hex(),
-    )
+    result = _CONSOLE_MSG.encode(message, font_color)
+
+    # Debug logging (el hex del paquete solo se calcula si DEBUG está habilitado)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "build_console_msg_response: message='%s', len=%d, font_color=%d, packet_hex=%s",
+            message,
+            len(message),
+            font_color,
+            result.hex(),
+        )
 
     return result
 
@@ -46,7 +46,4 @@ def build_error_msg_response(error_message: str) -> bytes:
         Paquete de bytes con el formato:
         PacketID (55) + longitud (int16) + mensaje de error (string).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.ERROR_MSG)
-    packet.add_unicode_string(error_message)
-    return packet.to_bytes()
+    return _ERROR_MSG.encode(error_message)
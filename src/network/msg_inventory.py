@@ -1,8 +1,17 @@
 """Construcción de mensajes de inventario, banco y comercio."""
 
-from src.network.packet_builder import PacketBuilder
+from itertools import starmap
+
+from src.network.packet_codec import COMMERCE_ITEM_CODEC, SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_CHANGE_INVENTORY_SLOT = SERVER_PACKET_CODECS[ServerPacketID.CHANGE_INVENTORY_SLOT]
+_CHANGE_BANK_SLOT = SERVER_PACKET_CODECS[ServerPacketID.CHANGE_BANK_SLOT]
+_CHANGE_NPC_INVENTORY_SLOT = SERVER_PACKET_CODECS[ServerPacketID.CHANGE_NPC_INVENTORY_SLOT]
+_CHANGE_SPELL_SLOT = SERVER_PACKET_CODECS[ServerPacketID.CHANGE_SPELL_SLOT]
+_COMMERCE_INIT = SERVER_PACKET_CODECS[ServerPacketID.COMMERCE_INIT]
+_COMMERCE_END = SERVER_PACKET_CODECS[ServerPacketID.COMMERCE_END].encode()
+
 
 def build_change_inventory_slot_response(
     slot: int,
@@ -37,22 +46,21 @@ def build_change_inventory_slot_response(
     Returns:
         Paquete de bytes con el formato del cliente.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHANGE_INVENTORY_SLOT)
-    packet.add_byte(slot)
-    packet.add_int16(item_id)
-    packet.add_unicode_string(name)
-    packet.add_int16(amount)
-    packet.add_byte(1 if equipped else 0)
-    packet.add_int16(grh_id)
-    packet.add_byte(item_type)
-    # Cliente espera: maxHit, minHit, maxDef, minDef
-    packet.add_int16(max_hit)
-    packet.add_int16(min_hit)
-    packet.add_int16(max_def)
-    packet.add_int16(min_def)
-    packet.add_float(sale_price)
-    return packet.to_bytes()
+    return _CHANGE_INVENTORY_SLOT.encode(
+        slot,
+        item_id,
+        name,
+        amount,
+        1 if equipped else 0,
+        grh_id,
+        item_type,
+        # Cliente espera: maxHit, minHit, maxDef, minDef
+        max_hit,
+        min_hit,
+        max_def,
+        min_def,
+        sale_price,
+    )
 
 
 def build_change_bank_slot_response(
@@ -84,19 +92,9 @@ def build_change_bank_slot_response(
     Returns:
         Paquete de bytes con el formato ChangeBankSlot.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHANGE_BANK_SLOT)
-    packet.add_byte(slot)
-    packet.add_int16(item_id)
-    packet.add_unicode_string(name)
-    packet.add_int16(amount)
-    packet.add_int16(grh_id)
-    packet.add_byte(item_type)
-    packet.add_int16(max_hit)
-    packet.add_int16(min_hit)
-    packet.add_int16(max_def)
-    packet.add_int16(min_def)
-    return packet.to_bytes()
+    return _CHANGE_BANK_SLOT.encode(
+        slot, item_id, name, amount, grh_id, item_type, max_hit, min_hit, max_def, min_def
+    )
 
 
 def build_change_npc_inventory_slot_response(
@@ -130,20 +128,19 @@ def build_change_npc_inventory_slot_response(
     Returns:
         Paquete de bytes con el formato ChangeNPCInventorySlot.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHANGE_NPC_INVENTORY_SLOT)
-    packet.add_byte(slot)
-    packet.add_unicode_string(name)
-    packet.add_int16(amount)
-    packet.add_float(sale_price)
-    packet.add_int16(grh_id)
-    packet.add_int16(item_id)
-    packet.add_byte(item_type)
-    packet.add_int16(max_hit)
-    packet.add_int16(min_hit)
-    packet.add_int16(max_def)
-    packet.add_int16(min_def)
-    return packet.to_bytes()
+    return _CHANGE_NPC_INVENTORY_SLOT.encode(
+        slot,
+        name,
+        amount,
+        sale_price,
+        grh_id,
+        item_id,
+        item_type,
+        max_hit,
+        min_hit,
+        max_def,
+        min_def,
+    )
 
 
 def build_change_spell_slot_response(slot: int, spell_id: int, spell_name: str) -> bytes:
@@ -157,12 +154,7 @@ def build_change_spell_slot_response(slot: int, spell_id: int, spell_name: str)
     Returns:
         Paquete de bytes con el formato ChangeSpellSlot.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHANGE_SPELL_SLOT)
-    packet.add_byte(slot)
-    packet.add_int16(spell_id)
-    packet.add_unicode_string(spell_name)
-    return packet.to_bytes()
+    return _CHANGE_SPELL_SLOT.encode(slot, spell_id, spell_name)
 
 
 def build_commerce_end_response() -> bytes:
@@ -171,9 +163,7 @@ def build_commerce_end_response() -> bytes:
     Returns:
         Paquete de bytes con el formato del cliente.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.COMMERCE_END)
-    return packet.to_bytes()
+    return _COMMERCE_END
 
 
 def build_commerce_init_response(
@@ -191,34 +181,10 @@ def build_commerce_init_response(
     Returns:
         Paquete de bytes con el formato del cliente.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.COMMERCE_INIT)
-    packet.add_int16(npc_id)
-    packet.add_byte(len(items))
-
-    for (
-        slot,
-        item_id,
-        name,
-        quantity,
-        price,
-        grh_index,
-        obj_type,
-        max_hit,
-        min_hit,
-        max_def,
-        min_def,
-    ) in items:
-        packet.add_byte(slot)
-        packet.add_int16(item_id)
-        packet.add_unicode_string(name)
-        packet.add_int16(quantity)
-        packet.add_int16(price)  # Cambiado de int32 a int16
-        packet.add_int16(grh_index)
-        packet.add_byte(obj_type)
-        packet.add_int16(max_hit)
-        packet.add_int16(min_hit)
-        packet.add_int16(max_def)
-        packet.add_int16(min_def)
-
-    return packet.to_bytes()
+    # Cabecera + un registro por item (precio en int16, no int32)
+    return b"".join(
+        [
+            _COMMERCE_INIT.encode(npc_id, len(items)),
+            *starmap(COMMERCE_ITEM_CODEC.encode, items),
+        ]
+    )
@@ -1,8 +1,14 @@
 """Construcción de mensajes de mapa."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_CHANGE_MAP = SERVER_PACKET_CODECS[ServerPacketID.CHANGE_MAP]
+_POS_UPDATE = SERVER_PACKET_CODECS[ServerPacketID.POS_UPDATE]
+_OBJECT_CREATE = SERVER_PACKET_CODECS[ServerPacketID.OBJECT_CREATE]
+_BLOCK_POSITION = SERVER_PACKET_CODECS[ServerPacketID.BLOCK_POSITION]
+_OBJECT_DELETE = SERVER_PACKET_CODECS[ServerPacketID.OBJECT_DELETE]
+
 
 def build_change_map_response(map_number: int, version: int = 0) -> bytes:
     """Construye el paquete ChangeMap del protocolo AO estándar.
@@ -14,11 +20,7 @@ def build_change_map_response(map_number: int, version: int = 0) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (21) + mapNumber (int16) + version (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CHANGE_MAP)
-    packet.add_int16(map_number)
-    packet.add_int16(version)
-    return packet.to_bytes()
+    return _CHANGE_MAP.encode(map_number, version)
 
 
 def build_pos_update_response(x: int, y: int) -> bytes:
@@ -31,11 +33,7 @@ def build_pos_update_response(x: int, y: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (22) + x (1 byte) + y (1 byte).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.POS_UPDATE)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    return packet.to_bytes()
+    return _POS_UPDATE.encode(x, y)
 
 
 def build_object_create_response(x: int, y: int, grh_index: int) -> bytes:
@@ -49,12 +47,7 @@ def build_object_create_response(x: int, y: int, grh_index: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (35) + X + Y + GrhIndex.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.OBJECT_CREATE)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    packet.add_int16(grh_index)
-    return packet.to_bytes()
+    return _OBJECT_CREATE.encode(x, y, grh_index)
 
 
 def build_block_position_response(x: int, y: int, blocked: bool) -> bytes:
@@ -68,12 +61,7 @@ def build_block_position_response(x: int, y: int, blocked: bool) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (36) + X + Y + Blocked.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.BLOCK_POSITION)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    packet.add_byte(1 if blocked else 0)
-    return packet.to_bytes()
+    return _BLOCK_POSITION.encode(x, y, 1 if blocked else 0)
 
 
 def build_object_delete_response(x: int, y: int) -> bytes:
@@ -86,8 +74,4 @@ def build_object_delete_response(x: int, y: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (37) + X + Y.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.OBJECT_DELETE)
-    packet.add_byte(x)
-    packet.add_byte(y)
-    return packet.to_bytes()
+    return _OBJECT_DELETE.encode(x, y)
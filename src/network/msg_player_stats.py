@@ -1,8 +1,20 @@
 """Construcción de mensajes de stats del jugador."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_UPDATE_HP = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_HP]
+_UPDATE_MANA = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_MANA]
+_UPDATE_STA = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_STA]
+_UPDATE_EXP = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_EXP]
+_UPDATE_GOLD = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_GOLD]
+_UPDATE_BANK_GOLD = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_BANK_GOLD]
+_UPDATE_HUNGER_AND_THIRST = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_HUNGER_AND_THIRST]
+_UPDATE_STRENGTH_AND_DEXTERITY = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_STRENGTH_AND_DEXTERITY]
+_UPDATE_STRENGTH = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_STRENGTH]
+_UPDATE_DEXTERITY = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_DEXTERITY]
+_UPDATE_USER_STATS = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_USER_STATS]
+
 
 def build_update_hp_response(hp: int) -> bytes:
     """Construye el paquete UpdateHP del protocolo AO estándar.
@@ -13,10 +25,7 @@ def build_update_hp_response(hp: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (17) + hp (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_HP)
-    packet.add_int16(hp)
-    return packet.to_bytes()
+    return _UPDATE_HP.encode(hp)
 
 
 def build_update_mana_response(mana: int) -> bytes:
@@ -28,10 +37,7 @@ def build_update_mana_response(mana: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (16) + mana (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_MANA)
-    packet.add_int16(mana)
-    return packet.to_bytes()
+    return _UPDATE_MANA.encode(mana)
 
 
 def build_update_sta_response(stamina: int) -> bytes:
@@ -43,10 +49,7 @@ def build_update_sta_response(stamina: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (15) + stamina (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_STA)
-    packet.add_int16(stamina)
-    return packet.to_bytes()
+    return _UPDATE_STA.encode(stamina)
 
 
 def build_update_exp_response(experience: int) -> bytes:
@@ -58,10 +61,7 @@ def build_update_exp_response(experience: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (20) + experience (int32).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_EXP)
-    packet.add_int32(experience)
-    return packet.to_bytes()
+    return _UPDATE_EXP.encode(experience)
 
 
 def build_update_gold_response(gold: int) -> bytes:
@@ -73,10 +73,7 @@ def build_update_gold_response(gold: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (18) + gold (int32).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_GOLD)
-    packet.add_int32(gold)
-    return packet.to_bytes()
+    return _UPDATE_GOLD.encode(gold)
 
 
 def build_update_bank_gold_response(bank_gold: int) -> bytes:
@@ -88,10 +85,7 @@ def build_update_bank_gold_response(bank_gold: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (19) + bank_gold (int32).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_BANK_GOLD)
-    packet.add_int32(bank_gold)
-    return packet.to_bytes()
+    return _UPDATE_BANK_GOLD.encode(bank_gold)
 
 
 def build_update_hunger_and_thirst_response(
@@ -108,13 +102,7 @@ def build_update_hunger_and_thirst_response(
     Returns:
         Paquete de bytes con el formato: PacketID (60) + maxAgua + minAgua + maxHam + minHam.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_HUNGER_AND_THIRST)
-    packet.add_byte(max_water)
-    packet.add_byte(min_water)
-    packet.add_byte(max_hunger)
-    packet.add_byte(min_hunger)
-    return packet.to_bytes()
+    return _UPDATE_HUNGER_AND_THIRST.encode(max_water, min_water, max_hunger, min_hunger)
 
 
 def build_update_strength_and_dexterity_response(strength: int, dexterity: int) -> bytes:
@@ -127,11 +115,7 @@ def build_update_strength_and_dexterity_response(strength: int, dexterity: int)
     Returns:
         Paquete de bytes con el formato: PacketID (100) + fuerza + agilidad.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_STRENGTH_AND_DEXTERITY)
-    packet.add_byte(strength)
-    packet.add_byte(dexterity)
-    return packet.to_bytes()
+    return _UPDATE_STRENGTH_AND_DEXTERITY.encode(strength, dexterity)
 
 
 def build_update_strength_response(strength: int) -> bytes:
@@ -143,10 +127,7 @@ def build_update_strength_response(strength: int) -> bytes:
     Returns:
         bytes: Paquete con el formato PacketID (101) + fuerza.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_STRENGTH)
-    packet.add_byte(strength)
-    return packet.to_bytes()
+    return _UPDATE_STRENGTH.encode(strength)
 
 
 def build_update_dexterity_response(dexterity: int) -> bytes:
@@ -158,10 +139,7 @@ def build_update_dexterity_response(dexterity: int) -> bytes:
     Returns:
         bytes: Paquete con el formato PacketID (102) + agilidad.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_DEXTERITY)
-    packet.add_byte(dexterity)
-    return packet.to_bytes()
+    return _UPDATE_DEXTERITY.encode(dexterity)
 
 
 def build_update_user_stats_response(
@@ -198,17 +176,16 @@ def build_update_user_stats_response(
     max_int16 = 32767
     min_int16 = -32768
 
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_USER_STATS)
     # Orden según cliente Godot: max/min (máximo/actual)
-    packet.add_int16(max(min(max_hp, max_int16), min_int16))
-    packet.add_int16(max(min(min_hp, max_int16), min_int16))
-    packet.add_int16(max(min(max_mana, max_int16), min_int16))
-    packet.add_int16(max(min(min_mana, max_int16), min_int16))
-    packet.add_int16(max(min(max_sta, max_int16), min_int16))
-    packet.add_int16(max(min(min_sta, max_int16), min_int16))
-    packet.add_int32(gold)
-    packet.add_byte(level)
-    packet.add_int32(elu)
-    packet.add_int32(experience)
-    return packet.to_bytes()
+    return _UPDATE_USER_STATS.encode(
+        max(min(max_hp, max_int16), min_int16),
+        max(min(min_hp, max_int16), min_int16),
+        max(min(max_mana, max_int16), min_int16),
+        max(min(min_mana, max_int16), min_int16),
+        max(min(max_sta, max_int16), min_int16),
+        max(min(min_sta, max_int16), min_int16),
+        gold,
+        level,
+        elu,
+        experience,
+    )
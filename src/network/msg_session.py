@@ -1,8 +1,14 @@
 """Construcción de mensajes de sesión y login."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_DICE_ROLL = SERVER_PACKET_CODECS[ServerPacketID.DICE_ROLL]
+_ATTRIBUTES = SERVER_PACKET_CODECS[ServerPacketID.ATTRIBUTES]
+_LOGGED = SERVER_PACKET_CODECS[ServerPacketID.LOGGED]
+_USER_CHAR_INDEX_IN_SERVER = SERVER_PACKET_CODECS[ServerPacketID.USER_CHAR_INDEX_IN_SERVER]
+_PONG = SERVER_PACKET_CODECS[ServerPacketID.PONG].encode()
+
 
 def build_dice_roll_response(
     strength: int,
@@ -23,14 +29,7 @@ def build_dice_roll_response(
     Returns:
         Paquete de bytes con el formato: PacketID + 5 bytes de atributos.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.DICE_ROLL)
-    packet.add_byte(strength)
-    packet.add_byte(agility)
-    packet.add_byte(intelligence)
-    packet.add_byte(charisma)
-    packet.add_byte(constitution)
-    return packet.to_bytes()
+    return _DICE_ROLL.encode(strength, agility, intelligence, charisma, constitution)
 
 
 def build_attributes_response(
@@ -52,14 +51,7 @@ def build_attributes_response(
     Returns:
         Paquete de bytes con el formato: PacketID (50) + 5 bytes de atributos.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.ATTRIBUTES)
-    packet.add_byte(strength)
-    packet.add_byte(agility)
-    packet.add_byte(intelligence)
-    packet.add_byte(charisma)
-    packet.add_byte(constitution)
-    return packet.to_bytes()
+    return _ATTRIBUTES.encode(strength, agility, intelligence, charisma, constitution)
 
 
 def build_logged_response(user_class: int) -> bytes:
@@ -71,10 +63,7 @@ def build_logged_response(user_class: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (0) + userClass (1 byte).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.LOGGED)
-    packet.add_byte(user_class)
-    return packet.to_bytes()
+    return _LOGGED.encode(user_class)
 
 
 def build_user_char_index_in_server_response(char_index: int) -> bytes:
@@ -86,10 +75,7 @@ def build_user_char_index_in_server_response(char_index: int) -> bytes:
     Returns:
         Paquete de bytes con el formato: PacketID (28) + charIndex (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.USER_CHAR_INDEX_IN_SERVER)
-    packet.add_int16(char_index)
-    return packet.to_bytes()
+    return _USER_CHAR_INDEX_IN_SERVER.encode(char_index)
 
 
 def build_pong_response() -> bytes:
@@ -98,6 +84,4 @@ def build_pong_response() -> bytes:
     Returns:
         Paquete de bytes con solo el PacketID PONG.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.PONG)
-    return packet.to_bytes()
+    return _PONG
@@ -1,8 +1,10 @@
 """Packet builders para habilidades del jugador."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_SEND_SKILLS = SERVER_PACKET_CODECS[ServerPacketID.SEND_SKILLS]
+
 
 def build_update_skills_response(
     magic: int,
@@ -31,17 +33,14 @@ def build_update_skills_response(
     Returns:
         Bytes del packet SEND_SKILLS (ID 71).
     """
-    return (
-        PacketBuilder()
-        .add_byte(ServerPacketID.SEND_SKILLS)
-        .add_int16(magic)  # 1. Magia
-        .add_int16(robustness)  # 2. Robustez
-        .add_int16(woodcutting)  # 3. Talar (Tácticas)
-        .add_int16(agility)  # 4. Agilidad
-        .add_int16(fishing)  # 5. Pesca
-        .add_int16(mining)  # 6. Minería
-        .add_int16(blacksmithing)  # 7. Herrería
-        .add_int16(carpentry)  # 8. Carpintería
-        .add_int16(survival)  # 9. Supervivencia
-        .to_bytes()
+    return _SEND_SKILLS.encode(
+        magic,  # 1. Magia
+        robustness,  # 2. Robustez
+        woodcutting,  # 3. Talar (Tácticas)
+        agility,  # 4. Agilidad
+        fishing,  # 5. Pesca
+        mining,  # 6. Minería
+        blacksmithing,  # 7. Herrería
+        carpentry,  # 8. Carpintería
+        survival,  # 9. Supervivencia
     )
@@ -1,8 +1,18 @@
 """Construcción de mensajes de efectos de estado (ceguera, estupidez, invisibilidad, etc.)."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+# Paquetes sin payload: se serializan una sola vez al importar
+_BLIND = SERVER_PACKET_CODECS[ServerPacketID.BLIND].encode()
+_BLIND_NO_MORE = SERVER_PACKET_CODECS[ServerPacketID.BLIND_NO_MORE].encode()
+_DUMB = SERVER_PACKET_CODECS[ServerPacketID.DUMB].encode()
+_DUMB_NO_MORE = SERVER_PACKET_CODECS[ServerPacketID.DUMB_NO_MORE].encode()
+_PARALIZE_OK = SERVER_PACKET_CODECS[ServerPacketID.PARALIZE_OK].encode()
+_REST_OK = SERVER_PACKET_CODECS[ServerPacketID.REST_OK].encode()
+_SET_INVISIBLE = SERVER_PACKET_CODECS[ServerPacketID.SET_INVISIBLE]
+_UPDATE_TAG_AND_STATUS = SERVER_PACKET_CODECS[ServerPacketID.UPDATE_TAG_AND_STATUS]
+
 
 def build_blind_response() -> bytes:
     """Construye el paquete BLIND del protocolo AO estándar.
@@ -13,7 +23,7 @@ def build_blind_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (56).
     """
-    return bytes([ServerPacketID.BLIND])
+    return _BLIND
 
 
 def build_blind_no_more_response() -> bytes:
@@ -25,7 +35,7 @@ def build_blind_no_more_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (69).
     """
-    return bytes([ServerPacketID.BLIND_NO_MORE])
+    return _BLIND_NO_MORE
 
 
 def build_dumb_response() -> bytes:
@@ -37,7 +47,7 @@ def build_dumb_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (57).
     """
-    return bytes([ServerPacketID.DUMB])
+    return _DUMB
 
 
 def build_dumb_no_more_response() -> bytes:
@@ -49,7 +59,7 @@ def build_dumb_no_more_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (70).
     """
-    return bytes([ServerPacketID.DUMB_NO_MORE])
+    return _DUMB_NO_MORE
 
 
 def build_paralize_ok_response() -> bytes:
@@ -61,7 +71,7 @@ def build_paralize_ok_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (82).
     """
-    return bytes([ServerPacketID.PARALIZE_OK])
+    return _PARALIZE_OK
 
 
 def build_rest_ok_response() -> bytes:
@@ -73,7 +83,7 @@ def build_rest_ok_response() -> bytes:
     Returns:
         Paquete de bytes: PacketID (54).
     """
-    return bytes([ServerPacketID.REST_OK])
+    return _REST_OK
 
 
 def build_set_invisible_response(char_index: int, invisible: bool) -> bytes:
@@ -89,11 +99,7 @@ def build_set_invisible_response(char_index: int, invisible: bool) -> bytes:
     Returns:
         Paquete de bytes: PacketID (66) + charIndex (int16) + invisible (u8).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.SET_INVISIBLE)
-    packet.add_int16(char_index)
-    packet.add_byte(1 if invisible else 0)
-    return packet.to_bytes()
+    return _SET_INVISIBLE.encode(char_index, 1 if invisible else 0)
 
 
 def build_update_tag_and_status_response(char_index: int, nick_color: int, user_tag: str) -> bytes:
@@ -109,9 +115,4 @@ def build_update_tag_and_status_response(char_index: int, nick_color: int, user_
     Returns:
         Paquete de bytes: PacketID (89) + charIndex (int16) + nickColor (u8) + userTag (unicode).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.UPDATE_TAG_AND_STATUS)
-    packet.add_int16(char_index)
-    packet.add_byte(nick_color)
-    packet.add_unicode_string(user_tag)
-    return packet.to_bytes()
+    return _UPDATE_TAG_AND_STATUS.encode(char_index, nick_color, user_tag)
@@ -1,8 +1,11 @@
 """Constructores de paquetes para comercio entre jugadores."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_USER_COMMERCE_INIT = SERVER_PACKET_CODECS[ServerPacketID.USER_COMMERCE_INIT]
+_USER_COMMERCE_END = SERVER_PACKET_CODECS[ServerPacketID.USER_COMMERCE_END].encode()
+
 
 def build_user_commerce_init_response(partner_username: str) -> bytes:
     """Construye packet USER_COMMERCE_INIT con el nombre del otro jugador.
@@ -10,10 +13,7 @@ def build_user_commerce_init_response(partner_username: str) -> bytes:
     Returns:
         Bytes listos para enviar al cliente.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.USER_COMMERCE_INIT)
-    packet.add_unicode_string(partner_username)
-    return packet.to_bytes()
+    return _USER_COMMERCE_INIT.encode(partner_username)
 
 
 def build_user_commerce_end_response() -> bytes:
@@ -22,6 +22,4 @@ def build_user_commerce_end_response() -> bytes:
     Returns:
         Bytes listos para enviar al cliente.
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.USER_COMMERCE_END)
-    return packet.to_bytes()
+    return _USER_COMMERCE_END
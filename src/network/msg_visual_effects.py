@@ -1,8 +1,10 @@
 """Construcción de mensajes de efectos visuales."""
 
-from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import SERVER_PACKET_CODECS
 from src.network.packet_id import ServerPacketID
 
+_CREATE_FX = SERVER_PACKET_CODECS[ServerPacketID.CREATE_FX]
+
 
 def build_create_fx_response(char_index: int, fx: int, loops: int) -> bytes:
     """Construye el paquete CreateFX del protocolo AO estándar.
@@ -15,9 +17,4 @@ def build_create_fx_response(char_index: int, fx: int, loops: int) -> bytes:
     Returns:
         Paquete de bytes: PacketID (44) + charIndex (int16) + fx (int16) + loops (int16).
     """
-    packet = PacketBuilder()
-    packet.add_byte(ServerPacketID.CREATE_FX)
-    packet.add_int16(char_index)
-    packet.add_int16(fx)
-    packet.add_int16(loops)
-    return packet.to_bytes()
+    return _CREATE_FX.encode(char_index, fx, loops)
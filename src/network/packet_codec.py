@@ -0,0 +1,224 @@
+"""Codecs de paquetes del servidor compilados desde un esquema declarativo.
+
+Cada paquete del servidor se declara como la tupla de tipos de sus campos
+(``SERVER_PACKET_SCHEMAS``) y al importar el módulo se compila a objetos
+``struct.Struct`` precalculados:
+
+- Paquetes de longitud fija: un único ``Struct`` que incluye el PacketID, por lo
+  que ``encode`` es un solo ``pack`` que devuelve ``bytes`` inmutables listos
+  para la cola de escritura.
+- Paquetes con strings: un ``Struct`` por tramo de campos fijos (el tramo
+  termina con la longitud int16 del string que le sigue); los tramos y los
+  strings codificados se unen con un único ``b"".join``. Para paquetes de este
+  tamaño es más barato que ``pack_into`` sobre un buffer reutilizable, que
+  obliga a copiar el resultado fuera del buffer.
+
+El formato binario es el mismo que produce ``PacketBuilder``: bytes sin signo,
+enteros little-endian con signo, floats de 32 bits y strings AO (longitud int16 +
+bytes latin-1, reemplazando los caracteres no representables).
+"""
+
+from __future__ import annotations
+
+import struct
+
+from src.network.packet_id import ServerPacketID
+
+# Tipos de campo (códigos de ``struct``; STRING no lo es y parte el esquema en tramos)
+BYTE = "B"
+INT16 = "h"
+INT32 = "i"
+FLOAT = "f"
+STRING = "S"
+
+_FIXED_FIELDS = frozenset({BYTE, INT16, INT32, FLOAT})
+_STRING_LENGTH = INT16
+
+
+class PacketCodec:
+    r"""Encoder precompilado de un paquete (o sub-registro) del protocolo AO.
+
+    Example:
+        >>> codec = PacketCodec("POS_UPDATE", ServerPacketID.POS_UPDATE, (BYTE, BYTE))
+        >>> codec.encode(50, 51)
+        b'\x1623'
+    """
+
+    __slots__ = (
+        "_fixed",
+        "_head",
+        "_segments",
+        "_tail",
+        "fields",
+        "name",
+    )
+
+    def __init__(self, name: str, packet_id: int | None, fields: tuple[str, ...]) -> None:
+        """Compila el esquema del paquete.
+
+        Args:
+            name: Nombre del paquete (para los mensajes de error).
+            packet_id: PacketID a anteponer, o None para sub-registros sin PacketID.
+            fields: Tipos de los campos en orden (BYTE, INT16, INT32, FLOAT o STRING).
+
+        Raises:
+            ValueError: Si el esquema contiene un tipo de campo desconocido.
+        """
+        unknown = [field for field in fields if field not in _FIXED_FIELDS and field != STRING]
+        if unknown:
+            msg = f"{name}: tipos de campo desconocidos {unknown}"
+            raise ValueError(msg)
+
+        self.name = name
+        self.fields = fields
+        self._head: tuple[int, ...] = () if packet_id is None else (int(packet_id),)
+
+        # Tramos (struct, inicio, índice del string que lo cierra) + tramo final. Los
+        # índices son sobre los valores de ``encode``; el PacketID va en el primer tramo.
+        segments: list[tuple[struct.Struct, int, int]] = []
+        fmt = BYTE * len(self._head)
+        start = 0
+        for index, field in enumerate(fields):
+            if field == STRING:
+                fmt += "".join(fields[start:index]) + _STRING_LENGTH
+                segments.append((struct.Struct("<" + fmt), start, index))
+                fmt = ""
+                start = index + 1
+        tail = struct.Struct("<" + fmt + "".join(fields[start:]))
+
+        self._segments = tuple(segments)
+        self._tail = (tail, start)
+        self._fixed: struct.Struct | None = None if segments else tail
+
+    def encode(self, *values: float | str) -> bytes:
+        """Serializa los valores de los campos en el orden del esquema.
+
+        Args:
+            *values: Valores de los campos (sin el PacketID).
+
+        Returns:
+            Paquete serializado.
+
+        Raises:
+            ValueError: Si la cantidad de valores no coincide con el esquema o algún
+                valor no entra en su tipo (por ejemplo un byte fuera de 0-255).
+        """
+        if self._fixed is not None:
+            try:
+                return self._fixed.pack(*self._head, *values)
+            except struct.error as exc:
+                raise self._value_error(exc) from exc
+
+        if len(values) != len(self.fields):
+            msg = (
+                f"{self.name}: se esperaban {len(self.fields)} campos, se recibieron {len(values)}"
+            )
+            raise ValueError(msg)
+        parts: list[bytes] = []
+        prefix = self._head  # el PacketID va en el primer tramo
+        try:
+            for packer, start, index in self._segments:
+                encoded = values[index].encode("latin-1", errors="replace")  # type: ignore[union-attr]
+                parts += (packer.pack(*prefix, *values[start:index], len(encoded)), encoded)
+                prefix = ()
+            tail, start = self._tail
+            parts.append(tail.pack(*prefix, *values[start:]))
+        except struct.error as exc:
+            raise self._value_error(exc) from exc
+        return b"".join(parts)
+
+    def _value_error(self, exc: struct.error) -> ValueError:
+        return ValueError(f"{self.name}: {exc}")
+
+
+# Esquema de los paquetes del servidor: tipos de los campos después del PacketID
+SERVER_PACKET_SCHEMAS: dict[ServerPacketID, tuple[str, ...]] = {
+    # Sesión
+    ServerPacketID.LOGGED: (BYTE,),
+    ServerPacketID.PONG: (),
+    ServerPacketID.USER_CHAR_INDEX_IN_SERVER: (INT16,),
+    ServerPacketID.DICE_ROLL: (BYTE, BYTE, BYTE, BYTE, BYTE),
+    ServerPacketID.ATTRIBUTES: (BYTE, BYTE, BYTE, BYTE, BYTE),
+    # Personajes: char_index, body, head, heading, [x, y], weapon, shield, helmet, fx, loops
+    ServerPacketID.CHARACTER_REMOVE: (INT16,),
+    ServerPacketID.CHARACTER_CHANGE: (INT16, INT16, INT16, BYTE, *(INT16,) * 5),
+    ServerPacketID.CHARACTER_CREATE: (
+        *(INT16, INT16, INT16, BYTE, BYTE, BYTE),
+        *(INT16,) * 5,
+        *(STRING, BYTE, BYTE),  # nombre, color del nick, privilegios
+    ),
+    ServerPacketID.CHARACTER_MOVE: (INT16, BYTE, BYTE),
+    # Mapa
+    ServerPacketID.CHANGE_MAP: (INT16, INT16),
+    ServerPacketID.POS_UPDATE: (BYTE, BYTE),
+    ServerPacketID.OBJECT_CREATE: (BYTE, BYTE, INT16),
+    ServerPacketID.OBJECT_DELETE: (BYTE, BYTE),
+    ServerPacketID.BLOCK_POSITION: (BYTE, BYTE, BYTE),
+    # Audio y efectos visuales
+    ServerPacketID.PLAY_MIDI: (BYTE,),
+    ServerPacketID.PLAY_WAVE: (BYTE, BYTE, BYTE),
+    ServerPacketID.CREATE_FX: (INT16, INT16, INT16),
+    # Consola
+    ServerPacketID.CONSOLE_MSG: (STRING, BYTE),
+    ServerPacketID.ERROR_MSG: (STRING,),
+    # Stats del jugador
+    ServerPacketID.UPDATE_HP: (INT16,),
+    ServerPacketID.UPDATE_MANA: (INT16,),
+    ServerPacketID.UPDATE_STA: (INT16,),
+    ServerPacketID.UPDATE_EXP: (INT32,),
+    ServerPacketID.UPDATE_GOLD: (INT32,),
+    ServerPacketID.UPDATE_BANK_GOLD: (INT32,),
+    ServerPacketID.UPDATE_HUNGER_AND_THIRST: (BYTE, BYTE, BYTE, BYTE),
+    ServerPacketID.UPDATE_STRENGTH_AND_DEXTERITY: (BYTE, BYTE),
+    ServerPacketID.UPDATE_STRENGTH: (BYTE,),
+    ServerPacketID.UPDATE_DEXTERITY: (BYTE,),
+    # max/min de hp, mana y stamina + oro, nivel, elu, experiencia
+    ServerPacketID.UPDATE_USER_STATS: (*(INT16,) * 6, INT32, BYTE, INT32, INT32),
+    ServerPacketID.SEND_SKILLS: (INT16,) * 9,
+    # Inventario, banco y comercio con NPCs (los últimos cuatro: max/min hit, max/min def)
+    ServerPacketID.CHANGE_INVENTORY_SLOT: (
+        *(BYTE, INT16, STRING, INT16, BYTE, INT16, BYTE),
+        *(INT16,) * 4,
+        FLOAT,  # precio de venta
+    ),
+    ServerPacketID.CHANGE_BANK_SLOT: (BYTE, INT16, STRING, INT16, INT16, BYTE, *(INT16,) * 4),
+    ServerPacketID.CHANGE_NPC_INVENTORY_SLOT: (
+        *(BYTE, STRING, INT16, FLOAT, INT16, INT16, BYTE),
+        *(INT16,) * 4,
+    ),
+    ServerPacketID.CHANGE_SPELL_SLOT: (BYTE, INT16, STRING),
+    ServerPacketID.COMMERCE_INIT: (INT16, BYTE),  # + un COMMERCE_ITEM_SCHEMA por item
+    ServerPacketID.COMMERCE_END: (),
+    # Efectos de estado
+    ServerPacketID.BLIND: (),
+    ServerPacketID.BLIND_NO_MORE: (),
+    ServerPacketID.DUMB: (),
+    ServerPacketID.DUMB_NO_MORE: (),
+    ServerPacketID.PARALIZE_OK: (),
+    ServerPacketID.REST_OK: (),
+    ServerPacketID.SET_INVISIBLE: (INT16, BYTE),
+    ServerPacketID.UPDATE_TAG_AND_STATUS: (INT16, BYTE, STRING),
+    # Comercio entre jugadores
+    ServerPacketID.USER_COMMERCE_INIT: (STRING,),
+    ServerPacketID.USER_COMMERCE_END: (),
+    # Clanes: nombre, fundador, fecha, líder, url, miembros, elecciones, alineación,
+    # enemigos, aliados, puntos de antifacción, códices, descripción
+    ServerPacketID.CLAN_DETAILS: (
+        *(STRING,) * 5,
+        *(INT32, BYTE, STRING, INT32, INT32),
+        *(STRING,) * 3,
+    ),
+}
+
+# Registro de item de COMMERCE_INIT: slot, item_id, nombre, cantidad, precio, grh,
+# tipo, max_hit, min_hit, max_def, min_def
+COMMERCE_ITEM_SCHEMA: tuple[str, ...] = (
+    *(BYTE, INT16, STRING, INT16, INT16, INT16, BYTE),
+    *(INT16,) * 4,
+)
+
+SERVER_PACKET_CODECS: dict[ServerPacketID, PacketCodec] = {
+    packet_id: PacketCodec(packet_id.name, packet_id, fields)
+    for packet_id, fields in SERVER_PACKET_SCHEMAS.items()
+}
+COMMERCE_ITEM_CODEC = PacketCodec("COMMERCE_INIT_ITEM", None, COMMERCE_ITEM_SCHEMA)
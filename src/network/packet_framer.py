@@ -20,6 +20,10 @@ responsabilidades:
 3. Aplicar un límite duro de buffer (``MAX_BUFFER_BYTES``) para evitar que
    un cliente malicioso retenga memoria indefinida con un packet "pendiente".
 
+El buffer se consume avanzando un offset de lectura y los probes de longitud
+reciben un ``memoryview``: extraer N packets de un mismo ``recv`` no copia el
+buffer pendiente N veces, solo los bytes de cada packet devuelto.
+
 Este módulo es puro: no hace I/O ni depende de asyncio.
 """
 
@@ -30,6 +34,34 @@ from typing import ClassVar
 
 from src.network.packet_id import ClientPacketID
 
+# Cabecera de un ClientHello TLS (record type + versión mayor + menor).
+TLS_HEADER_MIN_LENGTH = 3
+TLS_CONTENT_TYPE_HANDSHAKE = 0x16
+TLS_PROTOCOL_MAJOR_VERSION = 0x03
+TLS_CLIENT_HELLO_MINOR_VERSIONS = frozenset({0x00, 0x01, 0x02, 0x03, 0x04})
+
+
+def looks_like_tls_handshake(data: bytes) -> bool:
+    """Detecta si los bytes recibidos parecen el inicio de un ClientHello TLS.
+
+    Un cliente TLS contra un servidor sin SSL no habla el protocolo AO: esos
+    bytes no deben pasar por el framer (se desincronizaría o cortaría con un
+    ``UnknownPacketError`` poco descriptivo).
+
+    Args:
+        data: Primeros bytes recibidos de la conexión.
+
+    Returns:
+        True si coinciden con la cabecera de un ClientHello TLS.
+    """
+    if len(data) < TLS_HEADER_MIN_LENGTH:
+        return False
+    return (
+        data[0] == TLS_CONTENT_TYPE_HANDSHAKE
+        and data[1] == TLS_PROTOCOL_MAJOR_VERSION
+        and data[2] in TLS_CLIENT_HELLO_MINOR_VERSIONS
+    )
+
 
 class FramingError(Exception):
     """Error irrecuperable de framing: se debe cerrar la conexión."""
@@ -98,6 +130,7 @@ class PacketFramer:
         ClientPacketID.PARTY_LEAVE: 1,
         ClientPacketID.PARTY_CREATE: 1,
         ClientPacketID.PING: 1,
+        ClientPacketID.SAFE_TOGGLE: 1,
         # Packets con 1 byte de payload.
         ClientPacketID.WALK: 2,
         ClientPacketID.USE_ITEM: 2,
@@ -134,6 +167,15 @@ class PacketFramer:
     def __init__(self) -> None:
         """Inicializa el framer con buffer vacío."""
         self._buffer = bytearray()
+        # Offset del próximo byte sin consumir. Los packets extraídos no se
+        # borran del buffer uno a uno: se compacta una sola vez por ``feed``.
+        self._read_pos = 0
+        # Métricas de framing (ver ``get_metrics``).
+        self._reads = 0
+        self._bytes_received = 0
+        self._packets_framed = 0
+        self._max_packets_per_read = 0
+        self._partial_reads = 0
 
     # ----------------------------------------------------------------- API
 
@@ -148,17 +190,27 @@ class PacketFramer:
         """
         if not data:
             return
-        if len(self._buffer) + len(data) > self.MAX_BUFFER_BYTES:
+        pending = self.buffer_size
+        if pending + len(data) > self.MAX_BUFFER_BYTES:
             msg = (
                 f"Buffer de framing superó {self.MAX_BUFFER_BYTES} bytes "
-                f"(actual={len(self._buffer)}, recibido={len(data)})"
+                f"(actual={pending}, recibido={len(data)})"
             )
             raise BufferOverflowError(msg)
+        if self._read_pos:
+            # Compactar: descartar de una vez los bytes ya consumidos.
+            del self._buffer[: self._read_pos]
+            self._read_pos = 0
         self._buffer.extend(data)
+        self._reads += 1
+        self._bytes_received += len(data)
 
     def next_packet(self) -> bytes | None:
         """Extrae un packet completo del buffer si es posible.
 
+        Los probes de longitud trabajan sobre un ``memoryview`` del buffer
+        (sin copiar los bytes pendientes); solo se copia el packet extraído.
+
         Returns:
             Los bytes del próximo packet (incluido packet_id) o ``None`` si
             hacen falta más bytes.
@@ -166,36 +218,88 @@ class PacketFramer:
         Raises:
             UnknownPacketError: Si el ``packet_id`` no está soportado.
         """
-        if not self._buffer:
+        start = self._read_pos
+        available = len(self._buffer) - start
+        if available <= 0:
             return None
 
-        packet_id = self._buffer[0]
-        length = self._peek_packet_length(bytes(self._buffer), packet_id)
+        packet_id = self._buffer[start]
+        length = self._FIXED_LENGTHS.get(packet_id)
+        with memoryview(self._buffer) as view:
+            if length is None:
+                with view[start:] as pending:
+                    length = self._peek_packet_length(pending, packet_id)
 
-        if length is None:
-            # Necesitamos más bytes: probe indica incompleto.
-            return None
+            if length is None:
+                # Necesitamos más bytes: probe indica incompleto.
+                return None
 
-        if length <= 0:
-            # Contrato de probe: length > 0 siempre que packet_id sea conocido.
-            raise UnknownPacketError(packet_id)
+            if length <= 0:
+                # Contrato de probe: length > 0 siempre que packet_id sea conocido.
+                raise UnknownPacketError(packet_id)
 
-        if length > len(self._buffer):
-            return None  # Packet conocido pero truncado.
+            if length > available:
+                return None  # Packet conocido pero truncado.
 
-        packet = bytes(self._buffer[:length])
-        del self._buffer[:length]
+            packet = view[start : start + length].tobytes()
+
+        self._read_pos = start + length
+        if self._read_pos == len(self._buffer):
+            # Buffer consumido por completo: reiniciar sin mover memoria.
+            self._buffer.clear()
+            self._read_pos = 0
+        self._packets_framed += 1
         return packet
 
+    def drain(self) -> list[bytes]:
+        """Extrae todos los packets completos disponibles en el buffer.
+
+        Pensado para llamarse una vez por cada ``feed``: un único ``recv`` con
+        varios packets concatenados (ej: WALK + ATTACK + USE_ITEM) se traduce
+        en N packets listos para despachar. Propaga ``UnknownPacketError`` de
+        ``next_packet`` si algún ``packet_id`` no está soportado.
+
+        Returns:
+            Lista de packets completos, en orden de llegada (puede ser vacía).
+        """
+        packets: list[bytes] = []
+        while (packet := self.next_packet()) is not None:
+            packets.append(packet)
+
+        self._max_packets_per_read = max(self._max_packets_per_read, len(packets))
+        if self._read_pos < len(self._buffer):
+            self._partial_reads += 1
+        return packets
+
     @property
     def buffer_size(self) -> int:
         """Bytes pendientes (útil para métricas)."""
-        return len(self._buffer)
+        return len(self._buffer) - self._read_pos
+
+    def get_metrics(self) -> dict[str, int | float]:
+        """Obtiene las métricas de framing acumuladas.
+
+        Returns:
+            Diccionario con lecturas, bytes, packets extraídos, máximo de
+            packets por lectura, lecturas con packet parcial pendiente y
+            promedio de packets por lectura.
+        """
+        return {
+            "reads": self._reads,
+            "bytes_received": self._bytes_received,
+            "packets_framed": self._packets_framed,
+            "max_packets_per_read": self._max_packets_per_read,
+            "partial_reads": self._partial_reads,
+            "avg_packets_per_read": (
+                self._packets_framed / self._reads if self._reads > 0 else 0.0
+            ),
+            "buffered_bytes": self.buffer_size,
+        }
 
     # ------------------------------------------------------- longitud probes
 
     @classmethod
-    def _peek_packet_length(cls, buf: bytes, packet_id: int) -> int | None:
+    def _peek_packet_length(cls, buf: bytes | memoryview, packet_id: int) -> int | None:
         """Devuelve la longitud total del próximo packet, o None si incompleto.
 
         Contrato:
@@ -208,8 +312,9 @@ class PacketFramer:
             Longitud en bytes, ``None`` si el buffer está incompleto,
             ``-1`` si el ``packet_id`` es desconocido.
         """
-        if packet_id in cls._FIXED_LENGTHS:
-            return cls._FIXED_LENGTHS[packet_id]
+        fixed = cls._FIXED_LENGTHS.get(packet_id)
+        if fixed is not None:
+            return fixed
 
         probe = cls._VARIABLE_PROBES.get(packet_id)
         if probe is None:
@@ -218,12 +323,13 @@ class PacketFramer:
         return probe(buf)
 
     # Probes de longitud para packets variables.
-    # Cada probe recibe el buffer crudo (empezando por packet_id) y devuelve:
+    # Cada probe recibe el buffer crudo (empezando por packet_id, normalmente
+    # un memoryview sin copia) y devuelve:
     # - int > 0: longitud total del packet
     # - None: buffer incompleto (hace falta más bytes)
 
     @staticmethod
-    def _probe_login(buf: bytes) -> int | None:
+    def _probe_login(buf: bytes | memoryview) -> int | None:
         """LOGIN (0) según el cliente Godot.
 
         Layout (WriteLoginExistingCharacter):
@@ -244,7 +350,7 @@ class PacketFramer:
         return after_strings + trailer
 
     @staticmethod
-    def _probe_create_account(buf: bytes) -> int | None:
+    def _probe_create_account(buf: bytes | memoryview) -> int | None:
         """CREATE_ACCOUNT (2) según el cliente Godot (WriteLoginNewChar).
 
         Layout:
@@ -274,7 +380,7 @@ class PacketFramer:
         return after_email + 1  # + 1 byte de home
 
     @staticmethod
-    def _probe_single_string(buf: bytes) -> int | None:
+    def _probe_single_string(buf: bytes | memoryview) -> int | None:
         """Packet con un único string variable (TALK, YELL, PARTY_MESSAGE, etc.).
 
         Returns:
@@ -283,7 +389,7 @@ class PacketFramer:
         return _probe_n_strings(buf, start_offset=1, num_strings=1)
 
     @staticmethod
-    def _probe_two_strings(buf: bytes) -> int | None:
+    def _probe_two_strings(buf: bytes | memoryview) -> int | None:
         """Packet con dos strings variables (WHISPER: receiver + message).
 
         Returns:
@@ -292,7 +398,7 @@ class PacketFramer:
         return _probe_n_strings(buf, start_offset=1, num_strings=2)
 
     @staticmethod
-    def _probe_gm_commands(buf: bytes) -> int | None:
+    def _probe_gm_commands(buf: bytes | memoryview) -> int | None:
         """GM_COMMANDS (122): subcmd(1) + username(str) + map_id(i16) + x(1) + y(1).
 
         Returns:
@@ -304,10 +410,10 @@ class PacketFramer:
             return None
         return after_string + 4  # map_id(2) + x(1) + y(1)
 
-    _VARIABLE_PROBES: ClassVar[dict[int, Callable[[bytes], int | None]]]
+    _VARIABLE_PROBES: ClassVar[dict[int, Callable[[bytes | memoryview], int | None]]]
 
 
-def _probe_n_strings(buf: bytes, start_offset: int, num_strings: int) -> int | None:
+def _probe_n_strings(buf: bytes | memoryview, start_offset: int, num_strings: int) -> int | None:
     """Avanza ``num_strings`` campos (u16 length + bytes) en el buffer.
 
     Args:
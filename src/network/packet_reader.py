@@ -3,6 +3,14 @@
 import logging
 import struct
 
+logger = logging.getLogger(__name__)
+
+# Structs precompilados: se leen con unpack_from sobre el buffer, sin cortar slices
+_UINT8 = struct.Struct("B")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+
 
 class PacketReader:
     """Lee datos de un packet de forma secuencial y type-safe.
@@ -33,7 +41,7 @@ class PacketReader:
             Valor entero sin signo (0-255).
         """
         self.ensure_remaining_bytes(1, "read_byte")
-        value: int = struct.unpack("B", self.data[self.offset : self.offset + 1])[0]
+        value: int = _UINT8.unpack_from(self.data, self.offset)[0]
         self.offset += 1
         return value
 
@@ -44,7 +52,7 @@ class PacketReader:
             Valor entero sin signo (0-65535).
         """
         self.ensure_remaining_bytes(2, "read_int16")
-        value: int = struct.unpack("<H", self.data[self.offset : self.offset + 2])[0]
+        value: int = _UINT16.unpack_from(self.data, self.offset)[0]
         self.offset += 2
         return value
 
@@ -55,7 +63,7 @@ class PacketReader:
             Valor entero sin signo (0-4294967295).
         """
         self.ensure_remaining_bytes(4, "read_int32")
-        value: int = struct.unpack("<I", self.data[self.offset : self.offset + 4])[0]
+        value: int = _UINT32.unpack_from(self.data, self.offset)[0]
         self.offset += 4
         return value
 
@@ -87,24 +95,20 @@ class PacketReader:
         Returns:
             String decodificado.
         """
-        import logging  # noqa: PLC0415
-
-        logger = logging.getLogger(__name__)
-
         length = self.read_int16()
         self.ensure_remaining_bytes(length, "read_string")
         string_bytes = self.data[self.offset : self.offset + length]
 
-        logger.debug(
-            "read_string: length=%d, bytes=%s",
-            length,
-            string_bytes.hex() if string_bytes else "empty",
-        )
-
         value = string_bytes.decode("utf-16-le")
         self.offset += length
 
-        logger.debug("read_string: decoded='%s'", value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "read_string: length=%d, bytes=%s, decoded='%s'",
+                length,
+                string_bytes.hex() if string_bytes else "empty",
+                value,
+            )
 
         return value
 
@@ -118,31 +122,20 @@ class PacketReader:
         Returns:
             String decodificado.
         """
-        import logging  # noqa: PLC0415
-
-        logger = logging.getLogger(__name__)
-
         length = self.read_int16()
-        logger.debug(
-            "read_ascii_string: length from packet=%d, offset=%d, remaining=%d",
-            length,
-            self.offset,
-            len(self.data) - self.offset,
-        )
         self.ensure_remaining_bytes(length, "read_ascii_string")
         string_bytes = self.data[self.offset : self.offset + length]
 
-        logger.debug(
-            "read_ascii_string: length=%d, bytes=%s, hex=%s",
-            length,
-            string_bytes,
-            string_bytes.hex() if string_bytes else "empty",
-        )
-
         value = string_bytes.decode("latin-1")  # Latin-1 soporta caracteres especiales
         self.offset += length
 
-        logger.debug("read_ascii_string: decoded='%s' (len=%d)", value, len(value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "read_ascii_string: length=%d, hex=%s, decoded='%s'",
+                length,
+                string_bytes.hex() if string_bytes else "empty",
+                value,
+            )
 
         return value
 
@@ -159,11 +152,9 @@ class PacketReader:
         Returns:
             String decodificado.
         """
-        logger = logging.getLogger(__name__)
-
         # Leer longitud (int32, little-endian)
         self.ensure_remaining_bytes(4, "read_godot_put_string (length)")
-        length = struct.unpack("<i", self.data[self.offset : self.offset + 4])[0]
+        length = _INT32.unpack_from(self.data, self.offset)[0]
         self.offset += 4
 
         logger.debug(
@@ -186,14 +177,14 @@ class PacketReader:
         string_bytes = self.data[self.offset : self.offset + length]
         self.offset += length
 
-        logger.debug(
-            "read_godot_put_string: bytes=%s, hex=%s",
-            string_bytes,
-            string_bytes.hex() if string_bytes else "empty",
-        )
-
         value = string_bytes.decode(encoding)
-        logger.debug("read_godot_put_string: decoded='%s' (len=%d)", value, len(value))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "read_godot_put_string: hex=%s, decoded='%s' (len=%d)",
+                string_bytes.hex(),
+                value,
+                len(value),
+            )
 
         return value
 
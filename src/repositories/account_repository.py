@@ -1,9 +1,24 @@
-"""Repositorio para operaciones de cuentas de usuario usando Redis."""
+"""Repositorio para operaciones de cuentas de usuario usando Redis.
+
+Las cuentas se guardan por username; el índice inverso
+``RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID`` resuelve ``user_id -> username`` en
+O(1); las cuentas anteriores al índice se indexan al iniciar el servidor (y,
+si aun así falta alguna, con un backfill automático ante el primer miss). Los
+datos de apariencia (``char_race``, ``char_head``, ``username``), que
+se consultan por cada jugador visible al entrar a un mapa, se cachean en un
+LRU en proceso que se invalida en cada escritura de la cuenta.
+"""
 
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
-from src.utils.password_utils import verify_password as verify_password_hash
+from src.utils.password_utils import (
+    PasswordPoolBusyError,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
@@ -13,17 +28,29 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Campos de la cuenta que forman la apariencia cacheada
+APPEARANCE_FIELDS = ("char_race", "char_head", "username")
+
+# Entradas máximas del LRU de apariencias
+DEFAULT_APPEARANCE_CACHE_SIZE = 2048
+
 
 class AccountRepository:
     """Repositorio para operaciones de cuentas de usuario."""
 
-    def __init__(self, redis_client: RedisClient) -> None:
+    def __init__(
+        self, redis_client: RedisClient, appearance_cache_size: int = DEFAULT_APPEARANCE_CACHE_SIZE
+    ) -> None:
         """Inicializa el repositorio.
 
         Args:
             redis_client: Cliente Redis para operaciones de bajo nivel.
+            appearance_cache_size: Entradas máximas del LRU de apariencias.
         """
         self.redis = redis_client
+        self._appearance_cache_size = appearance_cache_size
+        self._appearance_cache: OrderedDict[int, dict[str, str]] = OrderedDict()
+        self._index_backfilled = False
 
     async def create_account(
         self, username: str, password_hash: str, email: str, char_data: dict[str, int] | None = None
@@ -79,6 +106,8 @@ class AccountRepository:
             )
 
         await self.redis.hset(account_key, mapping=account_data)
+        await self.redis.hset_field(RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID, str(user_id), username)
+        self.invalidate_appearance(user_id)
         logger.info("Cuenta creada: %s (ID: %d)", username, user_id)
 
         return user_id
@@ -103,6 +132,11 @@ class AccountRepository:
     async def verify_password(self, username: str, password: str) -> bool:
         """Verifica si la contraseña es correcta.
 
+        La verificación Argon2 corre en el pool de contraseñas y propaga
+        ``PasswordPoolBusyError`` si está saturado. Si el hash almacenado usa
+        parámetros viejos se regenera con los actuales (oportunísticamente: si
+        el pool está saturado se deja para otro login).
+
         Args:
             username: Nombre de usuario.
             password: Contraseña en texto plano enviada por el cliente.
@@ -116,7 +150,17 @@ class AccountRepository:
             return False
 
         stored_hash = account_data.get("password_hash", "")
-        return verify_password_hash(password, stored_hash)
+        if not await verify_password_async(password, stored_hash):
+            return False
+
+        if needs_rehash(stored_hash):
+            try:
+                new_hash = await hash_password_async(password)
+            except PasswordPoolBusyError:
+                return True
+            await self.redis.hset_field(RedisKeys.account_data(username), "password_hash", new_hash)
+            logger.info("Hash de contraseña actualizado a los parámetros actuales: %s", username)
+        return True
 
     async def is_gm(self, username: str) -> bool:
         """Verifica si un usuario es Game Master.
@@ -143,8 +187,20 @@ class AccountRepository:
         """
         account_key = RedisKeys.account_data(username)
         await self.redis.hset(account_key, "is_gm", "1" if is_gm else "0")
+        self._invalidate_username(username)
         logger.info("Estado GM actualizado para %s: %s", username, "GM" if is_gm else "No GM")
 
+    async def get_username_by_user_id(self, user_id: int) -> str | None:
+        """Resuelve el username de un user_id usando el índice inverso.
+
+        Args:
+            user_id: ID del usuario.
+
+        Returns:
+            Username o None si el user_id no está indexado.
+        """
+        return await self.redis.hget(RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID, str(user_id))
+
     async def get_account_by_user_id(self, user_id: int) -> dict[str, str] | None:
         """Obtiene los datos de una cuenta por user_id.
 
@@ -154,24 +210,156 @@ class AccountRepository:
         Returns:
             Diccionario con los datos de la cuenta o None si no existe.
         """
-        # Buscar en todas las cuentas (esto es ineficiente, pero funcional por ahora)
-        # En el futuro, podríamos mantener un índice user_id -> username en Redis
-        # Por ahora, iteramos sobre las claves de cuentas
-        pattern = "account:*:data"
-        keys = await self.redis.keys(pattern)
-        logger.debug("Buscando cuenta para user_id=%d, encontradas %d claves", user_id, len(keys))
+        username = await self.get_username_by_user_id(user_id)
+        if username is None and await self._backfill_on_miss():
+            username = await self.get_username_by_user_id(user_id)
+        if username is None:
+            logger.warning("No se encontró cuenta para user_id=%d en el índice", user_id)
+            return None
+
+        account_data = await self.get_account(username)
+        if account_data is None or account_data.get("user_id") != str(user_id):
+            logger.warning("Índice de cuentas desactualizado para user_id=%d", user_id)
+            return None
+        return account_data
+
+    async def get_account_appearance(self, user_id: int) -> dict[str, str] | None:
+        """Obtiene la apariencia de una cuenta (``char_race``, ``char_head``, ``username``).
+
+        Usa el LRU en proceso; solo consulta Redis ante un miss.
+
+        Args:
+            user_id: ID del usuario.
+
+        Returns:
+            Diccionario con los campos de apariencia presentes en la cuenta o
+            None si la cuenta no existe.
+        """
+        cached = self._appearance_cache.get(user_id)
+        if cached is not None:
+            self._appearance_cache.move_to_end(user_id)
+            return cached
+
+        account_data = await self.get_account_by_user_id(user_id)
+        if account_data is None:
+            return None
 
+        return self._remember_appearance(user_id, account_data)
+
+    async def get_account_appearances(self, user_ids: list[int]) -> dict[int, dict[str, str]]:
+        """Obtiene la apariencia de varias cuentas a la vez.
+
+        Los hits del LRU no tocan Redis; los misses se resuelven con un HMGET
+        del índice inverso y un único pipeline de HGETALL de las cuentas.
+
+        Args:
+            user_ids: IDs de los usuarios.
+
+        Returns:
+            Diccionario {user_id: apariencia} (sin las cuentas inexistentes).
+        """
+        appearances: dict[int, dict[str, str]] = {}
+        missing: list[int] = []
+        for user_id in user_ids:
+            cached = self._appearance_cache.get(user_id)
+            if cached is None:
+                missing.append(user_id)
+            else:
+                self._appearance_cache.move_to_end(user_id)
+                appearances[user_id] = cached
+        if not missing:
+            return appearances
+
+        index_fields = [str(user_id) for user_id in missing]
+        usernames = await self.redis.hmget(RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID, index_fields)
+        if None in usernames and await self._backfill_on_miss():
+            usernames = await self.redis.hmget(RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID, index_fields)
+        resolved = [
+            (user_id, username)
+            for user_id, username in zip(missing, usernames, strict=True)
+            if username is not None
+        ]
+        if not resolved:
+            return appearances
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for _, username in resolved:
+            pipeline.hgetall(RedisKeys.account_data(username))
+        accounts: list[dict[str, str]] = await pipeline.execute()
+
+        for (user_id, _), account_data in zip(resolved, accounts, strict=True):
+            if not account_data or account_data.get("user_id") != str(user_id):
+                logger.warning("Índice de cuentas desactualizado para user_id=%d", user_id)
+                continue
+            appearances[user_id] = self._remember_appearance(user_id, account_data)
+        return appearances
+
+    def _remember_appearance(self, user_id: int, account_data: dict[str, str]) -> dict[str, str]:
+        appearance = {
+            field: account_data[field] for field in APPEARANCE_FIELDS if field in account_data
+        }
+        self._appearance_cache[user_id] = appearance
+        if len(self._appearance_cache) > self._appearance_cache_size:
+            self._appearance_cache.popitem(last=False)
+        return appearance
+
+    def invalidate_appearance(self, user_id: int) -> None:
+        """Descarta la apariencia cacheada de un usuario.
+
+        Args:
+            user_id: ID del usuario.
+        """
+        self._appearance_cache.pop(user_id, None)
+
+    def _invalidate_username(self, username: str) -> None:
+        """Descarta las apariencias cacheadas de un username."""
+        stale = [
+            user_id
+            for user_id, appearance in self._appearance_cache.items()
+            if appearance.get("username") == username
+        ]
+        for user_id in stale:
+            del self._appearance_cache[user_id]
+
+    async def backfill_user_id_index(self) -> int:
+        """Reconstruye el índice ``user_id -> username`` desde las cuentas existentes.
+
+        Se corre al iniciar el servidor. Recorre las cuentas con SCAN (no bloquea
+        Redis como KEYS) y escribe el índice con pipelines. Es idempotente.
+
+        Returns:
+            Cantidad de cuentas indexadas.
+        """
+        keys = await self.redis.scan_keys(RedisKeys.account_data("*"))
+        if not keys:
+            return 0
+
+        read_pipe = self.redis.pipeline(transaction=False)
         for key in keys:
-            account_data: dict[str, str] = await self.redis.hgetall(key)
-            account_user_id_str = account_data.get("user_id")
-            if account_user_id_str == str(user_id):
-                logger.debug("Cuenta encontrada para user_id=%d en key=%s", user_id, key)
-                return account_data
-
-        logger.warning(
-            "No se encontró cuenta para user_id=%d después de revisar %d claves", user_id, len(keys)
-        )
-        return None
+            read_pipe.hmget(key, ["user_id", "username"])
+        results: list[list[str | None]] = await read_pipe.execute()
+
+        index = {user_id: username for user_id, username in results if user_id and username}
+        if index:
+            await self.redis.hset(RedisKeys.ACCOUNTS_USERNAME_BY_USER_ID, mapping=index)
+        self._index_backfilled = True
+        logger.info("Índice user_id -> username reconstruido: %d cuentas", len(index))
+        return len(index)
+
+    async def _backfill_on_miss(self) -> bool:
+        """Reconstruye el índice ante un miss, una sola vez por proceso.
+
+        Cubre cuentas anteriores al índice si no se corrió el backfill de inicio;
+        los misses posteriores (user_id inexistentes) no vuelven a escanear.
+
+        Returns:
+            True si se reconstruyó el índice y conviene reintentar la búsqueda.
+        """
+        if self._index_backfilled:
+            return False
+        logger.warning("user_id sin entrada en el índice de cuentas: reconstruyendo índice")
+        await self.backfill_user_id_index()
+        return True
 
     async def is_gm_by_user_id(self, user_id: int) -> bool:
         """Verifica si un usuario es Game Master por user_id.
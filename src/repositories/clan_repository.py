@@ -1,6 +1,12 @@
 """Repository for Clan System persistence in Redis.
 
 Handles storage and retrieval of clans, memberships, and invitations.
+
+Clans and user memberships are kept in an in-process identity map (same
+scheme as ``PartyRepository``): once read they are served from memory, and
+every mutation updates the map and is written through to Redis. Only online
+users are indexed, and a clan is evicted when its last online member is
+forgotten.
 """
 
 # mypy: disable-error-code="misc,no-any-return"
@@ -17,7 +23,7 @@ if TYPE_CHECKING:
 
 
 class ClanRepository:
-    """Repository for clan data persistence using Redis."""
+    """Repository for clan data persistence using Redis, with an in-memory identity map."""
 
     # Redis key patterns
     CLAN_KEY = "clan:{clan_id}"
@@ -40,6 +46,51 @@ class ClanRepository:
             redis_client: Redis client instance
         """
         self.redis = redis_client
+        self._clans: dict[int, Clan] = {}
+        self._user_clans: dict[int, int | None] = {}  # user_id -> clan_id (None: no clan)
+        self._online_members: dict[int, set[int]] = {}  # clan_id -> indexed user_ids
+
+    def _cache_clan(self, clan: Clan) -> Clan:
+        """Store a clan in the identity map if an online user points to it.
+
+        Returns:
+            Clan: The cached instance (an already cached one wins over ``clan``).
+        """
+        if clan.clan_id not in self._online_members:
+            return clan
+        return self._clans.setdefault(clan.clan_id, clan)
+
+    def _point_user(self, user_id: int, clan_id: int | None) -> None:
+        """Index an online user's clan (None: no clan).
+
+        A clan left without online users is evicted from the identity map.
+        """
+        previous = self._user_clans.get(user_id)
+        self._user_clans[user_id] = clan_id
+        if previous == clan_id:
+            return
+        if clan_id is not None:
+            self._online_members.setdefault(clan_id, set()).add(user_id)
+        if previous is not None:
+            self._drop_online_member(previous, user_id)
+
+    def _drop_online_member(self, clan_id: int, user_id: int) -> None:
+        online = self._online_members.get(clan_id)
+        if online is None:
+            return
+        online.discard(user_id)
+        if not online:
+            del self._online_members[clan_id]
+            self._clans.pop(clan_id, None)
+
+    def forget_user(self, user_id: int) -> None:
+        """Drop a disconnected user from the identity map.
+
+        The user's clan is dropped too when it was the last online member.
+        """
+        clan_id = self._user_clans.pop(user_id, None)
+        if clan_id is not None:
+            self._drop_online_member(clan_id, user_id)
 
     async def initialize(self) -> None:
         """Initialize repository - create next clan ID if not exists."""
@@ -114,6 +165,16 @@ class ClanRepository:
 
         await pipe.execute()
 
+        # Online users that were removed from the clan no longer point to it
+        for user_id in list(self._online_members.get(clan.clan_id, ())):
+            if user_id not in clan.members:
+                self._point_user(user_id, None)
+        for user_id in clan.members:
+            if user_id in self._user_clans:
+                self._point_user(user_id, clan.clan_id)
+        if clan.clan_id in self._online_members:
+            self._clans[clan.clan_id] = clan
+
     async def clear_user_clan(self, user_id: int) -> None:
         """Remove the clan reference for a user.
 
@@ -121,9 +182,11 @@ class ClanRepository:
             user_id: ID of the user to clear.
         """
         await self.redis.delete(self.USER_CLAN_KEY.format(user_id=user_id))
+        if user_id in self._user_clans:
+            self._point_user(user_id, None)
 
     async def get_clan(self, clan_id: int) -> Clan | None:
-        """Get clan by ID.
+        """Get clan by ID, loading it from Redis on the first access.
 
         Args:
             clan_id: ID of the clan.
@@ -131,6 +194,10 @@ class ClanRepository:
         Returns:
             Clan if found, None otherwise.
         """
+        cached = self._clans.get(clan_id)
+        if cached is not None:
+            return cached
+
         data_str = await self.redis.get(self.CLAN_KEY.format(clan_id=clan_id))
         if not data_str:
             return None
@@ -138,7 +205,7 @@ class ClanRepository:
         data = json.loads(data_str)
         members = await self._get_clan_members(clan_id)
 
-        return ClanRepository._deserialize_clan(data, members)
+        return self._cache_clan(ClanRepository._deserialize_clan(data, members))
 
     async def get_clan_by_name(self, name: str) -> Clan | None:
         """Get clan by name (case-insensitive).
@@ -164,11 +231,20 @@ class ClanRepository:
         Returns:
             Clan if user is in a clan, None otherwise.
         """
+        if user_id in self._user_clans:
+            cached_id = self._user_clans[user_id]
+            return None if cached_id is None else await self.get_clan(cached_id)
+
         clan_id = await self.redis.get(self.USER_CLAN_KEY.format(user_id=user_id))
         if not clan_id:
+            self._point_user(user_id, None)
             return None
 
-        return await self.get_clan(int(clan_id))
+        self._point_user(user_id, int(clan_id))
+        clan = await self.get_clan(int(clan_id))
+        if clan is None:
+            self._point_user(user_id, None)
+        return clan
 
     async def delete_clan(self, clan_id: int) -> None:
         """Delete a clan and all its data.
@@ -197,6 +273,10 @@ class ClanRepository:
 
         await pipe.execute()
 
+        for user_id in list(self._online_members.get(clan_id, ())):
+            self._point_user(user_id, None)
+        self._clans.pop(clan_id, None)
+
     async def save_invitation(self, invitation: ClanInvitation) -> None:
         """Save a clan invitation.
 
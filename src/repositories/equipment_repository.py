@@ -8,22 +8,39 @@ from src.utils.redis_config import RedisKeys
 from src.utils.redis_decorators import require_redis
 
 if TYPE_CHECKING:
+    from src.repositories.inventory_cache import InventoryCache
     from src.utils.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
 
 
 class EquipmentRepository:
-    """Gestiona el equipamiento de los jugadores en Redis."""
+    """Gestiona el equipamiento de los jugadores en Redis.
 
-    def __init__(self, redis_client: RedisClient) -> None:
+    Si recibe el ``InventoryCache``, mantiene al día el flag de equipado de los
+    slots del inventario en memoria de los jugadores online.
+    """
+
+    def __init__(
+        self, redis_client: RedisClient, inventory_cache: InventoryCache | None = None
+    ) -> None:
         """Inicializa el repositorio de equipamiento.
 
         Args:
             redis_client: Cliente de Redis (RedisClient wrapper).
+            inventory_cache: Cache de inventarios online (opcional).
         """
         self.redis_client = redis_client
         self.redis = redis_client
+        self.inventory_cache = inventory_cache
+
+    def _set_cached_equipped(self, user_id: int, inventory_slot: int, *, equipped: bool) -> None:
+        """Actualiza el flag de equipado del slot en el inventario en memoria."""
+        if self.inventory_cache is None:
+            return
+        inventory = self.inventory_cache.get(user_id)
+        if inventory is not None:
+            inventory.set_equipped(inventory_slot, equipped=equipped)
 
     @require_redis(default_return=False)
     async def equip_item(self, user_id: int, slot: EquipmentSlot, inventory_slot: int) -> bool:
@@ -40,6 +57,7 @@ class EquipmentRepository:
         try:
             key = RedisKeys.player_equipment(user_id)
             await self.redis_client.hset(key, slot.value, str(inventory_slot))
+            self._set_cached_equipped(user_id, inventory_slot, equipped=True)
             logger.info(
                 "Item equipado: user_id=%d, slot=%s, inventory_slot=%d",
                 user_id,
@@ -65,7 +83,12 @@ class EquipmentRepository:
         """
         try:
             key = RedisKeys.player_equipment(user_id)
+            inventory_slot = None
+            if self.inventory_cache is not None and self.inventory_cache.is_loaded(user_id):
+                inventory_slot = await self.redis_client.hget(key, slot.value)
             result = await self.redis_client.hdel(key, slot.value)
+            if inventory_slot and inventory_slot.isdigit():
+                self._set_cached_equipped(user_id, int(inventory_slot), equipped=False)
             if result > 0:
                 logger.info("Item desequipado: user_id=%d, slot=%s", user_id, slot.value)
                 return True
@@ -155,6 +178,10 @@ class EquipmentRepository:
         try:
             key = RedisKeys.player_equipment(user_id)
             await self.redis_client.delete(key)
+            inventory = self.inventory_cache.get(user_id) if self.inventory_cache else None
+            if inventory is not None:
+                for inventory_slot in range(1, inventory.max_slots + 1):
+                    inventory.set_equipped(inventory_slot, equipped=False)
             logger.debug("Equipamiento limpiado para user_id %d", user_id)
         except Exception:
             logger.exception("Error al limpiar equipamiento")
@@ -1,9 +1,26 @@
-"""Repositorio para gestionar ground items (items en el suelo) en Redis."""
-
+"""Repositorio para gestionar ground items (items en el suelo) en Redis.
+
+Cada mapa es un hash ``ground_items:{map_id}`` con un campo por tile
+(``"x,y"``) cuyo valor es la lista de items del tile en MessagePack. Así una
+modificación cuesta un ``HSET``/``HDEL`` del tile y no reescribe el mapa
+completo. El cliente Redis decodifica respuestas como texto, por eso el
+MessagePack se guarda envuelto en base64.
+
+Las claves no tienen TTL: los items vencen en memoria según su ``spawn_time``
+persistido (ver ``GroundItemIndex.enable_expiry``), y solo una vez cargado su
+mapa. En modo eager se cargan al arrancar todos los mapas con items
+persistidos (``get_persisted_map_ids``); en modo lazy, al activar cada mapa, y
+los items que vencieron mientras tanto se retiran en la primera pasada.
+"""
+
+import base64
 import json
 import logging
 from typing import TYPE_CHECKING
 
+import msgpack  # type: ignore[import-untyped]
+from redis.exceptions import ResponseError
+
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
@@ -11,12 +28,43 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+GroundTileItems = list[dict[str, int | str | None]]
+
+# Patrón SCAN de las claves ``ground_items:{map_id}``
+GROUND_ITEMS_KEY_PATTERN = "ground_items:*"
+
+
+def encode_tile_items(items: GroundTileItems) -> str:
+    """Serializa los items de un tile (MessagePack en base64).
+
+    Returns:
+        Valor del campo del hash.
+    """
+    return base64.b64encode(msgpack.packb(items, use_bin_type=True)).decode("ascii")
+
+
+def decode_tile_items(value: str | bytes) -> GroundTileItems:
+    """Deserializa el valor de un campo del hash.
+
+    Returns:
+        Lista de items del tile.
+    """
+    items: GroundTileItems = msgpack.unpackb(base64.b64decode(value), raw=False)
+    return items
+
+
+def _tile_field(x: int, y: int) -> str:
+    return f"{x},{y}"
+
+
+def _parse_tile_field(field: str) -> tuple[int, int]:
+    x_str, y_str = field.split(",")
+    return int(x_str), int(y_str)
+
 
 class GroundItemsRepository:
     """Gestiona la persistencia de ground items en Redis."""
 
-    GROUND_ITEMS_TTL = 3600  # TTL de 1 hora para items en el suelo
-
     def __init__(self, redis_client: RedisClient) -> None:
         """Inicializa el repositorio.
 
@@ -26,10 +74,43 @@ class GroundItemsRepository:
         self.redis_client = redis_client
         self.redis = redis_client
 
+    async def save_tiles(self, map_id: int, tiles: dict[tuple[int, int], GroundTileItems]) -> None:
+        """Persiste solo los tiles indicados de un mapa (un pipeline).
+
+        Los tiles con lista vacía se borran del hash (``HDEL``); el resto se
+        escribe con un único ``HSET``.
+
+        Args:
+            map_id: ID del mapa.
+            tiles: Diccionario {(x, y): [items]} con los tiles modificados.
+        """
+        if not tiles:
+            return
+
+        key = RedisKeys.ground_items(map_id)
+        # Serializar antes del primer await: las listas en memoria pueden cambiar
+        mapping = {
+            _tile_field(x, y): encode_tile_items(items) for (x, y), items in tiles.items() if items
+        }
+        removed = [_tile_field(x, y) for (x, y), items in tiles.items() if not items]
+
+        pipeline = self.redis_client.pipeline(transaction=False)
+        if mapping:
+            pipeline.hset(key, mapping=mapping)
+        if removed:
+            pipeline.hdel(key, *removed)
+        await pipeline.execute()
+        logger.debug(
+            "Ground items mapa %d: %d tiles escritos, %d borrados",
+            map_id,
+            len(mapping),
+            len(removed),
+        )
+
     async def save_ground_items(
-        self, map_id: int, items: dict[tuple[int, int], list[dict[str, int | str | None]]]
+        self, map_id: int, items: dict[tuple[int, int], GroundTileItems]
     ) -> None:
-        """Guarda los ground items de un mapa en Redis.
+        """Reemplaza todos los ground items de un mapa en Redis.
 
         Args:
             map_id: ID del mapa.
@@ -37,31 +118,37 @@ class GroundItemsRepository:
         """
         try:
             key = RedisKeys.ground_items(map_id)
+            mapping = {
+                _tile_field(x, y): encode_tile_items(item_list)
+                for (x, y), item_list in items.items()
+                if item_list
+            }
 
-            # Convertir a formato serializable
-            serializable_items = {}
-            for (x, y), item_list in items.items():
-                coord_key = f"{x},{y}"
-                serializable_items[coord_key] = item_list
-
-            # Guardar en Redis como JSON
-            if serializable_items:
-                await self.redis_client.set(
-                    key, json.dumps(serializable_items), ex=self.GROUND_ITEMS_TTL
-                )
-                logger.debug(
-                    "Guardados %d tiles con items en mapa %d", len(serializable_items), map_id
-                )
-            else:
-                # Si no hay items, eliminar la clave
-                await self.redis_client.delete(key)
+            pipeline = self.redis_client.pipeline(transaction=True)
+            pipeline.delete(key)
+            if mapping:
+                pipeline.hset(key, mapping=mapping)
+            await pipeline.execute()
+
+            logger.debug("Guardados %d tiles con items en mapa %d", len(mapping), map_id)
 
         except Exception:
             logger.exception("Error al guardar ground items del mapa %d", map_id)
 
-    async def load_ground_items(
-        self, map_id: int
-    ) -> dict[tuple[int, int], list[dict[str, int | str | None]]]:
+    async def get_persisted_map_ids(self) -> list[int]:
+        """Obtiene los mapas que tienen ground items persistidos en Redis.
+
+        Returns:
+            IDs de mapa ordenados (vacío si falla el escaneo).
+        """
+        try:
+            keys = await self.redis_client.scan_keys(GROUND_ITEMS_KEY_PATTERN)
+        except Exception:
+            logger.exception("Error al buscar mapas con ground items persistidos")
+            return []
+        return sorted(int(key.rsplit(":", 1)[1]) for key in keys)
+
+    async def load_ground_items(self, map_id: int) -> dict[tuple[int, int], GroundTileItems]:
         """Carga los ground items de un mapa desde Redis.
 
         Args:
@@ -70,22 +157,17 @@ class GroundItemsRepository:
         Returns:
             Diccionario {(x, y): [items]} con los items del mapa.
         """
+        key = RedisKeys.ground_items(map_id)
         try:
-            key = RedisKeys.ground_items(map_id)
-            data = await self.redis_client.get(key)
-
-            if not data:
-                return {}
+            try:
+                fields = await self.redis_client.hgetall(key)
+            except ResponseError:
+                # Formato anterior: un único JSON por mapa (se migra al hash)
+                return await self._migrate_legacy_json(map_id)
 
-            # Deserializar
-            serializable_items = json.loads(data)
-
-            # Convertir de vuelta a tuplas
-            items: dict[tuple[int, int], list[dict[str, int | str | None]]] = {}
-            for coord_key, item_list in serializable_items.items():
-                x_str, y_str = coord_key.split(",")
-                x, y = int(x_str), int(y_str)
-                items[x, y] = item_list
+            items: dict[tuple[int, int], GroundTileItems] = {}
+            for field, value in fields.items():
+                items[_parse_tile_field(field)] = decode_tile_items(value)
 
             logger.debug("Cargados %d tiles con items del mapa %d", len(items), map_id)
             return items  # noqa: TRY300
@@ -93,10 +175,26 @@ class GroundItemsRepository:
             logger.exception("Error al cargar ground items del mapa %d", map_id)
             return {}
 
+    async def _migrate_legacy_json(self, map_id: int) -> dict[tuple[int, int], GroundTileItems]:
+        """Convierte el JSON por mapa del formato anterior al hash por tile.
+
+        Returns:
+            Items del mapa.
+        """
+        key = RedisKeys.ground_items(map_id)
+        data = await self.redis_client.get(key)
+        items: dict[tuple[int, int], GroundTileItems] = {}
+        if data:
+            for coord_key, item_list in json.loads(data).items():
+                items[_parse_tile_field(coord_key)] = item_list
+        await self.save_ground_items(map_id, items)
+        logger.info("Ground items del mapa %d migrados a hash por tile", map_id)
+        return items
+
     async def add_ground_item(
         self, map_id: int, x: int, y: int, item: dict[str, int | str | None]
     ) -> None:
-        """Agrega un item al suelo y lo persiste en Redis.
+        """Agrega un item al suelo y lo persiste en Redis (solo su tile).
 
         Args:
             map_id: ID del mapa.
@@ -105,17 +203,9 @@ class GroundItemsRepository:
             item: Item a agregar.
         """
         try:
-            # Cargar items actuales
-            items = await self.load_ground_items(map_id)
-
-            # Agregar nuevo item
-            coord = (x, y)
-            if coord not in items:
-                items[coord] = []
-            items[coord].append(item)
-
-            # Guardar de vuelta
-            await self.save_ground_items(map_id, items)
+            items = await self._load_tile(map_id, x, y)
+            items.append(item)
+            await self.save_tiles(map_id, {(x, y): items})
 
         except Exception:
             logger.exception("Error al agregar ground item en mapa %d pos (%d,%d)", map_id, x, y)
@@ -123,7 +213,7 @@ class GroundItemsRepository:
     async def remove_ground_item(
         self, map_id: int, x: int, y: int, item_index: int = 0
     ) -> dict[str, int | str | None] | None:
-        """Remueve un item del suelo y actualiza Redis.
+        """Remueve un item del suelo y actualiza Redis (solo su tile).
 
         Args:
             map_id: ID del mapa.
@@ -135,22 +225,12 @@ class GroundItemsRepository:
             Item removido o None si no existe.
         """
         try:
-            # Cargar items actuales
-            items = await self.load_ground_items(map_id)
-
-            coord = (x, y)
-            if coord not in items or item_index >= len(items[coord]):
+            items = await self._load_tile(map_id, x, y)
+            if item_index >= len(items):
                 return None
 
-            # Remover item
-            item = items[coord].pop(item_index)
-
-            # Limpiar si no quedan items
-            if not items[coord]:
-                del items[coord]
-
-            # Guardar de vuelta
-            await self.save_ground_items(map_id, items)
+            item = items.pop(item_index)
+            await self.save_tiles(map_id, {(x, y): items})
 
             return item  # noqa: TRY300
 
@@ -168,18 +248,21 @@ class GroundItemsRepository:
             Cantidad de tiles limpiados.
         """
         try:
-            items = await self.load_ground_items(map_id)
-            count = len(items)
-
-            # Eliminar de Redis
             key = RedisKeys.ground_items(map_id)
-            await self.redis_client.delete(key)
+            pipeline = self.redis_client.pipeline(transaction=True)
+            pipeline.hlen(key)
+            pipeline.delete(key)
+            count, _ = await pipeline.execute()
 
             if count > 0:
                 logger.info("Limpiados %d tiles con items del mapa %d", count, map_id)
 
-            return count  # noqa: TRY300
+            return int(count)
 
         except Exception:
             logger.exception("Error al limpiar ground items del mapa %d", map_id)
             return 0
+
+    async def _load_tile(self, map_id: int, x: int, y: int) -> GroundTileItems:
+        value = await self.redis_client.hget(RedisKeys.ground_items(map_id), _tile_field(x, y))
+        return decode_tile_items(value) if value else []
@@ -0,0 +1,438 @@
+"""Cache write-behind en memoria de los inventarios de los jugadores online.
+
+El inventario se guarda en Redis como un hash ``slot_N -> "item_id:cantidad"``
+y cada uso, equipamiento, drop o pickup lo volvía a leer y parsear. Para los
+jugadores online el inventario vive en memoria:
+
+- ``load`` trae el hash del inventario y el de equipamiento con un único
+  pipeline al hacer login; los strings se decodifican recién en el primer
+  acceso a un slot.
+- Cada slot ocupa tres enteros de un ``array('I')`` (item_id, cantidad,
+  equipado) en lugar de un string por slot.
+- Las escrituras marcan el slot como dirty (pendiente de persistir) y como
+  cambiado (pendiente de enviar al cliente con ``CHANGE_INVENTORY_SLOT``).
+- Un flusher periódico (``start``/``stop``) persiste los slots dirty de todos
+  los jugadores en un pipeline, y ``release`` los persiste al desconectar. Si
+  el inventario vuelve a quedar dirty durante esa escritura (o la escritura
+  falla) queda marcado como liberado y el flusher lo quita de memoria en
+  cuanto queda persistido.
+
+Los inventarios de jugadores que no están cargados no pasan por el cache: el
+repositorio sigue yendo directo a Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from array import array
+from typing import TYPE_CHECKING
+
+from src.config.config_manager import ConfigManager, config_manager
+from src.utils.inventory_slot import InventorySlot
+from src.utils.redis_config import RedisKeys
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from src.utils.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Intervalo por defecto del flusher write-behind
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Enteros por slot en el array: item_id, cantidad, equipado
+_FIELDS_PER_SLOT = 3
+
+
+class PlayerInventory:
+    """Inventario en memoria de un jugador online, direccionado por slot (1-based)."""
+
+    __slots__ = ("_equipped_slots", "_raw", "_slots", "changed", "dirty", "max_slots", "user_id")
+
+    def __init__(
+        self,
+        user_id: int,
+        max_slots: int,
+        raw: dict[str, str],
+        equipped_slots: set[int] | None = None,
+    ) -> None:
+        """Inicializa el inventario sin decodificar.
+
+        Args:
+            user_id: ID del jugador.
+            max_slots: Cantidad de slots del inventario.
+            raw: Hash del inventario tal como está en Redis.
+            equipped_slots: Slots del inventario con un item equipado.
+        """
+        self.user_id = user_id
+        self.max_slots = max_slots
+        self.dirty: set[int] = set()
+        self.changed: set[int] = set()
+        self._raw: dict[str, str] | None = raw
+        self._equipped_slots = equipped_slots or set()
+        self._slots: array[int] | None = None
+
+    @property
+    def decoded(self) -> bool:
+        """True si los slots ya se decodificaron desde el hash de Redis."""
+        return self._slots is not None
+
+    def _decode(self) -> array[int]:
+        """Decodifica el hash de Redis al array de slots (solo la primera vez).
+
+        Returns:
+            Array con ``max_slots * 3`` enteros.
+        """
+        if self._slots is not None:
+            return self._slots
+
+        slots = array("I", bytes(4 * _FIELDS_PER_SLOT * self.max_slots))
+        raw = self._raw or {}
+        for slot in range(1, self.max_slots + 1):
+            value = raw.get(f"slot_{slot}")
+            parsed = InventorySlot.parse(value) if value else None
+            base = (slot - 1) * _FIELDS_PER_SLOT
+            if parsed is not None and not parsed.is_empty():
+                slots[base] = parsed.item_id
+                slots[base + 1] = parsed.quantity
+            if slot in self._equipped_slots:
+                slots[base + 2] = 1
+
+        if not raw:
+            # Inventario inexistente en Redis: persistirlo vacío
+            self.dirty.update(range(1, self.max_slots + 1))
+
+        self._slots = slots
+        self._raw = None
+        return slots
+
+    def is_valid_slot(self, slot: int) -> bool:
+        """Indica si el número de slot está en rango.
+
+        Returns:
+            True si el slot está entre 1 y ``max_slots``.
+        """
+        return 1 <= slot <= self.max_slots
+
+    def get(self, slot: int) -> tuple[int, int] | None:
+        """Lee un slot.
+
+        Returns:
+            Tupla (item_id, cantidad) o None si el slot está vacío.
+        """
+        slots = self._decode()
+        base = (slot - 1) * _FIELDS_PER_SLOT
+        quantity = slots[base + 1]
+        if not quantity:
+            return None
+        return slots[base], quantity
+
+    def set(self, slot: int, item_id: int, quantity: int) -> None:
+        """Escribe un slot (cantidad 0 lo vacía) y lo marca como dirty y cambiado.
+
+        Args:
+            slot: Número de slot.
+            item_id: ID del item.
+            quantity: Cantidad del item.
+        """
+        slots = self._decode()
+        base = (slot - 1) * _FIELDS_PER_SLOT
+        if quantity <= 0 or item_id <= 0:
+            item_id = quantity = 0
+        if slots[base] == item_id and slots[base + 1] == quantity:
+            return
+        slots[base] = item_id
+        slots[base + 1] = quantity
+        self.dirty.add(slot)
+        self.changed.add(slot)
+
+    def is_equipped(self, slot: int) -> bool:
+        """Indica si el item del slot está equipado.
+
+        Returns:
+            True si el slot tiene un item equipado.
+        """
+        return bool(self._decode()[(slot - 1) * _FIELDS_PER_SLOT + 2])
+
+    def set_equipped(self, slot: int, *, equipped: bool) -> None:
+        """Actualiza el flag de equipado de un slot.
+
+        No marca el slot como dirty: el equipamiento se persiste en su propio hash.
+
+        Args:
+            slot: Número de slot.
+            equipped: Si el item del slot queda equipado.
+        """
+        if self.is_valid_slot(slot):
+            self._decode()[(slot - 1) * _FIELDS_PER_SLOT + 2] = int(equipped)
+
+    def occupied(self) -> Iterator[tuple[int, int, int]]:
+        """Recorre los slots ocupados.
+
+        Yields:
+            Tuplas (slot, item_id, cantidad) en orden de slot.
+        """
+        slots = self._decode()
+        for index in range(0, len(slots), _FIELDS_PER_SLOT):
+            quantity = slots[index + 1]
+            if quantity:
+                yield index // _FIELDS_PER_SLOT + 1, slots[index], quantity
+
+    def find_empty(self) -> int | None:
+        """Busca el primer slot vacío.
+
+        Returns:
+            Número de slot vacío o None si el inventario está lleno.
+        """
+        slots = self._decode()
+        for index in range(1, len(slots), _FIELDS_PER_SLOT):
+            if not slots[index]:
+                return index // _FIELDS_PER_SLOT + 1
+        return None
+
+    def swap(self, slot_a: int, slot_b: int) -> None:
+        """Intercambia el contenido de dos slots.
+
+        El flag de equipado queda en el slot: el hash de equipamiento apunta a
+        números de slot, no a items.
+
+        Args:
+            slot_a: Primer slot.
+            slot_b: Segundo slot.
+        """
+        item_a = self.get(slot_a) or (0, 0)
+        item_b = self.get(slot_b) or (0, 0)
+        self.set(slot_a, *item_b)
+        self.set(slot_b, *item_a)
+
+    def take_changed(self) -> list[tuple[int, int, int, bool]]:
+        """Retorna y limpia los slots cambiados desde la última llamada.
+
+        Returns:
+            Tuplas (slot, item_id, cantidad, equipado) en orden de slot; los
+            slots vacíos tienen item_id y cantidad 0.
+        """
+        if not self.changed:
+            return []
+        slots = self._decode()
+        result = []
+        for slot in sorted(self.changed):
+            base = (slot - 1) * _FIELDS_PER_SLOT
+            result.append((slot, slots[base], slots[base + 1], bool(slots[base + 2])))
+        self.changed.clear()
+        return result
+
+    def dirty_mapping(self, slots: Iterable[int]) -> dict[str, str]:
+        """Serializa slots al formato del hash de Redis.
+
+        Returns:
+            Diccionario ``slot_N -> "item_id:cantidad"`` ("" para slots vacíos).
+        """
+        mapping = {}
+        for slot in slots:
+            item = self.get(slot)
+            mapping[f"slot_{slot}"] = f"{item[0]}:{item[1]}" if item else ""
+        return mapping
+
+
+class InventoryCache:
+    """Inventarios autoritativos en memoria de los jugadores online, con write-behind a Redis."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_slots: int | None = None,
+    ) -> None:
+        """Inicializa el cache vacío.
+
+        Args:
+            redis_client: Cliente Redis donde se persisten los cambios.
+            flush_interval_seconds: Intervalo del flusher periódico.
+            max_slots: Slots por inventario (default: ``game.inventory.max_slots``).
+        """
+        self.redis = redis_client
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_slots = max_slots or ConfigManager.as_int(
+            config_manager.get("game.inventory.max_slots", 30)
+        )
+        self._inventories: dict[int, PlayerInventory] = {}
+        self._released: set[int] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Métricas
+        self._hits = 0
+        self._flushes = 0
+        self._slots_flushed = 0
+        self._flush_errors = 0
+
+    # ── Ciclo de vida por jugador ──────────────────────────────────────
+
+    def get(self, user_id: int) -> PlayerInventory | None:
+        """Retorna el inventario en memoria del jugador.
+
+        Returns:
+            PlayerInventory o None si el jugador no está cargado.
+        """
+        inventory = self._inventories.get(user_id)
+        if inventory is not None:
+            self._hits += 1
+        return inventory
+
+    def is_loaded(self, user_id: int) -> bool:
+        """Indica si el inventario del jugador está cargado.
+
+        Returns:
+            True si el jugador tiene inventario en memoria.
+        """
+        return user_id in self._inventories
+
+    async def load(self, user_id: int) -> None:
+        """Carga el inventario y el equipamiento del jugador con un único pipeline.
+
+        Si el jugador ya está cargado (por ejemplo, reconectó antes de que se
+        persistieran sus cambios) se conserva el inventario en memoria.
+
+        Args:
+            user_id: ID del jugador.
+        """
+        if user_id in self._inventories:
+            self._released.discard(user_id)
+            return
+
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hgetall(RedisKeys.player_inventory(user_id))
+        pipeline.hgetall(RedisKeys.player_equipment(user_id))
+        raw_inventory, raw_equipment = await pipeline.execute()
+
+        equipped_slots = {
+            int(value) for value in (raw_equipment or {}).values() if str(value).isdigit()
+        }
+        self._inventories[user_id] = PlayerInventory(
+            user_id=user_id,
+            max_slots=self.max_slots,
+            raw=dict(raw_inventory or {}),
+            equipped_slots=equipped_slots,
+        )
+        logger.debug("Inventario de user_id %d cargado en memoria", user_id)
+
+    async def release(self, user_id: int) -> None:
+        """Persiste los slots pendientes del jugador y lo quita del cache.
+
+        Si la escritura falla, o el inventario se modifica mientras se escribe,
+        queda marcado como liberado: el flusher periódico lo persiste y lo quita
+        del cache cuando ya no tiene slots pendientes.
+
+        Args:
+            user_id: ID del jugador.
+        """
+        inventory = self._inventories.get(user_id)
+        if inventory is None:
+            return
+        self._released.add(user_id)
+        async with self._flush_lock:
+            await self._write_inventories([inventory])
+            self._evict_released()
+
+    def _evict_released(self) -> None:
+        """Quita del cache los inventarios liberados que ya no tienen slots pendientes."""
+        for user_id in [uid for uid in self._released if not self._inventories[uid].dirty]:
+            self._released.discard(user_id)
+            del self._inventories[user_id]
+            logger.debug("Inventario de user_id %d persistido y liberado", user_id)
+
+    # ── Write-behind ───────────────────────────────────────────────────
+
+    async def flush(self) -> int:
+        """Persiste los slots dirty de todos los jugadores en un pipeline.
+
+        Returns:
+            Cantidad de slots escritos en Redis.
+        """
+        async with self._flush_lock:
+            inventories = [inv for inv in self._inventories.values() if inv.dirty]
+            before = self._slots_flushed
+            if inventories:
+                await self._write_inventories(inventories)
+            if self._released:
+                self._evict_released()
+            return self._slots_flushed - before
+
+    async def _write_inventories(self, inventories: list[PlayerInventory]) -> bool:
+        """Escribe los slots dirty de ``inventories`` en un único pipeline.
+
+        Returns:
+            True si la escritura tuvo éxito (o no había nada pendiente).
+        """
+        pending = [(inventory, inventory.dirty) for inventory in inventories if inventory.dirty]
+        if not pending:
+            return True
+
+        pipeline = self.redis.pipeline(transaction=False)
+        slots_written = 0
+        for inventory, dirty in pending:
+            inventory.dirty = set()
+            pipeline.hset(
+                RedisKeys.player_inventory(inventory.user_id),
+                mapping=inventory.dirty_mapping(sorted(dirty)),
+            )
+            slots_written += len(dirty)
+
+        try:
+            await pipeline.execute()
+        except Exception:
+            # Re-marcar como dirty para reintentar en el próximo flush
+            for inventory, dirty in pending:
+                inventory.dirty.update(dirty)
+            self._flush_errors += 1
+            logger.exception("Error persistiendo inventario de %d jugadores", len(pending))
+            return False
+
+        self._flushes += 1
+        self._slots_flushed += slots_written
+        return True
+
+    def start(self) -> None:
+        """Inicia el flusher periódico en background."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(
+                "Flusher write-behind de inventarios iniciado (cada %.0f ms)",
+                self.flush_interval_seconds * 1000,
+            )
+
+    async def stop(self) -> None:
+        """Detiene el flusher y persiste todo lo pendiente."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        logger.info("Flusher write-behind de inventarios detenido")
+
+    async def _flush_loop(self) -> None:
+        """Loop del flusher periódico."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def get_metrics(self) -> dict[str, int]:
+        """Métricas del cache para diagnóstico.
+
+        Returns:
+            Diccionario con jugadores cargados, accesos servidos desde memoria,
+            flushes, slots persistidos, errores y slots dirty pendientes.
+        """
+        return {
+            "players_loaded": len(self._inventories),
+            "hits": self._hits,
+            "flushes": self._flushes,
+            "slots_flushed": self._slots_flushed,
+            "flush_errors": self._flush_errors,
+            "dirty_slots": sum(len(inv.dirty) for inv in self._inventories.values()),
+        }
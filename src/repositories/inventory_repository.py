@@ -6,6 +6,7 @@ los componentes más simples: InventoryStorage y InventoryStackingStrategy.
 
 import logging
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from src.config.config_manager import ConfigManager, config_manager
 from src.utils.inventory_slot import InventorySlot
@@ -14,6 +15,9 @@ from src.utils.inventory_storage import InventoryStorage
 from src.utils.redis_client import RedisClient  # noqa: TC001
 from src.utils.redis_config import RedisKeys
 
+if TYPE_CHECKING:
+    from src.repositories.inventory_cache import InventoryCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,21 +38,31 @@ class InventoryRepository:
 
     Esta clase actúa como fachada que coordina InventoryStorage
     y InventoryStackingStrategy para proporcionar una API simple.
+
+    Con un ``InventoryCache`` los inventarios de los jugadores online se operan
+    en memoria (ver ``InventoryCache``) y los slots modificados se obtienen con
+    ``pop_changed_slots`` para enviar solo esos ``CHANGE_INVENTORY_SLOT``.
     """
 
     MAX_SLOTS = config_manager.get(
         "game.inventory.max_slots", 30
     )  # Número máximo de slots de inventario
 
-    def __init__(self, redis_client: RedisClient, max_stack: int = 20) -> None:
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        max_stack: int = 20,
+        cache: InventoryCache | None = None,
+    ) -> None:
         """Inicializa el repositorio de inventario.
 
         Args:
             redis_client: Cliente de Redis.
             max_stack: Cantidad máxima por stack (default: 20).
+            cache: Cache en memoria de los inventarios online (opcional).
         """
         self.redis_client = redis_client
-        self.storage = InventoryStorage(redis_client)
+        self.storage = InventoryStorage(redis_client, cache)
         self.stacking = InventoryStackingStrategy(self.storage, max_stack)
 
     async def get_inventory(self, user_id: int) -> dict[str, str]:
@@ -64,6 +78,13 @@ class InventoryRepository:
             Este método mantiene compatibilidad con código existente.
             Para nuevo código, usar get_inventory_slots().
         """
+        inventory = self.storage.cached_inventory(user_id)
+        if inventory is not None:
+            cached_legacy = {f"slot_{i}": "" for i in range(1, inventory.max_slots + 1)}
+            for slot, item_id, quantity in inventory.occupied():
+                cached_legacy[f"slot_{slot}"] = f"{item_id}:{quantity}"
+            return cached_legacy
+
         slots = await self.storage.get_all_slots(user_id)
 
         # Convertir a formato legacy
@@ -241,6 +262,20 @@ class InventoryRepository:
                 reason=f"Slot fuera de rango: {', '.join(reasons)}",
             )
 
+        inventory = self.storage.cached_inventory(user_id)
+        if inventory is not None:
+            old_slot_data = inventory.get(old_slot)
+            new_slot_data = inventory.get(new_slot)
+            inventory.swap(old_slot, new_slot)
+            logger.info("Swap slots user_id=%d: slot %s <-> slot %s", user_id, old_slot, new_slot)
+            return SwapSlotsResult(
+                success=True,
+                old_slot=old_slot,
+                new_slot=new_slot,
+                old_slot_data=new_slot_data,
+                new_slot_data=old_slot_data,
+            )
+
         key = RedisKeys.player_inventory(user_id)
 
         # Leer ambos slots en un pipeline
@@ -290,3 +325,19 @@ class InventoryRepository:
             old_slot_data=new_slot_data,
             new_slot_data=old_slot_data,
         )
+
+    def pop_changed_slots(self, user_id: int) -> list[tuple[int, int, int, bool]] | None:
+        """Retorna y limpia los slots modificados desde la última llamada.
+
+        Args:
+            user_id: ID del jugador.
+
+        Returns:
+            Tuplas (slot, item_id, cantidad, equipado) en orden de slot (item_id
+            y cantidad 0 para slots vaciados), o None si el inventario del
+            jugador no está en memoria.
+        """
+        inventory = self.storage.cached_inventory(user_id)
+        if inventory is None:
+            return None
+        return inventory.take_changed()
@@ -8,6 +8,8 @@ from src.models.npc import NPC
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from src.utils.redis_client import RedisClient
 else:
     RedisClient = object
@@ -171,11 +173,12 @@ class NPCRepository:
             "snd3": str(snd3),
         }
 
-        await self.redis.hset(key, mapping=npc_data)
-
-        # Agregar a índice de mapa
-        map_key = RedisKeys.npc_map_index(map_id)
-        await self.redis.sadd(map_key, instance_id)
+        # Hash + índices (mapa y global) en un solo round-trip
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.hset(key, mapping=npc_data)
+        pipeline.sadd(RedisKeys.npc_map_index(map_id), instance_id)
+        pipeline.sadd(RedisKeys.NPC_GLOBAL_INDEX, instance_id)
+        await pipeline.execute()
 
         logger.debug(
             "NPC creado: %s (ID: %d, CharIndex: %d) en mapa %d (%d, %d)",
@@ -204,43 +207,75 @@ class NPCRepository:
         if not result:
             return None
 
+        return self._npc_from_hash(result)
+
+    @staticmethod
+    def _npc_from_hash(data: dict[str, str]) -> NPC:
+        """Construye un NPC a partir del hash guardado en Redis.
+
+        Args:
+            data: Campos del hash ``npc:instance:<id>``.
+
+        Returns:
+            Instancia de NPC.
+        """
         return NPC(
-            npc_id=int(result["npc_id"]),
-            char_index=int(result["char_index"]),
-            instance_id=result["instance_id"],
-            map_id=int(result["map_id"]),
-            x=int(result["x"]),
-            y=int(result["y"]),
-            heading=int(result["heading"]),
-            name=result["name"],
-            description=result["description"],
-            body_id=int(result["body_id"]),
-            head_id=int(result["head_id"]),
-            hp=int(result["hp"]),
-            max_hp=int(result["max_hp"]),
-            level=int(result["level"]),
-            is_hostile=result["is_hostile"].lower() == "true",
-            is_attackable=result["is_attackable"].lower() == "true",
-            is_merchant=result.get("is_merchant", "False").lower() == "true",
-            is_banker=result.get("is_banker", "False").lower() == "true",
-            movement_type=result["movement_type"],
-            respawn_time=int(result["respawn_time"]),
-            respawn_time_max=int(result.get("respawn_time_max", result["respawn_time"])),
-            gold_min=int(result["gold_min"]),
-            gold_max=int(result["gold_max"]),
-            attack_damage=int(result.get("attack_damage", "10")),
-            attack_cooldown=float(result.get("attack_cooldown", "3.0")),
-            aggro_range=int(result.get("aggro_range", "8")),
-            paralyzed_until=float(result.get("paralyzed_until", "0.0")),
-            poisoned_until=float(result.get("poisoned_until", "0.0")),
-            poisoned_by_user_id=int(result.get("poisoned_by_user_id", "0")),
-            summoned_by_user_id=int(result.get("summoned_by_user_id", "0")),
-            summoned_until=float(result.get("summoned_until", "0.0")),
-            snd1=int(result.get("snd1", "0")),
-            snd2=int(result.get("snd2", "0")),
-            snd3=int(result.get("snd3", "0")),
+            npc_id=int(data["npc_id"]),
+            char_index=int(data["char_index"]),
+            instance_id=data["instance_id"],
+            map_id=int(data["map_id"]),
+            x=int(data["x"]),
+            y=int(data["y"]),
+            heading=int(data["heading"]),
+            name=data["name"],
+            description=data["description"],
+            body_id=int(data["body_id"]),
+            head_id=int(data["head_id"]),
+            hp=int(data["hp"]),
+            max_hp=int(data["max_hp"]),
+            level=int(data["level"]),
+            is_hostile=data["is_hostile"].lower() == "true",
+            is_attackable=data["is_attackable"].lower() == "true",
+            is_merchant=data.get("is_merchant", "False").lower() == "true",
+            is_banker=data.get("is_banker", "False").lower() == "true",
+            movement_type=data["movement_type"],
+            respawn_time=int(data["respawn_time"]),
+            respawn_time_max=int(data.get("respawn_time_max", data["respawn_time"])),
+            gold_min=int(data["gold_min"]),
+            gold_max=int(data["gold_max"]),
+            attack_damage=int(data.get("attack_damage", "10")),
+            attack_cooldown=float(data.get("attack_cooldown", "3.0")),
+            aggro_range=int(data.get("aggro_range", "8")),
+            paralyzed_until=float(data.get("paralyzed_until", "0.0")),
+            poisoned_until=float(data.get("poisoned_until", "0.0")),
+            poisoned_by_user_id=int(data.get("poisoned_by_user_id", "0")),
+            summoned_by_user_id=int(data.get("summoned_by_user_id", "0")),
+            summoned_until=float(data.get("summoned_until", "0.0")),
+            snd1=int(data.get("snd1", "0")),
+            snd2=int(data.get("snd2", "0")),
+            snd3=int(data.get("snd3", "0")),
         )
 
+    async def get_many(self, instance_ids: Iterable[str]) -> list[NPC]:
+        """Obtiene varios NPCs con un único pipeline de HGETALL.
+
+        Args:
+            instance_ids: IDs de las instancias a leer.
+
+        Returns:
+            NPCs existentes, en el mismo orden (se omiten los que ya no existen).
+        """
+        ids = list(instance_ids)
+        if not ids:
+            return []
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for instance_id in ids:
+            pipeline.hgetall(RedisKeys.npc_instance(instance_id))
+        results: list[dict[str, str]] = await pipeline.execute()
+
+        return [self._npc_from_hash(result) for result in results if result]
+
     async def get_npcs_in_map(self, map_id: int) -> list[NPC]:
         """Obtiene todos los NPCs de un mapa.
 
@@ -252,34 +287,20 @@ class NPCRepository:
         """
         map_key = RedisKeys.npc_map_index(map_id)
         instance_ids: set[str] = await self.redis.smembers(map_key)
-
-        npcs = []
-        for instance_id in instance_ids:
-            npc = await self.get_npc(instance_id)
-            if npc:
-                npcs.append(npc)
-
-        return npcs
+        return await self.get_many(instance_ids)
 
     async def get_all_npcs(self) -> list[NPC]:
         """Obtiene todos los NPCs del mundo.
 
+        Usa el índice global (SET) en lugar de recorrer el keyspace; para
+        consultas frecuentes en el servidor usar el espejo en memoria de
+        ``MapManager``.
+
         Returns:
             Lista de todos los NPCs.
         """
-        # Obtener todas las claves de NPCs
-        pattern = "npc:instance:*"
-        keys = await self.redis.keys(pattern)
-
-        npcs = []
-        for key in keys:
-            # Extraer instance_id de la clave
-            instance_id = key.split(":")[-1]
-            npc = await self.get_npc(instance_id)
-            if npc:
-                npcs.append(npc)
-
-        return npcs
+        instance_ids: set[str] = await self.redis.smembers(RedisKeys.NPC_GLOBAL_INDEX)
+        return await self.get_many(instance_ids)
 
     async def update_npc_position(self, instance_id: str, x: int, y: int, heading: int) -> None:
         """Actualiza la posición de un NPC.
@@ -380,37 +401,31 @@ class NPCRepository:
         Args:
             instance_id: ID único de la instancia del NPC.
         """
-        # Obtener el NPC para saber su mapa
-        npc = await self.get_npc(instance_id)
-        if not npc:
+        # Solo se necesita el mapa para actualizar su índice
+        key = RedisKeys.npc_instance(instance_id)
+        map_id = await self.redis.hget(key, "map_id")
+        if map_id is None:
             logger.warning("Intento de eliminar NPC inexistente: %s", instance_id)
             return
 
-        # Eliminar de índice de mapa
-        map_key = RedisKeys.npc_map_index(npc.map_id)
-        await self.redis.srem(map_key, instance_id)
-
-        # Eliminar datos del NPC
-        key = RedisKeys.npc_instance(instance_id)
-        await self.redis.delete(key)
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.srem(RedisKeys.npc_map_index(int(map_id)), instance_id)
+        pipeline.srem(RedisKeys.NPC_GLOBAL_INDEX, instance_id)
+        pipeline.delete(key)
+        await pipeline.execute()
 
-        logger.debug("NPC eliminado: %s (%s)", npc.name, instance_id)
+        logger.debug("NPC eliminado: %s (mapa %s)", instance_id, map_id)
 
     async def clear_all_npcs(self) -> None:
         """Elimina todos los NPCs del mundo (útil para reiniciar).
 
         ADVERTENCIA: Esta operación es destructiva.
         """
-        # Eliminar todas las instancias de NPCs
-        pattern = "npc:instance:*"
-        keys = await self.redis.keys(pattern)
-        if keys:
-            await self.redis.delete(*keys)
-
-        # Eliminar todos los índices de mapas
-        pattern = "npc:map:*"
-        keys = await self.redis.keys(pattern)
-        if keys:
-            await self.redis.delete(*keys)
+        # SCAN incremental: también borra instancias de ejecuciones anteriores
+        # que no figuren en los índices
+        keys = await self.redis.scan_keys("npc:instance:*")
+        keys += await self.redis.scan_keys("npc:map:*")
+        keys.append(RedisKeys.NPC_GLOBAL_INDEX)
+        await self.redis.delete(*keys)
 
         logger.info("Todos los NPCs han sido eliminados de Redis")
@@ -1,6 +1,15 @@
 """Repository for Party System persistence in Redis.
 
 Handles storage and retrieval of parties, memberships, and invitations.
+
+Parties and user memberships are kept in an in-process identity map: this
+process is the only writer, so once a party (or the fact that a user has no
+party) has been read it is served from memory. Every mutation updates the map
+and is written through to Redis in a pipeline.
+
+Only online users are indexed (those looked up since they logged in, until
+``forget_user``), and a party stays cached while at least one of them points to
+it: offline members never pin a party in memory.
 """
 
 # mypy: disable-error-code="misc,no-any-return"
@@ -17,7 +26,7 @@ if TYPE_CHECKING:
 
 
 class PartyRepository:
-    """Repository for party data persistence using Redis."""
+    """Repository for party data persistence using Redis, with an in-memory identity map."""
 
     # Redis key patterns
     PARTY_KEY = "party:{party_id}"
@@ -39,6 +48,78 @@ class PartyRepository:
             redis_client: Redis client instance
         """
         self.redis = redis_client
+        self._parties: dict[int, Party] = {}
+        self._user_parties: dict[int, int | None] = {}  # user_id -> party_id (None: no party)
+        self._online_members: dict[int, set[int]] = {}  # party_id -> indexed user_ids
+
+    def _cache_party(self, party: Party) -> Party:
+        """Store a party in the identity map if an online user points to it.
+
+        Returns:
+            Party: The cached instance (an already cached one wins over ``party``).
+        """
+        if party.party_id not in self._online_members:
+            return party
+        return self._parties.setdefault(party.party_id, party)
+
+    def _point_user(self, user_id: int, party_id: int | None) -> None:
+        """Index an online user's party (None: no party).
+
+        A party left without online users is evicted from the identity map.
+        """
+        previous = self._user_parties.get(user_id)
+        self._user_parties[user_id] = party_id
+        if previous == party_id:
+            return
+        if party_id is not None:
+            self._online_members.setdefault(party_id, set()).add(user_id)
+        if previous is not None:
+            self._drop_online_member(previous, user_id)
+
+    def _drop_online_member(self, party_id: int, user_id: int) -> None:
+        online = self._online_members.get(party_id)
+        if online is None:
+            return
+        online.discard(user_id)
+        if not online:
+            del self._online_members[party_id]
+            self._parties.pop(party_id, None)
+
+    def forget_user(self, user_id: int) -> None:
+        """Drop a disconnected user from the identity map.
+
+        The user's party is dropped too when it was the last online member.
+        """
+        party_id = self._user_parties.pop(user_id, None)
+        if party_id is not None:
+            self._drop_online_member(party_id, user_id)
+
+    @staticmethod
+    def _serialize_metadata(party: Party) -> str:
+        return json.dumps(
+            {
+                "party_id": party.party_id,
+                "leader_id": party.leader_id,
+                "leader_username": party.leader_username,
+                "created_at": party.created_at,
+                "total_exp_earned": party.total_exp_earned,
+                "sum_elevated_levels": party.sum_elevated_levels,
+                "member_count": party.member_count,
+            }
+        )
+
+    @staticmethod
+    def _serialize_member(member: PartyMember) -> str:
+        return json.dumps(
+            {
+                "user_id": member.user_id,
+                "username": member.username,
+                "level": member.level,
+                "accumulated_exp": member.accumulated_exp,
+                "is_online": member.is_online,
+                "last_seen": member.last_seen,
+            }
+        )
 
     async def initialize(self) -> None:
         """Initialize repository - create next party ID if not exists."""
@@ -63,35 +144,17 @@ class PartyRepository:
         """Save complete party data to Redis."""
         pipe = self.redis.pipeline()
 
-        # Save party metadata
-        party_data = {
-            "party_id": party.party_id,
-            "leader_id": party.leader_id,
-            "leader_username": party.leader_username,
-            "created_at": party.created_at,
-            "total_exp_earned": party.total_exp_earned,
-            "sum_elevated_levels": party.sum_elevated_levels,
-            "member_count": party.member_count,
-        }
-
         # Save to main party key and hash
-        pipe.hset(self.ALL_PARTIES_KEY, str(party.party_id), json.dumps(party_data))
-        pipe.set(self.PARTY_KEY.format(party_id=party.party_id), json.dumps(party_data))
+        party_data = self._serialize_metadata(party)
+        pipe.hset(self.ALL_PARTIES_KEY, str(party.party_id), party_data)
+        pipe.set(self.PARTY_KEY.format(party_id=party.party_id), party_data)
 
         # Save each member
         for member in party.members.values():
-            member_data = {
-                "user_id": member.user_id,
-                "username": member.username,
-                "level": member.level,
-                "accumulated_exp": member.accumulated_exp,
-                "is_online": member.is_online,
-                "last_seen": member.last_seen,
-            }
             pipe.hset(
                 self.PARTY_MEMBERS_KEY.format(party_id=party.party_id),
                 str(member.user_id),
-                json.dumps(member_data),
+                self._serialize_member(member),
             )
 
             # Update user's current party
@@ -102,12 +165,22 @@ class PartyRepository:
 
         await pipe.execute()
 
+        for user_id in party.members:
+            if user_id in self._user_parties:
+                self._point_user(user_id, party.party_id)
+        if party.party_id in self._online_members:
+            self._parties[party.party_id] = party
+
     async def get_party(self, party_id: int) -> Party | None:
-        """Load party from Redis by ID.
+        """Get party by ID, loading it from Redis on the first access.
 
         Returns:
             Party | None: The party if found, None otherwise.
         """
+        cached = self._parties.get(party_id)
+        if cached is not None:
+            return cached
+
         # Get party metadata
         party_json = await self.redis.get(self.PARTY_KEY.format(party_id=party_id))
         if not party_json:
@@ -142,7 +215,7 @@ class PartyRepository:
         party.total_exp_earned = party_data["total_exp_earned"]
         party.sum_elevated_levels = party_data["sum_elevated_levels"]
 
-        return party
+        return self._cache_party(party)
 
     async def get_user_party(self, user_id: int) -> Party | None:
         """Get the party that user is currently in.
@@ -150,11 +223,20 @@ class PartyRepository:
         Returns:
             Party | None: The user's party if found, None otherwise.
         """
+        if user_id in self._user_parties:
+            cached_id = self._user_parties[user_id]
+            return None if cached_id is None else await self.get_party(cached_id)
+
         party_id = await self.redis.get(self.USER_PARTY_KEY.format(user_id=user_id))
         if not party_id:
+            self._point_user(user_id, None)
             return None
 
-        return await self.get_party(int(party_id))
+        self._point_user(user_id, int(party_id))
+        party = await self.get_party(int(party_id))
+        if party is None:
+            self._point_user(user_id, None)
+        return party
 
     async def delete_party(self, party_id: int) -> None:
         """Delete party and all associated data."""
@@ -162,10 +244,13 @@ class PartyRepository:
 
         # Get members to clean up their party references
         members_json = await self.redis.hgetall(self.PARTY_MEMBERS_KEY.format(party_id=party_id))
+        member_ids = {json.loads(member_json)["user_id"] for member_json in members_json.values()}
+        cached = self._parties.get(party_id)
+        if cached is not None:
+            member_ids.update(cached.members)
 
-        for member_json in members_json.values():
-            member_data = json.loads(member_json)
-            pipe.delete(self.USER_PARTY_KEY.format(user_id=member_data["user_id"]))
+        for user_id in member_ids:
+            pipe.delete(self.USER_PARTY_KEY.format(user_id=user_id))
 
         # Delete party data
         pipe.delete(self.PARTY_KEY.format(party_id=party_id))
@@ -175,22 +260,33 @@ class PartyRepository:
 
         await pipe.execute()
 
+        for user_id in list(self._online_members.get(party_id, ())):
+            self._point_user(user_id, None)
+        self._parties.pop(party_id, None)
+
     async def update_member(self, party_id: int, member: PartyMember) -> None:
         """Update a single member's data."""
-        member_data = {
-            "user_id": member.user_id,
-            "username": member.username,
-            "level": member.level,
-            "accumulated_exp": member.accumulated_exp,
-            "is_online": member.is_online,
-            "last_seen": member.last_seen,
-        }
-
         await self.redis.hset(
             self.PARTY_MEMBERS_KEY.format(party_id=party_id),
             str(member.user_id),
-            json.dumps(member_data),
+            self._serialize_member(member),
         )
+        cached = self._parties.get(party_id)
+        if cached is not None:
+            cached.members[member.user_id] = member
+
+    async def update_members(self, party: Party, members: list[PartyMember]) -> None:
+        """Update party metadata and several members in a single pipeline."""
+        party_data = self._serialize_metadata(party)
+        members_key = self.PARTY_MEMBERS_KEY.format(party_id=party.party_id)
+
+        pipe = self.redis.pipeline()
+        pipe.set(self.PARTY_KEY.format(party_id=party.party_id), party_data)
+        pipe.hset(self.ALL_PARTIES_KEY, str(party.party_id), party_data)
+        for member in members:
+            pipe.hset(members_key, str(member.user_id), self._serialize_member(member))
+
+        await pipe.execute()
 
     async def remove_member_from_party(self, party_id: int, user_id: int) -> None:
         """Remove a member from party data."""
@@ -204,24 +300,21 @@ class PartyRepository:
 
         await pipe.execute()
 
+        cached = self._parties.get(party_id)
+        if cached is not None:
+            cached.members.pop(user_id, None)
+        if user_id in self._user_parties:
+            self._point_user(user_id, None)
+
     async def add_member_to_party(self, party_id: int, member: PartyMember) -> None:
         """Add a member to existing party."""
-        member_data = {
-            "user_id": member.user_id,
-            "username": member.username,
-            "level": member.level,
-            "accumulated_exp": member.accumulated_exp,
-            "is_online": member.is_online,
-            "last_seen": member.last_seen,
-        }
-
         pipe = self.redis.pipeline()
 
         # Add to members
         pipe.hset(
             self.PARTY_MEMBERS_KEY.format(party_id=party_id),
             str(member.user_id),
-            json.dumps(member_data),
+            self._serialize_member(member),
         )
 
         # Update user's party reference
@@ -240,6 +333,11 @@ class PartyRepository:
 
         await pipe.execute()
 
+        cached = self._parties.get(party_id)
+        if cached is not None:
+            cached.members[member.user_id] = member
+        self._point_user(member.user_id, party_id)
+
     async def get_all_parties(self) -> list[int]:
         """Get list of all party IDs.
 
@@ -356,18 +454,10 @@ class PartyRepository:
 
     async def update_party_metadata(self, party: Party) -> None:
         """Update only party metadata (not members)."""
-        party_data = {
-            "party_id": party.party_id,
-            "leader_id": party.leader_id,
-            "leader_username": party.leader_username,
-            "created_at": party.created_at,
-            "total_exp_earned": party.total_exp_earned,
-            "sum_elevated_levels": party.sum_elevated_levels,
-            "member_count": party.member_count,
-        }
+        party_data = self._serialize_metadata(party)
 
         pipe = self.redis.pipeline()
-        pipe.set(self.PARTY_KEY.format(party_id=party.party_id), json.dumps(party_data))
-        pipe.hset(self.ALL_PARTIES_KEY, str(party.party_id), json.dumps(party_data))
+        pipe.set(self.PARTY_KEY.format(party_id=party.party_id), party_data)
+        pipe.hset(self.ALL_PARTIES_KEY, str(party.party_id), party_data)
 
         await pipe.execute()
@@ -44,7 +44,7 @@ class PlayerAttributesMixin:
             PlayerAttributes con los atributos o None si no existe.
         """
         key = RedisKeys.player_stats(user_id)
-        result: dict[str, str] = await self.redis.hgetall(key)
+        result: dict[str, str] = await self._store(key).hgetall(key)
 
         if not result:
             return None
@@ -171,7 +171,7 @@ class PlayerAttributesMixin:
             "charisma": str(charisma),
             "constitution": str(constitution),
         }
-        await self.redis.hset(key, mapping=stats_data)
+        await self._store(key).hset(key, mapping=stats_data)
         logger.debug("Atributos guardados para user_id %d", user_id)
 
     async def _get_modifier(self, user_id: int, name: str) -> tuple[float, int]:
@@ -194,7 +194,7 @@ class PlayerAttributesMixin:
     ) -> None:
         """Establece un modificador temporal de atributo."""
         key = RedisKeys.player_stats(user_id)
-        await self.redis.hset(
+        await self._store(key).hset(
             key,
             mapping={
                 f"{name}_modifier_until": str(expires_at),
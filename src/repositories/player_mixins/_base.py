@@ -4,6 +4,7 @@ import logging
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.repositories.player_state_cache import PlayerStateCache
     from src.utils.redis_client import RedisClient
 else:
     RedisClient = object
@@ -15,6 +16,16 @@ class PlayerRepositoryBase:
     """Redis helpers shared by player repository mixins."""
 
     redis: RedisClient
+    state_cache: PlayerStateCache
+
+    def _store(self, key: str) -> PlayerStateCache | RedisClient:
+        """Destino de una operación sobre un hash del jugador.
+
+        Returns:
+            El cache en memoria si el jugador está cargado, si no el cliente Redis.
+        """
+        cache = self.state_cache
+        return cache if cache.owns(key) else self.redis
 
     # ── Redis hash helpers ──────────────────────────────────────────────
 
@@ -24,7 +35,7 @@ class PlayerRepositoryBase:
         Returns:
             Valor float del campo o default si no existe / es inválido.
         """
-        result = await self.redis.hget(key, field)
+        result = await self._store(key).hget(key, field)
         if not result:
             return default
         try:
@@ -38,7 +49,7 @@ class PlayerRepositoryBase:
         Returns:
             Valor int del campo o default si no existe / es inválido.
         """
-        result = await self.redis.hget(key, field)
+        result = await self._store(key).hget(key, field)
         if not result:
             return default
         try:
@@ -52,9 +63,9 @@ class PlayerRepositoryBase:
         Returns:
             True si el campo es "1", False en caso contrario.
         """
-        result = await self.redis.hget(key, field)
+        result = await self._store(key).hget(key, field)
         return result in {b"1", "1", 1} if result else False
 
     async def _hset_field(self, key: str, field: str, value: str | float) -> None:
         """Escribe un campo en un hash Redis."""
-        await self.redis.hset_field(key, field, str(value))
+        await self._store(key).hset_field(key, field, str(value))
@@ -27,7 +27,7 @@ class PlayerPositionMixin:
             Diccionario con x, y, map, heading o None si no existe.
         """
         key = RedisKeys.player_position(user_id)
-        result: dict[str, str] = await self.redis.hgetall(key)
+        result: dict[str, str] = await self._store(key).hgetall(key)
 
         if not result:
             return None
@@ -59,7 +59,7 @@ class PlayerPositionMixin:
         }
         if heading is not None:
             position_data["heading"] = str(heading)
-        await self.redis.hset(key, mapping=position_data)
+        await self._store(key).hset(key, mapping=position_data)
         logger.debug(
             "Posición guardada para user_id %d: (%d, %d) en mapa %d", user_id, x, y, map_number
         )
@@ -72,5 +72,5 @@ class PlayerPositionMixin:
             heading: Dirección (1=Norte, 2=Este, 3=Sur, 4=Oeste).
         """
         key = RedisKeys.player_position(user_id)
-        await self.redis.hset(key, "heading", str(heading))
+        await self._store(key).hset(key, "heading", str(heading))
         logger.debug("Dirección actualizada para user_id %d: heading=%d", user_id, heading)
@@ -28,7 +28,7 @@ class PlayerSkillsMixin:
             Diccionario con las habilidades o None si no existe.
         """
         key = RedisKeys.player_skills(user_id)
-        result: dict[str, str] = await self.redis.hgetall(key)
+        result: dict[str, str] = await self._store(key).hgetall(key)
 
         if not result:
             return None
@@ -55,7 +55,7 @@ class PlayerSkillsMixin:
         """
         key = RedisKeys.player_skills(user_id)
         if skills:
-            await self.redis.hset(key, mapping={k: str(v) for k, v in skills.items()})
+            await self._store(key).hset(key, mapping={k: str(v) for k, v in skills.items()})
             logger.debug(
                 "Habilidades actualizadas para user_id %d: %s", user_id, list(skills.keys())
             )
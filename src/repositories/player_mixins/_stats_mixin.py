@@ -43,7 +43,7 @@ class PlayerStatsMixin:
             PlayerStats con las estadísticas o None si no existe.
         """
         key = RedisKeys.player_user_stats(user_id)
-        result: dict[str, str] = await self.redis.hgetall(key)
+        result: dict[str, str] = await self._store(key).hgetall(key)
 
         if not result:
             return None
@@ -180,7 +180,7 @@ class PlayerStatsMixin:
             "elu": str(elu),
             "experience": str(experience),
         }
-        await self.redis.hset(key, mapping=stats_data)
+        await self._store(key).hset(key, mapping=stats_data)
         logger.debug("Estadísticas guardadas para user_id %d", user_id)
 
     async def get_hunger_thirst(self, user_id: int) -> dict[str, int] | None:
@@ -193,7 +193,7 @@ class PlayerStatsMixin:
             Diccionario con hambre, sed, flags y contadores o None si no existe.
         """
         key = RedisKeys.player_hunger_thirst(user_id)
-        result: dict[str, str] = await self.redis.hgetall(key)
+        result: dict[str, str] = await self._store(key).hgetall(key)
 
         if not result:
             return None
@@ -245,7 +245,7 @@ class PlayerStatsMixin:
             "water_counter": str(water_counter),
             "hunger_counter": str(hunger_counter),
         }
-        await self.redis.hset(key, mapping=data)
+        await self._store(key).hset(key, mapping=data)
         logger.debug("Hambre y sed guardadas para user_id %d", user_id)
 
     async def set_meditating(self, user_id: int, is_meditating: bool) -> None:
@@ -295,7 +295,7 @@ class PlayerStatsMixin:
             elu: Nuevo ELU (experiencia para siguiente nivel).
         """
         key = RedisKeys.player_user_stats(user_id)
-        await self.redis.hset(key, mapping={"level": str(level), "elu": str(elu)})
+        await self._store(key).hset(key, mapping={"level": str(level), "elu": str(elu)})
         logger.debug(
             "Nivel y ELU actualizados para user_id %d: nivel=%d, elu=%d", user_id, level, elu
         )
@@ -99,7 +99,8 @@ class PlayerStatusMixin:
             Diccionario con morphed_body, morphed_head, morphed_until o None si no está morfeado.
         """
         key = RedisKeys.player_user_stats(user_id)
-        result = await self.redis.hmget(key, ["morphed_body", "morphed_head", "morphed_until"])
+        fields = ["morphed_body", "morphed_head", "morphed_until"]
+        result = await self._store(key).hmget(key, fields)
         if not result or not result[0] or not result[1] or not result[2]:
             return None
         try:
@@ -123,7 +124,7 @@ class PlayerStatusMixin:
             morphed_until: Timestamp hasta cuando está morfeado (0.0 = no morfeado).
         """
         key = RedisKeys.player_user_stats(user_id)
-        await self.redis.hset(
+        await self._store(key).hset(
             key,
             mapping={
                 "morphed_body": str(morphed_body),
@@ -146,7 +147,7 @@ class PlayerStatusMixin:
             user_id: ID del usuario.
         """
         key = RedisKeys.player_user_stats(user_id)
-        await self.redis.hdel(key, "morphed_body", "morphed_head", "morphed_until")
+        await self._store(key).hdel(key, "morphed_body", "morphed_head", "morphed_until")
         logger.debug("Apariencia morfeada eliminada para user_id %d", user_id)
 
     async def get_invisible_until(self, user_id: int) -> float:
@@ -2,12 +2,17 @@
 
 from typing import TYPE_CHECKING
 
+from src.repositories.inventory_cache import InventoryCache
 from src.repositories.player_mixins._attributes_mixin import PlayerAttributesMixin
 from src.repositories.player_mixins._base import PlayerRepositoryBase
 from src.repositories.player_mixins._position_mixin import PlayerPositionMixin
 from src.repositories.player_mixins._skills_mixin import PlayerSkillsMixin
 from src.repositories.player_mixins._stats_mixin import PlayerStatsMixin
 from src.repositories.player_mixins._status_mixin import PlayerStatusMixin
+from src.repositories.player_state_cache import (
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    PlayerStateCache,
+)
 
 if TYPE_CHECKING:
     from src.utils.redis_client import RedisClient
@@ -23,12 +28,43 @@ class PlayerRepository(
     PlayerStatusMixin,
     PlayerSkillsMixin,
 ):
-    """Repositorio para operaciones de datos de jugadores."""
+    """Repositorio para operaciones de datos de jugadores.
 
-    def __init__(self, redis_client: RedisClient) -> None:
+    Los hashes de los jugadores online viven en un ``PlayerStateCache``
+    write-behind, y su inventario en un ``InventoryCache``: ambos se cargan
+    con ``load_player_state`` al hacer login y se persisten con
+    ``release_player_state`` al desconectar.
+    """
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
         """Inicializa el repositorio.
 
         Args:
             redis_client: Cliente Redis para operaciones de bajo nivel.
+            flush_interval_seconds: Intervalo del flusher write-behind.
         """
         self.redis = redis_client
+        self.state_cache = PlayerStateCache(redis_client, flush_interval_seconds)
+        self.inventory_cache = InventoryCache(redis_client, flush_interval_seconds)
+
+    async def load_player_state(self, user_id: int) -> None:
+        """Carga en memoria el estado y el inventario del jugador que acaba de hacer login.
+
+        Args:
+            user_id: ID del usuario.
+        """
+        await self.state_cache.load(user_id)
+        await self.inventory_cache.load(user_id)
+
+    async def release_player_state(self, user_id: int) -> None:
+        """Persiste el estado y el inventario del jugador que se desconecta y los libera.
+
+        Args:
+            user_id: ID del usuario.
+        """
+        await self.state_cache.release(user_id)
+        await self.inventory_cache.release(user_id)
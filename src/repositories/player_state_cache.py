@@ -0,0 +1,342 @@
+"""Cache write-behind en memoria del estado de los jugadores online.
+
+Los efectos del tick y los handlers leen los hashes del jugador (stats,
+posición, hambre/sed, atributos, skills) en cada iteración, pero solo este
+proceso los escribe. Para los jugadores online esos hashes viven en memoria:
+
+- ``load`` los trae con un único pipeline al hacer login.
+- Las lecturas y escrituras de ``PlayerRepository`` operan sobre la copia en
+  memoria y marcan los campos modificados como dirty.
+- Un flusher periódico (``start``/``stop``) persiste los campos dirty de todos
+  los jugadores en un pipeline (``HSET``/``HDEL`` por hash), y ``release`` los
+  persiste al desconectar. Si el estado vuelve a quedar dirty durante esa
+  escritura (o la escritura falla) queda marcado como liberado y el flusher lo
+  quita de memoria en cuanto queda persistido.
+
+Las claves de jugadores que no están cargados no pasan por el cache: el
+repositorio sigue yendo directo a Redis.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.utils.redis_config import RedisKeys
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.utils.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+
+# Intervalo por defecto del flusher write-behind
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Hashes del jugador que se mantienen en memoria mientras está online
+CACHED_PLAYER_KEYS: tuple[Callable[[int], str], ...] = (
+    RedisKeys.player_position,
+    RedisKeys.player_user_stats,
+    RedisKeys.player_hunger_thirst,
+    RedisKeys.player_stats,
+    RedisKeys.player_skills,
+)
+
+
+@dataclass(slots=True)
+class PlayerState:
+    """Copia en memoria de los hashes de un jugador online."""
+
+    user_id: int
+    hashes: dict[str, dict[str, str]]
+    dirty: dict[str, set[str]] = field(default_factory=dict)
+
+    def mark_dirty(self, key: str, fields: set[str] | list[str] | tuple[str, ...]) -> None:
+        """Marca campos de un hash como pendientes de persistir."""
+        self.dirty.setdefault(key, set()).update(fields)
+
+
+class PlayerStateCache:
+    """Estado autoritativo en memoria de los jugadores online, con write-behind a Redis."""
+
+    def __init__(
+        self,
+        redis_client: RedisClient,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Inicializa el cache vacío.
+
+        Args:
+            redis_client: Cliente Redis donde se persisten los cambios.
+            flush_interval_seconds: Intervalo del flusher periódico.
+        """
+        self.redis = redis_client
+        self.flush_interval_seconds = flush_interval_seconds
+        self._states: dict[int, PlayerState] = {}
+        self._owners: dict[str, PlayerState] = {}
+        self._released: set[int] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Métricas
+        self._hits = 0
+        self._flushes = 0
+        self._fields_flushed = 0
+        self._flush_errors = 0
+
+    # ── Ciclo de vida por jugador ──────────────────────────────────────
+
+    def owns(self, key: str) -> bool:
+        """Indica si la clave pertenece a un jugador cargado en memoria.
+
+        Returns:
+            True si las operaciones sobre la clave deben ir al cache.
+        """
+        return key in self._owners
+
+    def is_loaded(self, user_id: int) -> bool:
+        """Indica si el estado del jugador está cargado.
+
+        Returns:
+            True si el jugador tiene estado en memoria.
+        """
+        return user_id in self._states
+
+    async def load(self, user_id: int) -> None:
+        """Carga los hashes del jugador desde Redis con un único pipeline.
+
+        Si el jugador ya está cargado (por ejemplo, reconectó antes de que se
+        persistieran sus cambios) se conserva el estado en memoria.
+
+        Args:
+            user_id: ID del jugador.
+        """
+        if user_id in self._states:
+            self._released.discard(user_id)
+            return
+
+        keys = [build_key(user_id) for build_key in CACHED_PLAYER_KEYS]
+        pipeline = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.hgetall(key)
+        results = await pipeline.execute()
+
+        state = PlayerState(
+            user_id=user_id,
+            hashes={key: dict(result or {}) for key, result in zip(keys, results, strict=True)},
+        )
+        self._states[user_id] = state
+        for key in keys:
+            self._owners[key] = state
+        logger.debug("Estado de user_id %d cargado en memoria (%d hashes)", user_id, len(keys))
+
+    async def release(self, user_id: int) -> None:
+        """Persiste los cambios pendientes del jugador y lo quita del cache.
+
+        Si la escritura falla, o el estado se modifica mientras se escribe, queda
+        marcado como liberado: el flusher periódico lo persiste y lo quita del
+        cache cuando ya no tiene cambios pendientes.
+
+        Args:
+            user_id: ID del jugador.
+        """
+        state = self._states.get(user_id)
+        if state is None:
+            return
+        self._released.add(user_id)
+        async with self._flush_lock:
+            await self._write_states([state])
+            self._evict_released()
+
+    def _evict_released(self) -> None:
+        """Quita del cache los jugadores liberados que ya no tienen cambios pendientes."""
+        for user_id in [uid for uid in self._released if not self._states[uid].dirty]:
+            self._released.discard(user_id)
+            state = self._states.pop(user_id)
+            for key in state.hashes:
+                self._owners.pop(key, None)
+            logger.debug("Estado de user_id %d persistido y liberado", user_id)
+
+    # ── Operaciones de hash (mismas firmas que RedisClient) ────────────
+
+    async def hget(self, key: str, field_name: str) -> str | None:
+        """Lee un campo de un hash cacheado.
+
+        Returns:
+            Valor del campo o None si no existe.
+        """
+        self._hits += 1
+        return self._owners[key].hashes[key].get(field_name)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        """Lee todos los campos de un hash cacheado.
+
+        Returns:
+            Copia del hash (vacío si no existe).
+        """
+        self._hits += 1
+        return dict(self._owners[key].hashes[key])
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        """Lee varios campos de un hash cacheado.
+
+        Returns:
+            Valores en el mismo orden que ``fields`` (None si no existen).
+        """
+        self._hits += 1
+        data = self._owners[key].hashes[key]
+        return [data.get(name) for name in fields]
+
+    async def hset(
+        self,
+        key: str,
+        field_name: str | dict[str, str] | None = None,
+        value: str | None = None,
+        *,
+        mapping: dict[str, str] | None = None,
+    ) -> int:
+        """Escribe campos en un hash cacheado y los marca como dirty.
+
+        Returns:
+            Cantidad de campos nuevos (igual que HSET).
+        """
+        if mapping is None:
+            if isinstance(field_name, dict):
+                mapping = field_name
+            elif field_name is not None and value is not None:
+                mapping = {field_name: value}
+            else:
+                return 0
+        state = self._owners[key]
+        data = state.hashes[key]
+        added = sum(1 for name in mapping if name not in data)
+        data.update(mapping)
+        state.mark_dirty(key, list(mapping))
+        return added
+
+    async def hset_field(self, key: str, field_name: str, value: str) -> int:
+        """Escribe un solo campo en un hash cacheado.
+
+        Returns:
+            1 si el campo es nuevo, 0 si se sobrescribió.
+        """
+        return await self.hset(key, mapping={field_name: value})
+
+    async def hdel(self, key: str, *fields: str) -> int:
+        """Elimina campos de un hash cacheado.
+
+        Returns:
+            Cantidad de campos eliminados.
+        """
+        state = self._owners[key]
+        data = state.hashes[key]
+        removed = 0
+        for name in fields:
+            if data.pop(name, None) is not None:
+                removed += 1
+        state.mark_dirty(key, fields)
+        return removed
+
+    # ── Write-behind ───────────────────────────────────────────────────
+
+    async def flush(self) -> int:
+        """Persiste los campos dirty de todos los jugadores en un pipeline.
+
+        Returns:
+            Cantidad de campos escritos o eliminados en Redis.
+        """
+        async with self._flush_lock:
+            states = [state for state in self._states.values() if state.dirty]
+            before = self._fields_flushed
+            if states:
+                await self._write_states(states)
+            if self._released:
+                self._evict_released()
+            return self._fields_flushed - before
+
+    async def _write_states(self, states: list[PlayerState]) -> bool:
+        """Escribe los campos dirty de ``states`` en un único pipeline.
+
+        Returns:
+            True si la escritura tuvo éxito (o no había nada pendiente).
+        """
+        pending = [(state, state.dirty) for state in states if state.dirty]
+        if not pending:
+            return True
+        for state, _ in pending:
+            state.dirty = {}
+
+        pipeline = self.redis.pipeline(transaction=False)
+        fields_written = 0
+        for state, dirty in pending:
+            for key, names in dirty.items():
+                data = state.hashes[key]
+                mapping = {name: data[name] for name in names if name in data}
+                deleted = [name for name in names if name not in data]
+                if mapping:
+                    pipeline.hset(key, mapping=mapping)
+                if deleted:
+                    pipeline.hdel(key, *deleted)
+                fields_written += len(names)
+
+        try:
+            await pipeline.execute()
+        except Exception:
+            # Re-marcar como dirty para reintentar en el próximo flush
+            for state, dirty in pending:
+                for key, names in dirty.items():
+                    state.mark_dirty(key, list(names))
+            self._flush_errors += 1
+            logger.exception("Error persistiendo estado de %d jugadores", len(pending))
+            return False
+
+        self._flushes += 1
+        self._fields_flushed += fields_written
+        return True
+
+    def start(self) -> None:
+        """Inicia el flusher periódico en background."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info(
+                "Flusher write-behind de jugadores iniciado (cada %.0f ms)",
+                self.flush_interval_seconds * 1000,
+            )
+
+    async def stop(self) -> None:
+        """Detiene el flusher y persiste todo lo pendiente."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        logger.info("Flusher write-behind de jugadores detenido")
+
+    async def _flush_loop(self) -> None:
+        """Loop del flusher periódico."""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            await self.flush()
+
+    def get_metrics(self) -> dict[str, int]:
+        """Métricas del cache para diagnóstico.
+
+        Returns:
+            Diccionario con jugadores cargados, lecturas servidas desde memoria,
+            flushes, campos persistidos, errores y campos dirty pendientes.
+        """
+        return {
+            "players_loaded": len(self._states),
+            "hits": self._hits,
+            "flushes": self._flushes,
+            "fields_flushed": self._fields_flushed,
+            "flush_errors": self._flush_errors,
+            "dirty_fields": sum(
+                len(names) for state in self._states.values() for names in state.dirty.values()
+            ),
+        }
@@ -10,10 +10,14 @@ import redis.asyncio as redis
 from src.config.config_manager import config_manager
 from src.core.server_initializer import ServerInitializer
 from src.messaging.message_sender import MessageSender
+from src.messaging.packet_fanout import fan_out_packet
 from src.network.client_connection import ClientConnection
+from src.network.msg_character import build_character_remove_response
+from src.network.packet_framer import FramingError
 from src.security.ssl_manager import SSLConfigurationError, SSLManager
 from src.tasks.task_factory import TaskFactory
 from src.tasks.task_null import TaskNull
+from src.utils.password_utils import shutdown_password_pool
 
 if TYPE_CHECKING:
     from src.core.dependency_container import DependencyContainer
@@ -67,7 +71,7 @@ class ArgentumServer:
 
         return self.task_factory.create_task(data, message_sender, session_data)  # type: ignore[arg-type]
 
-    async def handle_client(  # noqa: PLR0915
+    async def handle_client(
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
@@ -78,7 +82,7 @@ class ArgentumServer:
             reader: Stream para leer datos del cliente (pasado a ClientConnection).
             writer: Stream para escribir datos al cliente (pasado a ClientConnection).
         """
-        connection = ClientConnection(reader, writer)
+        connection = ClientConnection(reader, writer, coalesce_writes=True)
         message_sender = MessageSender(connection)
         logger.info("Nueva conexión desde %s", connection.address)
 
@@ -91,16 +95,22 @@ class ArgentumServer:
         # Datos de sesión compartidos entre tareas (mutable)
         session_data: dict[str, dict[str, int]] = {}
 
-        try:  # noqa: PLR1702
-            while True:
-                data = await connection.receive()
-                if not data:
-                    break
-
-                # Crear y ejecutar tarea apropiada según el mensaje
-                task = self.create_task(data, message_sender, session_data)
-                await task.execute()
-
+        try:
+            # Cada lectura del socket puede traer varios packets (o uno partido):
+            # el framer de la conexión entrega cada packet completo por separado.
+            if self.task_factory:
+                # Fast path de packets frecuentes con handlers ligados a esta conexión
+                dispatcher = self.task_factory.create_dispatcher(message_sender, session_data)  # type: ignore[arg-type]
+                async for data in connection.iter_packets():
+                    await dispatcher.dispatch(data)
+            else:
+                async for data in connection.iter_packets():
+                    # Crear y ejecutar tarea apropiada según el mensaje
+                    task = self.create_task(data, message_sender, session_data)
+                    await task.execute()
+
+        except FramingError as e:
+            logger.warning("Cerrando conexión %s por error de framing: %s", connection.address, e)
         except KeyboardInterrupt, asyncio.CancelledError:
             # Shutdown graceful, no loguear como error
             logger.debug("Cliente %s desconectado por shutdown del servidor", connection.address)
@@ -109,59 +119,18 @@ class ArgentumServer:
         finally:
             logger.info("Cerrando conexión con %s", connection.address)
 
-            # Broadcast multijugador: notificar desconexión
+            # Broadcast multijugador y limpieza del jugador desconectado
             if "user_id" in session_data and self.deps and self.deps.player_repo:
                 user_id_value = session_data["user_id"]
                 if not isinstance(user_id_value, dict):
-                    user_id = int(user_id_value)
-
-                    # Obtener el mapa del jugador antes de removerlo
-                    position = await self.deps.player_repo.get_position(user_id)
-                    if position:
-                        map_id = position["map"]
-
-                        # Enviar CHARACTER_REMOVE a todos los jugadores en el mapa
-                        other_senders = self.deps.map_manager.get_all_message_senders_in_map(
-                            map_id, exclude_user_id=user_id
-                        )
-                        for sender in other_senders:
-                            await sender.send_character_remove(user_id)
-
-                        logger.info(
-                            "Desconexión de user %d notificada a %d jugadores en mapa %d",
-                            user_id,
-                            len(other_senders),
-                            map_id,
-                        )
-
-                    # Limpiar mascotas del jugador
-                    if self.deps and self.deps.summon_service and self.deps.npc_service:
-                        try:
-                            pet_instance_ids = (
-                                await self.deps.summon_service.remove_all_player_pets(user_id)
-                            )
-                            # Remover cada mascota del mundo
-                            all_npcs = await self.deps.npc_service.npc_repository.get_all_npcs()
-                            for pet_instance_id in pet_instance_ids:
-                                pet_npc = next(
-                                    (npc for npc in all_npcs if npc.instance_id == pet_instance_id),
-                                    None,
-                                )
-                                if pet_npc:
-                                    await self.deps.npc_service.remove_npc(pet_npc)
-                                    logger.info(
-                                        "Mascota removida al desconectar: user_id=%d, mascota=%s",
-                                        user_id,
-                                        pet_npc.name,
-                                    )
-                        except Exception:
-                            logger.exception(
-                                "Error al limpiar mascotas del jugador %d al desconectar", user_id
-                            )
-
-                    # Remover jugador de todos los mapas
-                    self.deps.map_manager.remove_player_from_all_maps(user_id)
+                    await self._handle_player_disconnect(int(user_id_value))
 
+            logger.debug(
+                "Métricas de red de %s: framing=%s envío=%s",
+                connection.address,
+                connection.framer.get_metrics(),
+                connection.get_send_metrics(),
+            )
             connection.close()
             await connection.wait_closed()
 
@@ -171,6 +140,60 @@ class ArgentumServer:
                 connections = await self.deps.redis_client.get_connections_count()
                 logger.info("Conexiones activas: %d", connections)
 
+    async def _handle_player_disconnect(self, user_id: int) -> None:
+        """Notifica la desconexión de un jugador y libera su estado.
+
+        Args:
+            user_id: ID del jugador que se desconectó.
+        """
+        if not self.deps:
+            return
+
+        # Obtener el mapa del jugador antes de removerlo
+        position = await self.deps.player_repo.get_position(user_id)
+        if position:
+            map_id = position["map"]
+
+            # Enviar CHARACTER_REMOVE a todos los jugadores en el mapa
+            other_senders = self.deps.map_manager.get_all_message_senders_in_map(
+                map_id, exclude_user_id=user_id
+            )
+            await fan_out_packet(build_character_remove_response(user_id), other_senders)
+
+            logger.info(
+                "Desconexión de user %d notificada a %d jugadores en mapa %d",
+                user_id,
+                len(other_senders),
+                map_id,
+            )
+
+        # Limpiar mascotas del jugador
+        if self.deps.summon_service and self.deps.npc_service:
+            try:
+                pet_instance_ids = await self.deps.summon_service.remove_all_player_pets(user_id)
+                # Remover cada mascota del mundo (búsqueda O(1) en el espejo en memoria)
+                for pet_instance_id in pet_instance_ids:
+                    pet_npc = self.deps.map_manager.get_npc_by_instance_id(pet_instance_id)
+                    if pet_npc:
+                        await self.deps.npc_service.remove_npc(pet_npc)
+                        logger.info(
+                            "Mascota removida al desconectar: user_id=%d, mascota=%s",
+                            user_id,
+                            pet_npc.name,
+                        )
+            except Exception:
+                logger.exception("Error al limpiar mascotas del jugador %d al desconectar", user_id)
+
+        # Remover jugador de todos los mapas
+        self.deps.map_manager.remove_player_from_all_maps(user_id)
+
+        # Persistir y liberar el estado en memoria del jugador
+        await self.deps.player_repo.release_player_state(user_id)
+
+        # Liberar la membresía de party/clan cacheada (ya persistida write-through)
+        self.deps.party_repo.forget_user(user_id)
+        self.deps.clan_repo.forget_user(user_id)
+
     async def start(self) -> None:
         """Inicia el servidor TCP."""
         try:
@@ -179,12 +202,17 @@ class ArgentumServer:
 
             # Crear TaskFactory con las dependencias
             self.task_factory = TaskFactory(self.deps)
+            self.deps.task_factory = self.task_factory
             logger.info("✓ TaskFactory inicializado")
 
             # Iniciar el sistema de tick
             self.deps.game_tick.start()
             logger.info("✓ Sistema de tick del juego iniciado")
 
+            # Flushers write-behind del estado e inventario de jugadores online
+            self.deps.player_repo.state_cache.start()
+            self.deps.player_repo.inventory_cache.start()
+
         except redis.ConnectionError as e:
             logger.error("No se pudo conectar a Redis: %s", e)  # noqa: TRY400
             logger.error(  # noqa: TRY400
@@ -241,6 +269,15 @@ class ArgentumServer:
             await self.server.wait_closed()
             logger.info("Servidor detenido")
 
+        # Persistir el estado pendiente de los jugadores antes de desconectar Redis
+        if self.deps and self.deps.player_repo:
+            await self.deps.player_repo.state_cache.stop()
+            await self.deps.player_repo.inventory_cache.stop()
+        if self.deps and self.deps.map_manager:
+            await self.deps.map_manager.flush_ground_items()
+
+        shutdown_password_pool()
+
         # Desconectar de Redis
         if self.deps and self.deps.redis_client:
             await self.deps.redis_client.disconnect()
@@ -5,7 +5,10 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from src.services.map.map_resource_queries import ResourcesMap
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +28,7 @@ class MapBinaryCache:
     def __init__(
         self,
         maps_dir: Path,
-        resources: dict[str, dict[str, set[tuple[int, int]]]],
+        resources: ResourcesMap,
         signs: dict[str, dict[tuple[int, int], int]],
         doors: dict[str, dict[tuple[int, int], int]],
     ) -> None:
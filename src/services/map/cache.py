@@ -10,7 +10,10 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from src.services.map.map_resource_queries import ResourcesMap
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +66,7 @@ def is_cache_source_valid_lists(
 
 
 def serialize_resources_to_maps_dict(
-    resources: dict[str, dict[str, set[tuple[int, int]]]],
+    resources: ResourcesMap,
     signs: dict[str, dict[tuple[int, int], int]],
     doors: dict[str, dict[tuple[int, int], int]],
 ) -> dict[str, Any]:
@@ -85,7 +88,7 @@ def serialize_resources_to_maps_dict(
 
 def rebuild_resources_from_maps_data(
     maps_data: dict[str, Any],
-    resources: dict[str, dict[str, set[tuple[int, int]]]],
+    resources: ResourcesMap,
     signs: dict[str, dict[tuple[int, int], int]],
     doors: dict[str, dict[tuple[int, int], int]],
 ) -> None:
@@ -144,7 +147,7 @@ class MapCacheLoader:
 
     def try_load_from_cache(
         self,
-        resources: dict[str, dict[str, set[tuple[int, int]]]],
+        resources: ResourcesMap,
         signs: dict[str, dict[tuple[int, int], int]],
         doors: dict[str, dict[tuple[int, int], int]],
     ) -> bool:
@@ -210,7 +213,7 @@ class MapCacheLoader:
 
     def save_cache(
         self,
-        resources: dict[str, dict[str, set[tuple[int, int]]]],
+        resources: ResourcesMap,
         signs: dict[str, dict[tuple[int, int], int]],
         doors: dict[str, dict[tuple[int, int], int]],
     ) -> None:
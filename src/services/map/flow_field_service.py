@@ -0,0 +1,216 @@
+"""Campos de flujo (mapas de Dijkstra) para persecución compartida.
+
+Cuando varios NPCs persiguen al mismo jugador, cada uno correría su propio A*.
+En modo campo de flujo se calcula una sola vez, por posición del objetivo, un
+BFS acotado a ``radius`` pasos desde el jugador sobre la grilla de
+transitabilidad estática; cada perseguidor toma su siguiente paso en O(1)
+eligiendo el vecino libre cuya distancia baja en uno (descenso más empinado).
+
+Las distancias viven en un ``bytearray`` de la ventana ``(2 * radius + 1)²``
+centrada en el objetivo. El campo queda cacheado hasta que el objetivo se
+mueve (el anterior se descarta) o cambian las puertas del mapa; la cantidad de
+campos está acotada por ``max_fields`` con desalojo LRU.
+"""
+
+import logging
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.map_manager import MapManager
+    from src.game.walkability_grid import WalkabilityGrid
+
+logger = logging.getLogger(__name__)
+
+# Distancia en la ventana para tiles fuera de alcance
+UNREACHABLE = 255
+
+# Pasos máximos del BFS (cabe en un byte junto con UNREACHABLE)
+DEFAULT_FLOW_FIELD_RADIUS = 16
+
+# Campos cacheados como máximo (~1 KB cada uno con el radio por defecto)
+DEFAULT_MAX_FLOW_FIELDS = 1024
+
+# (dx, dy, heading) en el mismo orden que PathfindingService
+_DIRECTIONS = ((0, -1, 1), (1, 0, 2), (0, 1, 3), (-1, 0, 4))
+
+
+class FlowField:
+    """Distancias BFS hacia un objetivo dentro de una ventana acotada."""
+
+    __slots__ = ("distances", "grid", "origin_x", "origin_y", "side", "version")
+
+    def __init__(self, grid: WalkabilityGrid, target_x: int, target_y: int, radius: int) -> None:
+        """Calcula el campo con un BFS desde el objetivo.
+
+        Args:
+            grid: Grilla de transitabilidad del mapa.
+            target_x: Coordenada X del objetivo.
+            target_y: Coordenada Y del objetivo.
+            radius: Pasos máximos desde el objetivo.
+        """
+        self.grid = grid
+        self.version = grid.version
+        self.side = side = 2 * radius + 1
+        self.origin_x = origin_x = target_x - radius
+        self.origin_y = origin_y = target_y - radius
+        self.distances = distances = bytearray([UNREACHABLE]) * (side * side)
+
+        width = grid.width
+        height = grid.height
+        cells = grid.cells
+        distances[radius * side + radius] = 0
+        queue = deque([(target_x, target_y)])
+        while queue:
+            x, y = queue.popleft()
+            next_distance = distances[(y - origin_y) * side + (x - origin_x)] + 1
+            if next_distance > radius:
+                continue
+            for dx, dy, _ in _DIRECTIONS:
+                nx = x + dx
+                ny = y + dy
+                # Con distancia <= radius el vecino siempre cae dentro de la ventana
+                if not (1 <= nx <= width and 1 <= ny <= height):
+                    continue
+                local = (ny - origin_y) * side + (nx - origin_x)
+                if distances[local] != UNREACHABLE or cells[(ny - 1) * width + (nx - 1)]:
+                    continue
+                distances[local] = next_distance
+                queue.append((nx, ny))
+
+    def distance(self, x: int, y: int) -> int:
+        """Distancia en pasos desde (x, y) hasta el objetivo.
+
+        Returns:
+            Pasos hasta el objetivo o ``UNREACHABLE``.
+        """
+        local_x = x - self.origin_x
+        local_y = y - self.origin_y
+        if not (0 <= local_x < self.side and 0 <= local_y < self.side):
+            return UNREACHABLE
+        return self.distances[local_y * self.side + local_x]
+
+    def is_current(self, grid: WalkabilityGrid) -> bool:
+        """Indica si el campo sigue reflejando la grilla del mapa.
+
+        Returns:
+            False si el mapa se recargó o cambió alguna puerta.
+        """
+        return self.grid is grid and self.version == grid.version
+
+
+class FlowFieldService:
+    """Cache de campos de flujo por objetivo para la persecución de NPCs."""
+
+    def __init__(
+        self,
+        map_manager: MapManager,
+        radius: int = DEFAULT_FLOW_FIELD_RADIUS,
+        max_fields: int = DEFAULT_MAX_FLOW_FIELDS,
+    ) -> None:
+        """Inicializa el servicio.
+
+        Args:
+            map_manager: Gestor de mapas (grilla de transitabilidad y ocupación).
+            radius: Pasos máximos de cada campo (1-254).
+            max_fields: Campos cacheados como máximo.
+        """
+        self.map_manager = map_manager
+        self.radius = max(1, min(radius, UNREACHABLE - 1))
+        self.max_fields = max(1, max_fields)
+        self._fields: OrderedDict[tuple[int, int, int], FlowField] = OrderedDict()
+        # Última posición conocida de cada objetivo (para descartar su campo viejo)
+        self._target_keys: dict[int, tuple[int, int, int]] = {}
+        self.fields_built = 0
+        self.cache_hits = 0
+
+    def get_field(
+        self, map_id: int, target_x: int, target_y: int, target_id: int | None = None
+    ) -> FlowField | None:
+        """Devuelve el campo hacia (target_x, target_y), calculándolo si hace falta.
+
+        Args:
+            map_id: ID del mapa.
+            target_x: Coordenada X del objetivo.
+            target_y: Coordenada Y del objetivo.
+            target_id: ID del objetivo (p. ej. user_id); si se movió, su campo
+                anterior se descarta.
+
+        Returns:
+            Campo de flujo, o None si el objetivo no es transitable.
+        """
+        grid = self.map_manager.get_walkability(map_id)
+        if not grid.is_walkable(target_x, target_y):
+            return None
+
+        key = (map_id, target_x, target_y)
+        if target_id is not None:
+            previous = self._target_keys.get(target_id)
+            if previous is not None and previous != key:
+                self._fields.pop(previous, None)
+            self._target_keys[target_id] = key
+
+        field = self._fields.get(key)
+        if field is not None and field.is_current(grid):
+            self._fields.move_to_end(key)
+            self.cache_hits += 1
+            return field
+
+        field = FlowField(grid, target_x, target_y, self.radius)
+        self.fields_built += 1
+        logger.debug(
+            "Campo de flujo calculado hacia (%d,%d) en mapa %d", target_x, target_y, map_id
+        )
+        self._fields[key] = field
+        self._fields.move_to_end(key)
+        while len(self._fields) > self.max_fields:
+            self._fields.popitem(last=False)
+        return field
+
+    def get_next_step(
+        self,
+        map_id: int,
+        start_x: int,
+        start_y: int,
+        target_x: int,
+        target_y: int,
+        target_id: int | None = None,
+    ) -> tuple[int, int, int] | None:
+        """Siguiente paso hacia el objetivo por descenso sobre su campo de flujo.
+
+        Args:
+            map_id: ID del mapa.
+            start_x: Posición X actual del perseguidor.
+            start_y: Posición Y actual del perseguidor.
+            target_x: Posición X del objetivo.
+            target_y: Posición Y del objetivo.
+            target_id: ID del objetivo (ver ``get_field``).
+
+        Returns:
+            Tupla (next_x, next_y, heading), o None si el perseguidor está fuera
+            del campo o todos los vecinos que acercan están ocupados.
+        """
+        if start_x == target_x and start_y == target_y:
+            return None
+
+        field = self.get_field(map_id, target_x, target_y, target_id)
+        if field is None:
+            return None
+
+        current = field.distance(start_x, start_y)
+        if current == UNREACHABLE:
+            return None
+
+        for dx, dy, heading in _DIRECTIONS:
+            next_x = start_x + dx
+            next_y = start_y + dy
+            if field.distance(next_x, next_y) == current - 1 and not (
+                self.map_manager.is_tile_occupied(map_id, next_x, next_y)
+            ):
+                return next_x, next_y, heading
+        return None
+
+    def clear(self) -> None:
+        """Descarta todos los campos cacheados."""
+        self._fields.clear()
+        self._target_keys.clear()
@@ -6,10 +6,14 @@ import logging
 import time
 from collections import defaultdict
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.services.map.blocked_loader import process_blocked_file
 from src.services.map.objects_loader import process_objects_file
 
+if TYPE_CHECKING:
+    from src.services.map.map_resource_queries import ResourcesMap
+
 
 def gather_map_files(
     maps_dir: Path, log: logging.Logger
@@ -105,7 +109,7 @@ def collect_map_ids(
 
 
 def build_public_structures(
-    resources: dict[str, dict[str, set[tuple[int, int]]]],
+    resources: ResourcesMap,
     signs: dict[str, dict[tuple[int, int], int]],
     doors: dict[str, dict[tuple[int, int], int]],
     map_ids: set[int],
@@ -165,7 +169,7 @@ def build_public_structures(
 
 def run_load_all_maps(
     maps_dir: Path,
-    resources: dict[str, dict[str, set[tuple[int, int]]]],
+    resources: ResourcesMap,
     signs: dict[str, dict[tuple[int, int], int]],
     doors: dict[str, dict[tuple[int, int], int]],
     *,
@@ -0,0 +1,190 @@
+"""Snapshot de entrada a un mapa: todas las entidades del mapa en un único buffer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.network.msg_character import build_character_create_response
+from src.network.msg_map import build_object_create_response
+
+if TYPE_CHECKING:
+    from src.game.map_manager import MapManager
+    from src.repositories.account_repository import AccountRepository
+    from src.repositories.player_repository import PlayerRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlayerVisualData:
+    """Datos visuales de un jugador para CHARACTER_CREATE."""
+
+    user_id: int
+    username: str
+    char_body: int
+    char_head: int
+
+
+@dataclass
+class MapEntrySnapshot:
+    """Packets de entrada a un mapa ya codificados."""
+
+    payload: bytes
+    players: int
+    npcs: int
+    ground_items: int
+
+
+def resolve_visual_data(
+    user_id: int,
+    appearance: dict[str, str] | None,
+    morphed: dict[str, int | float] | None,
+) -> PlayerVisualData:
+    """Combina la apariencia de la cuenta con un morph activo.
+
+    Args:
+        user_id: ID del jugador.
+        appearance: Apariencia de la cuenta (o None si no existe).
+        morphed: Apariencia morfeada (o None si no está morfeado).
+
+    Returns:
+        PlayerVisualData con los valores por defecto donde falten datos.
+    """
+    char_body = 1
+    char_head = 1
+    username = f"Player{user_id}"
+
+    if appearance:
+        char_body = int(appearance.get("char_race", 1))
+        char_head = int(appearance.get("char_head", 1))
+        username = appearance.get("username", username)
+
+        # Validar body (no puede ser 0)
+        if char_body == 0:
+            char_body = 1
+
+    if morphed and time.time() < morphed.get("morphed_until", 0.0):
+        char_body = int(morphed.get("morphed_body", char_body))
+        char_head = int(morphed.get("morphed_head", char_head))
+
+    return PlayerVisualData(
+        user_id=user_id,
+        username=username,
+        char_body=char_body,
+        char_head=char_head,
+    )
+
+
+class MapEntrySnapshotBuilder:
+    """Arma el snapshot que recibe un jugador al entrar a un mapa.
+
+    Jugadores, NPCs y ground items salen de los índices en memoria del
+    ``MapManager``; las apariencias de cuenta faltantes se piden juntas
+    (``AccountRepository.get_account_appearances``) y las posiciones y morphs
+    de los jugadores online salen del cache de estado. Todo se codifica en un
+    único buffer para enviarlo con una sola escritura.
+    """
+
+    def __init__(
+        self,
+        player_repo: PlayerRepository,
+        account_repo: AccountRepository,
+        map_manager: MapManager,
+    ) -> None:
+        """Inicializa el builder.
+
+        Args:
+            player_repo: Repositorio de jugadores.
+            account_repo: Repositorio de cuentas.
+            map_manager: Gestor de mapas.
+        """
+        self.player_repo = player_repo
+        self.account_repo = account_repo
+        self.map_manager = map_manager
+
+    async def get_visual_data(self, user_ids: list[int]) -> dict[int, PlayerVisualData]:
+        """Obtiene los datos visuales de varios jugadores.
+
+        Returns:
+            Diccionario {user_id: PlayerVisualData}.
+        """
+        if not user_ids:
+            return {}
+
+        appearances = await self.account_repo.get_account_appearances(user_ids)
+        morphs = await asyncio.gather(
+            *(self.player_repo.get_morphed_appearance(user_id) for user_id in user_ids)
+        )
+        return {
+            user_id: resolve_visual_data(user_id, appearances.get(user_id), morphed)
+            for user_id, morphed in zip(user_ids, morphs, strict=True)
+        }
+
+    async def build(self, map_id: int, exclude_user_id: int | None = None) -> MapEntrySnapshot:
+        """Codifica CHARACTER_CREATE de jugadores y NPCs y OBJECT_CREATE del suelo.
+
+        Args:
+            map_id: ID del mapa.
+            exclude_user_id: Jugador a excluir (el que entra).
+
+        Returns:
+            MapEntrySnapshot con el buffer y la cantidad de entidades.
+        """
+        packets: list[bytes] = []
+
+        user_ids = self.map_manager.get_players_in_map(map_id, exclude_user_id)
+        positions = await asyncio.gather(
+            *(self.player_repo.get_position(user_id) for user_id in user_ids)
+        )
+        visible = [
+            (user_id, position)
+            for user_id, position in zip(user_ids, positions, strict=True)
+            if position
+        ]
+        visuals = await self.get_visual_data([user_id for user_id, _ in visible])
+        for user_id, position in visible:
+            visual = visuals[user_id]
+            packets.append(
+                build_character_create_response(
+                    char_index=user_id,
+                    body=visual.char_body,
+                    head=visual.char_head,
+                    heading=position.get("heading", 3),
+                    x=position["x"],
+                    y=position["y"],
+                    name=visual.username,
+                )
+            )
+        players = len(packets)
+
+        packets.extend(
+            build_character_create_response(
+                char_index=npc.char_index,
+                body=npc.body_id,
+                head=npc.head_id,
+                heading=npc.heading,
+                x=npc.x,
+                y=npc.y,
+                name=npc.name,
+            )
+            for npc in self.map_manager.get_npcs_in_map(map_id)
+        )
+        npcs = len(packets) - players
+
+        for (x, y), items in self.map_manager.get_map_ground_items(map_id).items():
+            for item in items:
+                grh_index = item.get("grh_index")
+                if grh_index and isinstance(grh_index, int):
+                    packets.append(build_object_create_response(x, y, grh_index))
+        ground_items = len(packets) - players - npcs
+
+        return MapEntrySnapshot(
+            payload=b"".join(packets),
+            players=players,
+            npcs=npcs,
+            ground_items=ground_items,
+        )
@@ -7,7 +7,10 @@ y del ciclo de vida del servicio. Tipado alineado con `MapResourcesService.resou
 
 from __future__ import annotations
 
-ResourcesMap = dict[str, dict[str, set[tuple[int, int]]]]
+from collections.abc import Set as AbstractSet
+
+# Las capas pueden ser sets o vistas del snapshot mapeado (MappedTileLayer)
+ResourcesMap = dict[str, dict[str, AbstractSet[tuple[int, int]]]]
 SignsMap = dict[str, dict[tuple[int, int], int]]
 DoorsMap = dict[str, dict[tuple[int, int], int]]
 
@@ -20,9 +20,11 @@ from src.services.map.map_resource_queries import (
     tile_in_required_layer,
 )
 from src.services.map.map_single_map_loader import load_single_map_into
+from src.services.map.world_snapshot import RESOURCE_LAYERS, load_world_snapshot
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
+    from src.services.map.map_resource_queries import ResourcesMap
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +55,7 @@ class MapResourcesService:
         self.cache_dir = Path("map_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        self.resources: dict[str, dict[str, set[tuple[int, int]]]] = {}
+        self.resources: ResourcesMap = {}
         self.signs: dict[str, dict[tuple[int, int], int]] = {}
         self.doors: dict[str, dict[tuple[int, int], int]] = {}
 
@@ -62,7 +64,10 @@ class MapResourcesService:
         self._cache_loader = MapCacheLoader(self.maps_dir, self.cache_dir)
         binary_loader = MapBinaryCache(self.maps_dir, self.resources, self.signs, self.doors)
 
-        loaded = binary_loader.try_load_from_binary()
+        loaded = self._load_from_snapshot()
+
+        if not loaded:
+            loaded = binary_loader.try_load_from_binary()
 
         if not loaded:
             loaded = self._cache_loader.try_load_from_cache(self.resources, self.signs, self.doors)
@@ -83,6 +88,28 @@ class MapResourcesService:
 
         self._load_manual_doors()
 
+    def _load_from_snapshot(self) -> bool:
+        """Usa las vistas del snapshot del mundo (``mmap``) si está al día.
+
+        Returns:
+            True si se cargaron los recursos desde el snapshot.
+        """
+        snapshot = load_world_snapshot(self.maps_dir)
+        if snapshot is None:
+            return False
+
+        for map_id in snapshot.map_ids():
+            snapshot_map = snapshot.get_map(map_id)
+            if snapshot_map is None:
+                continue
+            key = f"map_{map_id}"
+            self.resources[key] = {name: snapshot_map.layer(name) for name in RESOURCE_LAYERS}
+            self.signs[key] = snapshot_map.signs()
+            self.doors[key] = snapshot_map.doors()
+
+        logger.info("Recursos de %d mapas cargados desde %s", len(snapshot), snapshot.path)
+        return True
+
     def _load_all_maps(self) -> None:
         """Carga todos los mapas desde el directorio."""
         run_load_all_maps(
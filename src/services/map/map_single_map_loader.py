@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.services.map.ndjson_reader import iter_ndjson_entries
 
+if TYPE_CHECKING:
+    from src.services.map.map_resource_queries import ResourcesMap
+
 logger = logging.getLogger(__name__)
 
 
@@ -161,7 +165,7 @@ def load_doors_from_objects(objects_path: Path | None, map_id: int) -> dict[tupl
 
 
 def load_single_map_into(
-    resources: dict[str, dict[str, set[tuple[int, int]]]],
+    resources: ResourcesMap,
     signs: dict[str, dict[tuple[int, int], int]],
     doors: dict[str, dict[tuple[int, int], int]],
     maps_dir: Path,
@@ -1,18 +1,32 @@
-"""Pasos modulares para la secuencia de transición de mapa."""
+"""Pasos modulares para la secuencia de transición de mapa.
+
+La transición corre en dos fases. En la fase de lectura (``prepare``) cada paso
+carga lo que necesita sin modificar estado ni enviar nada; las lecturas corren
+concurrentemente. En la fase de escritura (``execute``) los pasos aplican los
+cambios en orden y encolan los packets del propio jugador en
+``MapTransitionContext.outgoing``, que se envían en una única escritura. Si un
+paso falla, los ya ejecutados se deshacen en orden inverso (``rollback``).
+"""
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from src.network.msg_character import build_character_create_response
+from src.network.msg_map import build_pos_update_response
+from src.utils.latency_histogram import LatencyHistogram
+
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
     from src.messaging.message_sender import MessageSender
     from src.repositories.player_repository import PlayerRepository
+    from src.services.map.map_entry_snapshot import MapEntrySnapshot
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
 
 logger = logging.getLogger(__name__)
@@ -34,24 +48,69 @@ class MapTransitionContext:
     new_y: int
     heading: int
     message_sender: MessageSender
+    # Packets para el propio jugador pendientes de enviar (ver SendQueuedPacketsStep)
+    outgoing: list[bytes] = field(default_factory=list)
 
 
 class MapTransitionStep(ABC):
     """Paso abstracto en la secuencia de transición de mapa."""
 
+    async def prepare(self, context: MapTransitionContext) -> None:  # noqa: B027
+        """Fase de lectura: carga datos sin modificar estado (por defecto no hace nada)."""
+
     @abstractmethod
     async def execute(self, context: MapTransitionContext) -> None:
         """Ejecuta el paso de transición."""
 
+    async def rollback(self, context: MapTransitionContext) -> None:  # noqa: B027
+        """Deshace el paso si la transición falla (por defecto no hace nada)."""
+
 
 class SendChangeMapStep(MapTransitionStep):
     """Paso 1: Enviar CHANGE_MAP al cliente."""
 
+    def __init__(
+        self,
+        send_map_snapshot: Callable[[int, MessageSender, int | None], Awaitable[object]]
+        | None = None,
+        reload_delay: float = 0.1,
+    ) -> None:
+        """Inicializa el paso.
+
+        Args:
+            send_map_snapshot: Rutina que envía el snapshot de un mapa (para
+                restaurar la vista del mapa anterior en el rollback).
+            reload_delay: Segundos de espera para que el cliente recargue el
+                mapa anterior en el rollback.
+        """
+        self.send_map_snapshot = send_map_snapshot
+        self.reload_delay = reload_delay
+
     async def execute(self, context: MapTransitionContext) -> None:
         """Envía el paquete CHANGE_MAP para que el cliente cargue el nuevo mapa."""
         logger.debug("Paso 1: Enviando CHANGE_MAP al mapa %d", context.new_map)
         await context.message_sender.send_change_map(context.new_map)
 
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Devuelve al cliente al mapa anterior y le reenvía lo que ve en él."""
+        sender = context.message_sender
+        await sender.send_change_map(context.current_map)
+        await asyncio.sleep(self.reload_delay)
+        await sender.send_packets(
+            build_pos_update_response(context.current_x, context.current_y)
+            + build_character_create_response(
+                char_index=context.user_id,
+                body=context.char_body,
+                head=context.char_head,
+                heading=context.heading,
+                x=context.current_x,
+                y=context.current_y,
+                name=context.username,
+            )
+        )
+        if self.send_map_snapshot is not None:
+            await self.send_map_snapshot(context.current_map, sender, context.user_id)
+
 
 class ClientLoadDelayStep(MapTransitionStep):
     """Paso 2: Delay para que el cliente cargue el mapa."""
@@ -80,18 +139,19 @@ class UpdatePositionStep(MapTransitionStep):
             context.user_id, context.new_x, context.new_y, context.new_map, context.heading
         )
 
-
-class SendPositionUpdateStep(MapTransitionStep):
-    """Paso 4: Enviar POS_UPDATE al cliente."""
-
-    async def execute(self, context: MapTransitionContext) -> None:
-        """Envía la actualización de posición al cliente."""
-        logger.debug("Paso 4: Enviando POS_UPDATE a (%d, %d)", context.new_x, context.new_y)
-        await context.message_sender.send_pos_update(context.new_x, context.new_y)
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Restaura la posición anterior."""
+        await self.player_repo.set_position(
+            context.user_id,
+            context.current_x,
+            context.current_y,
+            context.current_map,
+            context.heading,
+        )
 
 
 class RemoveFromOldMapStep(MapTransitionStep):
-    """Paso 5: Remover jugador del mapa anterior en MapManager."""
+    """Paso 4: Remover jugador del mapa anterior en MapManager."""
 
     def __init__(self, map_manager: MapManager) -> None:
         """Inicializa el paso con el gestor de mapas."""
@@ -99,42 +159,49 @@ class RemoveFromOldMapStep(MapTransitionStep):
 
     async def execute(self, context: MapTransitionContext) -> None:
         """Remueve al jugador del mapa anterior."""
-        logger.debug("Paso 5: Removiendo jugador del mapa %d", context.current_map)
+        logger.debug("Paso 4: Removiendo jugador del mapa %d", context.current_map)
         self.map_manager.remove_player(context.current_map, context.user_id)
 
-
-class BroadcastRemoveFromOldMapStep(MapTransitionStep):
-    """Paso 6: Broadcast CHARACTER_REMOVE en mapa anterior."""
-
-    def __init__(self, broadcast_service: MultiplayerBroadcastService) -> None:
-        """Inicializa el paso con el servicio de broadcast."""
-        self.broadcast_service = broadcast_service
-
-    async def execute(self, context: MapTransitionContext) -> None:
-        """Envía broadcast de eliminación del jugador en el mapa anterior."""
-        logger.debug("Paso 6: Broadcast CHARACTER_REMOVE en mapa %d", context.current_map)
-        await self.broadcast_service.broadcast_character_remove(
-            context.current_map, context.user_id
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Vuelve a registrar al jugador (y su tile) en el mapa anterior."""
+        self.map_manager.add_player(
+            context.current_map, context.user_id, context.message_sender, context.username
+        )
+        self.map_manager.update_player_tile(
+            context.user_id,
+            context.current_map,
+            context.current_x,
+            context.current_y,
+            context.current_x,
+            context.current_y,
         )
 
 
 class AddToNewMapStep(MapTransitionStep):
-    """Paso 7: Agregar jugador al nuevo mapa en MapManager."""
+    """Paso 5: Agregar jugador al nuevo mapa en MapManager."""
 
     def __init__(self, map_manager: MapManager) -> None:
         """Inicializa el paso con el gestor de mapas."""
         self.map_manager = map_manager
 
+    async def prepare(self, context: MapTransitionContext) -> None:
+        """Activa el nuevo mapa si no está residente (NPCs y ground items incluidos)."""
+        await self.map_manager.activate_map(context.new_map)
+
     async def execute(self, context: MapTransitionContext) -> None:
         """Agrega al jugador al nuevo mapa."""
-        logger.debug("Paso 7: Agregando jugador al mapa %d", context.new_map)
+        logger.debug("Paso 5: Agregando jugador al mapa %d", context.new_map)
         self.map_manager.add_player(
             context.new_map, context.user_id, context.message_sender, context.username
         )
 
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Remueve al jugador del nuevo mapa (libera también su tile)."""
+        self.map_manager.remove_player(context.new_map, context.user_id)
+
 
 class UpdateTileInNewMapStep(MapTransitionStep):
-    """Paso 7b: Marcar tile ocupado en el nuevo mapa en el índice espacial."""
+    """Paso 6: Marcar tile ocupado en el nuevo mapa en el índice espacial."""
 
     def __init__(self, map_manager: MapManager) -> None:
         """Inicializa el paso con el gestor de mapas."""
@@ -147,7 +214,7 @@ class UpdateTileInNewMapStep(MapTransitionStep):
         en update_player_tile incluso en el caso de primer registro.
         """
         logger.debug(
-            "Paso 7b: Actualizando tile ocupado en mapa %d pos (%d,%d)",
+            "Paso 6: Actualizando tile ocupado en mapa %d pos (%d,%d)",
             context.new_map,
             context.new_x,
             context.new_y,
@@ -162,73 +229,95 @@ class UpdateTileInNewMapStep(MapTransitionStep):
         )
 
 
+class SendPositionUpdateStep(MapTransitionStep):
+    """Paso 7: Encolar POS_UPDATE para el cliente."""
+
+    async def execute(self, context: MapTransitionContext) -> None:
+        """Encola la actualización de posición del jugador."""
+        logger.debug("Paso 7: Encolando POS_UPDATE a (%d, %d)", context.new_x, context.new_y)
+        context.outgoing.append(build_pos_update_response(context.new_x, context.new_y))
+
+
 class SendSelfCharacterCreateStep(MapTransitionStep):
-    """Paso 8: Enviar CHARACTER_CREATE del propio jugador."""
+    """Paso 8: Encolar CHARACTER_CREATE del propio jugador."""
 
     async def execute(self, context: MapTransitionContext) -> None:
-        """Envía el CHARACTER_CREATE del propio jugador."""
-        logger.debug("Paso 8: Enviando CHARACTER_CREATE propio")
-        await context.message_sender.send_character_create(
-            char_index=context.user_id,
-            body=context.char_body,
-            head=context.char_head,
-            heading=context.heading,
-            x=context.new_x,
-            y=context.new_y,
-            name=context.username,
+        """Encola el CHARACTER_CREATE del propio jugador."""
+        logger.debug("Paso 8: Encolando CHARACTER_CREATE propio")
+        context.outgoing.append(
+            build_character_create_response(
+                char_index=context.user_id,
+                body=context.char_body,
+                head=context.char_head,
+                heading=context.heading,
+                x=context.new_x,
+                y=context.new_y,
+                name=context.username,
+            )
         )
 
 
-class SendExistingPlayersStep(MapTransitionStep):
-    """Paso 9: Enviar todos los jugadores existentes en el nuevo mapa."""
+class SendMapSnapshotStep(MapTransitionStep):
+    """Paso 9: Encolar jugadores, NPCs y objetos del suelo del nuevo mapa."""
 
     def __init__(
         self,
-        send_players_in_map: Callable[[int, MessageSender, int | None], Awaitable[int]],
+        build_map_snapshot: Callable[[int, int | None], Awaitable[MapEntrySnapshot]],
     ) -> None:
-        """Inicializa el paso con la rutina de envío de jugadores."""
-        self.send_players_in_map = send_players_in_map
+        """Inicializa el paso con la rutina que arma el snapshot del mapa."""
+        self.build_map_snapshot = build_map_snapshot
 
     async def execute(self, context: MapTransitionContext) -> None:
-        """Envía los jugadores existentes en el nuevo mapa."""
-        logger.debug("Paso 9: Enviando jugadores existentes del mapa %d", context.new_map)
-        await self.send_players_in_map(
-            context.new_map,
-            context.message_sender,
-            context.user_id,
-        )
+        """Arma el snapshot de entrada del nuevo mapa y lo encola.
 
+        Se arma después de registrar al jugador en el mapa: lo que cambie
+        desde ahora le llega por los broadcasts normales.
+        """
+        logger.debug("Paso 9: Encolando snapshot del mapa %d", context.new_map)
+        snapshot = await self.build_map_snapshot(context.new_map, context.user_id)
+        if snapshot.payload:
+            context.outgoing.append(snapshot.payload)
 
-class SendNPCsStep(MapTransitionStep):
-    """Paso 10: Enviar todos los NPCs del nuevo mapa."""
 
-    def __init__(
-        self,
-        send_npcs_in_map: Callable[[int, MessageSender], Awaitable[int]],
-    ) -> None:
-        """Inicializa el paso con la rutina de envío de NPCs."""
-        self.send_npcs_in_map = send_npcs_in_map
+class SendQueuedPacketsStep(MapTransitionStep):
+    """Paso 10: Enviar los packets encolados para el jugador en una escritura."""
 
     async def execute(self, context: MapTransitionContext) -> None:
-        """Envía los NPCs del nuevo mapa."""
-        logger.debug("Paso 10: Enviando NPCs del mapa %d", context.new_map)
-        await self.send_npcs_in_map(context.new_map, context.message_sender)
+        """Envía y vacía ``context.outgoing``."""
+        if not context.outgoing:
+            return
+        logger.debug("Paso 10: Enviando %d packets encolados", len(context.outgoing))
+        payload = b"".join(context.outgoing)
+        context.outgoing.clear()
+        await context.message_sender.send_packets(payload)
 
 
-class SendGroundItemsStep(MapTransitionStep):
-    """Paso 11: Enviar todos los objetos del suelo en el nuevo mapa."""
+class BroadcastRemoveFromOldMapStep(MapTransitionStep):
+    """Paso 11: Broadcast CHARACTER_REMOVE en mapa anterior."""
 
-    def __init__(
-        self,
-        send_ground_items_in_map: Callable[[int, MessageSender], Awaitable[int]],
-    ) -> None:
-        """Inicializa el paso con la rutina de envío de objetos."""
-        self.send_ground_items_in_map = send_ground_items_in_map
+    def __init__(self, broadcast_service: MultiplayerBroadcastService) -> None:
+        """Inicializa el paso con el servicio de broadcast."""
+        self.broadcast_service = broadcast_service
 
     async def execute(self, context: MapTransitionContext) -> None:
-        """Envía los objetos del suelo del nuevo mapa."""
-        logger.debug("Paso 11: Enviando objetos del suelo del mapa %d", context.new_map)
-        await self.send_ground_items_in_map(context.new_map, context.message_sender)
+        """Envía broadcast de eliminación del jugador en el mapa anterior."""
+        logger.debug("Paso 11: Broadcast CHARACTER_REMOVE en mapa %d", context.current_map)
+        await self.broadcast_service.broadcast_character_remove(
+            context.current_map, context.user_id
+        )
+
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Vuelve a mostrar al jugador en el mapa anterior."""
+        await self.broadcast_service.broadcast_character_create(
+            map_id=context.current_map,
+            char_index=context.user_id,
+            body=context.char_body,
+            head=context.char_head,
+            heading=context.heading,
+            x=context.current_x,
+            y=context.current_y,
+            name=context.username,
+        )
 
 
 class BroadcastCreateInNewMapStep(MapTransitionStep):
@@ -252,16 +341,29 @@ class BroadcastCreateInNewMapStep(MapTransitionStep):
             name=context.username,
         )
 
+    async def rollback(self, context: MapTransitionContext) -> None:
+        """Quita al jugador de la vista del nuevo mapa."""
+        await self.broadcast_service.broadcast_character_remove(context.new_map, context.user_id)
+
 
 class MapTransitionOrchestrator:
-    """Orquestador que ejecuta la secuencia de transición de mapa."""
+    """Orquestador que ejecuta la secuencia de transición de mapa.
+
+    Mide la latencia de la fase de lectura, de cada paso y de la transición
+    completa (ver ``get_metrics``).
+    """
 
     def __init__(self, steps: list[MapTransitionStep]) -> None:
         """Inicializa el orquestador con la lista de pasos."""
         self.steps = steps
+        self._latencies: dict[str, LatencyHistogram] = {}
+        self._rollbacks = 0
 
     async def execute_transition(self, context: MapTransitionContext) -> None:
-        """Ejecuta todos los pasos de la transición de mapa."""
+        """Ejecuta todos los pasos de la transición de mapa.
+
+        Si un paso falla se deshacen los ya ejecutados y se relanza el error.
+        """
         logger.info(
             "Iniciando transición de mapa para %s (ID:%d): %d -> %d",
             context.username,
@@ -269,15 +371,31 @@ class MapTransitionOrchestrator:
             context.current_map,
             context.new_map,
         )
-
+        started = time.perf_counter()
+
+        # Fase 1: lecturas concurrentes, sin modificar estado (un error aborta sin rollback)
+        try:
+            await asyncio.gather(*(step.prepare(context) for step in self.steps))
+        except Exception:
+            logger.exception("Error en la fase de lectura de la transición")
+            raise
+        self._record("prepare", started)
+
+        # Fase 2: escrituras y envíos en orden
+        executed: list[MapTransitionStep] = []
         for i, step in enumerate(self.steps, 1):
+            step_started = time.perf_counter()
+            executed.append(step)
             try:
                 await step.execute(context)
-                logger.debug("Paso %d completado: %s", i, step.__class__.__name__)
             except Exception:
                 logger.exception("Error en paso %d (%s)", i, step.__class__.__name__)
+                await self._rollback(executed, context)
                 raise
+            self._record(step.__class__.__name__, step_started)
+            logger.debug("Paso %d completado: %s", i, step.__class__.__name__)
 
+        self._record("total", started)
         logger.info(
             "Transición completada para %s (ID:%d): (%d,%d) -> (%d,%d)",
             context.username,
@@ -288,15 +406,44 @@ class MapTransitionOrchestrator:
             context.new_y,
         )
 
+    async def _rollback(
+        self, executed: list[MapTransitionStep], context: MapTransitionContext
+    ) -> None:
+        self._rollbacks += 1
+        context.outgoing.clear()
+        for step in reversed(executed):
+            try:
+                await step.rollback(context)
+            except Exception:
+                logger.exception("Error deshaciendo paso %s", step.__class__.__name__)
+
+    def _record(self, name: str, started: float) -> None:
+        histogram = self._latencies.get(name)
+        if histogram is None:
+            histogram = self._latencies[name] = LatencyHistogram()
+        histogram.record((time.perf_counter() - started) * 1000)
+
+    def get_metrics(self) -> dict[str, object]:
+        """Métricas de latencia de las transiciones.
+
+        Returns:
+            Diccionario con ``rollbacks`` y, en ``latency``, el resumen del
+            histograma (ms) de ``prepare``, de cada paso y de ``total``.
+        """
+        return {
+            "rollbacks": self._rollbacks,
+            "latency": {name: hist.summary() for name, hist in self._latencies.items()},
+        }
+
     @classmethod
     def create_default_orchestrator(
         cls,
         player_repo: PlayerRepository,
         map_manager: MapManager,
         broadcast_service: MultiplayerBroadcastService,
-        send_players_in_map: Callable[[int, MessageSender, int | None], Awaitable[int]],
-        send_npcs_in_map: Callable[[int, MessageSender], Awaitable[int]],
-        send_ground_items_in_map: Callable[[int, MessageSender], Awaitable[int]],
+        build_map_snapshot: Callable[[int, int | None], Awaitable[MapEntrySnapshot]],
+        send_map_snapshot: Callable[[int, MessageSender, int | None], Awaitable[object]]
+        | None = None,
     ) -> MapTransitionOrchestrator:
         """Crea un orquestador con la secuencia predeterminada de 12 pasos.
 
@@ -304,18 +451,17 @@ class MapTransitionOrchestrator:
             MapTransitionOrchestrator configurado con la secuencia estándar.
         """
         steps = [
-            SendChangeMapStep(),
+            SendChangeMapStep(send_map_snapshot),
             ClientLoadDelayStep(),
             UpdatePositionStep(player_repo),
-            SendPositionUpdateStep(),
             RemoveFromOldMapStep(map_manager),
-            BroadcastRemoveFromOldMapStep(broadcast_service),
             AddToNewMapStep(map_manager),
             UpdateTileInNewMapStep(map_manager),
+            SendPositionUpdateStep(),
             SendSelfCharacterCreateStep(),
-            SendExistingPlayersStep(send_players_in_map),
-            SendNPCsStep(send_npcs_in_map),
-            SendGroundItemsStep(send_ground_items_in_map),
+            SendMapSnapshotStep(build_map_snapshot),
+            SendQueuedPacketsStep(),
+            BroadcastRemoveFromOldMapStep(broadcast_service),
             BroadcastCreateInNewMapStep(broadcast_service),
         ]
         return cls(steps)
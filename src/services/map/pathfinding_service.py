@@ -1,14 +1,43 @@
-"""Servicio de pathfinding para NPCs usando A*."""
+"""Servicio de pathfinding para NPCs usando A*.
+
+El A* trabaja sobre índices planos de tile: la transitabilidad estática sale
+del ``bytearray`` del mapa (``MapManager.get_walkability``) y solo los tiles
+estáticamente libres consultan la ocupación dinámica. ``g_score``/``came_from``
+son diccionarios de enteros en lugar de tuplas.
+
+Un NPC que persigue pide un paso por pasada de IA; con ``agent_id`` la ruta se
+cachea y se reutiliza mientras el objetivo no se aleje más de
+``PATH_REUSE_TARGET_DRIFT`` tiles de donde estaba al calcularla y ningún tile
+pendiente de la ruta se bloquee u ocupe.
+"""
 
 import heapq
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.game.map_manager import MapManager
+    from src.game.walkability_grid import WalkabilityGrid
 
 logger = logging.getLogger(__name__)
 
+# Distancia Manhattan que puede moverse el objetivo sin recalcular la ruta
+PATH_REUSE_TARGET_DRIFT = 2
+
+# Rutas cacheadas como máximo (una por NPC persiguiendo)
+MAX_CACHED_PATHS = 4096
+
+
+@dataclass(slots=True)
+class _CachedPath:
+    """Ruta calculada para un agente."""
+
+    map_id: int
+    target_x: int
+    target_y: int
+    cells: list[int]
+
 
 class PathfindingService:
     """Servicio para calcular rutas óptimas usando A* (4 direcciones)."""
@@ -29,6 +58,11 @@ class PathfindingService:
             (-1, 0, 4),  # Oeste
         ]
 
+        # Rutas por agente (instance_id del NPC)
+        self._paths: dict[str, _CachedPath] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def get_next_step(
         self,
         map_id: int,
@@ -37,9 +71,13 @@ class PathfindingService:
         target_x: int,
         target_y: int,
         max_depth: int = 20,
+        agent_id: str | None = None,
     ) -> tuple[int, int, int] | None:
         """Calcula el siguiente paso hacia el objetivo usando A*.
 
+        El tile objetivo solo debe ser estáticamente transitable: normalmente
+        lo ocupa el jugador perseguido.
+
         Args:
             map_id: ID del mapa.
             start_x: Posición X inicial.
@@ -47,6 +85,8 @@ class PathfindingService:
             target_x: Posición X objetivo.
             target_y: Posición Y objetivo.
             max_depth: Profundidad máxima de búsqueda (evita cálculos excesivos).
+            agent_id: Identificador del agente para reutilizar su ruta entre
+                llamadas (None para no cachear).
 
         Returns:
             Tupla (next_x, next_y, heading) con el siguiente paso, o None si no hay camino.
@@ -56,139 +96,187 @@ class PathfindingService:
             return None
 
         # Si el objetivo está bloqueado, no tiene sentido buscar camino
-        if not self.map_manager.can_move_to(map_id, target_x, target_y):
-            return None
-
-        # Ejecutar A*
-        path = self._astar(map_id, start_x, start_y, target_x, target_y, max_depth)
-
-        # Si no hay camino, retornar None
-        if not path or len(path) < 2:  # noqa: PLR2004
+        grid = self.map_manager.get_walkability(map_id)
+        if not grid.is_walkable(target_x, target_y) or not grid.in_bounds(start_x, start_y):
             return None
 
-        # Retornar el primer paso de la ruta (después del punto inicial)
-        next_pos = path[1]
-        next_x, next_y = next_pos
+        start = grid.index(start_x, start_y)
+        path = self._reuse_path(agent_id, map_id, grid, start, target_x, target_y)
+        if path is None:
+            path = self._astar(map_id, grid, start, grid.index(target_x, target_y), max_depth)
+            if agent_id is not None:
+                self._store_path(agent_id, map_id, target_x, target_y, path)
+            if path is None:
+                return None
 
-        # Calcular heading basado en la dirección
-        dx = next_x - start_x
-        dy = next_y - start_y
+        # Siguiente tile de la ruta después de la posición actual
+        next_x, next_y = grid.coords(path[path.index(start) + 1])
 
         # Determinar heading (1=Norte, 2=Este, 3=Sur, 4=Oeste)
-        if dy == -1:
+        if next_y < start_y:
             heading = 1  # Norte
-        elif dx == 1:
+        elif next_x > start_x:
             heading = 2  # Este
-        elif dy == 1:
+        elif next_y > start_y:
             heading = 3  # Sur
-        else:  # dx == -1
+        else:
             heading = 4  # Oeste
 
         return next_x, next_y, heading
 
-    def _astar(
+    def forget(self, agent_id: str) -> None:
+        """Descarta la ruta cacheada de un agente (p. ej. al morir el NPC).
+
+        Args:
+            agent_id: Identificador del agente.
+        """
+        self._paths.pop(agent_id, None)
+
+    def _reuse_path(
         self,
+        agent_id: str | None,
         map_id: int,
-        start_x: int,
-        start_y: int,
+        grid: WalkabilityGrid,
+        start: int,
         target_x: int,
         target_y: int,
+    ) -> list[int] | None:
+        """Devuelve la ruta cacheada del agente si sigue siendo válida.
+
+        Returns:
+            Lista de índices de la ruta o None si hay que recalcular.
+        """
+        if agent_id is None:
+            return None
+        cached = self._paths.get(agent_id)
+        if (
+            cached is None
+            or cached.map_id != map_id
+            or abs(cached.target_x - target_x) + abs(cached.target_y - target_y)
+            > PATH_REUSE_TARGET_DRIFT
+            or start not in cached.cells
+        ):
+            self.cache_misses += 1
+            return None
+
+        # Tiles pendientes (sin contar el destino, ocupado por el objetivo)
+        position = cached.cells.index(start)
+        pending = cached.cells[position + 1 : -1]
+        if position + 1 >= len(cached.cells) or any(
+            grid.cells[cell] or self.map_manager.is_tile_occupied(map_id, *grid.coords(cell))
+            for cell in pending
+        ):
+            self.cache_misses += 1
+            return None
+
+        self.cache_hits += 1
+        return cached.cells
+
+    def _store_path(
+        self, agent_id: str, map_id: int, target_x: int, target_y: int, path: list[int] | None
+    ) -> None:
+        """Guarda (o descarta si no hay camino) la ruta de un agente."""
+        if path is None:
+            self._paths.pop(agent_id, None)
+            return
+        if agent_id not in self._paths and len(self._paths) >= MAX_CACHED_PATHS:
+            # Descarta la ruta más vieja (orden de inserción)
+            del self._paths[next(iter(self._paths))]
+        self._paths[agent_id] = _CachedPath(map_id, target_x, target_y, path)
+
+    def _astar(  # noqa: PLR0914 - locales del loop caliente a propósito
+        self,
+        map_id: int,
+        grid: WalkabilityGrid,
+        start: int,
+        goal: int,
         max_depth: int,
-    ) -> list[tuple[int, int]] | None:
-        """Implementación del algoritmo A*.
+    ) -> list[int] | None:
+        """Implementación del algoritmo A* sobre índices planos.
 
         Args:
             map_id: ID del mapa.
-            start_x: Posición X inicial.
-            start_y: Posición Y inicial.
-            target_x: Posición X objetivo.
-            target_y: Posición Y objetivo.
-            max_depth: Profundidad máxima de búsqueda.
+            grid: Grilla de transitabilidad del mapa.
+            start: Índice del tile inicial.
+            goal: Índice del tile objetivo.
+            max_depth: Profundidad máxima de búsqueda (nodos expandidos).
 
         Returns:
-            Lista de posiciones (x, y) desde start hasta target, o None si no hay camino.
+            Lista de índices desde start hasta goal, o None si no hay camino.
         """
-        # Priority queue: (f_score, counter, (x, y))
-        # counter es para desempatar cuando f_score es igual
+        width = grid.width
+        height = grid.height
+        cells = grid.cells
+        is_occupied = self.map_manager.is_tile_occupied
+        goal_y, goal_x = divmod(goal, width)
+        start_y, start_x = divmod(start, width)
+
+        # Priority queue: (f_score, counter, índice); counter desempata en orden FIFO
         counter = 0
-        open_set: list[tuple[float, int, tuple[int, int]]] = []
-        heapq.heappush(open_set, (0, counter, (start_x, start_y)))
-
-        # Diccionario para rastrear de dónde vinimos
-        came_from: dict[tuple[int, int], tuple[int, int]] = {}
-
-        # g_score: costo desde start hasta el nodo
-        g_score: dict[tuple[int, int], float] = {(start_x, start_y): 0}
-
-        # f_score es el costo estimado total
-        f_score: dict[tuple[int, int], float] = {
-            (start_x, start_y): self._heuristic(start_x, start_y, target_x, target_y)
-        }
-
-        # Conjunto de nodos visitados
-        closed_set: set[tuple[int, int]] = set()
-
-        nodes_explored = 0
+        open_set: list[tuple[int, int, int]] = [
+            (self._heuristic(start_x, start_y, goal_x, goal_y), counter, start)
+        ]
+        came_from: dict[int, int] = {}
+        g_score: dict[int, int] = {start: 0}
+        closed_set: set[int] = set()
 
         while open_set:
-            # Obtener nodo con menor f_score
             _, _, current = heapq.heappop(open_set)
 
             # Si llegamos al objetivo, reconstruir camino
-            if current == (target_x, target_y):
+            if current == goal:
                 return self._reconstruct_path(came_from, current)
+            if current in closed_set:
+                continue
 
-            # Marcar como visitado
             closed_set.add(current)
-            nodes_explored += 1
 
             # Límite de profundidad (evitar búsquedas infinitas)
-            if nodes_explored > max_depth:
+            if len(closed_set) > max_depth:
                 logger.debug("Pathfinding: límite de profundidad alcanzado (%d nodos)", max_depth)
                 return None
 
-            # Explorar vecinos (4 direcciones)
-            current_x, current_y = current
+            current_y, current_x = divmod(current, width)
+            tentative_g = g_score[current] + 1  # Costo 1 por cada movimiento
             for dx, dy, _ in self.directions:
                 neighbor_x = current_x + dx
                 neighbor_y = current_y + dy
-                neighbor = (neighbor_x, neighbor_y)
-
-                # Si ya fue visitado, saltear
-                if neighbor in closed_set:
+                if not (0 <= neighbor_x < width and 0 <= neighbor_y < height):
                     continue
+                neighbor = neighbor_y * width + neighbor_x
 
-                # Verificar si es un tile válido (no bloqueado, no ocupado)
-                if not self.map_manager.can_move_to(map_id, neighbor_x, neighbor_y):
+                # Visitado o bloqueado (pared, agua, puerta cerrada)
+                if neighbor in closed_set or cells[neighbor]:
+                    continue
+                # Ocupado por un jugador o NPC (salvo el objetivo)
+                if neighbor != goal and is_occupied(map_id, neighbor_x + 1, neighbor_y + 1):
                     continue
 
-                # Calcular g_score tentativo
-                tentative_g = g_score[current] + 1  # Costo 1 por cada movimiento
-
-                # Si encontramos un camino mejor, actualizar
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
+                if tentative_g < g_score.get(neighbor, tentative_g + 1):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + self._heuristic(
-                        neighbor_x, neighbor_y, target_x, target_y
-                    )
-
-                    # Agregar a open_set si no está
                     counter += 1
-                    heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
+                    heapq.heappush(
+                        open_set,
+                        (
+                            tentative_g + self._heuristic(neighbor_x, neighbor_y, goal_x, goal_y),
+                            counter,
+                            neighbor,
+                        ),
+                    )
 
         # No se encontró camino
         logger.debug(
             "Pathfinding: no se encontró camino desde (%d,%d) a (%d,%d)",
-            start_x,
-            start_y,
-            target_x,
-            target_y,
+            start_x + 1,
+            start_y + 1,
+            goal_x + 1,
+            goal_y + 1,
         )
         return None
 
     @staticmethod
-    def _heuristic(x1: int, y1: int, x2: int, y2: int) -> float:
+    def _heuristic(x1: int, y1: int, x2: int, y2: int) -> int:
         """Calcula la distancia heurística (Manhattan).
 
         Args:
@@ -203,9 +291,7 @@ class PathfindingService:
         return abs(x1 - x2) + abs(y1 - y2)
 
     @staticmethod
-    def _reconstruct_path(
-        came_from: dict[tuple[int, int], tuple[int, int]], current: tuple[int, int]
-    ) -> list[tuple[int, int]]:
+    def _reconstruct_path[T](came_from: dict[T, T], current: T) -> list[T]:
         """Reconstruye el camino desde start hasta current.
 
         Args:
@@ -213,7 +299,7 @@ class PathfindingService:
             current: Nodo final.
 
         Returns:
-            Lista de posiciones desde start hasta current.
+            Lista de nodos desde start hasta current.
         """
         path = [current]
         while current in came_from:
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,27 +12,20 @@ if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
     from src.repositories.account_repository import AccountRepository
     from src.repositories.player_repository import PlayerRepository
+    from src.services.map.map_entry_snapshot import MapEntrySnapshot, PlayerVisualData
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
     from src.services.npc.random_spawn_service import RandomSpawnService
 
+from src.services.map.map_entry_snapshot import MapEntrySnapshotBuilder, resolve_visual_data
 from src.services.map.map_transition_steps import (
     MapTransitionContext,
     MapTransitionOrchestrator,
 )
+from src.utils.latency_histogram import LatencyHistogram
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class PlayerVisualData:
-    """Datos visuales de un jugador para CHARACTER_CREATE."""
-
-    user_id: int
-    username: str
-    char_body: int
-    char_head: int
-
-
 class PlayerMapService:
     """Servicio que encapsula la lógica de spawn y transición de jugadores entre mapas.
 
@@ -65,15 +57,19 @@ class PlayerMapService:
         self.map_manager = map_manager
         self.broadcast_service = broadcast_service
         self.random_spawn_service = random_spawn_service
+        self.snapshot_builder = MapEntrySnapshotBuilder(player_repo, account_repo, map_manager)
+
+        # Tiempo desde que empieza la entrada al mapa hasta enviar el snapshot
+        self._time_to_playable = LatencyHistogram()
+        self._snapshot_bytes = 0
 
         # Crear orquestador de transición con la secuencia predeterminada
         self.transition_orchestrator = MapTransitionOrchestrator.create_default_orchestrator(
             player_repo,
             map_manager,
             broadcast_service,
-            self._send_players_in_map,
-            self._send_npcs_in_map,
-            self._send_ground_items_in_map,
+            self._build_map_snapshot,
+            self._send_map_snapshot,
         )
 
     async def _get_player_visual_data(self, user_id: int) -> PlayerVisualData:
@@ -85,148 +81,75 @@ class PlayerMapService:
         Returns:
             PlayerVisualData con los datos del jugador.
         """
-        # Valores por defecto
-        char_body = 1
-        char_head = 1
-        username = f"Player{user_id}"
-
-        # Obtener datos de la cuenta
-        account_data = await self.account_repo.get_account_by_user_id(user_id)
-        if account_data:
-            char_body = int(account_data.get("char_race", 1))
-            char_head = int(account_data.get("char_head", 1))
-            username = account_data.get("username", f"Player{user_id}")
-
-            # Validar body (no puede ser 0)
-            if char_body == 0:
-                char_body = 1
-
-        # Verificar si el jugador tiene apariencia morfeada activa
+        appearance = await self.account_repo.get_account_appearance(user_id)
         morphed = await self.player_repo.get_morphed_appearance(user_id)
-        if morphed:
-            morphed_until = morphed.get("morphed_until", 0.0)
-            if time.time() < morphed_until:
-                # Usar apariencia morfeada
-                char_body = int(morphed.get("morphed_body", char_body))
-                char_head = int(morphed.get("morphed_head", char_head))
-
-        return PlayerVisualData(
-            user_id=user_id,
-            username=username,
-            char_body=char_body,
-            char_head=char_head,
-        )
+        return resolve_visual_data(user_id, appearance, morphed)
 
-    async def _send_players_in_map(
-        self,
-        map_id: int,
-        message_sender: MessageSender,
-        exclude_user_id: int | None = None,
-    ) -> int:
-        """Envía CHARACTER_CREATE de todos los jugadores en un mapa.
+    async def _build_map_snapshot(
+        self, map_id: int, exclude_user_id: int | None = None
+    ) -> MapEntrySnapshot:
+        """Arma el snapshot de jugadores, NPCs y ground items del mapa.
 
         Args:
             map_id: ID del mapa.
-            message_sender: MessageSender del jugador receptor.
-            exclude_user_id: ID del jugador a excluir (opcional).
+            exclude_user_id: ID del jugador a excluir (el que entra).
 
         Returns:
-            Número de jugadores enviados.
+            Snapshot a enviar.
         """
-        existing_players = self.map_manager.get_players_in_map(map_id)
-        players_sent = 0
-
-        for other_user_id in existing_players:
-            # Excluir al jugador especificado
-            if exclude_user_id and other_user_id == exclude_user_id:
-                continue
-
-            # Obtener posición del otro jugador
-            other_position = await self.player_repo.get_position(other_user_id)
-            if not other_position:
-                continue
-
-            # Obtener datos visuales del otro jugador
-            other_visual = await self._get_player_visual_data(other_user_id)
-
-            # Enviar CHARACTER_CREATE
-            await message_sender.send_character_create(
-                char_index=other_user_id,
-                body=other_visual.char_body,
-                head=other_visual.char_head,
-                heading=other_position.get("heading", 3),
-                x=other_position["x"],
-                y=other_position["y"],
-                name=other_visual.username,
-            )
-            await asyncio.sleep(0.01)
-            players_sent += 1
-
-        logger.debug("Enviados %d jugadores del mapa %d", players_sent, map_id)
-        return players_sent
+        snapshot = await self.snapshot_builder.build(map_id, exclude_user_id)
+        self._snapshot_bytes += len(snapshot.payload)
+        logger.debug(
+            "Snapshot del mapa %d: %d jugadores, %d NPCs, %d items (%d bytes)",
+            map_id,
+            snapshot.players,
+            snapshot.npcs,
+            snapshot.ground_items,
+            len(snapshot.payload),
+        )
+        return snapshot
 
-    async def _send_npcs_in_map(self, map_id: int, message_sender: MessageSender) -> int:
-        """Envía CHARACTER_CREATE de todos los NPCs en un mapa.
+    async def _send_map_snapshot(
+        self,
+        map_id: int,
+        message_sender: MessageSender,
+        exclude_user_id: int | None = None,
+    ) -> MapEntrySnapshot:
+        """Envía jugadores, NPCs y ground items del mapa en una sola escritura.
 
         Args:
             map_id: ID del mapa.
             message_sender: MessageSender del jugador receptor.
+            exclude_user_id: ID del jugador a excluir (el que entra).
 
         Returns:
-            Número de NPCs enviados.
+            Snapshot enviado.
         """
-        npcs = self.map_manager.get_npcs_in_map(map_id)
-        npcs_sent = 0
+        snapshot = await self._build_map_snapshot(map_id, exclude_user_id)
+        if snapshot.payload:
+            await message_sender.send_packets(snapshot.payload)
+        return snapshot
 
-        for npc in npcs:
-            await message_sender.send_character_create(
-                char_index=npc.char_index,
-                body=npc.body_id,
-                head=npc.head_id,
-                heading=npc.heading,
-                x=npc.x,
-                y=npc.y,
-                weapon=0,
-                shield=0,
-                helmet=0,
-                fx=0,
-                loops=0,
-                name=npc.name,
-            )
-            await asyncio.sleep(0.01)
-            npcs_sent += 1
-
-        logger.debug("Enviados %d NPCs del mapa %d", npcs_sent, map_id)
-        return npcs_sent
+    def _record_time_to_playable(self, started: float, user_id: int, map_id: int) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._time_to_playable.record(elapsed_ms)
+        logger.debug("Jugador %d jugable en mapa %d tras %.2fms", user_id, map_id, elapsed_ms)
 
-    async def _send_ground_items_in_map(self, map_id: int, message_sender: MessageSender) -> int:
-        """Envía OBJECT_CREATE de todos los ground items en un mapa.
-
-        Args:
-            map_id: ID del mapa.
-            message_sender: MessageSender del jugador receptor.
+    def get_metrics(self) -> dict[str, float | int]:
+        """Métricas de entrada a mapas.
 
         Returns:
-            Número de items enviados.
+            Resumen del histograma de time-to-playable (ms) y bytes de snapshots enviados.
         """
-        items_sent = 0
+        return {**self._time_to_playable.summary(), "snapshot_bytes": self._snapshot_bytes}
 
-        # Acceder a ground items del MapManager
-        for (item_map_id, x, y), items in self.map_manager._ground_items.items():  # noqa: SLF001
-            if item_map_id != map_id:
-                continue
+    def get_transition_metrics(self) -> dict[str, object]:
+        """Métricas de latencia por paso de las transiciones de mapa.
 
-            for item in items:
-                grh_index = item.get("grh_index")
-                if grh_index and isinstance(grh_index, int):
-                    await message_sender.send_object_create(x, y, grh_index)
-                    items_sent += 1
-                    await asyncio.sleep(0.01)
-
-        if items_sent > 0:
-            logger.debug("Enviados %d ground items del mapa %d", items_sent, map_id)
-
-        return items_sent
+        Returns:
+            Diccionario de ``MapTransitionOrchestrator.get_metrics``.
+        """
+        return self.transition_orchestrator.get_metrics()
 
     async def _unblock_exit_tiles(self, map_id: int, message_sender: MessageSender) -> int:
         """Envía BLOCK_POSITION(false) para tiles de exit que están bloqueados en el cliente.
@@ -280,10 +203,15 @@ class PlayerMapService:
             heading: Dirección del jugador.
             message_sender: MessageSender del jugador.
         """
+        started = time.perf_counter()
+
         # Obtener datos visuales del jugador
         visual_data = await self._get_player_visual_data(user_id)
 
-        # 1. Agregar jugador al mapa en MapManager
+        # 1. Cargar el mapa si no está residente (NPCs y ground items incluidos)
+        await self.map_manager.activate_map(map_id)
+
+        # 1a. Agregar jugador al mapa en MapManager
         self.map_manager.add_player(map_id, user_id, message_sender, visual_data.username)
 
         # 1b. Marcar ocupación de tile para el jugador en el índice espacial
@@ -301,22 +229,17 @@ class PlayerMapService:
             name=visual_data.username,
         )
 
-        # 3. Enviar todos los jugadores existentes en el mapa
-        await self._send_players_in_map(map_id, message_sender, exclude_user_id=user_id)
+        # 3. Enviar jugadores, NPCs y ground items del mapa en un único buffer
+        await self._send_map_snapshot(map_id, message_sender, exclude_user_id=user_id)
+        self._record_time_to_playable(started, user_id, map_id)
 
-        # 4. Enviar todos los NPCs del mapa
-        await self._send_npcs_in_map(map_id, message_sender)
-
-        # 4b. Spawneear NPCs aleatorios si hay áreas configuradas
+        # 4. Spawneear NPCs aleatorios si hay áreas configuradas
         await self._spawn_random_npcs_for_player(map_id, x, y, message_sender)
 
-        # 5. Enviar todos los ground items del mapa
-        await self._send_ground_items_in_map(map_id, message_sender)
-
-        # 6. Desbloquear tiles de exit (workaround para mapas con tiles bloqueados incorrectamente)
+        # 5. Desbloquear tiles de exit (workaround para mapas con tiles bloqueados incorrectamente)
         await self._unblock_exit_tiles(map_id, message_sender)
 
-        # 7. Broadcast CHARACTER_CREATE a otros jugadores
+        # 6. Broadcast CHARACTER_CREATE a otros jugadores
         await self.broadcast_service.broadcast_character_create(
             map_id=map_id,
             char_index=user_id,
@@ -351,8 +274,8 @@ class PlayerMapService:
     ) -> None:
         """Transiciona un jugador de un mapa a otro (usado en cambios de mapa).
 
-        Este método ahora usa el orquestador de transición para ejecutar la secuencia
-        completa de 12 pasos de forma modular y mantenible.
+        Este método usa el orquestador de transición para ejecutar la secuencia
+        completa de pasos de forma modular y mantenible.
 
         Args:
             user_id: ID del jugador.
@@ -365,6 +288,8 @@ class PlayerMapService:
             heading: Dirección del jugador.
             message_sender: MessageSender del jugador.
         """
+        started = time.perf_counter()
+
         # Obtener datos visuales del jugador
         visual_data = await self._get_player_visual_data(user_id)
 
@@ -386,6 +311,7 @@ class PlayerMapService:
 
         # Ejecutar transición usando el orquestador
         await self.transition_orchestrator.execute_transition(context)
+        self._record_time_to_playable(started, user_id, new_map)
 
         # Spawneear NPCs aleatorios después de la transición (si hay áreas configuradas)
         await self._spawn_random_npcs_for_player(new_map, new_x, new_y, message_sender)
@@ -0,0 +1,446 @@
+"""Snapshot binario del mundo mapeado en memoria (``mmap``).
+
+Un único archivo versionado y con checksum reemplaza, en el arranque, el
+parseo de JSON/NDJSON de ``map_data``. Para cada mapa guarda bitplanes de
+``width * height`` bits (colisión de ``MapManager`` y las capas de recursos
+blocked/water/trees/mines/anvils/forges) más tablas de exits, carteles y
+puertas. El archivo se abre con ``mmap`` de solo lectura y las capas se
+consultan en el lugar con vistas tipo ``TileBitmap``: no se arman sets de
+tuplas y varios procesos del mismo host comparten las mismas páginas.
+
+Formato (little endian)::
+
+    cabecera   <4sHHI32s  magic, versión, cantidad de mapas, crc32 del resto,
+                          huella de los archivos fuente
+    directorio <4H7I      por mapa: map_id, width, height, 0, offset de planos,
+                          offset/cantidad de exits, carteles y puertas
+    planos     LAYERS en orden, ceil(width * height / 8) bytes cada uno
+    exits      <5H        x, y, to_map, to_x, to_y
+    carteles   <HHI       x, y, grh_index (puertas igual)
+
+La huella (sha256 de nombre, tamaño y mtime de los ``*.json`` de
+``map_data``) detecta un snapshot desactualizado: en ese caso se ignora y se
+usa la carga tradicional. Se genera con
+``uv run python -m tools.compression.world_snapshot build``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.game.map_manager import (
+    MAP_RANGE_1,
+    MAP_RANGE_2,
+    MAP_RANGE_3,
+    MAP_RANGE_4,
+    MAP_RANGE_5,
+    MAX_COORDINATE,
+    MAX_MAP_ID,
+)
+from src.game.map_metadata_loader import MapMetadataLoader
+from src.services.map.map_bulk_resources_loader import gather_map_files, load_map_resources
+
+logger = logging.getLogger(__name__)
+
+WORLD_SNAPSHOT_PATH = Path("map_binary") / "world.snapshot"
+WORLD_SNAPSHOT_MAGIC = b"AOWS"
+WORLD_SNAPSHOT_VERSION = 1
+
+# Orden de los bitplanes dentro de cada mapa
+LAYERS = ("collision", "blocked", "water", "trees", "mines", "anvils", "forges")
+RESOURCE_LAYERS = LAYERS[1:]
+
+# Archivos de metadata por rango de mapas (mismo esquema que el arranque)
+METADATA_RANGES = (
+    (1, 51, "metadata_001-051.json"),
+    (52, 101, "metadata_052-101.json"),
+    (102, 151, "metadata_102-151.json"),
+    (152, 201, "metadata_152-201.json"),
+    (202, 251, "metadata_202-251.json"),
+    (252, 290, "metadata_252-290.json"),
+)
+
+_HEADER = struct.Struct("<4sHHI32s")
+_DIRECTORY_ENTRY = struct.Struct("<4H7I")
+_EXIT = struct.Struct("<5H")
+_GRH_ENTRY = struct.Struct("<HHI")
+_BITS_PER_BYTE = 8
+
+# Snapshots abiertos por ruta (un solo mmap por proceso)
+_open_snapshots: dict[Path, WorldSnapshot] = {}
+
+
+class MappedTileLayer(AbstractSet[tuple[int, int]]):
+    """Vista de solo lectura sobre un bitplane del snapshot (coordenadas 1-based)."""
+
+    __slots__ = ("_bits", "height", "width")
+
+    def __init__(self, bits: memoryview, width: int, height: int) -> None:
+        """Crea la vista.
+
+        Args:
+            bits: Bytes del bitplane (sin copiar).
+            width: Ancho del mapa.
+            height: Alto del mapa.
+        """
+        self._bits = bits
+        self.width = width
+        self.height = height
+
+    def get(self, x: int, y: int) -> bool:
+        """Indica si el tile (x, y) está marcado.
+
+        Returns:
+            True si el bit del tile está activo.
+        """
+        if not (0 < x <= self.width and 0 < y <= self.height):
+            return False
+        bit_index = (y - 1) * self.width + (x - 1)
+        return bool(self._bits[bit_index >> 3] & (1 << (bit_index & 7)))
+
+    def __contains__(self, coord: object) -> bool:
+        """Permite ``(x, y) in layer``.
+
+        Returns:
+            True si el tile está marcado.
+        """
+        if not isinstance(coord, tuple) or len(coord) != 2:  # noqa: PLR2004
+            return False
+        x, y = coord
+        return self.get(x, y)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Itera los tiles marcados.
+
+        Yields:
+            Coordenadas (x, y) activas.
+        """
+        width = self.width
+        for byte_index, byte in enumerate(self._bits):
+            pending = byte
+            while pending:
+                low_bit = pending & -pending
+                bit_index = byte_index * _BITS_PER_BYTE + low_bit.bit_length() - 1
+                pending ^= low_bit
+                y, x = divmod(bit_index, width)
+                yield x + 1, y + 1
+
+    def __len__(self) -> int:
+        """Cantidad de tiles marcados.
+
+        Returns:
+            Bits activos del plano.
+        """
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    @classmethod
+    def _from_iterable(cls, it: Iterable[Any]) -> set[Any]:
+        # Las operaciones de conjuntos (|, &, -) devuelven sets comunes
+        return set(it)
+
+
+@dataclass(slots=True)
+class WorldMapData:
+    """Datos de un mapa a volcar en el snapshot."""
+
+    map_id: int
+    width: int
+    height: int
+    layers: dict[str, set[tuple[int, int]]] = field(default_factory=dict)
+    exits: dict[tuple[int, int], tuple[int, int, int]] = field(default_factory=dict)
+    signs: dict[tuple[int, int], int] = field(default_factory=dict)
+    doors: dict[tuple[int, int], int] = field(default_factory=dict)
+
+
+class SnapshotMap:
+    """Vista de un mapa dentro del snapshot."""
+
+    __slots__ = ("_buffer", "_entry", "height", "map_id", "width")
+
+    def __init__(self, buffer: memoryview, entry: tuple[int, ...]) -> None:
+        """Crea la vista a partir de la entrada de directorio.
+
+        Args:
+            buffer: Contenido completo del snapshot.
+            entry: Entrada de directorio desempaquetada.
+        """
+        self._buffer = buffer
+        self._entry = entry
+        self.map_id, self.width, self.height = entry[0], entry[1], entry[2]
+
+    def layer(self, name: str) -> MappedTileLayer:
+        """Vista sobre uno de los bitplanes (``LAYERS``).
+
+        Returns:
+            MappedTileLayer del plano pedido.
+        """
+        plane_bytes = _plane_bytes(self.width, self.height)
+        start = self._entry[4] + LAYERS.index(name) * plane_bytes
+        return MappedTileLayer(self._buffer[start : start + plane_bytes], self.width, self.height)
+
+    def exits(self) -> dict[tuple[int, int, int], dict[str, int]]:
+        """Exits del mapa en el formato de ``ExitIndex``.
+
+        Returns:
+            Mapping {(map_id, x, y): {to_map, to_x, to_y}}.
+        """
+        return {
+            (self.map_id, x, y): {"to_map": to_map, "to_x": to_x, "to_y": to_y}
+            for x, y, to_map, to_x, to_y in _EXIT.iter_unpack(
+                self._buffer[self._entry[5] : self._entry[5] + self._entry[6] * _EXIT.size]
+            )
+        }
+
+    def signs(self) -> dict[tuple[int, int], int]:
+        """Carteles del mapa.
+
+        Returns:
+            Mapping {(x, y): grh_index}.
+        """
+        return self._grh_table(self._entry[7], self._entry[8])
+
+    def doors(self) -> dict[tuple[int, int], int]:
+        """Puertas del mapa.
+
+        Returns:
+            Mapping {(x, y): grh_index}.
+        """
+        return self._grh_table(self._entry[9], self._entry[10])
+
+    def _grh_table(self, offset: int, count: int) -> dict[tuple[int, int], int]:
+        table = self._buffer[offset : offset + count * _GRH_ENTRY.size]
+        return {(x, y): grh for x, y, grh in _GRH_ENTRY.iter_unpack(table)}
+
+
+class WorldSnapshot:
+    """Snapshot del mundo abierto con ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        """Abre y valida el snapshot.
+
+        Args:
+            path: Ruta al archivo.
+
+        Raises:
+            ValueError: Si la cabecera, la versión o el checksum no son válidos.
+        """
+        self.path = path
+        with path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(self._mmap)
+        if len(buffer) < _HEADER.size:
+            msg = f"snapshot truncado: {path}"
+            raise ValueError(msg)
+
+        magic, version, map_count, checksum, fingerprint = _HEADER.unpack_from(buffer)
+        if magic != WORLD_SNAPSHOT_MAGIC or version != WORLD_SNAPSHOT_VERSION:
+            msg = f"snapshot con formato {magic!r} v{version} no soportado: {path}"
+            raise ValueError(msg)
+        if zlib.crc32(buffer[_HEADER.size :]) != checksum:
+            msg = f"checksum inválido en snapshot: {path}"
+            raise ValueError(msg)
+
+        self.fingerprint: bytes = fingerprint
+        self._maps: dict[int, SnapshotMap] = {}
+        for entry in _DIRECTORY_ENTRY.iter_unpack(
+            buffer[_HEADER.size : _HEADER.size + map_count * _DIRECTORY_ENTRY.size]
+        ):
+            self._maps[entry[0]] = SnapshotMap(buffer, entry)
+
+    def map_ids(self) -> list[int]:
+        """IDs de los mapas incluidos.
+
+        Returns:
+            Lista ordenada de map_id.
+        """
+        return sorted(self._maps)
+
+    def get_map(self, map_id: int) -> SnapshotMap | None:
+        """Vista de un mapa del snapshot.
+
+        Returns:
+            SnapshotMap o None si el mapa no está incluido.
+        """
+        return self._maps.get(map_id)
+
+    def __len__(self) -> int:
+        """Cantidad de mapas.
+
+        Returns:
+            Mapas incluidos en el snapshot.
+        """
+        return len(self._maps)
+
+
+def _plane_bytes(width: int, height: int) -> int:
+    return (width * height + _BITS_PER_BYTE - 1) // _BITS_PER_BYTE
+
+
+def source_fingerprint(maps_dir: Path) -> bytes:
+    """Huella de los archivos fuente de ``map_data``.
+
+    Returns:
+        sha256 de nombre, tamaño y mtime de cada ``*.json`` del directorio.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(maps_dir.glob("*.json")):
+        stat = path.stat()
+        digest.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.digest()
+
+
+def collect_world(maps_dir: Path) -> list[WorldMapData]:
+    """Lee ``map_data`` con los loaders existentes y arma los datos del snapshot.
+
+    Returns:
+        Datos de cada mapa con metadata o recursos.
+    """
+    maps: dict[int, WorldMapData] = {}
+    metadata_loader = MapMetadataLoader(
+        map_ranges=(MAP_RANGE_1, MAP_RANGE_2, MAP_RANGE_3, MAP_RANGE_4, MAP_RANGE_5),
+        max_map_id=MAX_MAP_ID,
+        max_coordinate=MAX_COORDINATE,
+    )
+    for start_id, end_id, filename in METADATA_RANGES:
+        metadata_path = maps_dir / filename
+        if not metadata_path.exists():
+            continue
+        for map_id in range(start_id, end_id + 1):
+            result = metadata_loader.load_map_data(map_id, metadata_path)
+            maps[map_id] = WorldMapData(
+                map_id,
+                result.width,
+                result.height,
+                layers={"collision": result.blocked_tiles},
+                exits={
+                    (x, y): (target["to_map"], target["to_x"], target["to_y"])
+                    for (_, x, y), target in result.exit_tiles.items()
+                },
+            )
+
+    blocked_files, objects_files = gather_map_files(maps_dir, logger)
+    if blocked_files is not None and objects_files is not None:
+        resources = load_map_resources(blocked_files, objects_files)
+        *layers_by_map, signs_by_map, doors_by_map = resources
+        map_ids = set(signs_by_map) | set(doors_by_map)
+        for layer_by_map in layers_by_map:
+            map_ids.update(layer_by_map)
+        for map_id in map_ids:
+            world_map = maps.setdefault(map_id, WorldMapData(map_id, 100, 100))
+            for name, layer_by_map in zip(RESOURCE_LAYERS, layers_by_map, strict=True):
+                world_map.layers[name] = layer_by_map.get(map_id, set())
+            world_map.signs = signs_by_map.get(map_id, {})
+            world_map.doors = doors_by_map.get(map_id, {})
+
+    return [maps[map_id] for map_id in sorted(maps)]
+
+
+def write_world_snapshot(path: Path, maps: list[WorldMapData], fingerprint: bytes) -> int:
+    """Escribe el snapshot (reemplazo atómico del archivo).
+
+    Args:
+        path: Ruta de salida.
+        maps: Datos de los mapas.
+        fingerprint: Huella de los archivos fuente (ver ``source_fingerprint``).
+
+    Returns:
+        Tamaño del archivo escrito en bytes.
+    """
+    offset = _HEADER.size + len(maps) * _DIRECTORY_ENTRY.size
+    directory = bytearray()
+    body = bytearray()
+    dropped = 0
+    for world_map in maps:
+        width, height = world_map.width, world_map.height
+        planes_offset = offset + len(body)
+        for name in LAYERS:
+            plane = bytearray(_plane_bytes(width, height))
+            for x, y in world_map.layers.get(name, ()):
+                if not (0 < x <= width and 0 < y <= height):
+                    dropped += 1
+                    continue
+                bit_index = (y - 1) * width + (x - 1)
+                plane[bit_index >> 3] |= 1 << (bit_index & 7)
+            body += plane
+
+        exits_offset = offset + len(body)
+        for (x, y), (to_map, to_x, to_y) in sorted(world_map.exits.items()):
+            body += _EXIT.pack(x, y, to_map, to_x, to_y)
+        signs_offset = offset + len(body)
+        for (x, y), grh in sorted(world_map.signs.items()):
+            body += _GRH_ENTRY.pack(x, y, grh)
+        doors_offset = offset + len(body)
+        for (x, y), grh in sorted(world_map.doors.items()):
+            body += _GRH_ENTRY.pack(x, y, grh)
+
+        directory += _DIRECTORY_ENTRY.pack(
+            world_map.map_id,
+            width,
+            height,
+            0,
+            planes_offset,
+            exits_offset,
+            len(world_map.exits),
+            signs_offset,
+            len(world_map.signs),
+            doors_offset,
+            len(world_map.doors),
+        )
+
+    if dropped:
+        logger.warning("Snapshot: %d tiles fuera de los límites del mapa descartados", dropped)
+
+    payload = bytes(directory + body)
+    header = _HEADER.pack(
+        WORLD_SNAPSHOT_MAGIC, WORLD_SNAPSHOT_VERSION, len(maps), zlib.crc32(payload), fingerprint
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(header + payload)
+    tmp_path.replace(path)
+    return len(header) + len(payload)
+
+
+def load_world_snapshot(
+    maps_dir: Path = Path("map_data"), path: Path = WORLD_SNAPSHOT_PATH
+) -> WorldSnapshot | None:
+    """Abre el snapshot si existe y está al día con ``maps_dir``.
+
+    El resultado se reutiliza: ``MapManager`` y ``MapResourcesService``
+    comparten el mismo ``mmap``.
+
+    Args:
+        maps_dir: Directorio de los archivos fuente.
+        path: Ruta del snapshot.
+
+    Returns:
+        WorldSnapshot abierto, o None si falta, está desactualizado o es inválido.
+    """
+    snapshot = _open_snapshots.get(path)
+    if snapshot is None:
+        if not path.exists():
+            return None
+        try:
+            snapshot = WorldSnapshot(path)
+        except OSError, ValueError, struct.error:
+            logger.warning("Snapshot del mundo inválido, se ignora: %s", path, exc_info=True)
+            return None
+        _open_snapshots[path] = snapshot
+
+    if maps_dir.exists() and snapshot.fingerprint != source_fingerprint(maps_dir):
+        logger.warning(
+            "Snapshot del mundo desactualizado respecto de %s; "
+            "regenerar con 'uv run python -m tools.compression.world_snapshot build'",
+            maps_dir,
+        )
+        return None
+    return snapshot
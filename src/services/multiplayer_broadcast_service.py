@@ -4,6 +4,21 @@ import logging
 import time
 from typing import TYPE_CHECKING
 
+from src.messaging.packet_fanout import fan_out_packet
+from src.network.msg_audio import build_play_wave_response
+from src.network.msg_character import (
+    build_character_change_response,
+    build_character_create_response,
+    build_character_move_response,
+    build_character_remove_response,
+)
+from src.network.msg_map import (
+    build_block_position_response,
+    build_object_create_response,
+    build_object_delete_response,
+)
+from src.network.msg_visual_effects import build_create_fx_response
+
 # Constante para identificar NPCs
 NPC_CHAR_INDEX_START = 10001
 
@@ -17,7 +32,11 @@ logger = logging.getLogger(__name__)
 
 
 class MultiplayerBroadcastService:
-    """Servicio que encapsula la lógica de broadcast multijugador."""
+    """Servicio que encapsula la lógica de broadcast multijugador.
+
+    Cada broadcast codifica el packet una sola vez y entrega los mismos bytes
+    a todos los observadores (ver ``fan_out_packet``).
+    """
 
     # Rango visible en tiles (15 tiles = 31x31 grid centrado en el jugador)
     VISIBLE_RANGE = 15
@@ -117,7 +136,7 @@ class MultiplayerBroadcastService:
                 continue
 
             # Obtener datos visuales del otro jugador
-            other_account = await self.account_repo.get_account_by_user_id(other_user_id)
+            other_account = await self.account_repo.get_account_appearance(other_user_id)
             if not other_account:
                 continue
 
@@ -176,18 +195,19 @@ class MultiplayerBroadcastService:
             map_id, exclude_user_id=user_id
         )
 
-        for sender in other_senders:
-            await sender.send_character_create(
-                char_index=user_id,
-                body=char_body,
-                head=char_head,
-                heading=char_heading,
-                x=position["x"],
-                y=position["y"],
-                name=username,
-            )
-
-        return len(other_senders)
+        if not other_senders:
+            return 0
+
+        payload = build_character_create_response(
+            char_index=user_id,
+            body=char_body,
+            head=char_head,
+            heading=char_heading,
+            x=position["x"],
+            y=position["y"],
+            name=username,
+        )
+        return await fan_out_packet(payload, other_senders)
 
     async def broadcast_character_move(
         self,
@@ -215,40 +235,31 @@ class MultiplayerBroadcastService:
         Returns:
             Número de jugadores notificados.
         """
-        # Obtener todos los jugadores en el mapa (excluyendo el que se movió para evitar saltos)
-        all_player_ids = self.map_manager.get_players_in_map(map_id, exclude_user_id=char_index)
-
-        notified = 0
-        for player_id in all_player_ids:
-            # Obtener posición del jugador para verificar si está en rango visible
-            player_position = await self.player_repo.get_position(player_id)
-            if not player_position:
-                continue
-
-            # Filtrar por rango visible
-            if not self._is_in_visible_range(
-                new_x, new_y, player_position["x"], player_position["y"], self.VISIBLE_RANGE
-            ):
-                continue
-
-            # Obtener message_sender del jugador
-            sender = self.map_manager.get_message_sender(player_id, map_id)
-            if not sender:
-                continue
-
-            # Enviar el movimiento solo a jugadores en rango visible
-            await sender.send_character_move(char_index, new_x, new_y)
+        # Observadores en rango visible según la grilla espacial en memoria
+        # (excluyendo el que se movió para evitar saltos): sin Redis por observador.
+        nearby_player_ids = self.map_manager.get_players_in_range(
+            map_id, new_x, new_y, self.VISIBLE_RANGE, exclude_user_id=char_index
+        )
 
-            # Solo enviar CHARACTER_CHANGE si el heading cambió
-            # (CHARACTER_MOVE no incluye heading para compatibilidad con cliente Godot)
-            if old_heading is None or new_heading != old_heading:
-                # Obtener body_id y head_id según si es NPC o jugador
-                char_body, char_head = await self._get_character_appearance(char_index, map_id)
+        senders = [
+            sender
+            for player_id in nearby_player_ids
+            if (sender := self.map_manager.get_message_sender(player_id, map_id)) is not None
+        ]
+        if not senders:
+            return 0
+
+        payload = build_character_move_response(char_index, new_x, new_y)
+
+        # Solo agregar CHARACTER_CHANGE si el heading cambió
+        # (CHARACTER_MOVE no incluye heading para compatibilidad con cliente Godot)
+        if old_heading is None or new_heading != old_heading:
+            char_body, char_head = await self._get_character_appearance(char_index, map_id)
+            payload += build_character_change_response(
+                char_index, body=char_body, head=char_head, heading=new_heading
+            )
 
-                await sender.send_character_change(
-                    char_index, body=char_body, head=char_head, heading=new_heading
-                )
-            notified += 1
+        notified = await fan_out_packet(payload, senders)
 
         if notified > 0:
             logger.debug(
@@ -336,18 +347,16 @@ class MultiplayerBroadcastService:
         # Obtener todos los jugadores en el mapa
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
 
-        notified = 0
-        for sender in all_senders:
-            await sender.send_character_create(
-                char_index=char_index,
-                body=body,
-                head=head,
-                heading=heading,
-                x=x,
-                y=y,
-                name=name,
-            )
-            notified += 1
+        payload = build_character_create_response(
+            char_index=char_index,
+            body=body,
+            head=head,
+            heading=heading,
+            x=x,
+            y=y,
+            name=name,
+        )
+        notified = await fan_out_packet(payload, all_senders)
 
         if notified > 0:
             logger.debug(
@@ -374,10 +383,8 @@ class MultiplayerBroadcastService:
         # Obtener todos los jugadores en el mapa
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
 
-        notified = 0
-        for sender in all_senders:
-            await sender.send_character_remove(char_index)
-            notified += 1
+        payload = build_character_remove_response(char_index)
+        notified = await fan_out_packet(payload, all_senders)
 
         if notified > 0:
             logger.debug(
@@ -400,10 +407,8 @@ class MultiplayerBroadcastService:
         """
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
 
-        notified = 0
-        for sender in all_senders:
-            await sender.send_block_position(x, y, blocked)
-            notified += 1
+        payload = build_block_position_response(x, y, blocked)
+        notified = await fan_out_packet(payload, all_senders)
 
         if notified > 0:
             logger.debug(
@@ -431,10 +436,8 @@ class MultiplayerBroadcastService:
         # Obtener todos los jugadores en el mapa
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
 
-        notified = 0
-        for sender in all_senders:
-            await sender.send_object_create(x, y, grh_index)
-            notified += 1
+        payload = build_object_create_response(x, y, grh_index)
+        notified = await fan_out_packet(payload, all_senders)
 
         if notified > 0:
             logger.info(
@@ -470,10 +473,8 @@ class MultiplayerBroadcastService:
         # Obtener todos los jugadores en el mapa
         all_senders = self.map_manager.get_all_message_senders_in_map(map_id)
 
-        notified = 0
-        for sender in all_senders:
-            await sender.send_play_wave(wave_id, x, y)
-            notified += 1
+        payload = build_play_wave_response(wave_id, x, y)
+        notified = await fan_out_packet(payload, all_senders)
 
         if notified > 0:
             logger.debug(
@@ -499,8 +500,7 @@ class MultiplayerBroadcastService:
             return
 
         players = self.map_manager.get_all_message_senders_in_map(map_id)
-        for message_sender in players:
-            await message_sender.send_object_delete(x, y)
+        await fan_out_packet(build_object_delete_response(x, y), players)
 
     async def broadcast_create_fx(self, map_id: int, char_index: int, fx: int, loops: int) -> None:
         """Envía CREATE_FX a todos los jugadores en un mapa.
@@ -515,10 +515,7 @@ class MultiplayerBroadcastService:
             return
 
         players = self.map_manager.get_all_message_senders_in_map(map_id)
-        notified = 0
-        for message_sender in players:
-            await message_sender.send_create_fx(char_index, fx, loops)
-            notified += 1
+        notified = await fan_out_packet(build_create_fx_response(char_index, fx, loops), players)
 
         if notified > 0:
             logger.debug(
@@ -5,6 +5,7 @@ import random
 import time
 from typing import TYPE_CHECKING
 
+from src.game.player_snapshot import MapPlayerSnapshot
 from src.utils.sounds import SoundID
 from src.utils.visual_effects import VisualEffectID
 
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
     from src.models.npc import NPC
     from src.repositories.player_repository import PlayerRepository
     from src.services.combat.combat_service import CombatService
+    from src.services.map.flow_field_service import FlowFieldService
     from src.services.map.pathfinding_service import PathfindingService
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
     from src.services.npc.npc_service import NPCService
@@ -33,6 +35,7 @@ class NPCAIService:
         broadcast_service: MultiplayerBroadcastService,
         pathfinding_service: PathfindingService | None = None,
         player_death_service: PlayerDeathService | None = None,
+        flow_field_service: FlowFieldService | None = None,
     ) -> None:
         """Inicializa el servicio de IA.
 
@@ -44,6 +47,8 @@ class NPCAIService:
             broadcast_service: Servicio de broadcast.
             pathfinding_service: Servicio de pathfinding (opcional).
             player_death_service: Servicio de muerte de jugadores (opcional).
+            flow_field_service: Campos de flujo para persecución compartida
+                (opcional; si está, se usa antes que el A*).
         """
         self.npc_service = npc_service
         self.map_manager = map_manager
@@ -52,47 +57,47 @@ class NPCAIService:
         self.broadcast_service = broadcast_service
         self.pathfinding_service = pathfinding_service
         self.player_death_service = player_death_service
+        self.flow_field_service = flow_field_service
 
-    async def find_nearest_player(self, npc: NPC) -> tuple[int, int, int] | None:
-        """Encuentra el jugador más cercano al NPC.
+    async def build_player_snapshot(self, map_id: int) -> MapPlayerSnapshot:
+        """Arma el snapshot de jugadores vivos de un mapa para una pasada de IA.
+
+        Las posiciones salen del índice espacial en memoria de ``MapManager`` y
+        el HP del estado en memoria de los jugadores online: no consulta Redis
+        por jugador ni por NPC.
 
         Args:
-            npc: NPC que busca jugadores.
+            map_id: ID del mapa.
 
         Returns:
-            Tupla (user_id, x, y) del jugador más cercano, o None si no hay ninguno.
+            MapPlayerSnapshot con los jugadores vivos del mapa.
         """
-        # Usar el rango de agresión configurado en el NPC
-        max_range = npc.aggro_range
-        # Obtener todos los jugadores en el mapa
-        user_ids = self.map_manager.get_players_in_map(npc.map_id)
-
-        if not user_ids:
-            return None
-
-        nearest_player = None
-        min_distance = float("inf")
-
-        for user_id in user_ids:
-            # Verificar que el jugador esté vivo
+        snapshot = MapPlayerSnapshot(map_id)
+        for user_id in self.map_manager.get_players_in_map(map_id):
+            position = self.map_manager.get_player_position(user_id)
+            if position is None or position[0] != map_id:
+                continue
             if not await self.player_repo.is_alive(user_id):
-                continue  # Jugador muerto, ignorar
-
-            # Obtener posición del jugador
-            player_pos = await self.player_repo.get_position(user_id)
-            if not player_pos or player_pos["map"] != npc.map_id:
                 continue
+            snapshot.add(user_id, position[1], position[2])
+        return snapshot
 
-            px, py = player_pos["x"], player_pos["y"]
+    async def find_nearest_player(
+        self, npc: NPC, snapshot: MapPlayerSnapshot | None = None
+    ) -> tuple[int, int, int] | None:
+        """Encuentra el jugador vivo más cercano al NPC dentro de su rango de agresión.
 
-            # Calcular distancia Manhattan
-            distance = abs(npc.x - px) + abs(npc.y - py)
-
-            if distance <= max_range and distance < min_distance:
-                min_distance = distance
-                nearest_player = (user_id, px, py)
+        Args:
+            npc: NPC que busca jugadores.
+            snapshot: Snapshot de jugadores del mapa del NPC compartido por la
+                pasada de IA (si falta se arma uno).
 
-        return nearest_player
+        Returns:
+            Tupla (user_id, x, y) del jugador más cercano, o None si no hay ninguno.
+        """
+        if snapshot is None or snapshot.map_id != npc.map_id:
+            snapshot = await self.build_player_snapshot(npc.map_id)
+        return snapshot.nearest(npc.x, npc.y, npc.aggro_range)
 
     def get_direction_to_target(self, from_x: int, from_y: int, to_x: int, to_y: int) -> int:
         """Calcula la dirección hacia un objetivo.
@@ -275,15 +280,20 @@ class NPCAIService:
         )
         return True
 
-    async def try_move_towards(self, npc: NPC, target_x: int, target_y: int) -> bool:
+    async def try_move_towards(
+        self, npc: NPC, target_x: int, target_y: int, target_user_id: int | None = None
+    ) -> bool:
         """Intenta mover el NPC hacia una posición objetivo.
 
-        Usa pathfinding inteligente (A*) si está disponible, sino movimiento simple.
+        En modo campo de flujo todos los NPCs que persiguen al mismo objetivo
+        comparten un BFS; si el campo no da un paso se usa pathfinding (A*) si
+        está disponible, sino movimiento simple.
 
         Args:
             npc: NPC a mover.
             target_x: Coordenada X objetivo.
             target_y: Coordenada Y objetivo.
+            target_user_id: Jugador perseguido (clave del campo de flujo).
 
         Returns:
             True si se movió exitosamente.
@@ -300,10 +310,18 @@ class NPCAIService:
 
         new_x, new_y, direction = None, None, None
 
+        # Persecución compartida: descenso sobre el campo de flujo del objetivo
+        if self.flow_field_service is not None:
+            result = self.flow_field_service.get_next_step(
+                npc.map_id, npc.x, npc.y, target_x, target_y, target_id=target_user_id
+            )
+            if result:
+                new_x, new_y, direction = result
+
         # Intentar usar pathfinding si está disponible
-        if self.pathfinding_service:
+        if new_x is None and self.pathfinding_service:
             result = self.pathfinding_service.get_next_step(
-                npc.map_id, npc.x, npc.y, target_x, target_y
+                npc.map_id, npc.x, npc.y, target_x, target_y, agent_id=npc.instance_id
             )
             if result:
                 new_x, new_y, direction = result
@@ -391,11 +409,14 @@ class NPCAIService:
 
         return True
 
-    async def process_hostile_npc(self, npc: NPC) -> None:
+    async def process_hostile_npc(
+        self, npc: NPC, snapshot: MapPlayerSnapshot | None = None
+    ) -> None:
         """Procesa el comportamiento de un NPC hostil.
 
         Args:
             npc: NPC a procesar.
+            snapshot: Snapshot de jugadores del mapa del NPC (opcional).
         """
         if not npc.is_hostile:
             return
@@ -421,7 +442,7 @@ class NPCAIService:
             return
 
         # Buscar jugador más cercano (usa aggro_range del NPC)
-        nearest = await self.find_nearest_player(npc)
+        nearest = await self.find_nearest_player(npc, snapshot)
 
         if not nearest:
             # No hay jugadores cerca, comportamiento idle
@@ -439,4 +460,4 @@ class NPCAIService:
         # Si está cerca pero no adyacente, perseguir
         elif distance <= 8 and random.random() < 0.5:  # noqa: PLR2004
             # 50% de probabilidad de moverse (para no ser demasiado agresivo)
-            await self.try_move_towards(npc, target_x, target_y)
+            await self.try_move_towards(npc, target_x, target_y, target_user_id)
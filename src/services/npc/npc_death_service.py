@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
     from src.services.npc.loot_table_service import LootTableService
     from src.services.npc.npc_respawn_service import NPCRespawnService
+    from src.services.npc.npc_service import NPCService
     from src.services.npc.random_spawn_service import RandomSpawnService
     from src.services.party_service import PartyService
 
@@ -41,6 +42,7 @@ class NPCDeathService:
         npc_respawn_service: NPCRespawnService | None = None,
         party_service: PartyService | None = None,
         random_spawn_service: RandomSpawnService | None = None,
+        npc_service: NPCService | None = None,
     ) -> None:
         """Inicializa el servicio de muerte de NPCs.
 
@@ -54,6 +56,7 @@ class NPCDeathService:
             npc_respawn_service: Servicio de respawn (opcional).
             party_service: Servicio de parties (opcional).
             random_spawn_service: Servicio de spawns aleatorios (opcional).
+            npc_service: Servicio de NPCs, para sus hooks de eliminación (opcional).
         """
         self.map_manager = map_manager
         self.npc_repo = npc_repo
@@ -64,6 +67,7 @@ class NPCDeathService:
         self.npc_respawn_service = npc_respawn_service
         self.party_service = party_service
         self.random_spawn_service = random_spawn_service
+        self.npc_service = npc_service
 
     async def handle_npc_death(
         self,
@@ -410,6 +414,8 @@ class NPCDeathService:
 
         # Remover del MapManager
         self.map_manager.remove_npc(npc.map_id, npc.instance_id)
+        if self.npc_service is not None:
+            self.npc_service.notify_npc_removed(npc.instance_id)
 
         # Broadcast CHARACTER_REMOVE a todos los jugadores
         await self.broadcast_service.broadcast_character_remove(
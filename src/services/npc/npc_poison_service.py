@@ -0,0 +1,138 @@
+"""Servicio de daño periódico por envenenamiento de NPCs."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.timer_scheduler import TimerHandle, TimerScheduler
+    from src.models.npc import NPC
+    from src.services.npc.npc_service import NPCService
+
+logger = logging.getLogger(__name__)
+
+# Constantes de envenenamiento para NPCs
+NPC_POISON_DAMAGE_PER_TICK = 5  # Daño por tick
+NPC_POISON_TICK_INTERVAL = 2.0  # Segundos entre ticks de daño
+
+
+class NPCPoisonService:
+    """Aplica el daño de veneno a cada NPC envenenado con un timer propio.
+
+    En lugar de recorrer todos los NPCs del mundo buscando envenenados, cada NPC
+    envenenado tiene un timer en el ``TimerScheduler`` que se reagenda cada
+    ``NPC_POISON_TICK_INTERVAL`` segundos mientras siga envenenado y vivo.
+    """
+
+    def __init__(self, npc_service: NPCService, timer_scheduler: TimerScheduler) -> None:
+        """Inicializa el servicio.
+
+        Args:
+            npc_service: Servicio de NPCs.
+            timer_scheduler: Scheduler de timers del mundo.
+        """
+        self.npc_service = npc_service
+        self.timer_scheduler = timer_scheduler
+        self._timers: dict[str, TimerHandle] = {}  # instance_id -> próximo tick
+
+    def track(self, npc: NPC) -> None:
+        """Agenda el daño de veneno de un NPC recién envenenado.
+
+        Re-envenenar un NPC ya seguido no agenda otro timer: el tick en curso lee
+        ``poisoned_until`` actualizado.
+
+        Args:
+            npc: NPC envenenado.
+        """
+        if npc.instance_id in self._timers:
+            return
+        self._timers[npc.instance_id] = self.timer_scheduler.call_later(
+            NPC_POISON_TICK_INTERVAL, self._poison_tick, npc
+        )
+
+    def untrack(self, instance_id: str) -> None:
+        """Cancela el daño de veneno agendado de un NPC que salió del mundo.
+
+        Args:
+            instance_id: ID de la instancia del NPC.
+        """
+        handle = self._timers.pop(instance_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def get_tracked_count(self) -> int:
+        """Retorna la cantidad de NPCs envenenados con timer activo.
+
+        Returns:
+            NPCs con daño de veneno agendado.
+        """
+        return len(self._timers)
+
+    async def _poison_tick(self, npc: NPC) -> None:
+        self._timers.pop(npc.instance_id, None)
+        # El NPC murió o se despawneó por otra vía: no tocar una instancia muerta
+        if self.npc_service.map_manager.get_npc_by_instance_id(npc.instance_id) is not npc:
+            return
+        if await self._process_poisoned_npc(npc, self.timer_scheduler.clock()):
+            self._timers[npc.instance_id] = self.timer_scheduler.call_later(
+                NPC_POISON_TICK_INTERVAL, self._poison_tick, npc
+            )
+
+    async def _process_poisoned_npc(self, npc: NPC, current_time: float) -> bool:
+        """Procesa el daño de envenenamiento para un NPC.
+
+        Args:
+            npc: NPC envenenado.
+            current_time: Timestamp actual.
+
+        Returns:
+            True si el NPC sigue envenenado y vivo (hay que agendar otro tick).
+        """
+        # Curado (o nunca envenenado)
+        if npc.poisoned_until <= 0.0:
+            return False
+
+        # Verificar si el envenenamiento expiró o el NPC ya murió
+        if current_time >= npc.poisoned_until or npc.hp <= 0:
+            await self._clear_poison(npc)
+            logger.debug("Envenenamiento expirado para NPC %s", npc.name)
+            return False
+
+        # Aplicar daño de envenenamiento
+        new_hp = max(0, npc.hp - NPC_POISON_DAMAGE_PER_TICK)
+
+        # Actualizar HP en Redis
+        await self.npc_service.npc_repository.update_npc_hp(npc.instance_id, new_hp)
+        npc.hp = new_hp
+
+        if new_hp > 0:
+            logger.debug(
+                "NPC %s recibió daño de envenenamiento: %d -> %d HP (expira en %.1fs)",
+                npc.name,
+                npc.hp + NPC_POISON_DAMAGE_PER_TICK,
+                new_hp,
+                npc.poisoned_until - current_time,
+            )
+            return True
+
+        logger.info(
+            "NPC %s murió por envenenamiento (HP: %d/%d, envenenado por user_id %d)",
+            npc.name,
+            new_hp,
+            npc.max_hp,
+            npc.poisoned_by_user_id,
+        )
+        await self._clear_poison(npc)
+
+        # Remover el NPC del juego usando el servicio de NPCs
+        # Esto hará el broadcast CHARACTER_REMOVE a todos los jugadores
+        await self.npc_service.remove_npc(npc)
+        return False
+
+    async def _clear_poison(self, npc: NPC) -> None:
+        await self.npc_service.npc_repository.update_npc_poisoned_until(
+            npc.instance_id, 0.0, poisoned_by_user_id=0
+        )
+        npc.poisoned_until = 0.0
+        npc.poisoned_by_user_id = 0
@@ -1,28 +1,37 @@
 """Servicio para manejar el respawn de NPCs."""
 
-import asyncio
 import logging
 import random
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from src.game.timer_scheduler import TimerHandle, TimerScheduler
     from src.models.npc import NPC
     from src.services.npc.npc_service import NPCService
 
 logger = logging.getLogger(__name__)
 
+RESPAWN_RETRY_SECONDS = 1.0  # Espera entre intentos si no hay posición libre
+
 
 class NPCRespawnService:
-    """Servicio que maneja el respawn de NPCs después de morir."""
+    """Servicio que maneja el respawn de NPCs después de morir.
+
+    Cada respawn es un timer del ``TimerScheduler`` y no una tarea de asyncio
+    dormida: si no hay posición libre el intento se vuelve a agendar
+    ``RESPAWN_RETRY_SECONDS`` después.
+    """
 
-    def __init__(self, npc_service: NPCService) -> None:
+    def __init__(self, npc_service: NPCService, timer_scheduler: TimerScheduler) -> None:
         """Inicializa el servicio de respawn.
 
         Args:
             npc_service: Servicio de NPCs para spawnear nuevas instancias.
+            timer_scheduler: Scheduler de timers del mundo (avanzado por el game tick).
         """
         self.npc_service = npc_service
-        self._respawn_tasks: dict[str, asyncio.Task[None]] = {}  # instance_id -> Task
+        self.timer_scheduler = timer_scheduler
+        self._respawn_timers: dict[str, TimerHandle] = {}  # instance_id -> timer
 
     def _find_random_free_position(
         self, map_id: int, center_x: int, center_y: int, radius: int = 5
@@ -78,12 +87,11 @@ class NPCRespawnService:
         respawn_delay = random.randint(npc.respawn_time, npc.respawn_time_max)
 
         # Cancelar respawn anterior si existe
-        if npc.instance_id in self._respawn_tasks:
-            self._respawn_tasks[npc.instance_id].cancel()
+        self.cancel_respawn(npc.instance_id)
 
-        # Crear tarea de respawn
-        task = asyncio.create_task(self._respawn_after_delay(npc, respawn_delay))
-        self._respawn_tasks[npc.instance_id] = task
+        self._respawn_timers[npc.instance_id] = self.timer_scheduler.call_later(
+            respawn_delay, self._attempt_respawn, npc, 1
+        )
 
         logger.info(
             "Respawn programado para NPC %s en %d segundos (rango: %d-%d) (pos: %d,%d mapa: %d)",
@@ -96,84 +104,68 @@ class NPCRespawnService:
             npc.map_id,
         )
 
-    async def _respawn_after_delay(self, npc: NPC, delay_seconds: int) -> None:
-        """Espera el tiempo de respawn y luego spawnea el NPC.
+    async def _attempt_respawn(self, npc: NPC, attempt: int) -> None:
+        """Intenta spawnear el NPC; si no puede, reagenda el intento.
 
         Args:
             npc: NPC a respawnear.
-            delay_seconds: Tiempo en segundos a esperar antes de respawnear.
+            attempt: Número de intento (empieza en 1).
         """
-        try:
-            # Esperar el tiempo de respawn
-            await asyncio.sleep(delay_seconds)
-
-            # Intentar respawnear hasta encontrar una posición libre
-            attempt = 0
-            while True:
-                attempt += 1
-
-                # Buscar posición libre aleatoria cercana a la posición original
-                spawn_pos = self._find_random_free_position(npc.map_id, npc.x, npc.y, radius=5)
-
-                if spawn_pos:
-                    spawn_x, spawn_y = spawn_pos
-
-                    # Intentar spawnear el NPC
-                    try:
-                        new_npc = await self.npc_service.spawn_npc(
-                            npc_id=npc.npc_id,
-                            map_id=npc.map_id,
-                            x=spawn_x,
-                            y=spawn_y,
-                            heading=npc.heading,
-                        )
-
-                        if new_npc:
-                            logger.info(
-                                "NPC %s respawneado en (%d,%d) mapa %d (CharIndex: %d) "
-                                "[original: (%d,%d), intento: %d]",
-                                new_npc.name,
-                                new_npc.x,
-                                new_npc.y,
-                                new_npc.map_id,
-                                new_npc.char_index,
-                                npc.x,
-                                npc.y,
-                                attempt,
-                            )
-                            break  # Respawn exitoso, salir del loop
-                    except ValueError as e:
-                        # Tile ocupado, intentar de nuevo
-                        logger.info(
-                            "Tile (%d,%d) bloqueado al intentar respawnear %s: %s",
-                            spawn_x,
-                            spawn_y,
-                            npc.name,
-                            e,
-                        )
-
-                # Si no encontró posición o falló el spawn, esperar un poco antes de reintentar
-                if attempt % 10 == 0:
-                    logger.warning(
-                        "NPC %s: %d intentos de respawn sin éxito cerca de (%d,%d) mapa %d",
-                        npc.name,
-                        attempt,
+        self._respawn_timers.pop(npc.instance_id, None)
+
+        # Buscar posición libre aleatoria cercana a la posición original
+        spawn_pos = self._find_random_free_position(npc.map_id, npc.x, npc.y, radius=5)
+
+        if spawn_pos:
+            spawn_x, spawn_y = spawn_pos
+            try:
+                new_npc = await self.npc_service.spawn_npc(
+                    npc_id=npc.npc_id,
+                    map_id=npc.map_id,
+                    x=spawn_x,
+                    y=spawn_y,
+                    heading=npc.heading,
+                )
+            except ValueError as e:
+                # Tile ocupado, intentar de nuevo
+                logger.info(
+                    "Tile (%d,%d) bloqueado al intentar respawnear %s: %s",
+                    spawn_x,
+                    spawn_y,
+                    npc.name,
+                    e,
+                )
+            else:
+                if new_npc:
+                    logger.info(
+                        "NPC %s respawneado en (%d,%d) mapa %d (CharIndex: %d) "
+                        "[original: (%d,%d), intento: %d]",
+                        new_npc.name,
+                        new_npc.x,
+                        new_npc.y,
+                        new_npc.map_id,
+                        new_npc.char_index,
                         npc.x,
                         npc.y,
-                        npc.map_id,
+                        attempt,
                     )
+                    return
+
+        if attempt % 10 == 0:
+            logger.warning(
+                "NPC %s: %d intentos de respawn sin éxito cerca de (%d,%d) mapa %d",
+                npc.name,
+                attempt,
+                npc.x,
+                npc.y,
+                npc.map_id,
+            )
 
-                # Esperar 1 segundo antes de reintentar (no bloqueante)
-                await asyncio.sleep(1)
-
-        except asyncio.CancelledError:
-            logger.debug("Respawn cancelado para NPC %s", npc.name)
-        except Exception:
-            logger.exception("Error al respawnear NPC %s", npc.name)
-        finally:
-            # Limpiar tarea completada
-            if npc.instance_id in self._respawn_tasks:
-                del self._respawn_tasks[npc.instance_id]
+        # Reintentar en el próximo lote (salvo que se haya cancelado o reprogramado)
+        if npc.instance_id not in self._respawn_timers:
+            self._respawn_timers[npc.instance_id] = self.timer_scheduler.call_later(
+                RESPAWN_RETRY_SECONDS, self._attempt_respawn, npc, attempt + 1
+            )
 
     def cancel_respawn(self, instance_id: str) -> None:
         """Cancela el respawn programado de un NPC.
@@ -181,16 +173,36 @@ class NPCRespawnService:
         Args:
             instance_id: ID de instancia del NPC.
         """
-        if instance_id in self._respawn_tasks:
-            self._respawn_tasks[instance_id].cancel()
-            del self._respawn_tasks[instance_id]
+        timer = self._respawn_timers.pop(instance_id, None)
+        if timer is not None:
+            timer.cancel()
             logger.debug("Respawn cancelado para instance_id %s", instance_id)
 
+    async def cancel_map_respawns(self, map_id: int) -> None:
+        """Cancela los respawns pendientes de un mapa descargado.
+
+        Al reactivarse, el mapa vuelve a spawnear todos sus NPCs: un respawn que
+        venciera después duplicaría al NPC.
+
+        Args:
+            map_id: ID del mapa descargado.
+        """
+        # Cada timer es ``_attempt_respawn(npc, attempt)``
+        stale = [
+            instance_id
+            for instance_id, timer in self._respawn_timers.items()
+            if timer.args[0].map_id == map_id
+        ]
+        for instance_id in stale:
+            self.cancel_respawn(instance_id)
+        if stale:
+            logger.debug("%d respawns cancelados al descargar el mapa %d", len(stale), map_id)
+
     def cancel_all_respawns(self) -> None:
         """Cancela todos los respawns programados."""
-        for task in self._respawn_tasks.values():
-            task.cancel()
-        self._respawn_tasks.clear()
+        for timer in self._respawn_timers.values():
+            timer.cancel()
+        self._respawn_timers.clear()
         logger.info("Todos los respawns cancelados")
 
     def get_pending_respawns_count(self) -> int:
@@ -199,4 +211,4 @@ class NPCRespawnService:
         Returns:
             Número de NPCs esperando respawn.
         """
-        return len(self._respawn_tasks)
+        return len(self._respawn_timers)
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.messaging.message_sender import MessageSender
     from src.models.npc import NPC
     from src.models.npc_catalog import NPCCatalog
@@ -69,11 +71,14 @@ class NPCService:
         self.broadcast_service = broadcast_service
         self._next_char_index = 10001  # CharIndex inicial para NPCs
         self._spawn_entries: list[dict[str, Any]] = []
+        self._removal_hooks: list[Callable[[str], object]] = []
 
         NPCService._initialized = True
         NPCService._instance = self
 
-    async def initialize_world_npcs(self, spawns_path: str = "data/world/map_npcs.toml") -> None:
+    async def initialize_world_npcs(
+        self, spawns_path: str = "data/world/map_npcs.toml", *, lazy: bool = False
+    ) -> None:
         """Inicializa todos los NPCs del mundo al iniciar el servidor.
 
         TODO: Apenas se inicia Redis se cargan los recursos desde los archivos TOML y maps,
@@ -86,6 +91,8 @@ class NPCService:
 
         Args:
             spawns_path: Ruta al archivo de configuración de spawns.
+            lazy: Si es True solo se leen los spawns; cada mapa spawnea los suyos
+                con ``spawn_map_npcs`` al activarse (carga de mapas a demanda).
         """
         logger.info("Inicializando NPCs del mundo desde %s...", spawns_path)
 
@@ -100,6 +107,50 @@ class NPCService:
             logger.warning("No se encontraron spawns de NPC en %s", spawns_path)
             return
 
+        if lazy:
+            logger.info(
+                "✅ %d spawns de NPC leídos; se crean al activar cada mapa", len(spawn_entries)
+            )
+            return
+
+        spawned_count = await self._spawn_from_entries(spawn_entries)
+        logger.info("✅ NPCs inicializados: %d spawns creados exitosamente", spawned_count)
+
+    async def spawn_map_npcs(self, map_id: int) -> int:
+        """Crea los NPCs fijos de un mapa (hook de activación de mapas).
+
+        Args:
+            map_id: ID del mapa.
+
+        Returns:
+            Cantidad de NPCs creados.
+        """
+        entries = [entry for entry in self._spawn_entries if entry.get("map_id") == map_id]
+        spawned_count = await self._spawn_from_entries(entries)
+        if spawned_count:
+            logger.info("NPCs del mapa %d spawneados: %d", map_id, spawned_count)
+        return spawned_count
+
+    async def despawn_map_npcs(self, map_id: int) -> int:
+        """Elimina todos los NPCs de un mapa (hook de descarga de mapas).
+
+        Args:
+            map_id: ID del mapa.
+
+        Returns:
+            Cantidad de NPCs eliminados.
+        """
+        npcs = self.map_manager.get_npcs_in_map(map_id)
+        for npc in npcs:
+            await self.remove_npc(npc)
+        return len(npcs)
+
+    async def _spawn_from_entries(self, spawn_entries: list[dict[str, Any]]) -> int:
+        """Spawnea los NPCs de una lista de entradas de map_npcs.toml.
+
+        Returns:
+            Cantidad de NPCs creados.
+        """
         spawned_count = 0
         for spawn_data in spawn_entries:
             map_id = spawn_data.get("map_id")
@@ -138,7 +189,7 @@ class NPCService:
                 )
                 continue
 
-        logger.info("✅ NPCs inicializados: %d spawns creados exitosamente", spawned_count)
+        return spawned_count
 
     async def load_npc_spawns(self, spawns_path: str) -> list[dict[str, Any]] | None:
         """Carga datos de spawns de NPCs desde archivo TOML.
@@ -352,6 +403,27 @@ class NPCService:
 
         logger.debug("Enviados %d NPCs al jugador en mapa %d", len(npcs), map_id)
 
+    def add_removal_hook(self, hook: Callable[[str], object]) -> None:
+        """Registra un callback para cuando un NPC sale del mundo (eliminado o muerto).
+
+        Args:
+            hook: Recibe el ``instance_id`` del NPC; libera el estado por NPC de
+                otros servicios (rutas cacheadas, timers).
+        """
+        self._removal_hooks.append(hook)
+
+    def notify_npc_removed(self, instance_id: str) -> None:
+        """Ejecuta los hooks de salida del mundo de un NPC.
+
+        Args:
+            instance_id: ID de la instancia del NPC.
+        """
+        for hook in self._removal_hooks:
+            try:
+                hook(instance_id)
+            except Exception:
+                logger.exception("Error en hook de eliminación del NPC %s", instance_id)
+
     async def remove_npc(self, npc: NPC) -> None:
         """Elimina un NPC del mundo.
 
@@ -363,6 +435,7 @@ class NPCService:
 
         # Remover del MapManager
         self.map_manager.remove_npc(npc.map_id, npc.instance_id)
+        self.notify_npc_removed(npc.instance_id)
 
         # Remover de Redis
         await self.npc_repository.remove_npc(npc.instance_id)
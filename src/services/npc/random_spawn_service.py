@@ -163,6 +163,20 @@ class RandomSpawnService:
             del self._random_spawned_npcs[instance_id]
             logger.debug("NPC random removido del tracking tras muerte: %s", instance_id)
 
+    async def on_map_unloaded(self, map_id: int) -> None:
+        """Olvida los NPCs random de un mapa descargado (sus NPCs ya fueron eliminados).
+
+        Args:
+            map_id: ID del mapa descargado.
+        """
+        stale = [
+            instance_id
+            for instance_id, spawn_info in self._random_spawned_npcs.items()
+            if spawn_info["map_id"] == map_id
+        ]
+        for instance_id in stale:
+            del self._random_spawned_npcs[instance_id]
+
     async def _try_spawn_random_npc(
         self,
         spawn_config: dict[str, Any],
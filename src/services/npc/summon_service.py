@@ -1,13 +1,17 @@
 """Servicio para gestionar mascotas invocadas por jugadores."""
 
 import logging
+import time
 from typing import TYPE_CHECKING
 
 from src.constants.gameplay import MAX_PETS
 
 if TYPE_CHECKING:
+    from src.game.timer_scheduler import TimerScheduler
+    from src.models.npc import NPC
     from src.repositories.npc_repository import NPCRepository
     from src.repositories.player_repository import PlayerRepository
+    from src.services.npc.npc_service import NPCService
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +23,51 @@ class SummonService:
         self,
         npc_repository: NPCRepository,
         player_repository: PlayerRepository,
+        npc_service: NPCService | None = None,
+        timer_scheduler: TimerScheduler | None = None,
     ) -> None:
         """Inicializa el servicio de invocación.
 
         Args:
             npc_repository: Repositorio de NPCs.
             player_repository: Repositorio de jugadores.
+            npc_service: Servicio de NPCs para retirar mascotas vencidas (opcional).
+            timer_scheduler: Scheduler de timers del mundo (opcional, vencimiento).
         """
         self.npc_repository = npc_repository
         self.player_repository = player_repository
+        self.npc_service = npc_service
+        self.timer_scheduler = timer_scheduler
+
+    def schedule_expiry(self, npc: NPC) -> bool:
+        """Agenda el retiro de una mascota al vencer su ``summoned_until``.
+
+        Args:
+            npc: Mascota invocada.
+
+        Returns:
+            True si se agendó el vencimiento.
+        """
+        if not self.timer_scheduler or not self.npc_service or npc.summoned_until <= 0.0:
+            return False
+        self.timer_scheduler.call_at(npc.summoned_until, self._expire_pet, npc.instance_id)
+        return True
+
+    async def _expire_pet(self, instance_id: str) -> None:
+        """Retira la mascota si sigue en el mundo y su invocación venció."""
+        pet = await self.npc_repository.get_npc(instance_id)
+        if not pet or pet.summoned_until <= 0.0 or time.time() < pet.summoned_until:
+            # Ya murió, se liberó o se extendió la invocación (se agenda aparte)
+            return
+
+        logger.info(
+            "Mascota expirada eliminada: %s (npc_id=%d) de user_id %d",
+            pet.name,
+            pet.npc_id,
+            pet.summoned_by_user_id,
+        )
+        if self.npc_service:
+            await self.npc_service.remove_npc(pet)
 
     async def get_player_pets_count(self, user_id: int) -> int:
         """Obtiene el número de mascotas activas de un jugador.
@@ -121,17 +161,9 @@ class SummonService:
             True si se removió correctamente, False si no era mascota del jugador.
         """
         # Verificar que el NPC es mascota del jugador
-        all_npcs = await self.npc_repository.get_all_npcs()
-        pet_npc = next(
-            (
-                npc
-                for npc in all_npcs
-                if npc.instance_id == npc_instance_id and npc.summoned_by_user_id == user_id
-            ),
-            None,
-        )
+        pet_npc = await self.npc_repository.get_npc(npc_instance_id)
 
-        if not pet_npc:
+        if not pet_npc or pet_npc.summoned_by_user_id != user_id:
             logger.warning(
                 "Intento de remover mascota que no pertenece al jugador: "
                 "user_id=%d, instance_id=%s",
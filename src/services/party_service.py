@@ -583,10 +583,15 @@ class PartyService:
         if not party:
             return "No eres miembro de ninguna party"
 
-        # Get sender username from account
+        # Get sender username from the online players index, then from account
         sender_username = f"Usuario#{sender_id}"
-        if self.account_repo:
-            account_data = await self.account_repo.get_account_by_user_id(sender_id)
+        online_username = (
+            self.map_manager.get_player_username(sender_id) if self.map_manager else None
+        )
+        if online_username:
+            sender_username = online_username
+        elif self.account_repo:
+            account_data = await self.account_repo.get_account_appearance(sender_id)
             if account_data:
                 sender_username = account_data.get("username", sender_username)
         logger.info("Party message from %s (ID:%s): '%s'", sender_username, sender_id, message)
@@ -656,14 +661,9 @@ class PartyService:
             exp_amount, map_id, x, y, get_user_level, get_user_position, is_user_alive
         )
 
-        # Save updated party data
-        await self.party_repo.update_party_metadata(party)
-
-        # Update individual members
-        for user_id in distributed_exp:
-            member = party.get_member(user_id)
-            if member:
-                await self.party_repo.update_member(party.party_id, member)
+        # Save updated party data and members in a single pipeline
+        members = [member for user_id in distributed_exp if (member := party.get_member(user_id))]
+        await self.party_repo.update_members(party, members)
 
         return distributed_exp
 
@@ -679,12 +679,8 @@ class PartyService:
 
         success = party.update_member_level(user_id, new_level)
         if success:
-            await self.party_repo.update_party_metadata(party)
-
-            # Update member data
             member = party.get_member(user_id)
-            if member:
-                await self.party_repo.update_member(party.party_id, member)
+            await self.party_repo.update_members(party, [member] if member else [])
 
         return success
 
@@ -3,6 +3,8 @@
 import logging
 from typing import TYPE_CHECKING
 
+from src.utils.password_utils import PasswordPoolBusyError
+
 if TYPE_CHECKING:
     from src.messaging.message_sender import MessageSender
     from src.repositories.account_repository import AccountRepository
@@ -67,8 +69,16 @@ class AuthenticationService:
             await self.message_sender.send_error_msg("Usuario o contraseña incorrectos")
             return None
 
-        # Verificar la contraseña
-        if not await self.account_repo.verify_password(username, password):
+        # Verificar la contraseña (Argon2 en el pool; rechaza si está saturado)
+        try:
+            password_ok = await self.account_repo.verify_password(username, password)
+        except PasswordPoolBusyError:
+            logger.warning("Login de %s rechazado: pool de contraseñas saturado", username)
+            await self.message_sender.send_error_msg(
+                "Servidor ocupado, intenta nuevamente en unos segundos"
+            )
+            return None
+        if not password_ok:
             logger.warning("Contraseña incorrecta para usuario: %s", username)
             await self.message_sender.send_error_msg("Usuario o contraseña incorrectos")
             return None
@@ -0,0 +1,144 @@
+"""Servicio que restaura la apariencia de un jugador cuando vence el mimetismo."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.game.map_manager import MapManager
+    from src.game.timer_scheduler import TimerHandle, TimerScheduler
+    from src.repositories.account_repository import AccountRepository
+    from src.repositories.player_repository import PlayerRepository
+
+logger = logging.getLogger(__name__)
+
+
+class MorphExpiryService:
+    """Agenda la restauración de apariencia al vencer un mimetismo.
+
+    Cada mimetismo agenda un timer en el ``TimerScheduler`` para su
+    ``morphed_until``; al vencer se vuelve a leer la apariencia morfeada (pudo
+    renovarse o limpiarse) y solo se restaura si realmente expiró.
+    """
+
+    def __init__(
+        self,
+        player_repo: PlayerRepository,
+        map_manager: MapManager,
+        timer_scheduler: TimerScheduler,
+        account_repo: AccountRepository | None = None,
+    ) -> None:
+        """Inicializa el servicio de expiración de mimetismo.
+
+        Args:
+            player_repo: Repositorio de jugadores.
+            map_manager: Gestor de mapas.
+            timer_scheduler: Scheduler de timers del mundo.
+            account_repo: Repositorio de cuentas (opcional, necesario para apariencia original).
+        """
+        self.player_repo = player_repo
+        self.map_manager = map_manager
+        self.timer_scheduler = timer_scheduler
+        self.account_repo = account_repo
+        self._timers: dict[int, TimerHandle] = {}  # user_id -> timer
+
+    def schedule(self, user_id: int, morphed_until: float) -> None:
+        """Agenda la restauración de apariencia de un jugador.
+
+        Un mimetismo nuevo reemplaza el timer del anterior.
+
+        Args:
+            user_id: ID del jugador morfeado.
+            morphed_until: Timestamp de vencimiento del mimetismo.
+        """
+        previous = self._timers.pop(user_id, None)
+        if previous is not None:
+            previous.cancel()
+        self._timers[user_id] = self.timer_scheduler.call_at(
+            morphed_until, self.restore_if_expired, user_id
+        )
+
+    def get_pending_count(self) -> int:
+        """Retorna la cantidad de mimetismos con restauración agendada.
+
+        Returns:
+            Jugadores morfeados con timer pendiente.
+        """
+        return len(self._timers)
+
+    async def restore_if_expired(self, user_id: int) -> bool:
+        """Restaura la apariencia original si el mimetismo expiró.
+
+        Args:
+            user_id: ID del jugador.
+
+        Returns:
+            True si se restauró la apariencia.
+        """
+        timer = self._timers.pop(user_id, None)
+        if timer is not None:
+            # Restauración anticipada (p. ej. al revivir): descartar el timer
+            timer.cancel()
+
+        morphed = await self.player_repo.get_morphed_appearance(user_id)
+        if not morphed:
+            return False
+
+        morphed_until = morphed.get("morphed_until", 0.0)
+        if time.time() < morphed_until:
+            # Se renovó sin pasar por schedule (p. ej. desde otro servicio)
+            self.schedule(user_id, morphed_until)
+            return False
+
+        # Limpiar apariencia morfeada
+        await self.player_repo.clear_morphed_appearance(user_id)
+
+        # Obtener apariencia original desde account
+        original_body = 1
+        original_head = 1
+        if self.account_repo:
+            account_data = await self.account_repo.get_account_appearance(user_id)
+            if account_data:
+                original_body = int(account_data.get("char_race", 1))
+                original_head = int(account_data.get("char_head", 1))
+                if original_body == 0:
+                    original_body = 1
+
+        # Solo se notifica si el jugador sigue conectado
+        message_sender = self.map_manager.get_message_sender(user_id)
+        position = await self.player_repo.get_position(user_id)
+        if not message_sender or not position:
+            return True
+
+        map_id = position["map"]
+        heading = position.get("heading", 3)
+
+        # Enviar CHARACTER_CHANGE al jugador
+        await message_sender.send_character_change(
+            char_index=user_id,
+            body=original_body,
+            head=original_head,
+            heading=heading,
+        )
+
+        # Broadcast a otros jugadores en el mapa
+        other_senders = self.map_manager.get_all_message_senders_in_map(
+            map_id, exclude_user_id=user_id
+        )
+        for sender in other_senders:
+            await sender.send_character_change(
+                char_index=user_id,
+                body=original_body,
+                head=original_head,
+                heading=heading,
+            )
+
+        logger.info(
+            "Apariencia morfeada restaurada para user_id %d (body=%d head=%d)",
+            user_id,
+            original_body,
+            original_head,
+        )
+        return True
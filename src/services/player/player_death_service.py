@@ -13,6 +13,7 @@ if TYPE_CHECKING:
     from src.repositories.inventory_repository import InventoryRepository
     from src.repositories.player_repository import PlayerRepository
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
+    from src.services.player.morph_expiry_service import MorphExpiryService
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,7 @@ class PlayerDeathService:
         inventory_repo: InventoryRepository | None = None,
         item_catalog: ItemCatalog | None = None,
         account_repo: AccountRepository | None = None,
+        morph_expiry_service: MorphExpiryService | None = None,
     ) -> None:
         """Inicializa el servicio de muerte de jugadores.
 
@@ -55,6 +57,7 @@ class PlayerDeathService:
             inventory_repo: Repositorio de inventario (opcional).
             item_catalog: Catálogo de items (opcional).
             account_repo: Repositorio de cuentas (opcional).
+            morph_expiry_service: Restaura la apariencia al revivir (opcional).
         """
         self.map_manager = map_manager
         self.player_repo = player_repo
@@ -62,6 +65,7 @@ class PlayerDeathService:
         self.inventory_repo = inventory_repo
         self.item_catalog = item_catalog
         self.account_repo = account_repo
+        self.morph_expiry_service = morph_expiry_service
 
     async def handle_player_death(
         self,
@@ -162,8 +166,9 @@ class PlayerDeathService:
             morphed_until=0.0,
         )
 
-        # El broadcast del cambio de apariencia se hará automáticamente
-        # cuando el cliente se reconecte o el sistema de broadcast actualice
+        # Restaurar la apariencia original y avisar al mapa
+        if self.morph_expiry_service:
+            await self.morph_expiry_service.restore_if_expired(user_id)
 
         # Teletransportar a spawn si es necesario
         if revive_at_spawn:
@@ -407,7 +412,7 @@ class PlayerDeathService:
             Nombre del jugador o valor por defecto.
         """
         if self.account_repo:
-            account_data = await self.account_repo.get_account_by_user_id(user_id)
+            account_data = await self.account_repo.get_account_appearance(user_id)
             if account_data:
                 return account_data.get("username", f"Player{user_id}")
         return f"Player{user_id}"
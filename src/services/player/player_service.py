@@ -220,7 +220,9 @@ class PlayerService:
             user_id: ID del usuario.
             equipment_repo: Repositorio de equipamiento (opcional).
         """
-        inventory_repo = InventoryRepository(self.player_repo.redis)
+        inventory_repo = InventoryRepository(
+            self.player_repo.redis, cache=self.player_repo.inventory_cache
+        )
 
         # Asegurar que el jugador tenga una barca para navegar
         slots_dict = await inventory_repo.get_inventory_slots(user_id)
@@ -17,8 +17,10 @@ if TYPE_CHECKING:
     from src.repositories.player_repository import PlayerRepository
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
     from src.services.npc.npc_death_service import NPCDeathService
+    from src.services.npc.npc_poison_service import NPCPoisonService
     from src.services.npc.npc_service import NPCService
     from src.services.npc.summon_service import SummonService
+    from src.services.player.morph_expiry_service import MorphExpiryService
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,8 @@ class SpellContext:
     npc_death_service: NPCDeathService | None = None
     summon_service: SummonService | None = None
     spell_catalog: SpellCatalog | None = None
+    npc_poison_service: NPCPoisonService | None = None
+    morph_expiry_service: MorphExpiryService | None = None
 
     @property
     def target_name(self) -> str:
@@ -108,7 +108,7 @@ class RemoveInvisibilityEffect(SpellEffect):
             target_position = await ctx.player_repo.get_position(ctx.target_player_id)
             if target_position:
                 map_id = target_position["map"]
-                account_data = await ctx.account_repo.get_account_by_user_id(ctx.target_player_id)
+                account_data = await ctx.account_repo.get_account_appearance(ctx.target_player_id)
                 if account_data:
                     char_body = int(account_data.get("char_race", 1))
                     char_head = int(account_data.get("char_head", 1))
@@ -164,7 +164,7 @@ class MorphEffect(SpellEffect):
             return SpellEffectResult(success=False)
 
         # Obtener apariencia del target
-        target_account_data = await ctx.account_repo.get_account_by_user_id(ctx.target_player_id)
+        target_account_data = await ctx.account_repo.get_account_appearance(ctx.target_player_id)
         if not target_account_data:
             if ctx.message_sender:
                 await ctx.message_sender.send_console_msg(
@@ -182,6 +182,8 @@ class MorphEffect(SpellEffect):
         await ctx.player_repo.set_morphed_appearance(
             ctx.user_id, target_body, target_head, morphed_until
         )
+        if ctx.morph_expiry_service:
+            ctx.morph_expiry_service.schedule(ctx.user_id, morphed_until)
 
         # Obtener posición del caster
         caster_position = await ctx.player_repo.get_position(ctx.user_id)
@@ -355,8 +355,9 @@ class SummonEffect(SpellEffect):
             )
 
             if npc:
-                # Registrar como mascota del jugador
+                # Registrar como mascota del jugador y agendar su vencimiento
                 await ctx.summon_service.register_pet(owner_user_id, npc.instance_id)
+                ctx.summon_service.schedule_expiry(npc)
 
                 # Broadcast CHARACTER_CREATE
                 if ctx.broadcast_service:
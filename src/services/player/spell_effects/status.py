@@ -38,6 +38,8 @@ class PoisonEffect(SpellEffect):
         await ctx.npc_repo.update_npc_poisoned_until(
             npc.instance_id, poisoned_until, poisoned_by_user_id=ctx.user_id
         )
+        if ctx.npc_poison_service:
+            ctx.npc_poison_service.track(npc)
 
         logger.info(
             "NPC %s envenenado por user_id %d con hechizo %s (duración: %.1fs)",
@@ -85,6 +87,8 @@ class CurePoisonEffect(SpellEffect):
         if not ctx.target_npc or ctx.npc_died or not ctx.npc_repo:
             return SpellEffectResult(success=False)
 
+        # El timer de veneno del NPC se detiene al ver poisoned_until en 0
+        ctx.target_npc.poisoned_until = 0.0
         await ctx.npc_repo.update_npc_poisoned_until(ctx.target_npc.instance_id, 0.0)
         logger.info("Veneno removido de NPC %s por hechizo %s", ctx.target_npc.name, ctx.spell_name)
         return SpellEffectResult(success=True)
@@ -19,8 +19,10 @@ if TYPE_CHECKING:
     from src.repositories.player_repository import PlayerRepository
     from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
     from src.services.npc.npc_death_service import NPCDeathService
+    from src.services.npc.npc_poison_service import NPCPoisonService
     from src.services.npc.npc_service import NPCService
     from src.services.npc.summon_service import SummonService
+    from src.services.player.morph_expiry_service import MorphExpiryService
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,8 @@ class SpellService:
         broadcast_service: MultiplayerBroadcastService | None = None,
         npc_service: NPCService | None = None,
         summon_service: SummonService | None = None,
+        npc_poison_service: NPCPoisonService | None = None,
+        morph_expiry_service: MorphExpiryService | None = None,
     ) -> None:
         """Inicializa el servicio de hechizos.
 
@@ -52,6 +56,8 @@ class SpellService:
             broadcast_service: Servicio de broadcast (opcional).
             npc_service: Servicio de NPCs (opcional).
             summon_service: Servicio de invocación (opcional).
+            npc_poison_service: Servicio de veneno de NPCs (opcional).
+            morph_expiry_service: Servicio de vencimiento de mimetismo (opcional).
         """
         self.spell_catalog = spell_catalog
         self.player_repo = player_repo
@@ -62,6 +68,8 @@ class SpellService:
         self.broadcast_service = broadcast_service
         self.npc_service = npc_service
         self.summon_service = summon_service
+        self.npc_poison_service = npc_poison_service
+        self.morph_expiry_service = morph_expiry_service
         self._effect_registry = get_spell_effect_registry()
 
     async def _get_target_player_stats(
@@ -153,6 +161,8 @@ class SpellService:
             npc_death_service=self.npc_death_service,
             summon_service=self.summon_service,
             spell_catalog=self.spell_catalog,
+            npc_poison_service=self.npc_poison_service,
+            morph_expiry_service=self.morph_expiry_service,
         )
 
     async def cast_spell(
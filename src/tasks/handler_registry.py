@@ -315,7 +315,15 @@ HANDLER_CONFIGS: dict[str, HandlerConfig] = {
     ),
     "talk": HandlerConfig(
         TalkCommandHandler,
-        deps_keys=["player_repo", "account_repo", "map_manager", "game_tick", "session_data"],
+        deps_keys=[
+            "player_repo",
+            "account_repo",
+            "map_manager",
+            "game_tick",
+            "session_data",
+            "player_map_service",
+            "task_factory",
+        ],
     ),
     "yell": HandlerConfig(
         YellCommandHandler,
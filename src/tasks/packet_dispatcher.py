@@ -0,0 +1,139 @@
+"""Dispatch por conexión con fast path para los packets más frecuentes.
+
+``TaskFactory.create_task`` resuelve cada packet por introspección: detección de
+TLS, pre-validación con ``PacketReader``/``PacketValidator``, lookup del handler
+(intercambiando su ``message_sender``) y una instancia de ``Task`` nueva. Para
+WALK, ATTACK, CHANGE_HEADING y PING, que son la mayor parte del tráfico entrante,
+``PacketDispatcher`` usa una tabla precompilada ``packet_id -> corrutina`` con los
+handlers ya ligados a la conexión y los campos leídos directamente del packet.
+
+Cualquier otro packet, o un packet rápido que no pasa el chequeo inline (longitud
+o dirección inválida, sesión sin loguear), sigue el camino normal de
+``TaskFactory`` para que los mensajes de validación y los logs no cambien.
+"""
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from src.commands.change_heading_command import ChangeHeadingCommand
+from src.commands.ping_command import PingCommand
+from src.commands.walk_command import WalkCommand
+from src.network.packet_id import ClientPacketID
+from src.network.session_manager import SessionManager
+from src.tasks.handler_registry import HandlerRegistry
+from src.tasks.player.task_attack import build_attack_command
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from src.commands.base import CommandResult
+    from src.messaging.message_sender import MessageSender
+    from src.tasks.task_factory import TaskFactory
+
+logger = logging.getLogger(__name__)
+
+# Longitudes fijas de los packets rápidos (PacketID + payload)
+_HEADING_PACKET_SIZE = 2
+_EMPTY_PACKET_SIZE = 1
+_MIN_HEADING = 1
+_MAX_HEADING = 4
+
+
+class PacketDispatcher:
+    """Despacha los packets de una conexión, con fast path para los más frecuentes.
+
+    Se crea una vez por conexión con ``TaskFactory.create_dispatcher``: los
+    handlers del fast path salen de un ``HandlerRegistry`` propio, construidos
+    una sola vez con el ``message_sender`` y el ``session_data`` de la conexión.
+    """
+
+    def __init__(
+        self,
+        factory: TaskFactory,
+        message_sender: MessageSender,
+        session_data: dict[str, dict[str, int] | int | str],
+    ) -> None:
+        """Inicializa el dispatcher de la conexión.
+
+        Args:
+            factory: Factory de tasks (camino normal y métricas de latencia).
+            message_sender: Enviador de mensajes del cliente.
+            session_data: Datos de sesión de la conexión (mutable).
+        """
+        self.factory = factory
+        self.message_sender = message_sender
+        self.session_data = session_data
+        self.handlers = HandlerRegistry(factory.deps)
+
+        # Cada entrada devuelve False si el packet debe ir por el camino normal
+        self._fast_paths: dict[int, Callable[[bytes], Awaitable[bool]]] = {
+            ClientPacketID.WALK: self._walk,
+            ClientPacketID.ATTACK: self._attack,
+            ClientPacketID.CHANGE_HEADING: self._change_heading,
+            ClientPacketID.PING: self._ping,
+        }
+
+    async def dispatch(self, data: bytes) -> None:
+        """Procesa un packet completo y registra su latencia de dispatch.
+
+        Args:
+            data: Packet recibido (PacketID + payload).
+        """
+        started = time.perf_counter()
+        packet_id = data[0] if data else 0
+        fast_path = self._fast_paths.get(packet_id)
+        if fast_path is None or not await fast_path(data):
+            await self.factory.create_task(data, self.message_sender, self.session_data).execute()
+            self.factory.record_dispatch(packet_id, started, fast_path=False)
+        else:
+            self.factory.record_dispatch(packet_id, started, fast_path=True)
+
+    @staticmethod
+    def _read_heading(data: bytes) -> int | None:
+        if len(data) != _HEADING_PACKET_SIZE:
+            return None
+        heading = data[1]
+        return heading if _MIN_HEADING <= heading <= _MAX_HEADING else None
+
+    async def _walk(self, data: bytes) -> bool:
+        heading = self._read_heading(data)
+        user_id = SessionManager.get_user_id(self.session_data)
+        if heading is None or user_id is None:
+            return False
+        handler = self.handlers.get("walk", self.message_sender, self.session_data)
+        result = await handler.handle(WalkCommand(user_id=user_id, heading=heading))
+        self._log_failure("Movimiento", result)
+        return True
+
+    async def _change_heading(self, data: bytes) -> bool:
+        heading = self._read_heading(data)
+        user_id = SessionManager.get_user_id(self.session_data)
+        if heading is None or user_id is None:
+            return False
+        handler = self.handlers.get("change_heading", self.message_sender, self.session_data)
+        result = await handler.handle(ChangeHeadingCommand(user_id=user_id, heading=heading))
+        self._log_failure("Cambio de dirección", result)
+        return True
+
+    async def _attack(self, data: bytes) -> bool:
+        user_id = SessionManager.get_user_id(self.session_data)
+        if len(data) != _EMPTY_PACKET_SIZE or user_id is None:
+            return False
+        handler = self.handlers.get("attack", self.message_sender, self.session_data)
+        command = await build_attack_command(handler.player_repo, user_id)
+        if command is not None:
+            self._log_failure("Ataque", await handler.handle(command))
+        return True
+
+    async def _ping(self, data: bytes) -> bool:
+        if len(data) != _EMPTY_PACKET_SIZE:
+            return False
+        handler = self.handlers.get("ping", self.message_sender, self.session_data)
+        self._log_failure("Ping", await handler.handle(PingCommand()))
+        return True
+
+    @staticmethod
+    def _log_failure(action: str, result: CommandResult) -> None:
+        if not result.success:
+            logger.debug("%s falló: %s", action, result.error_message or "Error desconocido")
@@ -11,6 +11,7 @@ from src.tasks.task import Task
 if TYPE_CHECKING:
     from src.command_handlers.attack_handler import AttackCommandHandler
     from src.messaging.message_sender import MessageSender
+    from src.repositories.player_repository import PlayerRepository
 
 logger = logging.getLogger(__name__)
 
@@ -59,34 +60,11 @@ class TaskAttack(Task):
             logger.error("AttackCommandHandler no disponible")
             return
 
-        # Obtener posición del jugador para calcular objetivo
-        # Necesitamos esto para crear el comando
-        # Nota: Esto podría moverse al handler, pero necesitamos la posición para el comando
-        # Por ahora lo dejamos aquí para mantener la separación de responsabilidades
-
-        # Obtener player_repo del handler (tiene acceso a todas las dependencias)
-        player_repo = self.attack_handler.player_repo
-        position = await player_repo.get_position(user_id)
-        if not position:
-            logger.error("No se encontró posición para user_id %d", user_id)
+        # Crear comando hacia el tile al que mira el jugador
+        command = await build_attack_command(self.attack_handler.player_repo, user_id)
+        if command is None:
             return
 
-        player_x = position["x"]
-        player_y = position["y"]
-        player_map = position["map"]
-        player_heading = position["heading"]
-
-        # Calcular posición del objetivo según la dirección
-        target_x, target_y = self._get_target_position(player_x, player_y, player_heading)
-
-        # Crear comando (solo datos)
-        command = AttackCommand(
-            user_id=user_id,
-            target_x=target_x,
-            target_y=target_y,
-            map_id=player_map,
-        )
-
         # Delegar al handler (separación de responsabilidades)
         result = await self.attack_handler.handle(command)
 
@@ -106,14 +84,54 @@ class TaskAttack(Task):
         Returns:
             Tupla (target_x, target_y).
         """
-        # Constantes de dirección
-        north, east, south = 1, 2, 3
-
-        if heading == north:
-            return x, y - 1
-        if heading == east:
-            return x + 1, y
-        if heading == south:
-            return x, y + 1
-        # heading == 4:  # Oeste
-        return x - 1, y
+        return get_target_position(x, y, heading)
+
+
+def get_target_position(x: int, y: int, heading: int) -> tuple[int, int]:
+    """Calcula la posición del tile al que mira el jugador.
+
+    Args:
+        x: Posición X del jugador.
+        y: Posición Y del jugador.
+        heading: Dirección del jugador (1=Norte, 2=Este, 3=Sur, 4=Oeste).
+
+    Returns:
+        Tupla (target_x, target_y).
+    """
+    # Constantes de dirección
+    north, east, south = 1, 2, 3
+
+    if heading == north:
+        return x, y - 1
+    if heading == east:
+        return x + 1, y
+    if heading == south:
+        return x, y + 1
+    # heading == 4:  # Oeste
+    return x - 1, y
+
+
+async def build_attack_command(player_repo: PlayerRepository, user_id: int) -> AttackCommand | None:
+    """Crea el comando de ataque hacia el tile al que mira el jugador.
+
+    Compartido por ``TaskAttack`` y el fast path de ``PacketDispatcher``.
+
+    Args:
+        player_repo: Repositorio de jugadores (posición y dirección actuales).
+        user_id: ID del jugador que ataca.
+
+    Returns:
+        El comando, o None si el jugador no tiene posición.
+    """
+    position = await player_repo.get_position(user_id)
+    if not position:
+        logger.error("No se encontró posición para user_id %d", user_id)
+        return None
+
+    target_x, target_y = get_target_position(position["x"], position["y"], position["heading"])
+    return AttackCommand(
+        user_id=user_id,
+        target_x=target_x,
+        target_y=target_y,
+        map_id=position["map"],
+    )
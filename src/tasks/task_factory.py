@@ -8,18 +8,26 @@ Las dependencias se resuelven en este orden de prioridad:
 2. Handlers: parámetros que terminan en '_handler' se resuelven via HandlerRegistry
 3. Datos pre-validados: parámetros que coinciden con claves en parsed_data (slot, amount)
 4. Dependencias del contenedor: parámetros que coinciden con atributos de DependencyContainer
+
+Los packets más frecuentes (WALK, ATTACK, CHANGE_HEADING, PING) no pasan por aquí
+cuando la conexión usa un ``PacketDispatcher`` (ver ``create_dispatcher``).
 """
 
 import logging
+import time
 from functools import cache
 from typing import TYPE_CHECKING, Any
 
+from src.network.packet_framer import looks_like_tls_handshake
 from src.network.packet_handlers import TASK_HANDLERS
+from src.network.packet_id import ClientPacketID
 from src.network.packet_reader import PacketReader
 from src.network.packet_validator import PacketValidator
 from src.tasks.handler_registry import HandlerRegistry
+from src.tasks.packet_dispatcher import PacketDispatcher
 from src.tasks.task_null import TaskNull
 from src.tasks.task_tls_handshake import TaskTLSHandshake
+from src.utils.latency_histogram import LatencyHistogram
 
 if TYPE_CHECKING:
     from src.core.dependency_container import DependencyContainer
@@ -28,11 +36,6 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-TLS_HEADER_MIN_LENGTH = 3
-TLS_CONTENT_TYPE_HANDSHAKE = 0x16
-TLS_PROTOCOL_MAJOR_VERSION = 0x03
-TLS_CLIENT_HELLO_MINOR_VERSIONS = {0x00, 0x01, 0x02, 0x03, 0x04}
-
 
 class TaskFactory:
     """Factory para crear instancias de Tasks con sus dependencias inyectadas.
@@ -56,6 +59,62 @@ class TaskFactory:
         self.deps = deps
         self.enable_prevalidation = enable_prevalidation
         self.handlers = HandlerRegistry(deps)
+        self._dispatch_latencies: dict[int, LatencyHistogram] = {}
+        self._fast_path_hits = 0
+        self._fallbacks = 0
+
+    def create_dispatcher(
+        self,
+        message_sender: MessageSender,
+        session_data: dict[str, dict[str, int] | int | str],
+    ) -> PacketDispatcher:
+        """Crea el dispatcher de packets de una conexión.
+
+        Args:
+            message_sender: Enviador de mensajes del cliente.
+            session_data: Datos de sesión de la conexión (mutable).
+
+        Returns:
+            Dispatcher con los handlers del fast path ligados a la conexión.
+        """
+        return PacketDispatcher(self, message_sender, session_data)
+
+    def record_dispatch(self, packet_id: int, started: float, *, fast_path: bool) -> None:
+        """Registra la latencia de dispatch de un packet.
+
+        Args:
+            packet_id: ID del packet despachado.
+            started: Instante de inicio (``time.perf_counter``).
+            fast_path: Si el packet se resolvió sin crear una Task.
+        """
+        if fast_path:
+            self._fast_path_hits += 1
+        else:
+            self._fallbacks += 1
+        histogram = self._dispatch_latencies.get(packet_id)
+        if histogram is None:
+            histogram = self._dispatch_latencies[packet_id] = LatencyHistogram()
+        histogram.record((time.perf_counter() - started) * 1000)
+
+    def get_dispatch_metrics(self) -> dict[str, object]:
+        """Métricas de dispatch de packets.
+
+        Returns:
+            Diccionario con ``fast_path_hits``, ``fallbacks`` y, en ``latency``, el
+            resumen del histograma (ms) por nombre de packet.
+        """
+        latency: dict[str, object] = {}
+        for packet_id, histogram in self._dispatch_latencies.items():
+            try:
+                packet_name = ClientPacketID(packet_id).name
+            except ValueError:
+                packet_name = f"UNKNOWN_{packet_id}"
+            latency[packet_name] = histogram.summary()
+        return {
+            "fast_path_hits": self._fast_path_hits,
+            "fallbacks": self._fallbacks,
+            "latency": latency,
+        }
 
     def create_task(
         self,
@@ -199,8 +258,6 @@ class TaskFactory:
                 return None
 
             # Obtener nombre del packet para logging
-            from src.network.packet_id import ClientPacketID  # noqa: PLC0415
-
             try:
                 packet_name = ClientPacketID(packet_id).name
             except ValueError:
@@ -237,14 +294,7 @@ class TaskFactory:
         Returns:
             bool: True si el paquete coincide con la cabecera de un ClientHello TLS.
         """
-        if len(data) < TLS_HEADER_MIN_LENGTH:
-            return False
-
         if getattr(message_sender, "is_ssl_enabled", False):
             return False
 
-        return (
-            data[0] == TLS_CONTENT_TYPE_HANDSHAKE
-            and data[1] == TLS_PROTOCOL_MAJOR_VERSION
-            and data[2] in TLS_CLIENT_HELLO_MINOR_VERSIONS
-        )
+        return looks_like_tls_handshake(data)
@@ -8,6 +8,7 @@ from src.utils.inventory_slot import InventorySlot
 from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
+    from src.repositories.inventory_cache import InventoryCache, PlayerInventory
     from src.utils.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
@@ -17,18 +18,31 @@ class InventoryStorage:
     """Gestiona el almacenamiento de inventarios en Redis.
 
     Esta clase es responsable únicamente de la persistencia,
-    sin lógica de negocio de inventario.
+    sin lógica de negocio de inventario. Si recibe un ``InventoryCache``, los
+    inventarios de los jugadores cargados se leen y escriben en memoria.
     """
 
     MAX_SLOTS = config_manager.get("game.inventory.max_slots", 30)
 
-    def __init__(self, redis_client: RedisClient) -> None:
+    def __init__(self, redis_client: RedisClient, cache: InventoryCache | None = None) -> None:
         """Inicializa el storage de inventario.
 
         Args:
             redis_client: Cliente de Redis.
+            cache: Cache en memoria de los inventarios online (opcional).
         """
         self.redis_client = redis_client
+        self.cache = cache
+
+    def cached_inventory(self, user_id: int) -> PlayerInventory | None:
+        """Retorna el inventario en memoria del jugador, si está cargado.
+
+        Returns:
+            PlayerInventory o None si no hay cache o el jugador no está cargado.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(user_id)
 
     async def get_slot(self, user_id: int, slot: int) -> InventorySlot | None:
         """Obtiene el contenido de un slot específico.
@@ -44,6 +58,11 @@ class InventoryStorage:
             logger.warning("Slot inválido: %d", slot)
             return None
 
+        inventory = self.cached_inventory(user_id)
+        if inventory is not None:
+            item = inventory.get(slot)
+            return InventorySlot(item_id=item[0], quantity=item[1]) if item else None
+
         key = RedisKeys.player_inventory(user_id)
         slot_key = f"slot_{slot}"
         value = await self.redis_client.hget(key, slot_key)
@@ -65,6 +84,14 @@ class InventoryStorage:
             logger.warning("Slot inválido: %d", slot)
             return False
 
+        inventory = self.cached_inventory(user_id)
+        if inventory is not None:
+            if inventory_slot is None or inventory_slot.is_empty():
+                inventory.set(slot, 0, 0)
+            else:
+                inventory.set(slot, inventory_slot.item_id, inventory_slot.quantity)
+            return True
+
         key = RedisKeys.player_inventory(user_id)
         slot_key = f"slot_{slot}"
 
@@ -93,6 +120,13 @@ class InventoryStorage:
         Returns:
             Diccionario {slot_number: InventorySlot} con solo los slots ocupados.
         """
+        cached = self.cached_inventory(user_id)
+        if cached is not None:
+            return {
+                slot: InventorySlot(item_id=item_id, quantity=quantity)
+                for slot, item_id, quantity in cached.occupied()
+            }
+
         key = RedisKeys.player_inventory(user_id)
         inventory = await self.redis_client.hgetall(key)
 
@@ -135,6 +169,10 @@ class InventoryStorage:
         Returns:
             Número de slot vacío o None si no hay espacio.
         """
+        inventory = self.cached_inventory(user_id)
+        if inventory is not None:
+            return inventory.find_empty()
+
         slots = await self.get_all_slots(user_id)
 
         for slot_num in range(1, ConfigManager.as_int(self.MAX_SLOTS) + 1):
@@ -0,0 +1,123 @@
+"""Histograma de latencias log-lineal (estilo HDR).
+
+Registra duraciones en microsegundos enteros sobre buckets de ancho creciente:
+los valores menores a ``sub_buckets`` microsegundos son exactos y, por encima,
+cada potencia de dos se divide en ``sub_buckets / 2`` buckets lineales. El error
+relativo de un percentil queda acotado por ``2 / sub_buckets`` (~3% con 64)
+usando memoria proporcional al logaritmo del rango, sin guardar las muestras.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Buckets lineales por potencia de dos (debe ser potencia de dos)
+DEFAULT_SUB_BUCKETS = 64
+
+
+class LatencyHistogram:
+    """Histograma de latencias con percentiles de error relativo acotado."""
+
+    __slots__ = ("_counts", "_half", "_max_us", "_shift", "_sub_buckets", "_total_us", "count")
+
+    def __init__(self, sub_buckets: int = DEFAULT_SUB_BUCKETS) -> None:
+        """Inicializa un histograma vacío.
+
+        Args:
+            sub_buckets: Buckets lineales por magnitud; potencia de dos >= 2.
+
+        Raises:
+            ValueError: Si ``sub_buckets`` no es una potencia de dos >= 2.
+        """
+        if sub_buckets < 2 or sub_buckets & (sub_buckets - 1):  # noqa: PLR2004
+            msg = f"sub_buckets debe ser una potencia de dos >= 2 (recibido {sub_buckets})"
+            raise ValueError(msg)
+        self._sub_buckets = sub_buckets
+        self._half = sub_buckets // 2
+        self._shift = sub_buckets.bit_length() - 1
+        self._counts: list[int] = []
+        self._total_us = 0
+        self._max_us = 0
+        self.count = 0
+
+    def _index(self, value_us: int) -> int:
+        """Calcula el bucket de un valor.
+
+        Returns:
+            Índice del bucket en ``_counts``.
+        """
+        if value_us < self._sub_buckets:
+            return value_us
+        exponent = value_us.bit_length() - self._shift
+        return self._sub_buckets + (exponent - 1) * self._half + (value_us >> exponent) - self._half
+
+    def _upper_bound_us(self, index: int) -> int:
+        """Valor máximo representado por un bucket.
+
+        Returns:
+            Límite superior (inclusive) del bucket en microsegundos.
+        """
+        if index < self._sub_buckets:
+            return index
+        exponent, offset = divmod(index - self._sub_buckets, self._half)
+        exponent += 1
+        return ((self._half + offset + 1) << exponent) - 1
+
+    def record(self, value_ms: float) -> None:
+        """Registra una duración.
+
+        Args:
+            value_ms: Duración en milisegundos (los negativos cuentan como 0).
+        """
+        value_us = max(0, int(value_ms * 1000))
+        index = self._index(value_us)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += 1
+        self.count += 1
+        self._total_us += value_us
+        self._max_us = max(self._max_us, value_us)
+
+    def percentile(self, percent: float) -> float:
+        """Valor bajo el cual cae el ``percent`` por ciento de las muestras.
+
+        Args:
+            percent: Percentil entre 0 y 100.
+
+        Returns:
+            Latencia en milisegundos (0.0 si no hay muestras).
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(percent / 100.0 * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._upper_bound_us(index), self._max_us) / 1000.0
+        return self._max_us / 1000.0
+
+    @property
+    def mean_ms(self) -> float:
+        """Latencia media en milisegundos."""
+        return self._total_us / self.count / 1000.0 if self.count else 0.0
+
+    @property
+    def max_ms(self) -> float:
+        """Latencia máxima registrada en milisegundos."""
+        return self._max_us / 1000.0
+
+    def summary(self) -> dict[str, float | int]:
+        """Resume el histograma.
+
+        Returns:
+            Diccionario con count, avg_time_ms, max_time_ms, p50_ms, p95_ms y p99_ms.
+        """
+        return {
+            "count": self.count,
+            "avg_time_ms": self.mean_ms,
+            "max_time_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+        }
@@ -1,8 +1,28 @@
-"""Utilidades para manejo seguro de contraseñas."""
+"""Utilidades para manejo seguro de contraseñas.
+
+Argon2 es deliberadamente costoso (decenas de ms y ~64 MB por operación). Las
+variantes async (``hash_password_async``/``verify_password_async``) lo corren
+en un pool acotado de hilos (argon2-cffi libera el GIL) para no bloquear el
+event loop. El pool aplica control de admisión: si hay demasiadas operaciones
+en espera (p. ej. reconexiones masivas tras un reinicio) rechaza las nuevas con
+``PasswordPoolBusyError`` en lugar de encolarlas sin límite.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerificationError
 
+from src.config.config_manager import ConfigManager, config_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
 _PASSWORD_HASHER = PasswordHasher(
     time_cost=3,
     memory_cost=64_000,
@@ -11,6 +31,94 @@ _PASSWORD_HASHER = PasswordHasher(
     salt_len=16,
 )
 
+# Valores por defecto si no hay configuración (server.password_hash_*)
+DEFAULT_PASSWORD_HASH_WORKERS = 2
+DEFAULT_PASSWORD_HASH_MAX_PENDING = 256
+
+
+class PasswordPoolBusyError(Exception):
+    """El pool de contraseñas está saturado y no admite más operaciones."""
+
+
+class PasswordHashPool:
+    """Pool acotado de hilos para operaciones Argon2 con control de admisión."""
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        """Inicializa el pool.
+
+        Args:
+            max_workers: Operaciones Argon2 concurrentes (hilos).
+            max_pending: Operaciones que pueden esperar un hilo libre antes de
+                rechazar nuevas.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="argon2")
+        self._in_flight = 0
+        self.rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Operaciones en ejecución o esperando un hilo."""
+        return self._in_flight
+
+    async def run[T](self, func: Callable[..., T], *args: str) -> T:
+        """Ejecuta ``func(*args)`` en el pool.
+
+        Returns:
+            Resultado de ``func``.
+
+        Raises:
+            PasswordPoolBusyError: Si el pool ya tiene ``max_workers + max_pending``
+                operaciones en curso.
+        """
+        if self._in_flight >= self.max_workers + self.max_pending:
+            self.rejected += 1
+            msg = f"Pool de contraseñas saturado ({self._in_flight} operaciones en curso)"
+            raise PasswordPoolBusyError(msg)
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Libera los hilos del pool (las operaciones en curso terminan)."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: PasswordHashPool | None = None
+
+
+def get_password_pool() -> PasswordHashPool:
+    """Devuelve el pool global, creándolo con la configuración al primer uso.
+
+    Returns:
+        PasswordHashPool: Pool compartido del proceso.
+    """
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        _pool = PasswordHashPool(
+            max_workers=ConfigManager.as_int(
+                config_manager.get("server.password_hash_workers", DEFAULT_PASSWORD_HASH_WORKERS)
+            ),
+            max_pending=ConfigManager.as_int(
+                config_manager.get(
+                    "server.password_hash_max_pending", DEFAULT_PASSWORD_HASH_MAX_PENDING
+                )
+            ),
+        )
+    return _pool
+
+
+def shutdown_password_pool() -> None:
+    """Detiene el pool global si fue creado."""
+    global _pool  # noqa: PLW0603
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
 
 def hash_password(password: str) -> str:
     """Genera un hash Argon2id de la contraseña.
@@ -31,3 +139,33 @@ def verify_password(password: str, password_hash: str) -> bool:
         return _PASSWORD_HASHER.verify(password_hash, password)
     except VerificationError, InvalidHashError:
         return False
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Indica si un hash fue generado con parámetros distintos a los actuales.
+
+    Returns:
+        bool: True si conviene regenerar el hash con los parámetros actuales.
+    """
+    try:
+        return _PASSWORD_HASHER.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return False
+
+
+async def hash_password_async(password: str) -> str:
+    """Versión async de ``hash_password`` que corre en el pool de contraseñas.
+
+    Returns:
+        str: Hash Argon2id de la contraseña.
+    """
+    return await get_password_pool().run(hash_password, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """Versión async de ``verify_password`` que corre en el pool de contraseñas.
+
+    Returns:
+        bool: True si la contraseña es válida, False en caso contrario.
+    """
+    return await get_password_pool().run(verify_password, password, password_hash)
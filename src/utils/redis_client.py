@@ -198,6 +198,10 @@ class RedisClient:
         """Busca keys por patrón."""
         return await self._redis.keys(pattern)  # type: ignore[union-attr,no-any-return]
 
+    async def scan_keys(self, pattern: str, count: int = 500) -> list[str]:
+        """Busca keys por patrón con SCAN incremental (no bloquea Redis como KEYS)."""
+        return [key async for key in self._redis.scan_iter(match=pattern, count=count)]  # type: ignore[union-attr]
+
     async def incr(self, key: str) -> int:
         """Incrementa una key en 1."""
         return await self._redis.incr(key)  # type: ignore[union-attr,no-any-return]
@@ -39,6 +39,9 @@ class RedisKeys:
     SERVER_CONNECTIONS_COUNT = "server:connections:count"
     SERVER_CONNECTIONS_ACTIVE = "server:connections:active"
 
+    # Índice global de NPCs (SET con los instance_id de todo el mundo)
+    NPC_GLOBAL_INDEX = "npc:index:all"
+
     # Ground items (items en el suelo)
     @staticmethod
     def ground_items(map_id: int) -> str:
@@ -155,6 +158,8 @@ class RedisKeys:
 
     # Cuentas de usuario
     ACCOUNTS_COUNTER = "accounts:counter"
+    # Índice inverso user_id -> username (hash con un campo por cuenta)
+    ACCOUNTS_USERNAME_BY_USER_ID = "accounts:username_by_user_id"
 
     @staticmethod
     def account_data(username: str) -> str:
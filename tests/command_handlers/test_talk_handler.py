@@ -9,6 +9,9 @@ from src.command_handlers.talk_handler import TalkCommandHandler
 from src.commands.talk_command import TalkCommand
 from src.commands.walk_command import WalkCommand
 from src.models.npc import NPC
+from src.network.msg_console import build_console_msg_response
+from src.network.packet_id import ClientPacketID
+from src.tasks.task_factory import TaskFactory
 
 
 @pytest.fixture
@@ -160,8 +163,10 @@ async def test_handle_broadcast_message(
     result = await handler.handle(command)
 
     assert result.success is True
-    # Debe enviar a todos los jugadores
-    assert other_sender.send_console_msg.called
+    # Debe enviar a todos los jugadores el mismo packet ya codificado
+    other_sender.connection.enqueue.assert_called_once_with(
+        build_console_msg_response("testuser: Hola a todos")
+    )
 
 
 @pytest.mark.asyncio
@@ -178,6 +183,14 @@ async def test_handle_metrics_command(
             "total_ticks": 1000,
             "avg_tick_time_ms": 5.5,
             "max_tick_time_ms": 10.0,
+            "p50_tick_time_ms": 5.0,
+            "p95_tick_time_ms": 8.0,
+            "p99_tick_time_ms": 9.5,
+            "tick_budget_ms": 400.0,
+            "overruns": 0,
+            "skipped_ticks": 0,
+            "deferred_effects": 0,
+            "lag": {"p99_ms": 1.2},
             "effects": {},
         }
     )
@@ -199,6 +212,119 @@ async def test_handle_metrics_command(
     mock_message_sender.send_multiline_console_msg.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_metrics_include_map_entry_and_transitions(
+    mock_player_repo: MagicMock,
+    mock_account_repo: MagicMock,
+    mock_map_manager: MagicMock,
+    mock_message_sender: MagicMock,
+) -> None:
+    """/METRICS muestra el time-to-playable y la latencia de las transiciones."""
+    mock_game_tick = MagicMock()
+    mock_game_tick.get_metrics = MagicMock(
+        return_value={
+            "total_ticks": 10,
+            "avg_tick_time_ms": 1.0,
+            "max_tick_time_ms": 2.0,
+            "p50_tick_time_ms": 1.0,
+            "p95_tick_time_ms": 2.0,
+            "p99_tick_time_ms": 2.0,
+            "tick_budget_ms": 400.0,
+            "overruns": 0,
+            "skipped_ticks": 0,
+            "deferred_effects": 0,
+            "lag": {"p99_ms": 0.5},
+        }
+    )
+    mock_game_tick.effects = []
+    player_map_service = MagicMock()
+    player_map_service.get_metrics.return_value = {
+        "count": 3,
+        "avg_time_ms": 4.0,
+        "max_time_ms": 9.0,
+        "p50_ms": 3.0,
+        "p95_ms": 8.0,
+        "p99_ms": 9.0,
+        "snapshot_bytes": 1234,
+    }
+    player_map_service.get_transition_metrics.return_value = {
+        "rollbacks": 1,
+        "latency": {
+            "total": {
+                "count": 2,
+                "avg_time_ms": 6.0,
+                "max_time_ms": 7.0,
+                "p50_ms": 6.0,
+                "p95_ms": 7.0,
+                "p99_ms": 7.0,
+            }
+        },
+    }
+
+    handler = TalkCommandHandler(
+        player_repo=mock_player_repo,
+        account_repo=mock_account_repo,
+        map_manager=mock_map_manager,
+        game_tick=mock_game_tick,
+        message_sender=mock_message_sender,
+        player_map_service=player_map_service,
+    )
+
+    await handler.handle(TalkCommand(user_id=1, message="/METRICS"))
+
+    message = mock_message_sender.send_multiline_console_msg.call_args[0][0]
+    assert "Time-to-playable: 3 entradas, p50=3.00ms" in message
+    assert "Bytes de snapshots: 1234" in message
+    assert "Rollbacks: 1" in message
+    assert "total: 2 veces, avg=6.00ms, p99=7.00ms, max=7.00ms" in message
+
+
+@pytest.mark.asyncio
+async def test_metrics_include_packet_dispatch(
+    mock_player_repo: MagicMock,
+    mock_account_repo: MagicMock,
+    mock_map_manager: MagicMock,
+    mock_message_sender: MagicMock,
+) -> None:
+    """/METRICS muestra el dispatch de packets de TaskFactory."""
+    mock_game_tick = MagicMock()
+    mock_game_tick.get_metrics = MagicMock(
+        return_value={
+            "total_ticks": 10,
+            "avg_tick_time_ms": 1.0,
+            "max_tick_time_ms": 2.0,
+            "p50_tick_time_ms": 1.0,
+            "p95_tick_time_ms": 2.0,
+            "p99_tick_time_ms": 2.0,
+            "tick_budget_ms": 400.0,
+            "overruns": 0,
+            "skipped_ticks": 0,
+            "deferred_effects": 0,
+            "lag": {"p99_ms": 0.5},
+        }
+    )
+    mock_game_tick.effects = []
+    task_factory = TaskFactory(MagicMock())
+    task_factory.record_dispatch(ClientPacketID.WALK, time.perf_counter(), fast_path=True)
+    task_factory.record_dispatch(ClientPacketID.LOGIN, time.perf_counter(), fast_path=False)
+
+    handler = TalkCommandHandler(
+        player_repo=mock_player_repo,
+        account_repo=mock_account_repo,
+        map_manager=mock_map_manager,
+        game_tick=mock_game_tick,
+        message_sender=mock_message_sender,
+        task_factory=task_factory,
+    )
+
+    await handler.handle(TalkCommand(user_id=1, message="/METRICS"))
+
+    message = mock_message_sender.send_multiline_console_msg.call_args[0][0]
+    assert "Fast path: 1, con Task: 1" in message
+    assert "WALK: 1 packets" in message
+    assert "LOGIN: 1 packets" in message
+
+
 @pytest.mark.asyncio
 async def test_handle_metrics_no_game_tick(
     mock_player_repo: MagicMock,
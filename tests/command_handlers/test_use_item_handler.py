@@ -73,6 +73,7 @@ async def test_handle_empty_slot(
     with patch("src.command_handlers.use_item_handler.InventoryRepository") as mock_inv_repo_class:
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=None)
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         handler = UseItemCommandHandler(
@@ -125,6 +126,7 @@ async def test_handle_work_tool_equipped(
     ):
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(561, 1))  # Hacha de Leñador
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_eq_repo = MagicMock()
@@ -165,6 +167,7 @@ async def test_handle_work_tool_not_equipped(
     ):
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(561, 1))
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_eq_repo = MagicMock()
@@ -199,6 +202,7 @@ async def test_handle_boat_start_sailing(
     with patch("src.command_handlers.use_item_handler.InventoryRepository") as mock_inv_repo_class:
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(BOAT_ITEM_ID, 1))
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_player_repo.is_sailing = AsyncMock(return_value=False)
@@ -233,6 +237,7 @@ async def test_handle_boat_stop_sailing(
     with patch("src.command_handlers.use_item_handler.InventoryRepository") as mock_inv_repo_class:
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(BOAT_ITEM_ID, 1))
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_player_repo.is_sailing = AsyncMock(return_value=True)
@@ -269,6 +274,7 @@ async def test_handle_apple_consumption(
         mock_inv_repo.get_slot = AsyncMock(return_value=(1, 5))  # 5 manzanas
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_player_repo.get_hunger_thirst = AsyncMock(
@@ -312,6 +318,7 @@ async def test_handle_apple_last_one(
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(1, 1))  # 1 manzana
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_player_repo.get_hunger_thirst = AsyncMock(
@@ -353,6 +360,7 @@ async def test_handle_hp_potion(
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(38, 3))  # Poción Roja
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -400,6 +408,7 @@ async def test_handle_mana_potion(
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(37, 2))  # Poción Azul
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -447,6 +456,7 @@ async def test_handle_agility_potion(
         mock_inv_repo.get_slot = AsyncMock(return_value=(36, 1))  # Poción Amarilla
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -496,6 +506,7 @@ async def test_handle_strength_potion(
         mock_inv_repo.get_slot = AsyncMock(return_value=(39, 1))  # Poción Verde
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -545,6 +556,7 @@ async def test_handle_cure_poison_potion(
         mock_inv_repo.get_slot = AsyncMock(return_value=(166, 1))  # Poción Violeta
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -587,6 +599,7 @@ async def test_handle_invisibility_potion(
         mock_inv_repo.get_slot = AsyncMock(return_value=(645, 1))  # Poción Negra
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -635,6 +648,7 @@ async def test_handle_unknown_potion_type(
         mock_inv_repo.get_slot = AsyncMock(return_value=(999, 1))
         mock_inv_repo.remove_item = AsyncMock(return_value=True)
         mock_inv_repo.clear_slot = AsyncMock()
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(
@@ -673,6 +687,7 @@ async def test_handle_item_no_behavior(
     with patch("src.command_handlers.use_item_handler.InventoryRepository") as mock_inv_repo_class:
         mock_inv_repo = MagicMock()
         mock_inv_repo.get_slot = AsyncMock(return_value=(9999, 1))
+        mock_inv_repo.pop_changed_slots = MagicMock(return_value=None)  # sin cache en memoria
         mock_inv_repo_class.return_value = mock_inv_repo
 
         mock_item_catalog.get_item_data = MagicMock(return_value=None)
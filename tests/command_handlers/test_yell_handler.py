@@ -7,6 +7,7 @@ import pytest
 from src.command_handlers.yell_handler import YellCommandHandler
 from src.commands.walk_command import WalkCommand
 from src.commands.yell_command import YellCommand
+from src.network.msg_console import build_console_msg_response
 
 
 @pytest.fixture
@@ -136,11 +137,9 @@ async def test_handle_broadcast_message(
     result = await handler.handle(command)
 
     assert result.success is True
-    other_sender.send_console_msg.assert_called_once()
-    call_args_list = other_sender.send_console_msg.call_args_list
-    assert len(call_args_list) >= 1
-    call_args = call_args_list[0]
-    assert call_args[1]["font_color"] == 4
+    other_sender.connection.enqueue.assert_called_once_with(
+        build_console_msg_response("¡testuser grita!: Hola a todos", 4)
+    )
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,34 @@
+"""Tests para GroundItemExpiryEffect."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.effects.effect_ground_item_expiry import GroundItemExpiryEffect
+from src.effects.tick_effect import TickPriority
+from src.network.msg_map import build_object_create_response, build_object_delete_response
+
+
+@pytest.mark.asyncio
+async def test_sends_one_batched_buffer_per_map() -> None:
+    """Los tiles vencidos de un mapa se notifican en un único buffer."""
+    map_manager = MagicMock()
+    map_manager.expire_ground_items.return_value = {1: [(5, 5), (6, 6)], 2: [(1, 1)]}
+    map_manager.get_ground_items.side_effect = lambda _map_id, x, y: (
+        [{"item_id": 3, "grh_index": 700}] if (x, y) == (6, 6) else []
+    )
+    sender = MagicMock()
+    map_manager.get_all_message_senders_in_map.side_effect = lambda map_id: (
+        [sender] if map_id == 1 else []
+    )
+    effect = GroundItemExpiryEffect(map_manager)
+
+    with patch("src.effects.effect_ground_item_expiry.fan_out_packet") as fan_out:
+        await effect.apply(0, MagicMock(), None)
+
+    fan_out.assert_called_once_with(
+        build_object_delete_response(5, 5) + build_object_create_response(6, 6, 700),
+        [sender],
+    )
+    assert effect.get_priority() == TickPriority.LOW
+    assert effect.get_name() == "GroundItemExpiry"
@@ -0,0 +1,80 @@
+"""Tests para PetFollowEffect."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.effects.effect_pet_follow import PetFollowEffect
+from src.models.npc import NPC
+
+
+@pytest.fixture
+def pet() -> NPC:
+    """Mascota invocada por el usuario 7."""
+    return NPC(
+        npc_id=1,
+        char_index=10001,
+        instance_id="pet-1",
+        map_id=1,
+        x=50,
+        y=50,
+        heading=3,
+        name="Lobo",
+        description="Mascota",
+        body_id=100,
+        head_id=0,
+        hp=50,
+        max_hp=50,
+        level=1,
+        is_hostile=False,
+        is_attackable=True,
+        summoned_by_user_id=7,
+        summoned_until=9e9,
+    )
+
+
+@pytest.fixture
+def npc_service(pet: NPC) -> MagicMock:
+    """NPCService con la mascota en el mundo."""
+    service = MagicMock()
+    service.npc_repository.get_all_npcs = AsyncMock(return_value=[pet])
+    service.move_npc = AsyncMock()
+    service.map_manager.can_move_to.return_value = True
+    service.map_manager.is_tile_occupied.return_value = False
+    return service
+
+
+@pytest.fixture
+def player_repo() -> MagicMock:
+    """Repositorio con el dueño lejos de la mascota."""
+    repo = MagicMock()
+    repo.get_position = AsyncMock(return_value={"map": 1, "x": 50, "y": 40})
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_pet_moves_straight_without_flow_field(
+    npc_service: MagicMock, player_repo: MagicMock, pet: NPC
+) -> None:
+    """Sin campos de flujo la mascota avanza en línea recta."""
+    effect = PetFollowEffect(npc_service)
+
+    await effect.apply(0, player_repo, None)
+
+    npc_service.move_npc.assert_awaited_once_with(pet, 50, 49, 1)
+
+
+@pytest.mark.asyncio
+async def test_pet_uses_shared_flow_field(
+    npc_service: MagicMock, player_repo: MagicMock, pet: NPC
+) -> None:
+    """Con campos de flujo la mascota sigue el BFS hacia su dueño."""
+    flow_field_service = MagicMock()
+    flow_field_service.get_next_step.return_value = (51, 50, 2)
+    effect = PetFollowEffect(npc_service, flow_field_service=flow_field_service)
+
+    await effect.apply(0, player_repo, None)
+
+    flow_field_service.get_next_step.assert_called_once_with(1, 50, 50, 50, 40, target_id=7)
+    npc_service.move_npc.assert_awaited_once_with(pet, 51, 50, 2)
+    npc_service.map_manager.can_move_to.assert_not_called()
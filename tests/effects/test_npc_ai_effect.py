@@ -1,7 +1,10 @@
 """Tests básicos para NPCAIEffect."""
 
 import math
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
 from src.effects.npc_ai_effect import NPCAIEffect
 
@@ -46,3 +49,29 @@ class TestNPCAIEffect:
         effect = NPCAIEffect(npc_service, npc_ai_service)
 
         assert effect.get_name() == "NPCAI"
+
+    @pytest.mark.asyncio
+    async def test_apply_builds_one_snapshot_per_map(self) -> None:
+        """Todos los NPCs de un mapa comparten el snapshot de jugadores."""
+        npcs = [
+            SimpleNamespace(map_id=1, is_hostile=True, hp=10),
+            SimpleNamespace(map_id=1, is_hostile=True, hp=10),
+            SimpleNamespace(map_id=2, is_hostile=True, hp=10),
+            SimpleNamespace(map_id=3, is_hostile=True, hp=10),
+        ]
+        npc_service = MagicMock()
+        npc_service.map_manager.get_all_npcs.return_value = npcs
+        npc_service.map_manager.get_maps_with_players.return_value = [1, 2]
+        npc_ai_service = MagicMock()
+        npc_ai_service.build_player_snapshot = AsyncMock(side_effect=lambda map_id: f"snap{map_id}")
+        npc_ai_service.process_hostile_npc = AsyncMock()
+
+        effect = NPCAIEffect(npc_service, npc_ai_service)
+        await effect.apply(0, MagicMock(), None)
+
+        assert sorted(c.args[0] for c in npc_ai_service.build_player_snapshot.call_args_list) == [
+            1,
+            2,
+        ]
+        snapshots = [c.args[1] for c in npc_ai_service.process_hostile_npc.call_args_list]
+        assert snapshots == ["snap1", "snap1", "snap2"]
@@ -28,3 +28,20 @@ def test_exit_index_clear_map() -> None:
 
     assert index.get_exit_tile(1, 1, 1) is None
     assert index.get_exit_tile(2, 1, 1) is not None
+
+
+def test_exit_index_get_neighbor_maps() -> None:
+    """Los vecinos son los mapas destino de los exits (sin el propio mapa)."""
+    index = ExitIndex()
+    index.update(
+        {
+            (1, 1, 1): {"to_map": 2, "to_x": 1, "to_y": 1},
+            (1, 1, 2): {"to_map": 2, "to_x": 1, "to_y": 2},
+            (1, 100, 50): {"to_map": 3, "to_x": 1, "to_y": 50},
+            (1, 50, 50): {"to_map": 1, "to_x": 10, "to_y": 10},
+            (2, 1, 1): {"to_map": 4, "to_x": 1, "to_y": 1},
+        }
+    )
+
+    assert index.get_neighbor_maps(1) == {2, 3}
+    assert index.get_neighbor_maps(5) == set()
@@ -1,13 +1,22 @@
 """Tests para el sistema de tick genérico del juego."""
 
 import asyncio
+import time
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.effects.effect_gold_decay import GoldDecayEffect
 from src.effects.effect_hunger_thirst import HungerThirstEffect
-from src.game.game_tick import GameTick
+from src.effects.effect_timer_scheduler import TimerSchedulerEffect
+from src.effects.tick_effect import TickEffect, TickPriority, WorldTickEffect
+from src.game.game_tick import MAX_CONSECUTIVE_DEFERRALS, GameTick
+from src.game.timer_scheduler import TimerScheduler
+
+if TYPE_CHECKING:
+    from src.messaging.message_sender import MessageSender
+    from src.repositories.player_repository import PlayerRepository
 
 
 @pytest.fixture
@@ -316,3 +325,231 @@ async def test_hunger_thirst_flags_activated(
     assert call_kwargs["min_hunger"] == 0
     assert call_kwargs["thirst_flag"] == 1
     assert call_kwargs["hunger_flag"] == 1
+
+
+class _RecordingEffect(TickEffect):
+    """Efecto por jugador que registra a quién se aplicó."""
+
+    def __init__(self, failing_user_id: int | None = None) -> None:
+        self.applied: list[int] = []
+        self.failing_user_id = failing_user_id
+
+    async def apply(
+        self,
+        user_id: int,
+        player_repo: PlayerRepository,  # noqa: ARG002
+        message_sender: MessageSender | None,  # noqa: ARG002
+    ) -> None:
+        if user_id == self.failing_user_id:
+            msg = "fallo simulado"
+            raise RuntimeError(msg)
+        self.applied.append(user_id)
+
+    def get_interval_seconds(self) -> float:
+        return 1.0
+
+    def get_name(self) -> str:
+        return "Recording"
+
+
+class _RecordingWorldEffect(WorldTickEffect, _RecordingEffect):
+    """Efecto de mundo: debe aplicarse una sola vez por lote."""
+
+    def get_name(self) -> str:
+        return "RecordingWorld"
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_default_adapter_isolates_errors(mock_player_repo: AsyncMock) -> None:
+    """El adaptador por defecto aplica a cada jugador aunque uno falle."""
+    effect = _RecordingEffect(failing_user_id=2)
+
+    await effect.apply_batch([1, 2, 3], mock_player_repo, {})
+
+    assert effect.applied == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_world_effect_applies_once_per_batch(mock_player_repo: AsyncMock) -> None:
+    """Los efectos de mundo se ejecutan una vez sin importar cuántos jugadores haya."""
+    effect = _RecordingWorldEffect()
+
+    await effect.apply_batch([5, 6, 7], mock_player_repo, {})
+    await effect.apply_batch([], mock_player_repo, {})
+
+    assert effect.applied == [5]
+
+
+@pytest.mark.asyncio
+async def test_hunger_thirst_batch_reads_config_once(
+    mock_player_repo: AsyncMock, mock_server_repo: AsyncMock
+) -> None:
+    """La configuración se lee una vez por lote, no una vez por jugador."""
+    mock_player_repo.get_hunger_thirst.return_value = {
+        "max_water": 100,
+        "min_water": 80,
+        "max_hunger": 100,
+        "min_hunger": 90,
+        "thirst_flag": 0,
+        "hunger_flag": 0,
+        "water_counter": 0,
+        "hunger_counter": 0,
+    }
+    effect = HungerThirstEffect(mock_server_repo)
+
+    await effect.apply_batch([1, 2, 3], mock_player_repo, {})
+
+    assert mock_server_repo.get_effect_config_int.await_count == 4
+    assert mock_player_repo.set_hunger_thirst.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_game_tick_runs_batches_and_records_phases(
+    game_tick: GameTick, mock_map_manager: MagicMock
+) -> None:
+    """El tick entrega el lote completo a cada efecto y mide cada fase."""
+    mock_map_manager.get_all_connected_user_ids.return_value = [1, 2]
+    mock_map_manager.get_message_sender.return_value = None
+    per_player = _RecordingEffect()
+    world = _RecordingWorldEffect()
+    game_tick.add_effect(per_player)
+    game_tick.add_effect(world)
+
+    game_tick.start()
+    await asyncio.sleep(0.05)
+    await game_tick.stop()
+
+    assert per_player.applied[:2] == [1, 2]
+    assert world.applied[:1] == [1]
+    metrics = game_tick.get_metrics()
+    assert set(metrics["phases"]) == {"collect", "effects"}
+    assert metrics["effects"]["Recording"]["count"] >= 1
+    assert metrics["effects"]["RecordingWorld"]["count"] >= 1
+
+
+class _IntervalEffect(_RecordingWorldEffect):
+    """Efecto de mundo con intervalo y prioridad configurables."""
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        priority: TickPriority = TickPriority.NORMAL,
+        delay: float = 0.0,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.interval = interval
+        self.priority = priority
+        self.delay = delay
+
+    async def apply(
+        self,
+        user_id: int,
+        player_repo: PlayerRepository,
+        message_sender: MessageSender | None,
+    ) -> None:
+        if self.delay:
+            time.sleep(self.delay)  # noqa: ASYNC251 - simula trabajo que bloquea el tick
+        await super().apply(user_id, player_repo, message_sender)
+
+    def get_interval_seconds(self) -> float:
+        return self.interval
+
+    def get_priority(self) -> TickPriority:
+        return self.priority
+
+    def get_name(self) -> str:
+        return self.name
+
+
+@pytest.mark.asyncio
+async def test_effects_run_at_their_own_interval(
+    game_tick: GameTick, mock_map_manager: MagicMock
+) -> None:
+    """Cada efecto corre según su intervalo, no en cada tick."""
+    mock_map_manager.get_all_connected_user_ids.return_value = [1]
+    mock_map_manager.get_message_sender.return_value = None
+    fast = _IntervalEffect("Fast", interval=0.1)
+    slow = _IntervalEffect("Slow", interval=0.35)
+    game_tick.add_effect(fast)
+    game_tick.add_effect(slow)
+
+    for tick_number in range(10):  # deadlines 0.0 .. 0.9
+        await game_tick._run_tick(100.0 + tick_number * 0.1)
+
+    assert len(fast.applied) == 10
+    # 0.0, 0.35 -> corre en 0.4, 0.75 -> corre en 0.8 (alineado a la grilla del tick)
+    assert len(slow.applied) == 3
+    assert game_tick.get_metrics()["effects"]["Slow"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_timers_run_without_connected_players(
+    game_tick: GameTick, mock_map_manager: MagicMock
+) -> None:
+    """Con el servidor vacío los respawns vencen a su hora; el resto queda pendiente."""
+    mock_map_manager.get_all_connected_user_ids.return_value = []
+    now = [1000.0]
+    scheduler = TimerScheduler(clock=lambda: now[0])
+    respawns: list[int] = []
+    scheduler.call_later(1.0, respawns.append, 7)
+    per_player = _IntervalEffect("PerPlayer", interval=0.1)
+    game_tick.add_effect(TimerSchedulerEffect(scheduler, interval_seconds=0.1))
+    game_tick.add_effect(per_player)
+
+    await game_tick._run_tick(100.0)
+    assert respawns == []
+
+    now[0] += 1.0
+    await game_tick._run_tick(100.1)
+
+    assert respawns == [7]
+    assert len(scheduler) == 0
+    assert per_player.applied == []
+
+
+@pytest.mark.asyncio
+async def test_low_priority_effects_deferred_when_over_budget(
+    mock_player_repo: AsyncMock, mock_map_manager: MagicMock
+) -> None:
+    """Si el tick excede el presupuesto los efectos LOW pasan al tick siguiente."""
+    mock_map_manager.get_all_connected_user_ids.return_value = [1]
+    mock_map_manager.get_message_sender.return_value = None
+    game_tick = GameTick(mock_player_repo, mock_map_manager, tick_interval=0.1, tick_budget_ms=1.0)
+    heavy = _IntervalEffect("Heavy", interval=0.1, delay=0.005)
+    cleanup = _IntervalEffect("Cleanup", interval=0.1, priority=TickPriority.LOW)
+    game_tick.add_effect(heavy)
+    game_tick.add_effect(cleanup)
+
+    for tick_number in range(MAX_CONSECUTIVE_DEFERRALS):
+        await game_tick._run_tick(tick_number * 0.1)
+    assert cleanup.applied == []
+
+    # Tras MAX_CONSECUTIVE_DEFERRALS diferimientos seguidos se fuerza su ejecución
+    await game_tick._run_tick(MAX_CONSECUTIVE_DEFERRALS * 0.1)
+
+    assert cleanup.applied == [1]
+    metrics = game_tick.get_metrics()
+    assert metrics["deferred_effects"] == MAX_CONSECUTIVE_DEFERRALS
+    assert metrics["overruns"] == MAX_CONSECUTIVE_DEFERRALS + 1
+    assert metrics["p99_tick_time_ms"] >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_tick_loop_keeps_fixed_period(
+    mock_player_repo: AsyncMock, mock_map_manager: MagicMock
+) -> None:
+    """El período no se alarga con el tiempo de trabajo del tick."""
+    mock_map_manager.get_all_connected_user_ids.return_value = [1]
+    mock_map_manager.get_message_sender.return_value = None
+    game_tick = GameTick(mock_player_repo, mock_map_manager, tick_interval=0.02)
+    busy = _IntervalEffect("Busy", interval=0.02, delay=0.01)
+    game_tick.add_effect(busy)
+
+    game_tick.start()
+    await asyncio.sleep(0.21)
+    await game_tick.stop()
+
+    # Con sleep después del trabajo serían ~7 ticks (30ms cada uno); a deadline fijo ~11
+    assert len(busy.applied) >= 9
@@ -5,6 +5,11 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from src.core.game_tick_initializer import GameTickInitializer
+from src.effects.effect_gold_decay import GoldDecayEffect
+from src.effects.effect_hunger_thirst import HungerThirstEffect
+from src.effects.effect_npc_movement import NPCMovementEffect
+from src.effects.effect_stamina_regen import StaminaRegenEffect
+from src.effects.npc_ai_effect import NPCAIEffect
 from src.game.game_tick import GameTick
 
 
@@ -75,3 +80,47 @@ async def test_game_tick_initializer_respects_config() -> None:
     # Debería tener al menos el efecto de meditación (siempre habilitado)
     # y los efectos de NPC (movimiento e IA)
     assert len(game_tick.effects) >= 3
+
+
+@pytest.mark.asyncio
+async def test_step_effects_run_every_base_tick() -> None:
+    """Hambre/sed, oro y stamina corren en cada tick base (su ritmo por segundo no cambia).
+
+    Sus contadores avanzan un paso por aplicación: con el tick de 0.5s, 180 pasos
+    de sed son 90 segundos, igual que cuando el tick aplicaba todos los efectos.
+    """
+    server_repo = Mock()
+    server_repo.get_effect_config_bool = AsyncMock(return_value=True)
+    initializer = GameTickInitializer(Mock(), server_repo, Mock(), Mock(), Mock(), Mock())
+
+    game_tick = await initializer.initialize()
+
+    step_effects = [
+        effect
+        for effect in game_tick.effects
+        if isinstance(effect, (HungerThirstEffect, GoldDecayEffect, StaminaRegenEffect))
+    ]
+    assert len(step_effects) == 3
+    assert game_tick.tick_interval == pytest.approx(0.5)
+    for effect in step_effects:
+        assert effect.get_interval_seconds() == game_tick.tick_interval
+
+
+@pytest.mark.asyncio
+async def test_npc_effects_run_every_base_tick() -> None:
+    """La IA y el movimiento de NPCs corren en cada tick base, como antes del scheduler."""
+    server_repo = Mock()
+    server_repo.get_effect_config_bool = AsyncMock(return_value=True)
+    initializer = GameTickInitializer(Mock(), server_repo, Mock(), Mock(), Mock(), Mock())
+
+    game_tick = await initializer.initialize()
+
+    npc_effects = [
+        effect
+        for effect in game_tick.effects
+        if isinstance(effect, (NPCAIEffect, NPCMovementEffect))
+    ]
+    assert len(npc_effects) == 2
+    assert game_tick.tick_interval == pytest.approx(0.5)
+    for effect in npc_effects:
+        assert effect.get_interval_seconds() == game_tick.tick_interval
@@ -13,6 +13,9 @@ class DummyRepo:
     def __init__(self) -> None:
         """Inicializa el almacenamiento simulado."""
         self.saved: list[tuple[int, dict[tuple[int, int], list[dict[str, int | str | None]]]]] = []
+        self.saved_tiles: list[
+            tuple[int, dict[tuple[int, int], list[dict[str, int | str | None]]]]
+        ] = []
         self.to_load: dict[int, dict[tuple[int, int], list[dict[str, int | str | None]]]] = {}
 
     async def save_ground_items(
@@ -21,12 +24,22 @@ class DummyRepo:
         """Guarda items simuladamente."""
         self.saved.append((map_id, items))
 
+    async def save_tiles(
+        self, map_id: int, tiles: dict[tuple[int, int], list[dict[str, int | str | None]]]
+    ) -> None:
+        """Guarda tiles modificados simuladamente (copia las listas)."""
+        self.saved_tiles.append((map_id, {coords: list(items) for coords, items in tiles.items()}))
+
     async def load_ground_items(
         self, map_id: int
     ) -> dict[tuple[int, int], list[dict[str, int | str | None]]]:
         """Carga items simuladamente."""
         return self.to_load.get(map_id, {})
 
+    async def get_persisted_map_ids(self) -> list[int]:
+        """Mapas con items simulados."""
+        return sorted(self.to_load)
+
 
 def make_item(idx: int) -> dict[str, int]:
     """Crea un item simple de prueba."""
@@ -35,21 +48,102 @@ def make_item(idx: int) -> dict[str, int]:
 
 @pytest.mark.asyncio
 async def test_add_respects_max_and_persists() -> None:
-    """Agrega items respetando límite y persiste en repo."""
+    """Agrega items respetando límite y persiste solo el tile modificado."""
     repo = DummyRepo()
-    index = GroundItemIndex(max_items_per_tile=2, ground_items_repo=repo)
+    index = GroundItemIndex(max_items_per_tile=2, ground_items_repo=repo, flush_delay=0)
 
     index.add_ground_item(1, 1, 1, make_item(1))
     index.add_ground_item(1, 1, 1, make_item(2))
     # tercer item no entra
     index.add_ground_item(1, 1, 1, make_item(3))
 
-    # esperar a que corran las tareas de persistencia
-    await asyncio.sleep(0)
+    # esperar al flush diferido
+    await asyncio.sleep(0.01)
 
     assert index.get_ground_items(1, 1, 1) == [make_item(1), make_item(2)]
-    # persistencias async se disparan (dos saves)
-    assert len(repo.saved) == 2
+    # los dos cambios se agrupan en una única escritura del tile, sin reescribir el mapa
+    assert repo.saved_tiles == [(1, {(1, 1): [make_item(1), make_item(2)]})]
+    assert repo.saved == []
+
+
+@pytest.mark.asyncio
+async def test_drop_during_inflight_flush_is_persisted() -> None:
+    """Un tile ensuciado mientras save_tiles está en curso se persiste después."""
+    repo = DummyRepo()
+    release = asyncio.Event()
+    save_tiles = repo.save_tiles
+
+    async def slow_save_tiles(
+        map_id: int, tiles: dict[tuple[int, int], list[dict[str, int | str | None]]]
+    ) -> None:
+        await release.wait()
+        await save_tiles(map_id, tiles)
+
+    repo.save_tiles = slow_save_tiles  # type: ignore[method-assign]
+    index = GroundItemIndex(max_items_per_tile=2, ground_items_repo=repo, flush_delay=0)
+
+    index.add_ground_item(1, 1, 1, make_item(1))
+    await asyncio.sleep(0.01)
+    # el primer flush está bloqueado en save_tiles
+    index.add_ground_item(1, 2, 2, make_item(2))
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert repo.saved_tiles == [
+        (1, {(1, 1): [make_item(1)]}),
+        (1, {(2, 2): [make_item(2)]}),
+    ]
+    assert index.get_metrics()["dirty_tiles"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_save_is_retried() -> None:
+    """Si save_tiles falla, los tiles se reintentan sin esperar a otro cambio."""
+    repo = DummyRepo()
+    save_tiles = repo.save_tiles
+    calls = 0
+
+    async def flaky_save_tiles(
+        map_id: int, tiles: dict[tuple[int, int], list[dict[str, int | str | None]]]
+    ) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            msg = "redis caído"
+            raise ConnectionError(msg)
+        await save_tiles(map_id, tiles)
+
+    repo.save_tiles = flaky_save_tiles  # type: ignore[method-assign]
+    index = GroundItemIndex(max_items_per_tile=2, ground_items_repo=repo, flush_delay=0)
+
+    index.add_ground_item(1, 1, 1, make_item(1))
+    await asyncio.sleep(0.01)
+
+    assert calls == 2
+    assert repo.saved_tiles == [(1, {(1, 1): [make_item(1)]})]
+    assert index.get_metrics()["dirty_tiles"] == 0
+
+
+@pytest.mark.asyncio
+async def test_flush_deletes_emptied_tiles_and_counts_metrics() -> None:
+    """Un tile vaciado se persiste como lista vacía y las métricas cuentan el flush."""
+    repo = DummyRepo()
+    index = GroundItemIndex(max_items_per_tile=2, ground_items_repo=repo, flush_delay=60)
+
+    index.add_ground_item(1, 1, 1, make_item(1))
+    index.add_ground_item(1, 2, 2, make_item(2))
+    assert await index.flush() == 2
+
+    index.remove_ground_item(1, 1, 1, 0)
+    assert index.get_metrics()["dirty_tiles"] == 1
+    assert await index.flush() == 1
+
+    assert repo.saved_tiles[-1] == (1, {(1, 1): []})
+    metrics = index.get_metrics()
+    assert metrics["flushes"] == 2
+    assert metrics["tiles_flushed"] == 3
+    assert metrics["dirty_tiles"] == 0
+    assert metrics["tiles_with_items"] == 1
 
 
 @pytest.mark.asyncio
@@ -80,3 +174,62 @@ async def test_load_ground_items() -> None:
     assert index.get_ground_items_count(1) == 3
     assert index.get_ground_items(1, 1, 1) == [make_item(1)]
     assert index.get_ground_items(1, 2, 2) == [make_item(2), make_item(3)]
+
+
+def test_expiry_removes_items_individually_by_type() -> None:
+    """Cada item vence según su spawn_time y su TTL (oro o loot)."""
+    now = [1000.0]
+    index = GroundItemIndex(max_items_per_tile=3)
+    index.enable_expiry(loot_ttl=60, gold_ttl=10, clock=lambda: now[0])
+
+    loot = make_item(1)
+    gold = {"item_id": 12, "quantity": 100}
+    index.add_ground_item(1, 5, 5, loot)
+    index.add_ground_item(1, 5, 5, gold)
+    assert loot["spawn_time"] == 1000
+
+    now[0] = 1010.0
+    assert index.collect_expired() == {1: [(5, 5)]}
+    assert index.get_ground_items(1, 5, 5) == [loot]
+
+    # Un item recogido antes de vencer se ignora
+    index.remove_ground_item(1, 5, 5, 0)
+    now[0] = 1060.0
+    assert index.collect_expired() == {}
+    assert index.get_metrics()["expired_items"] == 1
+
+
+@pytest.mark.asyncio
+async def test_loaded_items_keep_their_spawn_time() -> None:
+    """Los items cargados de Redis vencen según el spawn_time persistido."""
+    now = [1000.0]
+    repo = DummyRepo()
+    repo.to_load[1] = {(1, 1): [{"item_id": 1, "quantity": 1, "spawn_time": 950}]}
+    index = GroundItemIndex(max_items_per_tile=3, ground_items_repo=repo, flush_delay=60)
+    index.enable_expiry(loot_ttl=60, gold_ttl=60, clock=lambda: now[0])
+
+    await index.load_ground_items(1)
+    now[0] = 1010.0
+
+    assert index.collect_expired() == {1: [(1, 1)]}
+    assert index.get_ground_items_count(1) == 0
+    assert await index.flush() == 1
+    assert repo.saved_tiles == [(1, {(1, 1): []})]
+
+
+@pytest.mark.asyncio
+async def test_load_all_ground_items_schedules_expiry_of_every_map() -> None:
+    """Al arrancar se cargan y agendan los items de todos los mapas, no solo el 1."""
+    now = [1000.0]
+    repo = DummyRepo()
+    repo.to_load[1] = {(1, 1): [{"item_id": 1, "quantity": 1, "spawn_time": 990}]}
+    repo.to_load[7] = {(3, 3): [{"item_id": 2, "quantity": 1, "spawn_time": 950}]}
+    index = GroundItemIndex(max_items_per_tile=3, ground_items_repo=repo, flush_delay=60)
+    index.enable_expiry(loot_ttl=60, gold_ttl=60, clock=lambda: now[0])
+
+    assert await index.load_all_ground_items() == 2
+    assert index.get_ground_items_count(7) == 1
+
+    now[0] = 1010.0
+    assert index.collect_expired() == {7: [(3, 3)]}
+    assert index.get_ground_items_count(1) == 1
@@ -0,0 +1,196 @@
+"""Tests para MapResidency y la carga de mapas a demanda de MapManager."""
+
+import pytest
+
+from src.game.map_manager import MapManager
+from src.game.map_residency import MapResidency
+
+
+class FakeClock:
+    """Reloj manual para controlar el TTL."""
+
+    def __init__(self) -> None:
+        """Arranca en cero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Retorna la hora actual simulada."""
+        return self.now
+
+
+class DummyGroundRepo:
+    """Repo de ground items en memoria."""
+
+    def __init__(self) -> None:
+        """Inicializa el almacenamiento simulado."""
+        self.stored: dict[int, dict[tuple[int, int], list[dict[str, int | str | None]]]] = {}
+
+    async def save_ground_items(
+        self, map_id: int, items: dict[tuple[int, int], list[dict[str, int | str | None]]]
+    ) -> None:
+        """Guarda items simuladamente."""
+        self.stored[map_id] = dict(items)
+
+    async def save_tiles(
+        self, map_id: int, tiles: dict[tuple[int, int], list[dict[str, int | str | None]]]
+    ) -> None:
+        """Guarda tiles modificados simuladamente."""
+        stored = self.stored.setdefault(map_id, {})
+        for coords, items in tiles.items():
+            if items:
+                stored[coords] = list(items)
+            else:
+                stored.pop(coords, None)
+
+    async def load_ground_items(
+        self, map_id: int
+    ) -> dict[tuple[int, int], list[dict[str, int | str | None]]]:
+        """Carga items simuladamente."""
+        return dict(self.stored.get(map_id, {}))
+
+
+def test_ensure_loads_once_and_counts_hits() -> None:
+    """El loader se llama solo en el primer acceso; los mapas inexistentes se recuerdan."""
+    calls: list[int] = []
+
+    def loader(map_id: int) -> bool:
+        calls.append(map_id)
+        return map_id != 999
+
+    residency = MapResidency(loader)
+
+    assert residency.ensure(1)
+    assert residency.ensure(1)
+    assert not residency.ensure(999)
+    assert not residency.ensure(999)
+
+    assert calls == [1, 999]
+    metrics = residency.get_metrics()
+    assert metrics["loads"] == 1
+    assert metrics["hits"] == 1
+    assert metrics["failed_loads"] == 1
+    assert residency.resident_maps() == [1]
+
+
+def test_collect_idle_respects_ttl_and_pinned_maps() -> None:
+    """Vencen los mapas sin uso; los fijados renuevan su último uso."""
+    clock = FakeClock()
+    residency = MapResidency(lambda _map_id: True, idle_ttl=60.0, clock=clock)
+    residency.ensure(1)
+    residency.ensure(2)
+
+    clock.now = 59.0
+    assert residency.collect_idle(pinned=set()) == []
+
+    clock.now = 61.0
+    assert residency.collect_idle(pinned={1}) == [2]
+
+    residency.forget(2)
+    clock.now = 100.0
+    assert residency.collect_idle(pinned=set()) == []
+    clock.now = 121.0
+    assert residency.collect_idle(pinned=set()) == [1]
+
+
+def test_collect_idle_evicts_least_recently_used_over_cap() -> None:
+    """Por encima del límite se desalojan los menos usados que no tengan jugadores."""
+    clock = FakeClock()
+    residency = MapResidency(lambda _map_id: True, idle_ttl=1000.0, max_resident=2, clock=clock)
+    for map_id in (1, 2, 3, 4):
+        clock.now += 1
+        residency.ensure(map_id)
+    residency.ensure(1)
+
+    assert residency.collect_idle(pinned={2}) == [3, 4]
+    assert residency.get_metrics()["evictions"] == 2
+
+
+def test_prefetch_skips_resident_maps() -> None:
+    """El prefetch solo carga los mapas ausentes."""
+    residency = MapResidency(lambda _map_id: True)
+    residency.ensure(1)
+
+    assert residency.prefetch([1, 2, 3]) == 2
+    assert residency.get_metrics()["prefetches"] == 2
+
+
+def _lazy_map_manager(repo: DummyGroundRepo | None = None) -> tuple[MapManager, list[int]]:
+    map_manager = MapManager(repo)  # type: ignore[arg-type]
+    loaded: list[int] = []
+    exits = {
+        1: {(1, 100, 50): {"to_map": 2, "to_x": 1, "to_y": 50}},
+        2: {(2, 1, 50): {"to_map": 1, "to_x": 100, "to_y": 50}},
+    }
+
+    def loader(map_id: int) -> bool:
+        if map_id not in exits:
+            return False
+        loaded.append(map_id)
+        map_manager._map_sizes[map_id] = (100, 100)
+        map_manager._blocked_tiles[map_id] = {(5, 5)}
+        map_manager._exit_index.update(exits[map_id])
+        return True
+
+    map_manager.enable_lazy_loading(loader, idle_ttl=0.0)
+    return map_manager, loaded
+
+
+def test_static_data_loads_on_first_access() -> None:
+    """can_move_to carga el mapa a demanda antes de consultar bloqueados."""
+    map_manager, loaded = _lazy_map_manager()
+
+    assert not map_manager.can_move_to(1, 5, 5)
+    assert map_manager.can_move_to(1, 6, 5)
+    assert map_manager.get_exit_tile(1, 100, 50) == {"to_map": 2, "to_x": 1, "to_y": 50}
+    assert loaded == [1]
+
+
+@pytest.mark.asyncio
+async def test_activate_map_runs_hooks_once_and_prefetches_neighbors() -> None:
+    """La activación carga el contenido dinámico una vez y prefetchea vecinos por exits."""
+    map_manager, loaded = _lazy_map_manager()
+    activated: list[int] = []
+
+    async def on_load(map_id: int) -> None:
+        activated.append(map_id)
+
+    map_manager.add_map_lifecycle_hooks(on_load=on_load)
+
+    await map_manager.activate_map(1)
+    await map_manager.activate_map(1)
+
+    assert activated == [1]
+    assert loaded == [1, 2]
+    metrics = map_manager.get_residency_metrics()
+    assert metrics["active_maps"] == 1
+    assert metrics["prefetches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unload_idle_maps_persists_ground_items_and_keeps_occupied_maps() -> None:
+    """Los mapas sin jugadores se descargan persistiendo sus ground items."""
+    repo = DummyGroundRepo()
+    map_manager, _ = _lazy_map_manager(repo)
+    unloaded_hooks: list[int] = []
+
+    async def on_unload(map_id: int) -> None:
+        unloaded_hooks.append(map_id)
+
+    map_manager.add_map_lifecycle_hooks(on_unload=on_unload)
+    await map_manager.activate_map(1)
+    await map_manager.activate_map(2)
+    map_manager.add_ground_item(2, 10, 10, {"item_id": 7, "quantity": 1})
+    map_manager._player_index.add_player(1, 42, None, "Tester")  # type: ignore[arg-type]
+
+    unloaded = await map_manager.unload_idle_maps()
+
+    assert unloaded == [2]
+    assert unloaded_hooks == [2]
+    assert repo.stored[2] == {(10, 10): [{"item_id": 7, "quantity": 1}]}
+    assert map_manager.get_ground_items(2, 10, 10) == []
+    assert map_manager.get_exit_tile(1, 100, 50) is not None
+    assert 2 not in map_manager._blocked_tiles
+
+    # Al volver a activarse recupera sus items desde el repositorio
+    await map_manager.activate_map(2)
+    assert map_manager.get_ground_items(2, 10, 10) == [{"item_id": 7, "quantity": 1}]
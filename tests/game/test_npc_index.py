@@ -89,3 +89,20 @@ def test_get_all_and_by_char_index() -> None:
     assert index.get_npc_by_char_index(1, 10) is npc1
     assert index.get_npc_by_char_index(2, 20) is npc2
     assert index.get_npc_by_char_index(1, 999) is None
+
+
+def test_lookup_indexes_follow_add_and_remove() -> None:
+    """Los índices por instance_id y char_index se mantienen al agregar y remover."""
+    tile_occupation = TileOccupation()
+    index = NpcIndex(tile_occupation)
+    npc = make_npc(instance_id="npc-7", char_index=70)
+    index.add_npc(3, cast("NPC", npc))
+
+    assert index.get_npc("npc-7") is npc
+    assert index.get_npc_by_char_index(3, 70) is npc
+
+    index.remove_npc(3, "npc-7")
+
+    assert index.get_npc("npc-7") is None
+    assert index.get_npc_by_char_index(3, 70) is None
+    assert index.get_all_npcs() == []
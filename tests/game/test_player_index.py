@@ -82,3 +82,22 @@ def test_get_all_message_senders_in_map_with_exclude() -> None:
 
     senders = index.get_all_message_senders_in_map(1, exclude_user_id=1)
     assert senders == [s2]
+
+
+def test_players_in_range_follow_position_updates() -> None:
+    """La grilla refleja movimientos y bajas sin depender de Redis."""
+    index = PlayerIndex(TileOccupation())
+    index.add_player(1, 1, make_sender("s1"), "Alice")
+    index.add_player(1, 2, make_sender("s2"), "Bob")
+    index.update_position(1, 1, 50, 50)
+    index.update_position(2, 1, 60, 50)
+
+    assert sorted(index.get_players_in_range(1, 50, 50, 15)) == [1, 2]
+    assert index.get_players_in_range(1, 50, 50, 15, exclude_user_id=1) == [2]
+
+    index.update_position(2, 1, 80, 50)
+    assert index.get_players_in_range(1, 50, 50, 15) == [1]
+
+    index.remove_player(1, 1)
+    assert index.get_position(1) is None
+    assert index.get_players_in_range(1, 50, 50, 15) == []
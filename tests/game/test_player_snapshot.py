@@ -0,0 +1,31 @@
+"""Tests para MapPlayerSnapshot."""
+
+from src.game.player_snapshot import MapPlayerSnapshot
+
+
+def test_empty_snapshot_has_no_nearest() -> None:
+    """Sin jugadores no hay objetivo."""
+    snapshot = MapPlayerSnapshot(1)
+
+    assert len(snapshot) == 0
+    assert snapshot.nearest(10, 10, 8) is None
+
+
+def test_nearest_within_range() -> None:
+    """Devuelve el jugador más cercano por distancia Manhattan dentro del rango."""
+    snapshot = MapPlayerSnapshot(1)
+    snapshot.add(1, 20, 10)
+    snapshot.add(2, 13, 12)
+    snapshot.add(3, 30, 30)
+
+    assert snapshot.nearest(10, 10, 8) == (2, 13, 12)
+    assert snapshot.nearest(10, 10, 4) is None
+
+
+def test_range_is_inclusive_and_ties_keep_first() -> None:
+    """El rango es inclusive y ante empates gana el primero agregado."""
+    snapshot = MapPlayerSnapshot(1)
+    snapshot.add(5, 12, 10)
+    snapshot.add(6, 10, 12)
+
+    assert snapshot.nearest(10, 10, 2) == (5, 12, 10)
@@ -0,0 +1,47 @@
+"""Tests unitarios para SpatialGrid (consultas de proximidad en memoria)."""
+
+from src.game.spatial_grid import SpatialGrid
+
+
+def test_query_range_filters_by_chebyshev_distance() -> None:
+    """Solo devuelve entidades dentro del cuadrado de radio dado."""
+    grid: SpatialGrid[int] = SpatialGrid(cell_size=16)
+    grid.update(1, 1, 50, 50)
+    grid.update(2, 1, 65, 35)  # justo en el borde (dx=15, dy=15)
+    grid.update(3, 1, 66, 50)  # fuera (dx=16)
+
+    assert sorted(grid.query_range(1, 50, 50, 15)) == [1, 2]
+
+
+def test_query_range_is_scoped_to_map() -> None:
+    """Entidades en otro mapa con mismas coordenadas no se devuelven."""
+    grid: SpatialGrid[int] = SpatialGrid()
+    grid.update(1, 1, 10, 10)
+    grid.update(2, 2, 10, 10)
+
+    assert grid.query_range(1, 10, 10, 5) == [1]
+
+
+def test_update_moves_entity_between_cells() -> None:
+    """Mover una entidad la saca de la celda anterior."""
+    grid: SpatialGrid[str] = SpatialGrid(cell_size=4)
+    grid.update("npc", 1, 1, 1)
+    grid.update("npc", 1, 20, 20)
+
+    assert grid.query_range(1, 1, 1, 2) == []
+    assert grid.query_range(1, 20, 20, 0) == ["npc"]
+    assert grid.get_position("npc") == (1, 20, 20)
+    assert len(grid) == 1
+
+
+def test_remove_with_map_guard_keeps_newer_position() -> None:
+    """remove(map_id=...) no borra una entidad que ya está en otro mapa."""
+    grid: SpatialGrid[int] = SpatialGrid()
+    grid.update(7, 2, 30, 30)
+
+    grid.remove(7, map_id=1)
+    assert grid.get_position(7) == (2, 30, 30)
+
+    grid.remove(7)
+    assert grid.get_position(7) is None
+    assert grid.query_range(2, 30, 30, 1) == []
@@ -34,3 +34,70 @@ def test_remove_npc_by_instance() -> None:
     occ.occupy_npc(1, 2, 2, "npc-1")
     occ.remove_npc_by_instance("npc-1", map_id=1)
     assert not occ.is_occupied(1, 2, 2)
+
+
+def test_remove_player_only_on_given_map() -> None:
+    """remove_player con map_id deja los tiles de otros mapas."""
+    occ = TileOccupation()
+    occ.data[1, 1, 1] = "player:10"
+    occ.data[2, 3, 3] = "player:10"
+
+    occ.remove_player(10, map_id=1)
+
+    assert not occ.is_occupied(1, 1, 1)
+    assert occ.get_player_at(2, 3, 3) == 10
+
+
+def test_overwrite_updates_reverse_index() -> None:
+    """Pisar un tile saca al ocupante anterior de su índice inverso."""
+    occ = TileOccupation()
+    occ.occupy_npc(1, 4, 4, "npc-1")
+    occ.occupy_player(1, 4, 4, 10)
+
+    occ.remove_npc_by_instance("npc-1")
+
+    assert occ.get_player_at(1, 4, 4) == 10
+    assert occ.get_npc_at(1, 4, 4) is None
+
+
+def test_clear_map_keeps_other_maps() -> None:
+    """clear_map libera solo el mapa indicado."""
+    occ = TileOccupation()
+    occ.occupy_npc(1, 2, 2, "npc-1")
+    occ.occupy_player(1, 3, 3, 10)
+    occ.occupy_npc(2, 2, 2, "npc-2")
+
+    occ.clear_map(1)
+
+    assert not occ.is_occupied(1, 2, 2)
+    assert not occ.is_occupied(1, 3, 3)
+    assert occ.get_npc_at(2, 2, 2) == "npc-2"
+    assert dict(occ.data) == {(2, 2, 2): "npc:npc-2"}
+
+
+def test_out_of_bounds_and_resize() -> None:
+    """Coordenadas fuera de la grilla y cambios de tamaño conservan la ocupación."""
+    occ = TileOccupation()
+    occ.occupy_player(1, 150, 5, 10)
+    occ.occupy_npc(1, 50, 50, "npc-1")
+
+    occ.set_map_size(1, 200, 200)
+
+    assert occ.get_player_at(1, 150, 5) == 10
+    assert occ.get_npc_at(1, 50, 50) == "npc-1"
+    assert len(occ) == 2
+
+
+def test_data_view_behaves_like_dict() -> None:
+    """La vista ``data`` acepta etiquetas y borra como un dict."""
+    occ = TileOccupation()
+    occ.data[1, 1, 1] = "npc:npc-1"
+
+    assert (1, 1, 1) in occ.data
+    assert occ.data[1, 1, 1] == "npc:npc-1"
+    del occ.data[1, 1, 1]
+    assert (1, 1, 1) not in occ.data
+    with pytest.raises(KeyError):
+        del occ.data[1, 1, 1]
+    with pytest.raises(ValueError, match="inválida"):
+        occ.data[1, 1, 1] = "item:3"
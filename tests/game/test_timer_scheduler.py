@@ -0,0 +1,120 @@
+"""Tests unitarios para TimerScheduler."""
+
+import pytest
+
+from src.effects.effect_timer_scheduler import TimerSchedulerEffect
+from src.game.timer_scheduler import COMPACT_MIN_CANCELLED, TimerScheduler
+
+
+class FakeClock:
+    """Reloj manual para los timers."""
+
+    def __init__(self) -> None:
+        """Inicializa el reloj."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Retorna el tiempo actual."""
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_run_due_executes_in_deadline_order() -> None:
+    """Solo se ejecutan los vencidos, en orden de deadline y de alta."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    calls: list[str] = []
+    scheduler.call_later(5.0, calls.append, "b")
+    scheduler.call_later(1.0, calls.append, "a")
+    scheduler.call_later(5.0, calls.append, "c")
+    scheduler.call_later(10.0, calls.append, "d")
+
+    assert await scheduler.run_due() == 0
+    clock.now += 5.0
+    assert await scheduler.run_due() == 3
+
+    assert calls == ["a", "b", "c"]
+    assert len(scheduler) == 1
+
+
+@pytest.mark.asyncio
+async def test_coroutines_run_together_and_errors_are_isolated() -> None:
+    """Las corrutinas del lote corren juntas; un error no corta el resto."""
+    scheduler = TimerScheduler(clock=FakeClock())
+    done: list[int] = []
+
+    async def ok(value: int) -> None:
+        done.append(value)
+
+    async def fail() -> None:
+        raise RuntimeError
+
+    def fail_sync() -> None:
+        raise RuntimeError
+
+    scheduler.call_later(0.0, ok, 1)
+    scheduler.call_later(0.0, fail)
+    scheduler.call_later(0.0, fail_sync)
+    scheduler.call_later(0.0, ok, 2)
+
+    assert await scheduler.run_due() == 4
+    assert done == [1, 2]
+    assert scheduler.get_metrics()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_timers_added_while_running_wait_for_next_run() -> None:
+    """Un timer agendado desde un callback no corre en el mismo lote."""
+    scheduler = TimerScheduler(clock=FakeClock())
+    calls: list[str] = []
+
+    def reschedule() -> None:
+        calls.append("first")
+        scheduler.call_later(0.0, calls.append, "second")
+
+    scheduler.call_later(0.0, reschedule)
+
+    await scheduler.run_due()
+    assert calls == ["first"]
+    await scheduler.run_due()
+    assert calls == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_timers_are_skipped_and_compacted() -> None:
+    """Los cancelados no se ejecutan y el heap se compacta al acumularlos."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    calls: list[int] = []
+    handles = [scheduler.call_later(1.0, calls.append, i) for i in range(COMPACT_MIN_CANCELLED + 1)]
+    keep = scheduler.call_later(1.0, calls.append, -1)
+
+    for handle in handles:
+        handle.cancel()
+        handle.cancel()  # idempotente
+
+    assert len(scheduler) == 1
+    assert scheduler.get_metrics()["cancelled_in_heap"] == 0
+    clock.now += 1.0
+    assert await scheduler.run_due() == 1
+    assert calls == [-1]
+    keep.cancel()  # ya ejecutado: no-op
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_lateness() -> None:
+    """El retraso respecto del deadline se registra por timer."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    scheduler.call_later(1.0, lambda: None)
+    clock.now += 1.25
+
+    effect = TimerSchedulerEffect(scheduler)
+    await effect.apply(0, None, None)  # type: ignore[arg-type]
+
+    metrics = effect.get_metrics()
+    assert metrics["executed"] == 1
+    assert metrics["pending"] == 0
+    assert 240 <= metrics["lateness_max_ms"] <= 260
+    assert effect.get_name() == "TimerScheduler"
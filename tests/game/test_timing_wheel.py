@@ -0,0 +1,43 @@
+"""Tests unitarios para TimingWheel."""
+
+from src.game.timing_wheel import TimingWheel
+
+
+def test_advance_returns_only_expired_values() -> None:
+    """Los valores vencen al alcanzar su deadline, no antes."""
+    wheel: TimingWheel[str] = TimingWheel(1000.0)
+    wheel.schedule(1005.0, "a")
+    wheel.schedule(1010.5, "b")
+
+    assert wheel.advance(1004.9) == []
+    assert wheel.advance(1005.0) == ["a"]
+    assert wheel.advance(1010.9) == []
+    assert wheel.advance(1011.0) == ["b"]
+    assert len(wheel) == 0
+
+
+def test_past_deadline_expires_on_next_advance() -> None:
+    """Un deadline ya pasado vence en el próximo avance."""
+    wheel: TimingWheel[int] = TimingWheel(1000.0)
+    wheel.schedule(990.0, 1)
+
+    assert len(wheel) == 1
+    assert wheel.advance(1000.0) == [1]
+
+
+def test_cascades_through_levels_and_overflow() -> None:
+    """Deadlines en niveles superiores y fuera de rango vencen a tiempo."""
+    # 4 slots x 2 niveles = 16 ticks de rango antes del overflow
+    wheel: TimingWheel[int] = TimingWheel(0.0, slot_bits=2, levels=2)
+    deadlines = [3, 7, 15, 16, 40, 100]
+    for deadline in deadlines:
+        wheel.schedule(float(deadline), deadline)
+
+    expired: list[int] = []
+    for now in range(101):
+        for value in wheel.advance(float(now)):
+            assert value == now
+            expired.append(value)
+
+    assert expired == deadlines
+    assert len(wheel) == 0
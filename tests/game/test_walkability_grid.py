@@ -0,0 +1,53 @@
+"""Tests para WalkabilityGrid."""
+
+from src.game.walkability_grid import WalkabilityGrid
+
+
+def test_blocked_and_doors_are_not_walkable() -> None:
+    """Tiles bloqueados y puertas cerradas no son transitables."""
+    grid = WalkabilityGrid(10, 10, blocked=[(2, 3)], closed_doors=[(5, 5)])
+
+    assert grid.is_walkable(1, 1) is True
+    assert grid.is_walkable(2, 3) is False
+    assert grid.is_walkable(5, 5) is False
+
+
+def test_out_of_bounds_is_not_walkable() -> None:
+    """Las coordenadas son 1-based y fuera del mapa no se transita."""
+    grid = WalkabilityGrid(10, 10)
+
+    assert grid.is_walkable(10, 10) is True
+    assert grid.is_walkable(0, 5) is False
+    assert grid.is_walkable(11, 5) is False
+
+
+def test_index_roundtrip() -> None:
+    """Index y coords son inversas."""
+    grid = WalkabilityGrid(7, 4)
+
+    assert grid.index(1, 1) == 0
+    assert grid.coords(grid.index(7, 4)) == (7, 4)
+
+
+def test_door_toggle_keeps_static_block() -> None:
+    """Abrir una puerta no desbloquea un tile que además es pared."""
+    grid = WalkabilityGrid(10, 10, blocked=[(3, 3)])
+
+    grid.set_door(3, 3, closed=True)
+    grid.set_door(3, 3, closed=False)
+    grid.set_door(4, 4, closed=True)
+
+    assert grid.is_walkable(3, 3) is False
+    assert grid.is_walkable(4, 4) is False
+    grid.set_door(4, 4, closed=False)
+    assert grid.is_walkable(4, 4) is True
+
+
+def test_door_change_bumps_version() -> None:
+    """Cada cambio de puerta incrementa la versión de la grilla."""
+    grid = WalkabilityGrid(10, 10)
+
+    grid.set_door(4, 4, closed=True)
+    grid.set_door(4, 4, closed=False)
+
+    assert grid.version == 2
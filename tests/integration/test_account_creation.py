@@ -72,6 +72,7 @@ async def test_task_create_account_success() -> None:  # noqa: PLR0914, PLR0915
     redis_client_mock.hget = AsyncMock(return_value=None)
     redis_client_mock.pipeline = MagicMock()
     player_repo.redis = redis_client_mock
+    player_repo.inventory_cache = None
 
     account_repo = MagicMock(spec=AccountRepository)
     account_repo.create_account = AsyncMock(return_value=1)
@@ -0,0 +1,66 @@
+"""Tests para fan_out_packet."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.messaging.message_sender import MessageSender
+from src.messaging.packet_fanout import fan_out_packet
+from src.network.client_connection import ClientConnection
+
+
+def _make_sender(coalesce_writes: bool) -> tuple[MessageSender, MagicMock]:
+    """Crea un MessageSender real sobre un writer mockeado."""
+    writer = MagicMock()
+    writer.get_extra_info.return_value = ("127.0.0.1", 12345)
+    writer.drain = AsyncMock()
+    writer.transport.get_write_buffer_size.return_value = 0
+    connection = ClientConnection(MagicMock(), writer, coalesce_writes=coalesce_writes)
+    return MessageSender(connection), writer
+
+
+@pytest.mark.asyncio
+async def test_fan_out_direct_connections_write_same_bytes() -> None:
+    """Cada conexión directa recibe exactamente el buffer codificado."""
+    pairs = [_make_sender(coalesce_writes=False) for _ in range(3)]
+
+    delivered = await fan_out_packet(b"\x05\x01\x02", [sender for sender, _ in pairs])
+
+    assert delivered == 3
+    for _, writer in pairs:
+        writer.write.assert_called_once_with(b"\x05\x01\x02")
+        writer.drain.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_coalesced_connections_enqueue_without_drain() -> None:
+    """Las conexiones coalescidas encolan y escriben en la siguiente iteración."""
+    sender, writer = _make_sender(coalesce_writes=True)
+
+    delivered = await fan_out_packet(b"\x05\x01\x02", [sender])
+
+    assert delivered == 1
+    writer.write.assert_not_called()
+    await asyncio.sleep(0)
+    writer.write.assert_called_once_with(b"\x05\x01\x02")
+    writer.drain.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fan_out_continues_after_failed_connection() -> None:
+    """Un error en un destinatario no impide el envío al resto."""
+    failing, failing_writer = _make_sender(coalesce_writes=False)
+    failing_writer.drain.side_effect = ConnectionResetError("peer reset")
+    healthy, healthy_writer = _make_sender(coalesce_writes=False)
+
+    delivered = await fan_out_packet(b"\x07", [failing, healthy])
+
+    assert delivered == 1
+    healthy_writer.write.assert_called_once_with(b"\x07")
+
+
+@pytest.mark.asyncio
+async def test_fan_out_without_recipients() -> None:
+    """Sin destinatarios no se envía nada."""
+    assert await fan_out_packet(b"\x07", []) == 0
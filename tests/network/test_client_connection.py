@@ -1,10 +1,13 @@
 """Tests para la clase ClientConnection."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.network.client_connection import ClientConnection
+from src.network.packet_framer import FramingError
+from src.network.packet_id import ClientPacketID, ServerPacketID
 
 
 def test_client_connection_initialization() -> None:
@@ -97,3 +100,178 @@ async def test_client_connection_multiple_sends() -> None:
 
     assert writer.write.call_count == 3
     assert writer.drain.call_count == 3
+
+
+def _make_streaming_connection(chunks: list[bytes], ssl_object: object = None) -> ClientConnection:
+    """Crea una ClientConnection cuyo reader devuelve ``chunks`` y luego EOF."""
+    writer = MagicMock()
+    writer.get_extra_info.side_effect = lambda key: (
+        ssl_object if key == "ssl_object" else ("127.0.0.1", 12345)
+    )
+    reader = MagicMock()
+    reader.read = AsyncMock(side_effect=[*chunks, b""])
+    return ClientConnection(reader, writer)
+
+
+@pytest.mark.asyncio
+async def test_iter_packets_splits_coalesced_packets() -> None:
+    """Un único recv con varios packets produce un packet por cada uno."""
+    connection = _make_streaming_connection(
+        [bytes([ClientPacketID.WALK, 1, ClientPacketID.ATTACK])]
+    )
+
+    packets = [packet async for packet in connection.iter_packets()]
+
+    assert packets == [bytes([ClientPacketID.WALK, 1]), bytes([ClientPacketID.ATTACK])]
+
+
+@pytest.mark.asyncio
+async def test_iter_packets_joins_split_packet() -> None:
+    """Un packet partido entre dos recv se entrega una sola vez, completo."""
+    connection = _make_streaming_connection(
+        [
+            bytes([ClientPacketID.WALK]),
+            bytes([3, ClientPacketID.PING]),
+        ]
+    )
+
+    packets = [packet async for packet in connection.iter_packets()]
+
+    assert packets == [bytes([ClientPacketID.WALK, 3]), bytes([ClientPacketID.PING])]
+
+
+@pytest.mark.asyncio
+async def test_iter_packets_passes_tls_hello_raw() -> None:
+    """Un ClientHello TLS sin SSL habilitado no pasa por el framer."""
+    hello = bytes([0x16, 0x03, 0x01, 0x00, 0x05])
+    connection = _make_streaming_connection([hello, bytes([ClientPacketID.PING])])
+
+    packets = [packet async for packet in connection.iter_packets()]
+
+    assert packets == [hello]
+
+
+@pytest.mark.asyncio
+async def test_iter_packets_raises_on_unknown_packet() -> None:
+    """Un packet_id desconocido corta la iteración con FramingError."""
+    connection = _make_streaming_connection([bytes([0xFF, 0x00])])
+
+    with pytest.raises(FramingError):
+        _ = [packet async for packet in connection.iter_packets()]
+
+
+def _make_coalescing_connection(
+    transport_buffer_size: int = 0, send_high_watermark: int = 1024
+) -> tuple[ClientConnection, MagicMock]:
+    """Crea una ClientConnection en modo coalescido con un writer mockeado."""
+    writer = MagicMock()
+    writer.get_extra_info.return_value = None
+    writer.drain = AsyncMock()
+    writer.transport.get_write_buffer_size.return_value = transport_buffer_size
+    connection = ClientConnection(
+        MagicMock(), writer, coalesce_writes=True, send_high_watermark=send_high_watermark
+    )
+    return connection, writer
+
+
+@pytest.mark.asyncio
+async def test_coalesced_sends_are_written_once_per_loop_iteration() -> None:
+    """Varios send en la misma iteración del loop producen un único write."""
+    connection, writer = _make_coalescing_connection()
+
+    await connection.send(b"\x01\x02")
+    await connection.send(b"\x03")
+    await connection.send(b"\x04\x05")
+    writer.write.assert_not_called()
+
+    await asyncio.sleep(0)
+
+    writer.write.assert_called_once_with(b"\x01\x02\x03\x04\x05")
+    writer.drain.assert_not_called()
+    metrics = connection.get_send_metrics()
+    assert metrics["flushes"] == 1
+    assert metrics["packets_sent"] == 3
+    assert metrics["max_packets_per_flush"] == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_and_drains() -> None:
+    """flush() escribe lo encolado de inmediato y espera drain."""
+    connection, writer = _make_coalescing_connection()
+
+    await connection.send(b"\x01")
+    await connection.flush()
+
+    writer.write.assert_called_once_with(b"\x01")
+    writer.drain.assert_called_once()
+
+    await asyncio.sleep(0)
+    writer.write.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_drops_oldest_position_updates_only() -> None:
+    """Sobre el watermark se descartan posiciones viejas, nunca otros packets."""
+    connection, writer = _make_coalescing_connection(send_high_watermark=12)
+    move_old = bytes([ServerPacketID.CHARACTER_MOVE, 1, 0, 10, 10])
+    stats = bytes([ServerPacketID.UPDATE_USER_STATS]) + b"\x00" * 6
+    move_new = bytes([ServerPacketID.CHARACTER_MOVE, 1, 0, 11, 10])
+
+    await connection.send(move_old)
+    await connection.send(stats)
+    await connection.send(move_new)
+    await asyncio.sleep(0)
+
+    writer.write.assert_called_once_with(stats + move_new)
+    assert connection.get_send_metrics()["dropped_packets"] == 1
+
+
+@pytest.mark.asyncio
+async def test_backpressure_keeps_last_position_of_each_character() -> None:
+    """Con moves intercalados solo se descartan los reemplazados del mismo personaje."""
+    connection, writer = _make_coalescing_connection(send_high_watermark=12)
+    moves = [
+        bytes([ServerPacketID.CHARACTER_MOVE, 1, 0, 10, 10]),
+        bytes([ServerPacketID.CHARACTER_MOVE, 2, 0, 20, 20]),
+        bytes([ServerPacketID.CHARACTER_MOVE, 1, 0, 11, 10]),
+        bytes([ServerPacketID.CHARACTER_MOVE, 2, 0, 21, 20]),
+        bytes([ServerPacketID.CHARACTER_MOVE, 3, 0, 30, 30]),
+    ]
+
+    for move in moves:
+        await connection.send(move)
+    await asyncio.sleep(0)
+
+    writer.write.assert_called_once_with(moves[2] + moves[3] + moves[4])
+    assert connection.get_send_metrics()["dropped_packets"] == 2
+
+
+@pytest.mark.asyncio
+async def test_backpressure_waits_for_drain_when_transport_is_full() -> None:
+    """Con el transport saturado se espera drain antes de escribir."""
+    connection, writer = _make_coalescing_connection(transport_buffer_size=4096)
+
+    await connection.send(b"\x01")
+    await asyncio.sleep(0)
+    writer.write.assert_not_called()
+
+    writer.transport.get_write_buffer_size.return_value = 0
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    writer.drain.assert_called_once()
+    writer.write.assert_called_once_with(b"\x01")
+    assert connection.get_send_metrics()["backpressure_waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_close_writes_pending_before_closing() -> None:
+    """close() no pierde lo encolado (ej: mensaje de error + desconexión)."""
+    connection, writer = _make_coalescing_connection()
+
+    await connection.send(b"\x01\x02")
+    connection.close()
+    await asyncio.sleep(0)
+
+    writer.write.assert_called_once_with(b"\x01\x02")
+    writer.close.assert_called_once()
@@ -0,0 +1,234 @@
+"""Tests del codec de paquetes precompilado.
+
+Los bytes esperados se generaron con los builders basados en ``PacketBuilder``
+(antes de migrarlos a ``PacketCodec``): cualquier diferencia es un cambio de
+protocolo.
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+from src.models.clan import Clan
+from src.network import (
+    msg_audio,
+    msg_character,
+    msg_clan,
+    msg_console,
+    msg_inventory,
+    msg_map,
+    msg_player_stats,
+    msg_session,
+    msg_skills,
+    msg_status_effects,
+    msg_user_commerce,
+    msg_visual_effects,
+)
+from src.network.packet_builder import PacketBuilder
+from src.network.packet_codec import (
+    BYTE,
+    FLOAT,
+    INT16,
+    INT32,
+    SERVER_PACKET_CODECS,
+    STRING,
+    PacketCodec,
+)
+from src.network.packet_id import ServerPacketID
+
+COMMERCE_ITEMS = [
+    (1, 38, "Espada", 5, 150, 500, 2, 10, 5, 0, 0),
+    (2, 40, "", 1, -1, 0, 0, 0, 0, 0, 0),
+]
+
+GOLDEN_PACKETS = [
+    (msg_audio.build_play_midi_response, (255,), "26ff"),
+    (msg_audio.build_play_wave_response, (12, 50, 77), "270c324d"),
+    (msg_audio.build_play_wave_response, (3,), "27030000"),
+    (
+        msg_character.build_character_change_response,
+        (1234, 1, 2, 3, 4, 5, 6, -1, 32767),
+        "22d2040100020003040005000600ffffff7f",
+    ),
+    (
+        msg_character.build_character_create_response,
+        (-5, 56, 12, 4, 50, 51, 10, 11, 12, 13, -1, "Pérez ☃", 2, 3),
+        "1dfbff38000c000432330a000b000c000d00ffff070050e972657a203f0203",
+    ),
+    (
+        msg_character.build_character_create_response,
+        (1, 2, 3, 1, 4, 5),
+        "1d0100020003000104050000000000000000000000000000",
+    ),
+    (msg_character.build_character_move_response, (500, 99, 100), "20f4016364"),
+    (msg_character.build_character_remove_response, (-32768,), "1e0080"),
+    (msg_console.build_console_msg_response, ("Hola ñandú", 3), "180a00486f6c6120f1616e64fa03"),
+    (msg_console.build_console_msg_response, ("",), "18000007"),
+    (msg_console.build_error_msg_response, ("Error €",), "3707004572726f72203f"),
+    (
+        msg_inventory.build_change_inventory_slot_response,
+        (20, 38, "Espada", 1000, True, 500, 2, 10, 5, 0, 0, 12.5),
+        "2f1426000600457370616461e80301f401020a0005000000000000004841",
+    ),
+    (
+        msg_inventory.build_change_bank_slot_response,
+        (1, 38, "Poción", 5, 500, 11, 0, 0, 3, 1),
+        "300126000600506f6369f36e0500f4010b0000000003000100",
+    ),
+    (
+        msg_inventory.build_change_npc_inventory_slot_response,
+        (3, "Arco", 1, 99.75, 600, 40, 4, 8, 4, 0, 0),
+        "3b0304004172636f01000080c74258022800040800040000000000",
+    ),
+    (
+        msg_inventory.build_change_spell_slot_response,
+        (35, 1000, "Dardo mágico"),
+        "3123e8030c00446172646f206de16769636f",
+    ),
+    (msg_inventory.build_commerce_end_response, (), "05"),
+    (
+        msg_inventory.build_commerce_init_response,
+        (7, COMMERCE_ITEMS),
+        (
+            "07070002012600060045737061646105009600f401020a00050000000000"
+            "02280000000100ffff0000000000000000000000"
+        ),
+    ),
+    (msg_inventory.build_commerce_init_response, (7, []), "07070000"),
+    (msg_map.build_block_position_response, (10, 20, True), "250a1401"),
+    (msg_map.build_block_position_response, (10, 20, False), "250a1400"),
+    (msg_map.build_change_map_response, (290, 7), "1522010700"),
+    (msg_map.build_object_create_response, (1, 2, 20000), "230102204e"),
+    (msg_map.build_object_delete_response, (1, 2), "240102"),
+    (msg_map.build_pos_update_response, (0, 255), "1600ff"),
+    (msg_player_stats.build_update_bank_gold_response, (2147483647,), "13ffffff7f"),
+    (msg_player_stats.build_update_dexterity_response, (18,), "6612"),
+    (msg_player_stats.build_update_exp_response, (-1,), "14ffffffff"),
+    (msg_player_stats.build_update_gold_response, (123456,), "1240e20100"),
+    (msg_player_stats.build_update_hp_response, (-10,), "11f6ff"),
+    (msg_player_stats.build_update_hunger_and_thirst_response, (100, 50, 100, 0), "3c64326400"),
+    (msg_player_stats.build_update_mana_response, (32767,), "10ff7f"),
+    (msg_player_stats.build_update_sta_response, (0,), "0f0000"),
+    (msg_player_stats.build_update_strength_and_dexterity_response, (35, 36), "642324"),
+    (msg_player_stats.build_update_strength_response, (40,), "6528"),
+    (
+        msg_player_stats.build_update_user_stats_response,
+        (40000, -40000, 100, 50, 300, 10, 5000, 13, 20000, 15000),
+        "2dff7f0080640032002c010a00881300000d204e0000983a0000",
+    ),
+    (msg_session.build_attributes_response, (18, 17, 16, 15, 14), "321211100f0e"),
+    (msg_session.build_dice_roll_response, (6, 7, 8, 9, 10), "43060708090a"),
+    (msg_session.build_logged_response, (5,), "0005"),
+    (msg_session.build_pong_response, (), "58"),
+    (msg_session.build_user_char_index_in_server_response, (4242,), "1c9210"),
+    (
+        msg_skills.build_update_skills_response,
+        (1, 2, 3, 4, 5, 6, 7, 8, 100),
+        "47010002000400030005000600070008006400",
+    ),
+    (msg_status_effects.build_blind_response, (), "38"),
+    (msg_status_effects.build_blind_no_more_response, (), "45"),
+    (msg_status_effects.build_dumb_response, (), "39"),
+    (msg_status_effects.build_dumb_no_more_response, (), "46"),
+    (msg_status_effects.build_paralize_ok_response, (), "52"),
+    (msg_status_effects.build_rest_ok_response, (), "36"),
+    (msg_status_effects.build_set_invisible_response, (77, True), "424d0001"),
+    (msg_status_effects.build_set_invisible_response, (77, False), "424d0000"),
+    (
+        msg_status_effects.build_update_tag_and_status_response,
+        (77, 1, "Gandalf <Clan>"),
+        "594d00010e0047616e64616c66203c436c616e3e",
+    ),
+    (msg_user_commerce.build_user_commerce_end_response, (), "0a"),
+    (msg_user_commerce.build_user_commerce_init_response, ("Ñoño",), "090400d16ff16f"),
+    (msg_visual_effects.build_create_fx_response, (9, 16, -1), "2c09001000ffff"),
+]
+
+
+@pytest.mark.parametrize(
+    ("builder", "args", "expected_hex"),
+    GOLDEN_PACKETS,
+    ids=[f"{builder.__name__}-{index}" for index, (builder, _, _) in enumerate(GOLDEN_PACKETS)],
+)
+def test_builders_match_golden_bytes(
+    builder: Callable[..., bytes], args: tuple[object, ...], expected_hex: str
+) -> None:
+    """Cada builder produce exactamente los bytes del builder anterior."""
+    assert builder(*args) == bytes.fromhex(expected_hex)
+
+
+def test_clan_details_matches_golden_bytes() -> None:
+    """CLAN_DETAILS (todos sus strings y contadores) mantiene el formato."""
+    clan = Clan(
+        clan_id=1,
+        name="Los Ñandúes",
+        description="Desc",
+        leader_id=1,
+        leader_username="Líder",
+        created_at=86400.0 * 365,
+        website="http://x.com",
+        wars={2},
+        alliances={3, 4},
+    )
+
+    assert msg_clan.build_clan_details_response(clan) == bytes.fromhex(
+        "500b004c6f7320d1616e64fa657305004ced6465720a0030312f30312f31393731"
+        "05004ced6465720c00687474703a2f2f782e636f6d010000000006004e455554524f"
+        "01000000020000000300302f350000040044657363"
+    )
+
+
+def test_codec_matches_packet_builder() -> None:
+    """Un esquema con todos los tipos codifica igual que PacketBuilder."""
+    codec = PacketCodec("TEST", 99, (BYTE, INT16, STRING, INT32, FLOAT, STRING))
+    expected = (
+        PacketBuilder()
+        .add_byte(99)
+        .add_byte(7)
+        .add_int16(-2)
+        .add_unicode_string("añejo")
+        .add_int32(-70000)
+        .add_float(1.5)
+        .add_unicode_string("")
+        .to_bytes()
+    )
+
+    assert codec.encode(7, -2, "añejo", -70000, 1.5, "") == expected
+
+
+def test_reused_buffer_grows_and_does_not_leak_previous_packet() -> None:
+    """El buffer crece para strings largos y un paquete corto no arrastra bytes viejos."""
+    codec = SERVER_PACKET_CODECS[ServerPacketID.CONSOLE_MSG]
+    long_message = "x" * 1000
+
+    long_packet = codec.encode(long_message, 1)
+    short_packet = codec.encode("hi", 2)
+
+    assert len(long_packet) == 1 + 2 + 1000 + 1
+    assert long_packet[-1] == 1
+    assert short_packet == bytes.fromhex("1802006869") + b"\x02"
+
+
+def test_out_of_range_values_raise_value_error() -> None:
+    """Los valores que no entran en su tipo fallan igual que con PacketBuilder."""
+    with pytest.raises(ValueError, match="POS_UPDATE"):
+        msg_map.build_pos_update_response(256, 1)
+    with pytest.raises(ValueError, match="CONSOLE_MSG"):
+        msg_console.build_console_msg_response("hola", -1)
+    with pytest.raises(ValueError, match="CONSOLE_MSG"):
+        SERVER_PACKET_CODECS[ServerPacketID.CONSOLE_MSG].encode("hola")
+
+
+def test_unknown_field_type_is_rejected() -> None:
+    """El esquema se valida al compilarse."""
+    with pytest.raises(ValueError, match="desconocidos"):
+        PacketCodec("TEST", 1, (BYTE, "q"))
+
+
+def test_every_schema_compiles_to_a_codec() -> None:
+    """Todos los paquetes del esquema tienen un codec con su PacketID."""
+    for packet_id, codec in SERVER_PACKET_CODECS.items():
+        assert codec.name == packet_id.name
+        if STRING not in codec.fields:
+            values = [0.0 if field == FLOAT else 0 for field in codec.fields]
+            assert codec.encode(*values)[0] == packet_id
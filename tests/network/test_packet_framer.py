@@ -18,6 +18,7 @@ from src.network.packet_framer import (
     PacketFramer,
     UnknownPacketError,
 )
+from src.network.packet_handlers import TASK_HANDLERS
 from src.network.packet_id import ClientPacketID
 
 
@@ -145,6 +146,19 @@ class TestUnknownPacket:
         assert exc.value.packet_id == 0xFF
 
 
+@pytest.mark.parametrize("packet_id", sorted(TASK_HANDLERS))
+def test_every_handled_packet_id_is_framed(packet_id: int) -> None:
+    """Todo packet con Task tiene longitud conocida: si no, el cliente se desconecta."""
+    framer = PacketFramer()
+    # Payload de ceros: alcanza para cualquier packet (strings de largo 0)
+    framer.feed(bytes([packet_id]) + bytes(64))
+
+    packet = framer.next_packet()
+
+    assert packet is not None
+    assert packet[0] == packet_id
+
+
 class TestBufferOverflowProtection:
     def test_buffer_overflow_raises(self) -> None:
         framer = PacketFramer()
@@ -229,3 +243,60 @@ class TestEmptyAndNoOpFeeds:
     def test_next_packet_on_empty_buffer(self) -> None:
         framer = PacketFramer()
         assert framer.next_packet() is None
+
+
+class TestDrain:
+    """Un recv con N packets debe traducirse en N packets despachables."""
+
+    def test_drain_returns_all_complete_packets(self) -> None:
+        framer = PacketFramer()
+        framer.feed(
+            bytes([ClientPacketID.WALK, 0x01, ClientPacketID.ATTACK, ClientPacketID.USE_ITEM, 3])
+        )
+
+        assert framer.drain() == [
+            bytes([ClientPacketID.WALK, 0x01]),
+            bytes([ClientPacketID.ATTACK]),
+            bytes([ClientPacketID.USE_ITEM, 3]),
+        ]
+        assert framer.buffer_size == 0
+
+    def test_drain_keeps_partial_tail_for_next_feed(self) -> None:
+        framer = PacketFramer()
+        talk = _talk_packet("hola")
+        framer.feed(bytes([ClientPacketID.PING]) + talk[:4])
+
+        assert framer.drain() == [bytes([ClientPacketID.PING])]
+        assert framer.buffer_size == 4
+
+        framer.feed(talk[4:] + bytes([ClientPacketID.PING]))
+        assert framer.drain() == [talk, bytes([ClientPacketID.PING])]
+        assert framer.buffer_size == 0
+
+    def test_consumed_bytes_do_not_count_against_buffer_limit(self) -> None:
+        framer = PacketFramer()
+        chunk = bytes([ClientPacketID.PING]) * (PacketFramer.MAX_BUFFER_BYTES - 1) + bytes(
+            [ClientPacketID.WALK]
+        )
+        framer.feed(chunk)
+        assert len(framer.drain()) == PacketFramer.MAX_BUFFER_BYTES - 1
+
+        # Solo queda 1 byte pendiente: la compactación evita un overflow espurio.
+        framer.feed(bytes([0x02]) + bytes([ClientPacketID.PING]) * 100)
+        assert len(framer.drain()) == 101
+
+    def test_metrics_track_reads_and_packets(self) -> None:
+        framer = PacketFramer()
+        framer.feed(bytes([ClientPacketID.PING, ClientPacketID.PING, ClientPacketID.WALK]))
+        framer.drain()
+        framer.feed(bytes([0x01]))
+        framer.drain()
+
+        metrics = framer.get_metrics()
+        assert metrics["reads"] == 2
+        assert metrics["bytes_received"] == 4
+        assert metrics["packets_framed"] == 3
+        assert metrics["max_packets_per_read"] == 2
+        assert metrics["partial_reads"] == 1
+        assert metrics["avg_packets_per_read"] == pytest.approx(1.5)
+        assert metrics["buffered_bytes"] == 0
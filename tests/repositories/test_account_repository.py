@@ -1,12 +1,18 @@
 """Tests directos para AccountRepository."""
 
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
 
 import pytest
+from argon2 import PasswordHasher
 
 from src.repositories.account_repository import AccountRepository
+from src.utils.redis_config import RedisKeys
 from tests.conftest import create_mock_redis_client
 
+if TYPE_CHECKING:
+    from src.utils.redis_client import RedisClient
+
 
 @pytest.mark.asyncio
 class TestAccountRepository:
@@ -87,3 +93,118 @@ class TestAccountRepository:
         account = await repo.get_account("nonexistent")
 
         assert account is None
+
+
+@pytest.mark.asyncio
+async def test_get_account_by_user_id_uses_index(redis_client: RedisClient) -> None:
+    """La búsqueda por user_id resuelve por el índice, sin KEYS."""
+    repo = AccountRepository(redis_client)
+    await repo.create_account("alice", "hash", "a@example.com")
+    bob_id = await repo.create_account("bob", "hash", "b@example.com", {"race": 2, "head": 7})
+    redis_client.keys = AsyncMock(side_effect=AssertionError("KEYS no debe usarse"))
+
+    account = await repo.get_account_by_user_id(bob_id)
+
+    assert account is not None
+    assert account["username"] == "bob"
+    assert await repo.get_account_by_user_id(999) is None
+
+
+@pytest.mark.asyncio
+async def test_appearance_is_cached_and_invalidated(redis_client: RedisClient) -> None:
+    """La apariencia se sirve del LRU y se invalida al escribir la cuenta."""
+    repo = AccountRepository(redis_client)
+    user_id = await repo.create_account("carol", "hash", "c@example.com", {"race": 3, "head": 9})
+
+    first = await repo.get_account_appearance(user_id)
+    redis_client.hget = AsyncMock(side_effect=AssertionError("debe usar el cache"))
+    second = await repo.get_account_appearance(user_id)
+
+    assert first == second == {"char_race": "3", "char_head": "9", "username": "carol"}
+
+    await repo.set_gm_status("carol", is_gm=True)
+    with pytest.raises(AssertionError, match="debe usar el cache"):
+        await repo.get_account_appearance(user_id)
+
+
+@pytest.mark.asyncio
+async def test_appearance_cache_evicts_least_recently_used(redis_client: RedisClient) -> None:
+    """El LRU descarta la entrada menos usada al superar la capacidad."""
+    repo = AccountRepository(redis_client, appearance_cache_size=2)
+    ids = [await repo.create_account(f"user{n}", "hash", "x@example.com") for n in range(3)]
+
+    await repo.get_account_appearance(ids[0])
+    await repo.get_account_appearance(ids[1])
+    await repo.get_account_appearance(ids[0])
+    await repo.get_account_appearance(ids[2])
+
+    assert list(repo._appearance_cache) == [ids[0], ids[2]]
+
+
+@pytest.mark.asyncio
+async def test_get_account_appearances_batches_misses(redis_client: RedisClient) -> None:
+    """Las apariencias de varias cuentas se resuelven juntas y quedan cacheadas."""
+    repo = AccountRepository(redis_client)
+    dave = await repo.create_account("dave", "hash", "d@example.com", {"race": 1, "head": 4})
+    erin = await repo.create_account("erin", "hash", "e@example.com", {"race": 2, "head": 5})
+    await repo.get_account_appearance(dave)
+
+    appearances = await repo.get_account_appearances([dave, erin, 999])
+
+    assert appearances == {
+        dave: {"char_race": "1", "char_head": "4", "username": "dave"},
+        erin: {"char_race": "2", "char_head": "5", "username": "erin"},
+    }
+    assert list(repo._appearance_cache) == [dave, erin]
+
+
+@pytest.mark.asyncio
+async def test_backfill_indexes_existing_accounts(redis_client: RedisClient) -> None:
+    """El backfill indexa cuentas creadas antes del índice."""
+    for user_id, username in ((1, "legacy1"), (2, "legacy2")):
+        await redis_client.hset(
+            RedisKeys.account_data(username),
+            mapping={"user_id": str(user_id), "username": username},
+        )
+    repo = AccountRepository(redis_client)
+    assert await repo.get_username_by_user_id(2) is None
+
+    indexed = await repo.backfill_user_id_index()
+    account = await repo.get_account_by_user_id(2)
+
+    assert indexed == 2
+    assert account is not None
+    assert account["username"] == "legacy2"
+
+
+@pytest.mark.asyncio
+async def test_index_miss_backfills_once(redis_client: RedisClient) -> None:
+    """Una cuenta sin indexar se encuentra igual y el índice se repara una sola vez."""
+    await redis_client.hset(
+        RedisKeys.account_data("legacy"),
+        mapping={"user_id": "5", "username": "legacy", "char_race": "2", "char_head": "7"},
+    )
+    repo = AccountRepository(redis_client)
+
+    appearances = await repo.get_account_appearances([5])
+
+    assert appearances == {5: {"char_race": "2", "char_head": "7", "username": "legacy"}}
+    assert await repo.get_username_by_user_id(5) == "legacy"
+
+    redis_client.scan_keys = AsyncMock(side_effect=AssertionError("no debe volver a escanear"))
+    assert await repo.get_account_by_user_id(99) is None
+
+
+@pytest.mark.asyncio
+async def test_verify_password_rehashes_old_parameters(redis_client: RedisClient) -> None:
+    """Un login válido con hash de parámetros viejos lo regenera."""
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8_192, parallelism=1).hash("secreto")
+    repo = AccountRepository(redis_client)
+    await repo.create_account("dave", old_hash, "d@example.com")
+
+    assert await repo.verify_password("dave", "secreto") is True
+
+    account = await repo.get_account("dave")
+    assert account is not None
+    assert account["password_hash"] != old_hash
+    assert await repo.verify_password("dave", "secreto") is True
@@ -0,0 +1,83 @@
+"""Tests para el identity map en memoria de ClanRepository."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.models.clan import Clan, ClanMember
+from src.repositories.clan_repository import ClanRepository
+
+if TYPE_CHECKING:
+    from src.utils.redis_client import RedisClient
+
+
+@pytest.mark.asyncio
+async def test_clan_is_loaded_once_and_served_from_memory(redis_client: RedisClient) -> None:
+    """Tras la primera lectura el clan y la membresía salen de memoria."""
+    await ClanRepository(redis_client).save_clan(
+        Clan(clan_id=7, name="Legion", leader_id=1, leader_username="Leader")
+    )
+    repo = ClanRepository(redis_client)
+
+    clan = await repo.get_user_clan(1)
+    assert clan is not None
+    redis_client.get = AsyncMock(side_effect=AssertionError("no debe leer Redis"))
+
+    assert await repo.get_user_clan(1) is clan
+    assert await repo.get_clan(7) is clan
+
+
+@pytest.mark.asyncio
+async def test_removed_member_no_longer_points_to_clan(redis_client: RedisClient) -> None:
+    """Guardar un clan sin un miembro limpia su membresía cacheada."""
+    repo = ClanRepository(redis_client)
+    assert await repo.get_user_clan(1) is None
+    assert await repo.get_user_clan(2) is None
+    clan = Clan(clan_id=7, name="Legion", leader_id=1, leader_username="Leader")
+    clan.add_member(ClanMember(user_id=2, username="Member", level=10))
+    await repo.save_clan(clan)
+    assert await repo.get_user_clan(2) is clan
+
+    clan.remove_member(2)
+    await repo.save_clan(clan)
+
+    assert await repo.get_user_clan(2) is None
+    assert await repo.get_user_clan(1) is clan
+
+
+@pytest.mark.asyncio
+async def test_delete_and_forget_user(redis_client: RedisClient) -> None:
+    """Disolver el clan y desconectar al usuario vacían el identity map."""
+    repo = ClanRepository(redis_client)
+    await repo.save_clan(Clan(clan_id=7, name="Legion", leader_id=1, leader_username="Leader"))
+
+    await repo.delete_clan(7)
+    assert await repo.get_user_clan(1) is None
+
+    repo.forget_user(1)
+    assert await repo.get_clan(7) is None
+
+
+@pytest.mark.asyncio
+async def test_clan_is_evicted_after_last_online_member_logs_out(
+    redis_client: RedisClient,
+) -> None:
+    """Los miembros offline no se indexan: el clan se libera con el último online."""
+    clan = Clan(clan_id=7, name="Legion", leader_id=1, leader_username="Leader")
+    clan.add_member(ClanMember(user_id=2, username="Member", level=10))
+    clan.add_member(ClanMember(user_id=3, username="Offline", level=10))
+    await ClanRepository(redis_client).save_clan(clan)
+    repo = ClanRepository(redis_client)
+
+    cached = await repo.get_user_clan(1)
+    assert await repo.get_user_clan(2) is cached
+    assert 3 not in repo._user_clans
+
+    repo.forget_user(1)
+    assert await repo.get_clan(7) is cached
+    repo.forget_user(2)
+
+    assert repo._clans == {}
+    assert repo._user_clans == {}
+    assert repo._online_members == {}
@@ -1,10 +1,18 @@
 """Tests básicos para GroundItemsRepository."""
 
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.repositories.ground_items_repository import GroundItemsRepository
+from src.utils.redis_config import RedisKeys
+
+if TYPE_CHECKING:
+    from src.utils.redis_client import RedisClient
 
 
 @pytest.mark.asyncio
@@ -21,11 +29,66 @@ class TestGroundItemsRepository:
     async def test_add_ground_item(self) -> None:
         """Test de agregar item al suelo (test básico)."""
         redis_client = MagicMock()
-        redis_client.get = AsyncMock(return_value=None)
-        redis_client.set = AsyncMock()
+        redis_client.hget = AsyncMock(return_value=None)
 
         repo = GroundItemsRepository(redis_client)
         item = {"item_id": 10, "quantity": 5}
 
         # Solo verificar que no crashea
         await repo.add_ground_item(map_id=1, x=50, y=50, item=item)
+
+
+@pytest.mark.asyncio
+class TestGroundItemsRepositoryRedis:
+    """Tests del hash por tile contra fakeredis."""
+
+    async def test_save_tiles_writes_and_deletes_single_tiles(
+        self, redis_client: RedisClient
+    ) -> None:
+        """save_tiles solo toca los campos de los tiles indicados."""
+        await redis_client.flushdb()
+        repo = GroundItemsRepository(redis_client)
+        await repo.save_ground_items(1, {(1, 1): [{"item_id": 1, "quantity": 1}]})
+
+        await repo.save_tiles(1, {(2, 2): [{"item_id": 2, "quantity": 3}]})
+        assert await repo.load_ground_items(1) == {
+            (1, 1): [{"item_id": 1, "quantity": 1}],
+            (2, 2): [{"item_id": 2, "quantity": 3}],
+        }
+
+        await repo.save_tiles(1, {(1, 1): []})
+        assert await repo.load_ground_items(1) == {(2, 2): [{"item_id": 2, "quantity": 3}]}
+        assert await redis_client.hget(RedisKeys.ground_items(1), "1,1") is None
+
+    async def test_add_and_remove_ground_item(self, redis_client: RedisClient) -> None:
+        """Agregar y remover items actualiza solo su tile."""
+        await redis_client.flushdb()
+        repo = GroundItemsRepository(redis_client)
+
+        await repo.add_ground_item(1, 5, 5, {"item_id": 10, "quantity": 5, "owner_id": None})
+        removed = await repo.remove_ground_item(1, 5, 5)
+
+        assert removed == {"item_id": 10, "quantity": 5, "owner_id": None}
+        assert await repo.load_ground_items(1) == {}
+        assert await repo.clear_ground_items(1) == 0
+
+    async def test_load_migrates_legacy_json(self, redis_client: RedisClient) -> None:
+        """Un mapa guardado como JSON se migra al hash por tile al cargarlo."""
+        await redis_client.flushdb()
+        repo = GroundItemsRepository(redis_client)
+        legacy = {"3,4": [{"item_id": 7, "quantity": 2}]}
+        await redis_client.set(RedisKeys.ground_items(1), json.dumps(legacy))
+
+        items = await repo.load_ground_items(1)
+
+        assert items == {(3, 4): [{"item_id": 7, "quantity": 2}]}
+        assert await redis_client.hget(RedisKeys.ground_items(1), "3,4") is not None
+
+    async def test_get_persisted_map_ids(self, redis_client: RedisClient) -> None:
+        """Lista los mapas con ground items guardados."""
+        await redis_client.flushdb()
+        repo = GroundItemsRepository(redis_client)
+        await repo.add_ground_item(12, 1, 1, {"item_id": 1, "quantity": 1})
+        await repo.add_ground_item(3, 2, 2, {"item_id": 2, "quantity": 1})
+
+        assert await repo.get_persisted_map_ids() == [3, 12]
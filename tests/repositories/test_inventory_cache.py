@@ -0,0 +1,149 @@
+"""Tests para InventoryCache y su integración con InventoryRepository."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.repositories.equipment_repository import EquipmentRepository
+from src.repositories.inventory_repository import InventoryRepository
+from src.repositories.player_repository import PlayerRepository
+from src.utils.equipment_slot import EquipmentSlot
+from src.utils.redis_config import RedisKeys
+
+if TYPE_CHECKING:
+    from src.utils.redis_client import RedisClient
+
+
+async def _load_player(redis_client: RedisClient) -> tuple[PlayerRepository, InventoryRepository]:
+    """Guarda un inventario en Redis y carga al jugador 1."""
+    await redis_client.hset(
+        RedisKeys.player_inventory(1),
+        mapping={"slot_1": "38:10", "slot_2": "", "slot_3": "1:5"},
+    )
+    await redis_client.hset(RedisKeys.player_equipment(1), mapping={"weapon": "3"})
+    player_repo = PlayerRepository(redis_client)
+    await player_repo.load_player_state(1)
+    return player_repo, InventoryRepository(redis_client, cache=player_repo.inventory_cache)
+
+
+@pytest.mark.asyncio
+async def test_loaded_inventory_is_decoded_lazily(redis_client: RedisClient) -> None:
+    """El hash se decodifica en el primer acceso y luego no se lee Redis."""
+    player_repo, inventory_repo = await _load_player(redis_client)
+    inventory = player_repo.inventory_cache.get(1)
+    assert inventory is not None
+    assert not inventory.decoded
+
+    redis_client.hget = AsyncMock(side_effect=AssertionError("no debe leer Redis"))
+    redis_client.hgetall = AsyncMock(side_effect=AssertionError("no debe leer Redis"))
+
+    assert await inventory_repo.get_slot(1, 1) == (38, 10)
+    assert await inventory_repo.get_slot(1, 2) is None
+    assert inventory.decoded
+    assert inventory.is_equipped(3)
+    legacy = await inventory_repo.get_inventory(1)
+    assert legacy["slot_3"] == "1:5"
+    assert not legacy["slot_30"]
+
+
+@pytest.mark.asyncio
+async def test_changed_slots_are_deltas_and_flush_is_batched(redis_client: RedisClient) -> None:
+    """Solo los slots modificados se reportan y se persisten en el flush."""
+    player_repo, inventory_repo = await _load_player(redis_client)
+
+    await inventory_repo.remove_item(1, 1, 1)
+    await inventory_repo.remove_item(1, 1, 1)
+    assert await inventory_repo.add_item(1, 40, 2) == [(2, 2)]
+    await inventory_repo.set_slot(1, 3, 1, 5)  # sin cambios
+
+    assert inventory_repo.pop_changed_slots(1) == [(1, 38, 8, False), (2, 40, 2, False)]
+    assert inventory_repo.pop_changed_slots(1) == []
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_1") == "38:10"
+
+    assert await player_repo.inventory_cache.flush() == 2
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_1") == "38:8"
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_2") == "40:2"
+
+    await inventory_repo.clear_slot(1, 2)
+    await player_repo.release_player_state(1)
+    assert not player_repo.inventory_cache.is_loaded(1)
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_2") == ""  # noqa: PLC1901 (distinto de None)
+
+
+@pytest.mark.asyncio
+async def test_release_during_concurrent_write_is_evicted_by_flusher(
+    redis_client: RedisClient,
+) -> None:
+    """Si el inventario se modifica mientras se persiste el logout, el flusher lo libera."""
+    player_repo, inventory_repo = await _load_player(redis_client)
+    cache = player_repo.inventory_cache
+    await inventory_repo.remove_item(1, 1, 1)
+
+    original_pipeline = redis_client.pipeline
+
+    def racing_pipeline(transaction: bool = True) -> object:
+        pipeline = original_pipeline(transaction=transaction)
+        execute = pipeline.execute
+
+        async def execute_with_concurrent_write() -> object:
+            await inventory_repo.set_slot(1, 2, 40, 3)  # otra corrutina escribe durante el await
+            return await execute()
+
+        pipeline.execute = execute_with_concurrent_write
+        return pipeline
+
+    redis_client.pipeline = racing_pipeline  # type: ignore[method-assign]
+    await cache.release(1)
+    redis_client.pipeline = original_pipeline  # type: ignore[method-assign]
+
+    assert cache.is_loaded(1)
+    await cache.flush()
+
+    assert not cache.is_loaded(1)
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_1") == "38:9"
+    assert await redis_client.hget(RedisKeys.player_inventory(1), "slot_2") == "40:3"
+
+
+@pytest.mark.asyncio
+async def test_swap_keeps_equipped_flag_on_slot(redis_client: RedisClient) -> None:
+    """El swap mueve items; el flag de equipado sigue al hash de equipamiento."""
+    player_repo, inventory_repo = await _load_player(redis_client)
+    equipment_repo = EquipmentRepository(redis_client, inventory_cache=player_repo.inventory_cache)
+
+    result = await inventory_repo.swap_slots(1, 1, 3)
+    assert result is not None
+    assert result.success
+    assert result.old_slot_data == (1, 5)
+    assert inventory_repo.pop_changed_slots(1) == [(1, 1, 5, False), (3, 38, 10, True)]
+
+    await equipment_repo.unequip_item(1, EquipmentSlot.WEAPON)
+    await equipment_repo.equip_item(1, EquipmentSlot.WEAPON, 1)
+    inventory = player_repo.inventory_cache.get(1)
+    assert inventory is not None
+    assert inventory.is_equipped(1)
+    assert not inventory.is_equipped(3)
+
+
+@pytest.mark.asyncio
+async def test_missing_inventory_is_persisted_empty(redis_client: RedisClient) -> None:
+    """Un jugador sin hash de inventario lo obtiene vacío al persistir."""
+    player_repo = PlayerRepository(redis_client)
+    await player_repo.load_player_state(2)
+    inventory_repo = InventoryRepository(redis_client, cache=player_repo.inventory_cache)
+
+    assert await inventory_repo.get_inventory_slots(2) == {}
+    assert await player_repo.inventory_cache.flush() == player_repo.inventory_cache.max_slots
+    assert await redis_client.hget(RedisKeys.player_inventory(2), "slot_1") == ""  # noqa: PLC1901 (distinto de None)
+
+
+@pytest.mark.asyncio
+async def test_unloaded_player_goes_to_redis(redis_client: RedisClient) -> None:
+    """Sin inventario en memoria el repositorio opera sobre Redis."""
+    player_repo = PlayerRepository(redis_client)
+    inventory_repo = InventoryRepository(redis_client, cache=player_repo.inventory_cache)
+
+    await inventory_repo.set_slot(3, 1, 38, 4)
+
+    assert await redis_client.hget(RedisKeys.player_inventory(3), "slot_1") == "38:4"
+    assert inventory_repo.pop_changed_slots(3) is None
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
 
 import pytest
 
 from src.repositories.npc_repository import NPCRepository
+from src.utils.redis_config import RedisKeys
 
 if TYPE_CHECKING:
     from src.utils.redis_client import RedisClient
@@ -396,3 +398,82 @@ class TestNPCRepository:
 
         # Intentar eliminar NPC que no existe (no debería lanzar error)
         await repo.remove_npc("nonexistent-id")
+
+
+async def _create_npc(repo: NPCRepository, map_id: int, char_index: int) -> str:
+    """Crea un NPC mínimo y devuelve su instance_id."""
+    npc = await repo.create_npc_instance(
+        npc_id=1,
+        char_index=char_index,
+        map_id=map_id,
+        x=10,
+        y=char_index % 100,
+        heading=3,
+        name=f"NPC{char_index}",
+        description="",
+        body_id=500,
+        head_id=0,
+        hp=100,
+        max_hp=100,
+        level=1,
+        is_hostile=False,
+        is_attackable=True,
+        respawn_time=0,
+        respawn_time_max=0,
+        gold_min=0,
+        gold_max=0,
+    )
+    return npc.instance_id
+
+
+@pytest.mark.asyncio
+async def test_indexes_follow_create_and_remove(redis_client: RedisClient) -> None:
+    """Los SET de mapa y global se mantienen al crear y eliminar."""
+    repo = NPCRepository(redis_client)
+    first = await _create_npc(repo, map_id=1, char_index=1)
+    second = await _create_npc(repo, map_id=2, char_index=2)
+
+    assert await redis_client.smembers(RedisKeys.NPC_GLOBAL_INDEX) == {first, second}
+    assert await redis_client.smembers(RedisKeys.npc_map_index(2)) == {second}
+
+    await repo.remove_npc(second)
+
+    assert await redis_client.smembers(RedisKeys.NPC_GLOBAL_INDEX) == {first}
+    assert await redis_client.smembers(RedisKeys.npc_map_index(2)) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_all_npcs_uses_index_not_keyspace(redis_client: RedisClient) -> None:
+    """get_all_npcs lee el índice global con un pipeline, sin KEYS."""
+    repo = NPCRepository(redis_client)
+    ids = {await _create_npc(repo, map_id=1, char_index=i) for i in range(3)}
+    redis_client.keys = AsyncMock(side_effect=AssertionError("no debe usar KEYS"))
+
+    npcs = await repo.get_all_npcs()
+
+    assert {npc.instance_id for npc in npcs} == ids
+
+
+@pytest.mark.asyncio
+async def test_get_many_skips_missing(redis_client: RedisClient) -> None:
+    """get_many conserva el orden y omite instancias inexistentes."""
+    repo = NPCRepository(redis_client)
+    first = await _create_npc(repo, map_id=1, char_index=1)
+    second = await _create_npc(repo, map_id=1, char_index=2)
+
+    npcs = await repo.get_many([second, "inexistente", first])
+
+    assert [npc.instance_id for npc in npcs] == [second, first]
+    assert await repo.get_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_clear_all_npcs_removes_unindexed_leftovers(redis_client: RedisClient) -> None:
+    """clear_all_npcs borra también instancias huérfanas de ejecuciones anteriores."""
+    repo = NPCRepository(redis_client)
+    await _create_npc(repo, map_id=1, char_index=1)
+    await redis_client.hset(RedisKeys.npc_instance("huerfano"), mapping={"npc_id": "1"})
+
+    await repo.clear_all_npcs()
+
+    assert await redis_client.scan_keys("npc:*") == []
@@ -0,0 +1,173 @@
+"""Tests para PlayerStateCache y su integración con PlayerRepository."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.repositories.player_repository import PlayerRepository
+from src.utils.redis_config import RedisKeys
+
+if TYPE_CHECKING:
+    from src.utils.redis_client import RedisClient
+
+
+async def _seed_player(redis_client: RedisClient, user_id: int) -> None:
+    """Guarda stats y posición de un jugador directamente en Redis."""
+    await redis_client.hset(
+        RedisKeys.player_user_stats(user_id),
+        mapping={"min_hp": "80", "max_hp": "100", "gold": "50", "level": "3"},
+    )
+    await redis_client.hset(
+        RedisKeys.player_position(user_id),
+        mapping={"x": "10", "y": "20", "map": "1", "heading": "3"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_loaded_player_reads_come_from_memory(redis_client: RedisClient) -> None:
+    """Tras el login las lecturas no van a Redis."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+
+    redis_client.hgetall = AsyncMock(side_effect=AssertionError("no debe leer Redis"))
+
+    stats = await repo.get_player_stats(1)
+    position = await repo.get_position(1)
+
+    assert stats is not None
+    assert stats.min_hp == 80
+    assert position == {"x": 10, "y": 20, "map": 1, "heading": 3}
+    assert repo.state_cache.get_metrics()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_are_deferred_until_flush(redis_client: RedisClient) -> None:
+    """Las escrituras quedan en memoria hasta el flush write-behind."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+
+    await repo.update_hp(1, 40)
+    await repo.set_position(1, 11, 20, 1, heading=2)
+
+    assert await repo.get_current_hp(1) == 40
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "min_hp") == "80"
+    assert repo.state_cache.get_metrics()["dirty_fields"] == 5
+
+    assert await repo.state_cache.flush() == 5
+
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "min_hp") == "40"
+    assert await redis_client.hgetall(RedisKeys.player_position(1)) == {
+        "x": "11",
+        "y": "20",
+        "map": "1",
+        "heading": "2",
+    }
+    assert repo.state_cache.get_metrics()["dirty_fields"] == 0
+
+
+@pytest.mark.asyncio
+async def test_deleted_fields_are_flushed_as_hdel(redis_client: RedisClient) -> None:
+    """Los campos borrados en memoria se eliminan en Redis al persistir."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+
+    await repo.set_morphed_appearance(1, 5, 6, 999.0)
+    await repo.state_cache.flush()
+    await repo.clear_morphed_appearance(1)
+
+    assert await repo.get_morphed_appearance(1) is None
+    await repo.state_cache.flush()
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "morphed_body") is None
+
+
+@pytest.mark.asyncio
+async def test_release_persists_and_evicts(redis_client: RedisClient) -> None:
+    """Al desconectar se persisten los cambios y el jugador deja de estar en memoria."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+    await repo.update_gold(1, 75)
+
+    await repo.release_player_state(1)
+
+    assert not repo.state_cache.is_loaded(1)
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "gold") == "75"
+    assert await repo.get_gold(1) == 75
+
+
+@pytest.mark.asyncio
+async def test_release_during_concurrent_write_is_evicted_by_flusher(
+    redis_client: RedisClient,
+) -> None:
+    """Si el estado se modifica mientras se persiste el logout, el flusher lo libera."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+    await repo.update_gold(1, 75)
+
+    original_pipeline = redis_client.pipeline
+
+    def racing_pipeline(transaction: bool = True) -> object:
+        pipeline = original_pipeline(transaction=transaction)
+        execute = pipeline.execute
+
+        async def execute_with_concurrent_write() -> object:
+            await repo.update_hp(1, 40)  # otra corrutina escribe durante el await
+            return await execute()
+
+        pipeline.execute = execute_with_concurrent_write
+        return pipeline
+
+    redis_client.pipeline = racing_pipeline  # type: ignore[method-assign]
+    await repo.release_player_state(1)
+    redis_client.pipeline = original_pipeline  # type: ignore[method-assign]
+
+    assert repo.state_cache.is_loaded(1)
+    await repo.state_cache.flush()
+
+    assert not repo.state_cache.is_loaded(1)
+    assert not repo.state_cache.owns(RedisKeys.player_user_stats(1))
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "gold") == "75"
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "min_hp") == "40"
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_fields_dirty(redis_client: RedisClient) -> None:
+    """Si el pipeline falla los cambios se reintentan en el próximo flush."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client)
+    await repo.load_player_state(1)
+    await repo.update_mana(1, 10)
+
+    original_pipeline = redis_client.pipeline
+
+    def failing_pipeline(transaction: bool = True) -> object:
+        pipeline = original_pipeline(transaction=transaction)
+        pipeline.execute = AsyncMock(side_effect=ConnectionError("redis caído"))
+        return pipeline
+
+    redis_client.pipeline = failing_pipeline  # type: ignore[method-assign]
+    assert await repo.state_cache.flush() == 0
+    assert repo.state_cache.get_metrics()["flush_errors"] == 1
+
+    redis_client.pipeline = original_pipeline  # type: ignore[method-assign]
+    assert await repo.state_cache.flush() == 1
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "min_mana") == "10"
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_changes(redis_client: RedisClient) -> None:
+    """Al detener el flusher se persiste todo lo pendiente."""
+    await _seed_player(redis_client, 1)
+    repo = PlayerRepository(redis_client, flush_interval_seconds=60)
+    await repo.load_player_state(1)
+    repo.state_cache.start()
+
+    await repo.update_stamina(1, 33)
+    await repo.state_cache.stop()
+
+    assert await redis_client.hget(RedisKeys.player_user_stats(1), "min_sta") == "33"
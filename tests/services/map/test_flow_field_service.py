@@ -0,0 +1,106 @@
+"""Tests para FlowFieldService (campos de flujo de persecución)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.game.map_manager import MapManager
+from src.game.walkability_grid import WalkabilityGrid
+from src.services.map.flow_field_service import UNREACHABLE, FlowField, FlowFieldService
+
+
+@pytest.fixture
+def mock_map_manager() -> MagicMock:
+    """Mock de MapManager con un mapa 100x100 libre."""
+    manager = MagicMock()
+    manager.get_walkability.return_value = WalkabilityGrid(100, 100)
+    manager.is_tile_occupied.return_value = False
+    return manager
+
+
+class TestFlowField:
+    """Tests para el BFS acotado."""
+
+    def test_distances_follow_walls(self) -> None:
+        """Las distancias rodean los tiles bloqueados."""
+        grid = WalkabilityGrid(20, 20, blocked=[(11, y) for y in range(8, 13)])
+
+        field = FlowField(grid, 12, 10, radius=10)
+
+        assert field.distance(12, 10) == 0
+        assert field.distance(13, 10) == 1
+        # Del otro lado del muro hay que rodearlo (3 arriba, 2 al costado, 3 abajo)
+        assert field.distance(10, 10) == 8
+        assert field.distance(11, 10) == UNREACHABLE
+
+    def test_radius_bounds_the_field(self) -> None:
+        """Fuera del radio (o de la ventana) no hay distancia."""
+        field = FlowField(WalkabilityGrid(50, 50), 25, 25, radius=3)
+
+        assert field.distance(28, 25) == 3
+        assert field.distance(29, 25) == UNREACHABLE
+        assert field.distance(27, 27) == UNREACHABLE
+
+
+class TestFlowFieldService:
+    """Tests para el cache y el descenso."""
+
+    def test_next_step_descends_towards_target(self, mock_map_manager: MagicMock) -> None:
+        """El paso baja la distancia en uno."""
+        service = FlowFieldService(mock_map_manager)
+
+        assert service.get_next_step(1, 50, 50, 50, 45) == (50, 49, 1)
+        assert service.get_next_step(1, 50, 50, 55, 50) == (51, 50, 2)
+
+    def test_pack_shares_one_field(self, mock_map_manager: MagicMock) -> None:
+        """Varios perseguidores del mismo objetivo reutilizan el campo."""
+        service = FlowFieldService(mock_map_manager)
+
+        for start_x in range(40, 46):
+            service.get_next_step(1, start_x, 50, 50, 50, target_id=7)
+
+        assert service.fields_built == 1
+        assert service.cache_hits == 5
+
+    def test_target_move_drops_previous_field(self, mock_map_manager: MagicMock) -> None:
+        """Cuando el objetivo se mueve se calcula un campo nuevo y se descarta el viejo."""
+        service = FlowFieldService(mock_map_manager)
+
+        service.get_next_step(1, 40, 50, 50, 50, target_id=7)
+        service.get_next_step(1, 40, 50, 51, 50, target_id=7)
+
+        assert service.fields_built == 2
+        assert len(service._fields) == 1
+
+    def test_occupied_descent_returns_none(self, mock_map_manager: MagicMock) -> None:
+        """Si los vecinos que acercan están ocupados no hay paso."""
+        mock_map_manager.is_tile_occupied.side_effect = lambda _m, x, y: (x, y) == (50, 49)
+        service = FlowFieldService(mock_map_manager)
+
+        assert service.get_next_step(1, 50, 50, 50, 45) is None
+
+    def test_out_of_radius_returns_none(self, mock_map_manager: MagicMock) -> None:
+        """Un perseguidor fuera del radio no recibe paso."""
+        service = FlowFieldService(mock_map_manager, radius=4)
+
+        assert service.get_next_step(1, 50, 50, 50, 40) is None
+
+    def test_lru_eviction_respects_cap(self, mock_map_manager: MagicMock) -> None:
+        """El cache no supera max_fields."""
+        service = FlowFieldService(mock_map_manager, max_fields=2)
+
+        for target_x in (10, 20, 30):
+            service.get_field(1, target_x, 10)
+
+        assert list(service._fields) == [(1, 20, 10), (1, 30, 10)]
+
+    def test_door_change_invalidates_field(self) -> None:
+        """Cerrar una puerta en el camino obliga a recalcular el campo."""
+        map_manager = MapManager()
+        service = FlowFieldService(map_manager)
+        assert service.get_next_step(1, 50, 50, 50, 45) == (50, 49, 1)
+
+        map_manager.block_tile(1, 50, 49)
+
+        assert service.get_next_step(1, 50, 50, 50, 45) in {(49, 50, 4), (51, 50, 2)}
+        assert service.fields_built == 2
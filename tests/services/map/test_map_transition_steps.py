@@ -5,6 +5,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.network.msg_character import build_character_create_response
+from src.network.msg_map import build_pos_update_response
+from src.services.map.map_entry_snapshot import MapEntrySnapshot
 from src.services.map.map_transition_steps import (
     AddToNewMapStep,
     BroadcastCreateInNewMapStep,
@@ -14,9 +17,9 @@ from src.services.map.map_transition_steps import (
     MapTransitionOrchestrator,
     RemoveFromOldMapStep,
     SendChangeMapStep,
-    SendGroundItemsStep,
-    SendNPCsStep,
+    SendMapSnapshotStep,
     SendPositionUpdateStep,
+    SendQueuedPacketsStep,
     SendSelfCharacterCreateStep,
     UpdatePositionStep,
 )
@@ -54,6 +57,22 @@ class TestSendChangeMapStep:
 
         mock_context.message_sender.send_change_map.assert_awaited_once_with(2)
 
+    @pytest.mark.asyncio
+    async def test_rollback_restores_previous_map_view(self, mock_context):
+        """El rollback devuelve al cliente al mapa anterior con su snapshot."""
+        sender = mock_context.message_sender
+        sender.send_change_map = AsyncMock()
+        sender.send_packets = AsyncMock()
+        send_snapshot = AsyncMock()
+        step = SendChangeMapStep(send_snapshot, reload_delay=0)
+
+        await step.rollback(mock_context)
+
+        sender.send_change_map.assert_awaited_once_with(1)
+        payload = sender.send_packets.await_args.args[0]
+        assert payload.startswith(build_pos_update_response(50, 50))
+        send_snapshot.assert_awaited_once_with(1, sender, 1)
+
 
 class TestClientLoadDelayStep:
     """Tests para ClientLoadDelayStep."""
@@ -83,19 +102,28 @@ class TestUpdatePositionStep:
 
         player_repo.set_position.assert_awaited_once_with(1, 100, 100, 2, 3)
 
+    @pytest.mark.asyncio
+    async def test_rollback_restores_previous_position(self, mock_context):
+        """El rollback vuelve a guardar la posición anterior."""
+        player_repo = AsyncMock()
+        step = UpdatePositionStep(player_repo)
+
+        await step.rollback(mock_context)
+
+        player_repo.set_position.assert_awaited_once_with(1, 50, 50, 1, 3)
+
 
 class TestSendPositionUpdateStep:
     """Tests para SendPositionUpdateStep."""
 
     @pytest.mark.asyncio
-    async def test_execute_sends_position_update(self, mock_context):
-        """Test que envía POS_UPDATE."""
-        mock_context.message_sender.send_pos_update = AsyncMock()
+    async def test_execute_queues_position_update(self, mock_context):
+        """Test que encola POS_UPDATE."""
         step = SendPositionUpdateStep()
 
         await step.execute(mock_context)
 
-        mock_context.message_sender.send_pos_update.assert_awaited_once_with(100, 100)
+        assert mock_context.outgoing == [build_pos_update_response(100, 100)]
 
 
 class TestRemoveFromOldMapStep:
@@ -111,6 +139,19 @@ class TestRemoveFromOldMapStep:
 
         map_manager.remove_player.assert_called_once_with(1, 1)
 
+    @pytest.mark.asyncio
+    async def test_rollback_readds_to_old_map(self, mock_context):
+        """El rollback vuelve a registrar al jugador y su tile en el mapa anterior."""
+        map_manager = MagicMock()
+        step = RemoveFromOldMapStep(map_manager)
+
+        await step.rollback(mock_context)
+
+        map_manager.add_player.assert_called_once_with(
+            1, 1, mock_context.message_sender, "TestPlayer"
+        )
+        map_manager.update_player_tile.assert_called_once_with(1, 1, 50, 50, 50, 50)
+
 
 class TestBroadcastRemoveFromOldMapStep:
     """Tests para BroadcastRemoveFromOldMapStep."""
@@ -129,6 +170,18 @@ class TestBroadcastRemoveFromOldMapStep:
 class TestAddToNewMapStep:
     """Tests para AddToNewMapStep."""
 
+    @pytest.mark.asyncio
+    async def test_prepare_activates_new_map(self, mock_context):
+        """La fase de lectura activa el nuevo mapa sin registrar al jugador."""
+        map_manager = MagicMock()
+        map_manager.activate_map = AsyncMock()
+        step = AddToNewMapStep(map_manager)
+
+        await step.prepare(mock_context)
+
+        map_manager.activate_map.assert_awaited_once_with(2)
+        map_manager.add_player.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_adds_to_new_map(self, mock_context):
         """Test que agrega al nuevo mapa."""
@@ -141,57 +194,80 @@ class TestAddToNewMapStep:
             2, 1, mock_context.message_sender, "TestPlayer"
         )
 
+    @pytest.mark.asyncio
+    async def test_rollback_removes_from_new_map(self, mock_context):
+        """El rollback remueve al jugador del nuevo mapa."""
+        map_manager = MagicMock()
+        step = AddToNewMapStep(map_manager)
+
+        await step.rollback(mock_context)
+
+        map_manager.remove_player.assert_called_once_with(2, 1)
+
 
 class TestSendSelfCharacterCreateStep:
     """Tests para SendSelfCharacterCreateStep."""
 
     @pytest.mark.asyncio
-    async def test_execute_sends_self_character_create(self, mock_context):
-        """Test que envía CHARACTER_CREATE propio."""
-        mock_context.message_sender.send_character_create = AsyncMock()
+    async def test_execute_queues_self_character_create(self, mock_context):
+        """Test que encola CHARACTER_CREATE propio."""
         step = SendSelfCharacterCreateStep()
 
         await step.execute(mock_context)
 
-        mock_context.message_sender.send_character_create.assert_awaited_once_with(
-            char_index=1,
-            body=1,
-            head=1,
-            heading=3,
-            x=100,
-            y=100,
-            name="TestPlayer",
-        )
+        assert mock_context.outgoing == [
+            build_character_create_response(
+                char_index=1,
+                body=1,
+                head=1,
+                heading=3,
+                x=100,
+                y=100,
+                name="TestPlayer",
+            )
+        ]
 
 
-class TestSendNPCsStep:
-    """Tests para SendNPCsStep."""
+class TestSendMapSnapshotStep:
+    """Tests para SendMapSnapshotStep."""
 
     @pytest.mark.asyncio
-    async def test_execute_sends_npcs(self, mock_context):
-        """Test que envía NPCs del mapa."""
-        send_npcs = AsyncMock()
-        step = SendNPCsStep(send_npcs)
+    async def test_execute_queues_snapshot(self, mock_context):
+        """Test que encola el snapshot del mapa excluyendo al propio jugador."""
+        build_snapshot = AsyncMock(
+            return_value=MapEntrySnapshot(payload=b"snap", players=1, npcs=0, ground_items=0)
+        )
+        step = SendMapSnapshotStep(build_snapshot)
 
         await step.execute(mock_context)
 
-        send_npcs.assert_awaited_once_with(mock_context.new_map, mock_context.message_sender)
+        build_snapshot.assert_awaited_once_with(mock_context.new_map, mock_context.user_id)
+        assert mock_context.outgoing == [b"snap"]
 
 
-class TestSendGroundItemsStep:
-    """Tests para SendGroundItemsStep."""
+class TestSendQueuedPacketsStep:
+    """Tests para SendQueuedPacketsStep."""
 
     @pytest.mark.asyncio
-    async def test_execute_sends_ground_items(self, mock_context):
-        """Test que envía objetos del suelo."""
-        send_ground_items = AsyncMock()
-        step = SendGroundItemsStep(send_ground_items)
+    async def test_execute_sends_queue_in_single_write(self, mock_context):
+        """Los packets encolados salen en una sola escritura."""
+        mock_context.message_sender.send_packets = AsyncMock()
+        mock_context.outgoing.extend([b"a", b"bc"])
+        step = SendQueuedPacketsStep()
 
         await step.execute(mock_context)
 
-        send_ground_items.assert_awaited_once_with(
-            mock_context.new_map, mock_context.message_sender
-        )
+        mock_context.message_sender.send_packets.assert_awaited_once_with(b"abc")
+        assert mock_context.outgoing == []
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_empty_queue(self, mock_context):
+        """Sin packets encolados no se escribe."""
+        mock_context.message_sender.send_packets = AsyncMock()
+
+        await SendQueuedPacketsStep().execute(mock_context)
+
+        mock_context.message_sender.send_packets.assert_not_awaited()
 
 
 class TestBroadcastCreateInNewMapStep:
@@ -231,10 +307,15 @@ class TestMapTransitionOrchestrator:
 
         await orchestrator.execute_transition(mock_context)
 
-        # Verificar que todos los pasos se ejecutaron
-        step1.execute.assert_awaited_once_with(mock_context)
-        step2.execute.assert_awaited_once_with(mock_context)
-        step3.execute.assert_awaited_once_with(mock_context)
+        # Verificar que todos los pasos se prepararon y ejecutaron
+        for step in (step1, step2, step3):
+            step.prepare.assert_awaited_once_with(mock_context)
+            step.execute.assert_awaited_once_with(mock_context)
+            step.rollback.assert_not_awaited()
+
+        latency = orchestrator.get_metrics()["latency"]
+        assert latency["prepare"]["count"] == 1
+        assert latency["total"]["count"] == 1
 
     @pytest.mark.asyncio
     async def test_execute_transition_handles_step_failure(self, mock_context):
@@ -254,6 +335,45 @@ class TestMapTransitionOrchestrator:
         step2.execute.assert_awaited_once_with(mock_context)
         # step3 no debe ejecutarse debido al fallo
         step3.execute.assert_not_awaited()
+        # Se deshacen el paso fallido y los anteriores, en orden inverso
+        step2.rollback.assert_awaited_once_with(mock_context)
+        step1.rollback.assert_awaited_once_with(mock_context)
+        step3.rollback.assert_not_awaited()
+        assert orchestrator.get_metrics()["rollbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_transition_rollback_runs_in_reverse_order(self, mock_context):
+        """El rollback recorre los pasos ejecutados de atrás hacia adelante."""
+        order: list[str] = []
+        step1 = AsyncMock()
+        step1.rollback.side_effect = lambda _ctx: order.append("step1")
+        step2 = AsyncMock()
+        step2.rollback.side_effect = lambda _ctx: order.append("step2")
+        step3 = AsyncMock()
+        step3.execute.side_effect = RuntimeError("boom")
+        step3.rollback.side_effect = lambda _ctx: order.append("step3")
+
+        orchestrator = MapTransitionOrchestrator([step1, step2, step3])
+
+        with pytest.raises(RuntimeError):
+            await orchestrator.execute_transition(mock_context)
+
+        assert order == ["step3", "step2", "step1"]
+
+    @pytest.mark.asyncio
+    async def test_execute_transition_prepare_failure_changes_nothing(self, mock_context):
+        """Un error en la fase de lectura aborta antes de ejecutar ningún paso."""
+        step1 = AsyncMock()
+        step2 = AsyncMock()
+        step2.prepare.side_effect = RuntimeError("map load failed")
+
+        orchestrator = MapTransitionOrchestrator([step1, step2])
+
+        with pytest.raises(RuntimeError, match="map load failed"):
+            await orchestrator.execute_transition(mock_context)
+
+        step1.execute.assert_not_awaited()
+        step1.rollback.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_create_default_orchestrator(self):
@@ -261,21 +381,19 @@ class TestMapTransitionOrchestrator:
         player_repo = AsyncMock()
         map_manager = MagicMock()
         broadcast_service = AsyncMock()
-        send_players = AsyncMock()
-        send_npcs = AsyncMock()
-        send_ground_items = AsyncMock()
+        build_snapshot = AsyncMock()
+        send_snapshot = AsyncMock()
 
         orchestrator = MapTransitionOrchestrator.create_default_orchestrator(
             player_repo,
             map_manager,
             broadcast_service,
-            send_players,
-            send_npcs,
-            send_ground_items,
+            build_snapshot,
+            send_snapshot,
         )
 
-        # Verificar que tiene 13 pasos (incluyendo actualización de tile en nuevo mapa)
-        assert len(orchestrator.steps) == 13
+        # Verificar que tiene 12 pasos (estado primero, envíos agrupados al final)
+        assert len(orchestrator.steps) == 12
 
         # Verificar tipos de pasos
         step_types = [type(step).__name__ for step in orchestrator.steps]
@@ -283,15 +401,14 @@ class TestMapTransitionOrchestrator:
             "SendChangeMapStep",
             "ClientLoadDelayStep",
             "UpdatePositionStep",
-            "SendPositionUpdateStep",
             "RemoveFromOldMapStep",
-            "BroadcastRemoveFromOldMapStep",
             "AddToNewMapStep",
             "UpdateTileInNewMapStep",
+            "SendPositionUpdateStep",
             "SendSelfCharacterCreateStep",
-            "SendExistingPlayersStep",
-            "SendNPCsStep",
-            "SendGroundItemsStep",
+            "SendMapSnapshotStep",
+            "SendQueuedPacketsStep",
+            "BroadcastRemoveFromOldMapStep",
             "BroadcastCreateInNewMapStep",
         ]
         assert step_types == expected_types
@@ -4,15 +4,23 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from src.game.map_manager import MapManager
+from src.game.walkability_grid import WalkabilityGrid
 from src.services.map.pathfinding_service import PathfindingService
 
 
+def _set_blocked(manager: MagicMock, blocked: set[tuple[int, int]]) -> None:
+    """Configura tiles bloqueados en la grilla de transitabilidad del mock."""
+    manager.get_walkability.return_value = WalkabilityGrid(100, 100, blocked)
+
+
 @pytest.fixture
 def mock_map_manager():
     """Mock de MapManager."""
     manager = MagicMock()
-    # Por defecto, todos los tiles son transitables
-    manager.can_move_to.return_value = True
+    # Por defecto, todos los tiles son transitables y están libres
+    _set_blocked(manager, set())
+    manager.is_tile_occupied.return_value = False
     return manager
 
 
@@ -41,10 +49,7 @@ class TestPathfindingService:
         service = PathfindingService(mock_map_manager)
 
         # El objetivo (60, 60) está bloqueado
-        def can_move_to_mock(_map_id, x, y):
-            return not (x == 60 and y == 60)
-
-        mock_map_manager.can_move_to.side_effect = can_move_to_mock
+        _set_blocked(mock_map_manager, {(60, 60)})
 
         result = service.get_next_step(map_id=1, start_x=50, start_y=50, target_x=60, target_y=60)
 
@@ -106,12 +111,8 @@ class TestPathfindingService:
         """Test pathfinding rodeando un obstáculo."""
         service = PathfindingService(mock_map_manager)
 
-        # Crear un muro vertical en x=51
-        def can_move_to_mock(map_id, x, y):  # noqa: ARG001
-            # Muro en x=51, y entre 48 y 52
-            return not (x == 51 and 48 <= y <= 52)
-
-        mock_map_manager.can_move_to.side_effect = can_move_to_mock
+        # Crear un muro vertical en x=51, y entre 48 y 52
+        _set_blocked(mock_map_manager, {(51, y) for y in range(48, 53)})
 
         # Ir de (50, 50) a (52, 50) - debe rodear el muro
         result = service.get_next_step(
@@ -129,15 +130,9 @@ class TestPathfindingService:
         """Test cuando no hay camino posible."""
         service = PathfindingService(mock_map_manager)
 
-        # Crear un muro que rodea completamente el objetivo
-        def can_move_to_mock(map_id, x, y):  # noqa: ARG001
-            # Objetivo en (55, 55), rodeado por muros
-            if x == 55 and y == 55:
-                return True  # El objetivo es válido
-            # Muros alrededor
-            return not (54 <= x <= 56 and 54 <= y <= 56)
-
-        mock_map_manager.can_move_to.side_effect = can_move_to_mock
+        # Objetivo en (55, 55), rodeado por muros
+        walls = {(x, y) for x in range(54, 57) for y in range(54, 57)} - {(55, 55)}
+        _set_blocked(mock_map_manager, walls)
 
         result = service.get_next_step(map_id=1, start_x=50, start_y=50, target_x=55, target_y=55)
 
@@ -244,10 +239,7 @@ class TestPathfindingService:
             (53, 51),  # Muro horizontal
         }
 
-        def can_move_to_mock(map_id, x, y):  # noqa: ARG001
-            return (x, y) not in blocked_tiles
-
-        mock_map_manager.can_move_to.side_effect = can_move_to_mock
+        _set_blocked(mock_map_manager, blocked_tiles)
 
         # Ir de (50, 50) a (54, 50) - debe encontrar camino
         result = service.get_next_step(
@@ -274,3 +266,70 @@ class TestPathfindingService:
             map_id=999, start_x=50, start_y=50, target_x=50, target_y=45
         )
         assert result3 is not None
+
+    def test_get_next_step_target_occupied_by_player(self, mock_map_manager):
+        """El tile objetivo puede estar ocupado (es el jugador perseguido)."""
+        mock_map_manager.is_tile_occupied.side_effect = lambda _m, x, y: (x, y) == (50, 45)
+        service = PathfindingService(mock_map_manager)
+
+        result = service.get_next_step(map_id=1, start_x=50, start_y=50, target_x=50, target_y=45)
+
+        assert result == (50, 49, 1)
+
+    def test_get_next_step_avoids_occupied_tiles(self, mock_map_manager):
+        """Los tiles ocupados por otros personajes se rodean."""
+        mock_map_manager.is_tile_occupied.side_effect = lambda _m, x, y: (x, y) == (51, 50)
+        service = PathfindingService(mock_map_manager)
+
+        result = service.get_next_step(map_id=1, start_x=50, start_y=50, target_x=53, target_y=50)
+
+        assert result is not None
+        assert result[:2] != (51, 50)
+
+
+class TestPathCache:
+    """Tests para la reutilización de rutas por agente."""
+
+    def test_reuses_path_while_target_stays_close(self, mock_map_manager):
+        """Los pasos siguientes salen de la ruta cacheada."""
+        service = PathfindingService(mock_map_manager)
+
+        first = service.get_next_step(1, 50, 50, 50, 40, agent_id="npc-1")
+        second = service.get_next_step(1, 50, 49, 50, 41, agent_id="npc-1")
+
+        assert first == (50, 49, 1)
+        assert second == (50, 48, 1)
+        assert service.cache_hits == 1
+
+    def test_recomputes_when_target_moves_far(self, mock_map_manager):
+        """Si el objetivo se aleja más del umbral se recalcula."""
+        service = PathfindingService(mock_map_manager)
+
+        service.get_next_step(1, 50, 50, 50, 40, agent_id="npc-1")
+        result = service.get_next_step(1, 50, 49, 60, 49, agent_id="npc-1")
+
+        assert result == (51, 49, 2)
+        assert service.cache_hits == 0
+
+    def test_recomputes_when_path_gets_occupied(self, mock_map_manager):
+        """Un tile ocupado sobre la ruta invalida la ruta cacheada."""
+        service = PathfindingService(mock_map_manager)
+        service.get_next_step(1, 50, 50, 50, 45, agent_id="npc-1")
+
+        mock_map_manager.is_tile_occupied.side_effect = lambda _m, x, y: (x, y) == (50, 47)
+        result = service.get_next_step(1, 50, 49, 50, 45, agent_id="npc-1")
+
+        assert result is not None
+        assert service.cache_hits == 0
+
+    def test_closed_door_blocks_path(self):
+        """Las puertas cerradas de MapManager bloquean la grilla sin reconstruirla."""
+        map_manager = MapManager()
+        service = PathfindingService(map_manager)
+        map_manager.get_walkability(1)
+
+        map_manager.block_tile(1, 50, 45)
+
+        assert service.get_next_step(1, 50, 50, 50, 45) is None
+        map_manager.unblock_tile(1, 50, 45)
+        assert service.get_next_step(1, 50, 50, 50, 45) == (50, 49, 1)
@@ -5,7 +5,10 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.models.npc import NPC
-from src.services.map.player_map_service import PlayerMapService, PlayerVisualData
+from src.network.msg_character import build_character_create_response
+from src.network.msg_map import build_object_create_response, build_pos_update_response
+from src.services.map.map_entry_snapshot import PlayerVisualData
+from src.services.map.player_map_service import PlayerMapService
 
 
 @pytest.fixture
@@ -22,11 +25,15 @@ def mock_player_repo():
 def mock_account_repo():
     """Mock de AccountRepository."""
     repo = AsyncMock()
-    repo.get_account_by_user_id.return_value = {
+    repo.get_account_appearance.return_value = {
         "username": "TestPlayer",
         "char_race": 2,
         "char_head": 3,
     }
+    repo.get_account_appearances.side_effect = lambda user_ids: {
+        user_id: {"username": f"Player{user_id}", "char_race": 2, "char_head": 3}
+        for user_id in user_ids
+    }
     return repo
 
 
@@ -36,7 +43,8 @@ def mock_map_manager():
     manager = MagicMock()
     manager.get_players_in_map.return_value = []
     manager.get_npcs_in_map.return_value = []
-    manager._ground_items = {}
+    manager.get_map_ground_items.return_value = {}
+    manager.activate_map = AsyncMock()
     manager.add_player = MagicMock()
     manager.remove_player = MagicMock()
     manager.update_player_tile = MagicMock()
@@ -61,6 +69,7 @@ def mock_message_sender():
     sender.send_pos_update = AsyncMock()
     sender.send_object_create = AsyncMock()
     sender.send_block_position = AsyncMock()
+    sender.send_packets = AsyncMock()
     return sender
 
 
@@ -114,7 +123,7 @@ class TestPlayerMapService:
     @pytest.mark.asyncio
     async def test_get_player_visual_data_no_account(self, player_map_service):
         """Test obtener datos visuales cuando no hay cuenta."""
-        player_map_service.account_repo.get_account_by_user_id.return_value = None
+        player_map_service.account_repo.get_account_appearance.return_value = None
 
         visual_data = await player_map_service._get_player_visual_data(1)
 
@@ -127,7 +136,7 @@ class TestPlayerMapService:
     @pytest.mark.asyncio
     async def test_get_player_visual_data_body_zero(self, player_map_service):
         """Test que body 0 se reemplaza por 1."""
-        player_map_service.account_repo.get_account_by_user_id.return_value = {
+        player_map_service.account_repo.get_account_appearance.return_value = {
             "username": "TestPlayer",
             "char_race": 0,  # Body inválido
             "char_head": 3,
@@ -139,50 +148,17 @@ class TestPlayerMapService:
         assert visual_data.char_body == 1
 
     @pytest.mark.asyncio
-    async def test_send_players_in_map_empty(self, player_map_service, mock_message_sender):
-        """Test enviar jugadores cuando el mapa está vacío."""
-        count = await player_map_service._send_players_in_map(1, mock_message_sender)
-
-        assert count == 0
-        mock_message_sender.send_character_create.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_send_players_in_map_with_players(self, player_map_service, mock_message_sender):
-        """Test enviar jugadores cuando hay otros jugadores."""
-        # Simular 2 jugadores en el mapa
-        player_map_service.map_manager.get_players_in_map.return_value = [2, 3]
-
-        count = await player_map_service._send_players_in_map(1, mock_message_sender)
-
-        assert count == 2
-        assert mock_message_sender.send_character_create.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_send_players_in_map_exclude_self(self, player_map_service, mock_message_sender):
-        """Test que se excluye al jugador especificado."""
-        # Simular 3 jugadores en el mapa (incluyendo el propio)
-        player_map_service.map_manager.get_players_in_map.return_value = [1, 2, 3]
-
-        count = await player_map_service._send_players_in_map(
-            1, mock_message_sender, exclude_user_id=1
-        )
+    async def test_send_map_snapshot_empty_map(self, player_map_service, mock_message_sender):
+        """Un mapa vacío no envía nada."""
+        snapshot = await player_map_service._send_map_snapshot(1, mock_message_sender)
 
-        # Solo debe enviar 2 (excluye el 1)
-        assert count == 2
+        assert (snapshot.players, snapshot.npcs, snapshot.ground_items) == (0, 0, 0)
+        mock_message_sender.send_packets.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_send_npcs_in_map_empty(self, player_map_service, mock_message_sender):
-        """Test enviar NPCs cuando no hay NPCs."""
-        count = await player_map_service._send_npcs_in_map(1, mock_message_sender)
-
-        assert count == 0
-        mock_message_sender.send_character_create.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_send_npcs_in_map_with_npcs(self, player_map_service, mock_message_sender):
-        """Test enviar NPCs cuando hay NPCs en el mapa."""
-        # Crear NPCs de prueba
-        npc1 = NPC(
+    async def test_send_map_snapshot_single_write(self, player_map_service, mock_message_sender):
+        """Jugadores, NPCs y ground items se envían en un único buffer."""
+        npc = NPC(
             npc_id=1,
             char_index=10001,
             instance_id="test-npc-1",
@@ -200,55 +176,43 @@ class TestPlayerMapService:
             is_hostile=True,
             is_attackable=True,
         )
-        npc2 = NPC(
-            npc_id=7,
-            char_index=10002,
-            instance_id="test-npc-2",
-            map_id=1,
-            x=40,
-            y=40,
-            heading=2,
-            name="Lobo",
-            description="Un lobo salvaje",
-            body_id=10,
-            head_id=0,
-            hp=80,
-            max_hp=80,
-            level=3,
-            is_hostile=True,
-            is_attackable=True,
-        )
-
-        player_map_service.map_manager.get_npcs_in_map.return_value = [npc1, npc2]
-
-        count = await player_map_service._send_npcs_in_map(1, mock_message_sender)
-
-        assert count == 2
-        assert mock_message_sender.send_character_create.call_count == 2
+        player_map_service.map_manager.get_players_in_map.return_value = [2]
+        player_map_service.map_manager.get_npcs_in_map.return_value = [npc]
+        player_map_service.map_manager.get_map_ground_items.return_value = {
+            (50, 50): [{"grh_index": 100}, {"grh_index": None}],
+        }
 
-    @pytest.mark.asyncio
-    async def test_send_ground_items_in_map_empty(self, player_map_service, mock_message_sender):
-        """Test enviar ground items cuando no hay items."""
-        count = await player_map_service._send_ground_items_in_map(1, mock_message_sender)
+        snapshot = await player_map_service._send_map_snapshot(
+            1, mock_message_sender, exclude_user_id=1
+        )
 
-        assert count == 0
-        mock_message_sender.send_object_create.assert_not_called()
+        assert (snapshot.players, snapshot.npcs, snapshot.ground_items) == (1, 1, 1)
+        player_map_service.map_manager.get_players_in_map.assert_called_once_with(1, 1)
+        mock_message_sender.send_packets.assert_awaited_once_with(
+            build_character_create_response(
+                char_index=2, body=2, head=3, heading=3, x=50, y=50, name="Player2"
+            )
+            + build_character_create_response(
+                char_index=10001, body=14, head=0, heading=3, x=30, y=30, name="Goblin"
+            )
+            + build_object_create_response(50, 50, 100)
+        )
+        mock_message_sender.send_character_create.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_send_ground_items_in_map_with_items(
+    async def test_send_map_snapshot_skips_players_without_position(
         self, player_map_service, mock_message_sender
     ):
-        """Test enviar ground items cuando hay items en el suelo."""
-        # Simular items en el suelo
-        player_map_service.map_manager._ground_items = {
-            (1, 50, 50): [{"grh_index": 100}],
-            (1, 51, 51): [{"grh_index": 101}],
-        }
+        """Los jugadores sin posición no entran al snapshot."""
+        player_map_service.map_manager.get_players_in_map.return_value = [2, 3]
+        player_map_service.player_repo.get_position.side_effect = lambda user_id: (
+            {"x": 10, "y": 10, "map": 1, "heading": 1} if user_id == 3 else None
+        )
 
-        count = await player_map_service._send_ground_items_in_map(1, mock_message_sender)
+        snapshot = await player_map_service._send_map_snapshot(1, mock_message_sender)
 
-        assert count == 2
-        assert mock_message_sender.send_object_create.call_count == 2
+        assert snapshot.players == 1
+        player_map_service.account_repo.get_account_appearances.assert_awaited_once_with([3])
 
     @pytest.mark.asyncio
     async def test_unblock_exit_tiles_without_exits(self, player_map_service, mock_message_sender):
@@ -302,6 +266,9 @@ class TestPlayerMapService:
         # Debe hacer broadcast
         player_map_service.broadcast_service.broadcast_character_create.assert_called_once()
 
+        # Debe registrar el time-to-playable
+        assert player_map_service.get_metrics()["count"] == 1
+
     @pytest.mark.asyncio
     async def test_transition_to_map(self, player_map_service, mock_message_sender):
         """Test transición de jugador entre mapas."""
@@ -323,31 +290,35 @@ class TestPlayerMapService:
         # 3. Debe actualizar posición en Redis
         player_map_service.player_repo.set_position.assert_called_once_with(1, 60, 60, 2, 3)
 
-        # 4. Debe enviar POS_UPDATE
-        mock_message_sender.send_pos_update.assert_called_once_with(60, 60)
-
-        # 5. Debe remover del mapa anterior
+        # 4. Debe remover del mapa anterior
         player_map_service.map_manager.remove_player.assert_called_once_with(1, 1)
 
-        # 6. Debe broadcast CHARACTER_REMOVE en mapa anterior
-        player_map_service.broadcast_service.broadcast_character_remove.assert_called_once_with(
-            1, 1
-        )
-
-        # 7. Debe agregar al nuevo mapa
+        # 5. Debe activar y agregar al nuevo mapa
+        player_map_service.map_manager.activate_map.assert_awaited_once_with(2)
         player_map_service.map_manager.add_player.assert_called_once()
 
-        # 7b. Debe marcar el tile ocupado en el nuevo mapa
+        # 6. Debe marcar el tile ocupado en el nuevo mapa
         player_map_service.map_manager.update_player_tile.assert_called_once_with(
             1, 2, 60, 60, 60, 60
         )
 
-        # 8. Debe enviar CHARACTER_CREATE del propio jugador
-        assert mock_message_sender.send_character_create.call_count >= 1
+        # 7-10. POS_UPDATE y CHARACTER_CREATE propio en una sola escritura
+        mock_message_sender.send_packets.assert_awaited_once()
+        payload = mock_message_sender.send_packets.await_args.args[0]
+        assert payload.startswith(build_pos_update_response(60, 60))
+        assert build_character_create_response(1, 2, 3, 3, 60, 60, name="TestPlayer") in payload
+
+        # 11. Debe broadcast CHARACTER_REMOVE en mapa anterior
+        player_map_service.broadcast_service.broadcast_character_remove.assert_called_once_with(
+            1, 1
+        )
 
         # 12. Debe broadcast CHARACTER_CREATE en nuevo mapa
         player_map_service.broadcast_service.broadcast_character_create.assert_called_once()
 
+        latency = player_map_service.get_transition_metrics()["latency"]
+        assert latency["total"]["count"] == 1
+
     @pytest.mark.asyncio
     async def test_transition_to_map_sequence(self, player_map_service, mock_message_sender):
         """Test que la secuencia de transición es correcta."""
@@ -370,9 +341,9 @@ class TestPlayerMapService:
         assert "send_change_map" in call_order
         change_map_index = call_order.index("send_change_map")
 
-        # POS_UPDATE debe venir después
-        assert "send_pos_update" in call_order
-        pos_update_index = call_order.index("send_pos_update")
+        # POS_UPDATE (en el buffer encolado) debe venir después
+        assert "send_packets" in call_order
+        pos_update_index = call_order.index("send_packets")
         assert pos_update_index > change_map_index
 
     @pytest.mark.asyncio
@@ -390,8 +361,11 @@ class TestPlayerMapService:
             message_sender=mock_message_sender,
         )
 
-        # Debe enviar CHARACTER_CREATE del propio jugador + otros 2
-        assert mock_message_sender.send_character_create.call_count >= 3
+        # CHARACTER_CREATE propio + los otros 2 en el snapshot
+        mock_message_sender.send_character_create.assert_awaited_once()
+        payload = mock_message_sender.send_packets.await_args.args[0]
+        assert build_character_create_response(2, 2, 3, 3, 50, 50, name="Player2") in payload
+        assert build_character_create_response(3, 2, 3, 3, 50, 50, name="Player3") in payload
 
     @pytest.mark.asyncio
     async def test_spawn_in_map_with_npcs(self, player_map_service, mock_message_sender):
@@ -425,8 +399,13 @@ class TestPlayerMapService:
             message_sender=mock_message_sender,
         )
 
-        # Debe enviar CHARACTER_CREATE del jugador + NPC
-        assert mock_message_sender.send_character_create.call_count >= 2
+        # CHARACTER_CREATE del jugador + NPC en el snapshot
+        mock_message_sender.send_character_create.assert_awaited_once()
+        mock_message_sender.send_packets.assert_awaited_once_with(
+            build_character_create_response(
+                char_index=10001, body=14, head=0, heading=3, x=30, y=30, name="Goblin"
+            )
+        )
 
     @pytest.mark.asyncio
     async def test_transition_same_map(self, player_map_service, mock_message_sender):
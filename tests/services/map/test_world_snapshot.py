@@ -0,0 +1,132 @@
+"""Tests para el snapshot binario del mundo (world_snapshot)."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from src.game.map_manager import MapManager
+from src.services.map.world_snapshot import (
+    WorldMapData,
+    WorldSnapshot,
+    collect_world,
+    load_world_snapshot,
+    source_fingerprint,
+    write_world_snapshot,
+)
+
+
+@pytest.fixture
+def maps_dir(tmp_path: Path) -> Path:
+    """Directorio map_data con un archivo fuente."""
+    directory = tmp_path / "map_data"
+    directory.mkdir()
+    (directory / "metadata_001-051.json").write_text("[]", encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def snapshot_path(tmp_path: Path, maps_dir: Path) -> Path:
+    """Snapshot con un mapa 20x10 y otro 100x100."""
+    path = tmp_path / "map_binary" / "world.snapshot"
+    maps = [
+        WorldMapData(
+            1,
+            20,
+            10,
+            layers={
+                "collision": {(1, 1), (20, 10), (5, 3)},
+                "water": {(2, 2)},
+                "trees": {(7, 8), (8, 8)},
+            },
+            exits={(20, 5): (2, 1, 5)},
+            signs={(3, 3): 1234},
+            doors={(4, 4): 5678},
+        ),
+        WorldMapData(2, 100, 100, layers={"mines": {(100, 100)}}),
+    ]
+    write_world_snapshot(path, maps, source_fingerprint(maps_dir))
+    return path
+
+
+def test_round_trip_layers_and_tables(snapshot_path: Path) -> None:
+    """Las vistas y tablas reflejan lo escrito."""
+    snapshot = WorldSnapshot(snapshot_path)
+    first = snapshot.get_map(1)
+
+    assert snapshot.map_ids() == [1, 2]
+    assert first is not None
+    assert (first.width, first.height) == (20, 10)
+    collision = first.layer("collision")
+    assert (20, 10) in collision
+    assert (5, 3) in collision
+    assert (5, 4) not in collision
+    assert (21, 10) not in collision
+    assert set(collision) == {(1, 1), (20, 10), (5, 3)}
+    assert len(first.layer("trees")) == 2
+    assert len(first.layer("forges")) == 0
+    assert first.exits() == {(1, 20, 5): {"to_map": 2, "to_x": 1, "to_y": 5}}
+    assert first.signs() == {(3, 3): 1234}
+    assert first.doors() == {(4, 4): 5678}
+
+    second = snapshot.get_map(2)
+    assert second is not None
+    assert (100, 100) in second.layer("mines")
+
+
+def test_corrupted_snapshot_is_ignored(snapshot_path: Path, maps_dir: Path) -> None:
+    """Un checksum inválido descarta el snapshot."""
+    data = bytearray(snapshot_path.read_bytes())
+    data[-1] ^= 0xFF
+    snapshot_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="checksum"):
+        WorldSnapshot(snapshot_path)
+    assert load_world_snapshot(maps_dir, snapshot_path) is None
+
+
+def test_stale_snapshot_is_ignored(snapshot_path: Path, maps_dir: Path) -> None:
+    """Si cambian los archivos fuente el snapshot deja de usarse."""
+    assert load_world_snapshot(maps_dir, snapshot_path) is not None
+
+    source = maps_dir / "metadata_001-051.json"
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_world_snapshot(maps_dir, snapshot_path) is None
+
+
+def test_map_manager_loads_from_snapshot(snapshot_path: Path) -> None:
+    """MapManager usa el bitplane de colisión y los exits del snapshot."""
+    snapshot_map = WorldSnapshot(snapshot_path).get_map(1)
+    assert snapshot_map is not None
+    map_manager = MapManager()
+
+    map_manager.load_map_snapshot(snapshot_map)
+
+    assert map_manager.get_map_size(1) == (20, 10)
+    assert not map_manager.can_move_to(1, 5, 3)
+    assert map_manager.can_move_to(1, 6, 3)
+    assert map_manager.get_exit_tile(1, 20, 5) == {"to_map": 2, "to_x": 1, "to_y": 5}
+    assert not map_manager.get_walkability(1).is_walkable(1, 1)
+
+
+def test_collect_world_reads_map_data(maps_dir: Path, tmp_path: Path) -> None:
+    """El build toma colisión de la metadata y las capas de recursos de blocked."""
+    (maps_dir / "metadata_001-051.json").write_text('[{"w": 100, "h": 100}]', encoding="utf-8")
+    (maps_dir / "blocked_001-050.json").write_text(
+        '{"m": 1, "x": 5, "y": 5, "t": "b"}\n{"m": 1, "x": 6, "y": 5, "t": "w"}\n',
+        encoding="utf-8",
+    )
+    path = tmp_path / "world.snapshot"
+
+    write_world_snapshot(path, collect_world(maps_dir), source_fingerprint(maps_dir))
+    snapshot = load_world_snapshot(maps_dir, path)
+
+    assert snapshot is not None
+    assert len(snapshot) == 51
+    first = snapshot.get_map(1)
+    assert first is not None
+    assert set(first.layer("collision")) == {(5, 5), (6, 5)}
+    assert set(first.layer("water")) == {(6, 5)}
+    assert set(first.layer("blocked")) == {(5, 5), (6, 5)}
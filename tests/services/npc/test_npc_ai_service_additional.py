@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.game.player_snapshot import MapPlayerSnapshot
 from src.models.npc import NPC
 from src.models.player_stats import PlayerStats
 from src.services.npc.npc_ai_service import NPCAIService
@@ -121,6 +122,7 @@ class TestFindNearestPlayer:
     ) -> None:
         """Test cuando el jugador est? muerto."""
         mock_map_manager.get_players_in_map.return_value = [1]
+        mock_map_manager.get_player_position.return_value = (1, 51, 50)
         mock_player_repo.is_alive = AsyncMock(return_value=False)  # Muerto
         mock_player_repo.get_player_stats = AsyncMock()
 
@@ -140,9 +142,7 @@ class TestFindNearestPlayer:
         mock_map_manager.get_players_in_map.return_value = [1]
         mock_player_repo.is_alive = AsyncMock(return_value=True)
         mock_player_repo.get_player_stats = AsyncMock()
-        mock_player_repo.get_position = AsyncMock(
-            return_value={"map": 2, "x": 50, "y": 50}
-        )  # Mapa diferente
+        mock_map_manager.get_player_position.return_value = (2, 50, 50)  # Mapa diferente
 
         result = await ai_service.find_nearest_player(sample_npc)
 
@@ -161,9 +161,7 @@ class TestFindNearestPlayer:
         mock_map_manager.get_players_in_map.return_value = [1]
         mock_player_repo.is_alive = AsyncMock(return_value=True)
         mock_player_repo.get_player_stats = AsyncMock()
-        mock_player_repo.get_position = AsyncMock(
-            return_value={"map": 1, "x": 100, "y": 100}
-        )  # Muy lejos
+        mock_map_manager.get_player_position.return_value = (1, 100, 100)  # Muy lejos
 
         result = await ai_service.find_nearest_player(sample_npc)
 
@@ -183,12 +181,10 @@ class TestFindNearestPlayer:
         mock_player_repo.is_alive = AsyncMock(return_value=True)
         mock_player_repo.get_player_stats = AsyncMock()
         # Jugador 1 m?s cerca, jugador 2 m?s lejos
-        mock_player_repo.get_position = AsyncMock(
-            side_effect=[
-                {"map": 1, "x": 51, "y": 50},  # Distancia 1
-                {"map": 1, "x": 55, "y": 50},  # Distancia 5
-            ]
-        )
+        mock_map_manager.get_player_position.side_effect = [
+            (1, 51, 50),  # Distancia 1
+            (1, 55, 50),  # Distancia 5
+        ]
 
         result = await ai_service.find_nearest_player(sample_npc)
 
@@ -197,6 +193,25 @@ class TestFindNearestPlayer:
         assert user_id == 1  # Jugador m?s cercano
         assert x == 51
         assert y == 50
+        mock_player_repo.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_nearest_player_uses_shared_snapshot(
+        self,
+        ai_service: NPCAIService,
+        sample_npc: NPC,
+        mock_map_manager: MagicMock,
+        mock_player_repo: MagicMock,
+    ) -> None:
+        """Con un snapshot del mapa no se consulta ningún jugador."""
+        snapshot = MapPlayerSnapshot(sample_npc.map_id)
+        snapshot.add(7, 52, 50)
+        mock_map_manager.get_players_in_map.side_effect = AssertionError("usa el snapshot")
+
+        result = await ai_service.find_nearest_player(sample_npc, snapshot)
+
+        assert result == (7, 52, 50)
+        mock_player_repo.is_alive.assert_not_called()
 
 
 class TestGetDirectionToTarget:
@@ -547,6 +562,50 @@ class TestTryMoveTowards:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_try_move_towards_uses_flow_field_first(
+        self,
+        ai_service: NPCAIService,
+        sample_npc: NPC,
+        mock_map_manager: MagicMock,
+    ) -> None:
+        """Con campo de flujo el A* no se consulta si el campo da un paso."""
+        flow_field_service = MagicMock()
+        flow_field_service.get_next_step = MagicMock(return_value=(50, 49, 1))
+        ai_service.flow_field_service = flow_field_service
+        pathfinding_service = MagicMock()
+        ai_service.pathfinding_service = pathfinding_service
+        mock_map_manager.move_npc = MagicMock()
+
+        result = await ai_service.try_move_towards(sample_npc, 50, 40, target_user_id=7)
+
+        assert result is True
+        assert (sample_npc.x, sample_npc.y, sample_npc.heading) == (50, 49, 1)
+        flow_field_service.get_next_step.assert_called_once_with(1, 50, 50, 50, 40, target_id=7)
+        pathfinding_service.get_next_step.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_try_move_towards_flow_field_falls_back_to_astar(
+        self,
+        ai_service: NPCAIService,
+        sample_npc: NPC,
+        mock_map_manager: MagicMock,
+    ) -> None:
+        """Si el campo no da paso (fuera de radio, vecinos ocupados) se usa A*."""
+        flow_field_service = MagicMock()
+        flow_field_service.get_next_step = MagicMock(return_value=None)
+        ai_service.flow_field_service = flow_field_service
+        pathfinding_service = MagicMock()
+        pathfinding_service.get_next_step = MagicMock(return_value=(51, 50, 2))
+        ai_service.pathfinding_service = pathfinding_service
+        mock_map_manager.is_tile_occupied = MagicMock(return_value=False)
+        mock_map_manager.move_npc = MagicMock()
+
+        result = await ai_service.try_move_towards(sample_npc, 60, 50, target_user_id=7)
+
+        assert result is True
+        assert sample_npc.x == 51
+
 
 class TestProcessHostileNPC:
     """Tests para process_hostile_npc."""
@@ -593,6 +652,7 @@ class TestProcessHostileNPC:
         mock_player_repo.get_position = AsyncMock(
             return_value={"map": 1, "x": 51, "y": 50}
         )  # Adyacente
+        mock_map_manager.get_player_position.return_value = (1, 51, 50)
         mock_combat_service.npc_attack_player = AsyncMock(return_value={"damage": 10})
 
         message_sender = MagicMock()
@@ -622,9 +682,7 @@ class TestProcessHostileNPC:
         mock_map_manager.get_players_in_map.return_value = [1]
         mock_player_repo.is_alive = AsyncMock(return_value=True)
         mock_player_repo.get_player_stats = AsyncMock()
-        mock_player_repo.get_position = AsyncMock(
-            return_value={"map": 1, "x": 55, "y": 50}
-        )  # Lejos pero en rango
+        mock_map_manager.get_player_position.return_value = (1, 55, 50)  # Lejos pero en rango
         mock_map_manager.can_move_to = MagicMock(return_value=True)
         mock_map_manager.is_tile_occupied = MagicMock(return_value=False)
         mock_map_manager.move_npc = MagicMock()
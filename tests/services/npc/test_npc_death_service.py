@@ -189,6 +189,26 @@ class TestNPCDeathService:
         # Assert - NPC eliminado de Redis
         npc_repo.remove_npc.assert_called_once_with("npc_123")
 
+    async def test_remove_npc_from_game_notifies_npc_service(self) -> None:
+        """Al morir se ejecutan los hooks de eliminación de NPCService."""
+        map_manager = MagicMock()
+        broadcast_service = MagicMock()
+        broadcast_service.broadcast_character_remove = AsyncMock()
+        npc_service = MagicMock()
+        service = NPCDeathService(
+            map_manager=map_manager,
+            npc_repo=MagicMock(),
+            player_repo=MagicMock(),
+            broadcast_service=broadcast_service,
+            npc_service=npc_service,
+        )
+        npc = MagicMock(instance_id="npc_123", map_id=1, char_index=100, fx=0)
+
+        await service._remove_npc_from_game(npc)
+
+        map_manager.remove_npc.assert_called_once_with(1, "npc_123")
+        npc_service.notify_npc_removed.assert_called_once_with("npc_123")
+
     async def test_handle_npc_death_drops_gold(self) -> None:
         """Test que el NPC dropea oro al morir."""
         # Setup
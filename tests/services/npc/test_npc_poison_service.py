@@ -0,0 +1,133 @@
+"""Tests para NPCPoisonService."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.game.timer_scheduler import TimerScheduler
+from src.services.npc.npc_poison_service import (
+    NPC_POISON_DAMAGE_PER_TICK,
+    NPC_POISON_TICK_INTERVAL,
+    NPCPoisonService,
+)
+
+
+class FakeClock:
+    """Reloj manual para los timers."""
+
+    def __init__(self) -> None:
+        """Inicializa el reloj."""
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        """Retorna el tiempo actual."""
+        return self.now
+
+
+@pytest.fixture
+def npc_service() -> MagicMock:
+    """Mock de NPCService."""
+    service = MagicMock()
+    service.npc_repository.update_npc_hp = AsyncMock()
+    service.npc_repository.update_npc_poisoned_until = AsyncMock()
+    service.remove_npc = AsyncMock()
+    # Por defecto el NPC sigue en el mundo (ver ``make_npc``)
+    service.map_manager.get_npc_by_instance_id.side_effect = lambda _instance_id: (
+        service.tracked_npc
+    )
+    return service
+
+
+def make_npc(npc_service: MagicMock, hp: int, poisoned_for: float) -> MagicMock:
+    """Crea un NPC envenenado y presente en el MapManager del servicio."""
+    npc = MagicMock()
+    npc.instance_id = "npc-1"
+    npc.name = "Orco"
+    npc.hp = hp
+    npc.max_hp = 100
+    npc.poisoned_until = time.time() + poisoned_for
+    npc.poisoned_by_user_id = 7
+    npc_service.tracked_npc = npc
+    return npc
+
+
+@pytest.mark.asyncio
+async def test_poison_ticks_until_npc_dies(npc_service: MagicMock) -> None:
+    """Cada tick resta vida y al morir se limpia el veneno y se remueve el NPC."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    service = NPCPoisonService(npc_service, scheduler)
+    npc = make_npc(npc_service, hp=NPC_POISON_DAMAGE_PER_TICK + 1, poisoned_for=60)
+
+    service.track(npc)
+    service.track(npc)  # ya seguido: no duplica el timer
+    assert len(scheduler) == 1
+
+    clock.now += NPC_POISON_TICK_INTERVAL
+    await scheduler.run_due()
+    assert npc.hp == 1
+    assert service.get_tracked_count() == 1
+
+    clock.now += NPC_POISON_TICK_INTERVAL
+    await scheduler.run_due()
+    assert npc.hp == 0
+    npc_service.remove_npc.assert_called_once_with(npc)
+    assert not npc.poisoned_until
+    assert service.get_tracked_count() == 0
+    assert len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_cured_npc_stops_ticking(npc_service: MagicMock) -> None:
+    """Si el NPC se curó, el timer no aplica daño ni se reagenda."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    service = NPCPoisonService(npc_service, scheduler)
+    npc = make_npc(npc_service, hp=50, poisoned_for=60)
+
+    service.track(npc)
+    npc.poisoned_until = 0.0
+    clock.now += NPC_POISON_TICK_INTERVAL
+    await scheduler.run_due()
+
+    npc_service.npc_repository.update_npc_hp.assert_not_called()
+    assert service.get_tracked_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_untrack_cancels_pending_tick(npc_service: MagicMock) -> None:
+    """Un NPC que sale del mundo no conserva su timer de veneno."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    service = NPCPoisonService(npc_service, scheduler)
+    npc = make_npc(npc_service, hp=50, poisoned_for=60)
+
+    service.track(npc)
+    service.untrack(npc.instance_id)
+    service.untrack(npc.instance_id)  # ya no seguido: no-op
+
+    assert service.get_tracked_count() == 0
+    assert len(scheduler) == 0
+    clock.now += NPC_POISON_TICK_INTERVAL
+    await scheduler.run_due()
+    npc_service.npc_repository.update_npc_hp.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_tick_skips_npc_no_longer_in_world(npc_service: MagicMock) -> None:
+    """Si el NPC ya no está en el MapManager el tick no aplica daño ni se reagenda."""
+    clock = FakeClock()
+    scheduler = TimerScheduler(clock=clock)
+    service = NPCPoisonService(npc_service, scheduler)
+    npc = make_npc(npc_service, hp=50, poisoned_for=60)
+
+    service.track(npc)
+    npc_service.tracked_npc = None  # muerto o despawneado por otra vía
+    clock.now += NPC_POISON_TICK_INTERVAL
+    await scheduler.run_due()
+
+    npc_service.npc_repository.update_npc_hp.assert_not_called()
+    npc_service.remove_npc.assert_not_called()
+    assert service.get_tracked_count() == 0
+    assert len(scheduler) == 0
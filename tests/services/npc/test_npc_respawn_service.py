@@ -1,13 +1,24 @@
 """Tests para NPCRespawnService."""
 
-import asyncio
-import contextlib
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.game.timer_scheduler import TimerScheduler
 from src.models.npc import NPC
-from src.services.npc.npc_respawn_service import NPCRespawnService
+from src.services.npc.npc_respawn_service import RESPAWN_RETRY_SECONDS, NPCRespawnService
+
+
+class FakeClock:
+    """Reloj manual para los timers."""
+
+    def __init__(self) -> None:
+        """Inicializa el reloj."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Retorna el tiempo actual."""
+        return self.now
 
 
 @pytest.fixture
@@ -20,9 +31,21 @@ def mock_npc_service() -> MagicMock:
 
 
 @pytest.fixture
-def respawn_service(mock_npc_service: MagicMock) -> NPCRespawnService:
+def clock() -> FakeClock:
+    """Reloj manual compartido por el scheduler."""
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock: FakeClock) -> TimerScheduler:
+    """Scheduler de timers con reloj manual."""
+    return TimerScheduler(clock=clock)
+
+
+@pytest.fixture
+def respawn_service(mock_npc_service: MagicMock, scheduler: TimerScheduler) -> NPCRespawnService:
     """Crea una instancia de NPCRespawnService con mocks."""
-    return NPCRespawnService(mock_npc_service)
+    return NPCRespawnService(mock_npc_service, scheduler)
 
 
 @pytest.fixture
@@ -125,18 +148,23 @@ class TestScheduleRespawn:
     async def test_schedule_respawn_with_respawn_time(
         self,
         respawn_service: NPCRespawnService,
+        scheduler: TimerScheduler,
+        clock: FakeClock,
         sample_npc: NPC,
     ) -> None:
         """Test programar respawn con tiempo de respawn válido."""
         await respawn_service.schedule_respawn(sample_npc)
 
-        # Debe crear una tarea de respawn
-        assert sample_npc.instance_id in respawn_service._respawn_tasks
+        # Debe agendar un timer dentro del rango de respawn
+        timer = respawn_service._respawn_timers[sample_npc.instance_id]
+        assert clock.now + 5 <= timer.when <= clock.now + 10
+        assert len(scheduler) == 1
 
     @pytest.mark.asyncio
     async def test_schedule_respawn_no_respawn_time(
         self,
         respawn_service: NPCRespawnService,
+        scheduler: TimerScheduler,
         sample_npc: NPC,
     ) -> None:
         """Test programar respawn sin tiempo de respawn (respawn_time=0)."""
@@ -144,155 +172,99 @@ class TestScheduleRespawn:
 
         await respawn_service.schedule_respawn(sample_npc)
 
-        # No debe crear tarea de respawn
-        assert sample_npc.instance_id not in respawn_service._respawn_tasks
+        # No debe agendar respawn
+        assert sample_npc.instance_id not in respawn_service._respawn_timers
+        assert len(scheduler) == 0
 
     @pytest.mark.asyncio
     async def test_schedule_respawn_cancels_existing(
         self,
         respawn_service: NPCRespawnService,
+        scheduler: TimerScheduler,
         sample_npc: NPC,
     ) -> None:
         """Test que schedule_respawn cancela respawn existente."""
-        # Crear primera tarea
         await respawn_service.schedule_respawn(sample_npc)
-        first_task = respawn_service._respawn_tasks[sample_npc.instance_id]
+        first_timer = respawn_service._respawn_timers[sample_npc.instance_id]
 
-        # Programar segundo respawn
         await respawn_service.schedule_respawn(sample_npc)
-        second_task = respawn_service._respawn_tasks[sample_npc.instance_id]
+        second_timer = respawn_service._respawn_timers[sample_npc.instance_id]
 
-        # Debe ser una tarea diferente
-        assert first_task != second_task
-        # Esperar un poco para que la cancelación se procese
-        await asyncio.sleep(0.01)
-        # La primera tarea debe estar cancelada o completada
-        assert first_task.cancelled() or first_task.done()
+        assert first_timer is not second_timer
+        assert first_timer.cancelled
+        assert len(scheduler) == 1
 
 
-class TestRespawnAfterDelay:
-    """Tests para _respawn_after_delay."""
+class TestAttemptRespawn:
+    """Tests para el respawn al vencer el timer."""
 
     @pytest.mark.asyncio
-    async def test_respawn_after_delay_success(
+    async def test_respawn_when_timer_expires(
         self,
         respawn_service: NPCRespawnService,
         mock_npc_service: MagicMock,
+        scheduler: TimerScheduler,
+        clock: FakeClock,
         sample_npc: NPC,
     ) -> None:
-        """Test respawn exitoso después del delay."""
-        # Setup
+        """Test respawn exitoso cuando vence el timer."""
         mock_npc_service.map_manager.can_move_to.return_value = True
-        new_npc = NPC(
-            npc_id=1,
-            char_index=10002,
-            instance_id="test-instance-2",
-            map_id=1,
-            x=51,
-            y=50,
-            heading=3,
-            name="Orco",
-            description="Un orco hostil",
-            body_id=100,
-            head_id=0,
-            hp=50,
-            max_hp=100,
-            level=5,
-            is_hostile=True,
-            is_attackable=True,
-            respawn_time=5,
-            respawn_time_max=10,
+        mock_npc_service.spawn_npc.return_value = MagicMock(
+            name="Orco", x=51, y=50, map_id=1, char_index=10002
         )
-        mock_npc_service.spawn_npc.return_value = new_npc
+        await respawn_service.schedule_respawn(sample_npc)
+
+        # Antes del deadline no pasa nada
+        await scheduler.run_due()
+        mock_npc_service.spawn_npc.assert_not_called()
 
-        # Execute
-        await respawn_service._respawn_after_delay(
-            sample_npc, delay_seconds=0
-        )  # Sin delay para test rápido
+        clock.now += 10
+        await scheduler.run_due()
 
-        # Assert
         mock_npc_service.spawn_npc.assert_called_once()
-        # La tarea debe limpiarse después del respawn
-        assert sample_npc.instance_id not in respawn_service._respawn_tasks
+        assert respawn_service.get_pending_respawns_count() == 0
+        assert len(scheduler) == 0
 
     @pytest.mark.asyncio
-    async def test_respawn_after_delay_no_free_position(
+    async def test_respawn_no_free_position_reschedules(
         self,
         respawn_service: NPCRespawnService,
         mock_npc_service: MagicMock,
+        clock: FakeClock,
         sample_npc: NPC,
     ) -> None:
-        """Test respawn cuando no hay posición libre (debe reintentar)."""
-        # Setup - todas las posiciones bloqueadas
+        """Test respawn sin posición libre: reagenda el intento."""
         mock_npc_service.map_manager.can_move_to.return_value = False
         mock_npc_service.map_manager.get_tile_occupant.return_value = None
 
-        # Execute con delay 0 y timeout corto
-        task = asyncio.create_task(
-            respawn_service._respawn_after_delay(sample_npc, delay_seconds=0)
-        )
-
-        # Esperar un poco para que intente
-        await asyncio.sleep(0.1)
+        await respawn_service._attempt_respawn(sample_npc, 1)
 
-        # Cancelar la tarea para que no siga intentando indefinidamente
-        task.cancel()
-
-        with contextlib.suppress(asyncio.CancelledError):
-            await task
-
-        # Debe haber intentado spawnear (aunque falló)
-        # No verificamos el número exacto de intentos porque es aleatorio
+        mock_npc_service.spawn_npc.assert_not_called()
+        timer = respawn_service._respawn_timers[sample_npc.instance_id]
+        assert timer.when == clock.now + RESPAWN_RETRY_SECONDS
+        assert timer.args == (sample_npc, 2)
 
     @pytest.mark.asyncio
-    async def test_respawn_after_delay_spawn_fails(
+    async def test_respawn_spawn_fails_retries_until_success(
         self,
         respawn_service: NPCRespawnService,
         mock_npc_service: MagicMock,
+        scheduler: TimerScheduler,
+        clock: FakeClock,
         sample_npc: NPC,
     ) -> None:
-        """Test respawn cuando spawn_npc falla."""
-        # Setup
+        """Test respawn cuando spawn_npc falla: reintenta en el lote siguiente."""
         mock_npc_service.map_manager.can_move_to.return_value = True
-        mock_npc_service.spawn_npc.side_effect = ValueError("Tile ocupado")
+        mock_npc_service.spawn_npc.side_effect = [ValueError("Tile ocupado"), MagicMock()]
 
-        # Execute con delay 0
-        task = asyncio.create_task(
-            respawn_service._respawn_after_delay(sample_npc, delay_seconds=0)
-        )
+        await respawn_service._attempt_respawn(sample_npc, 1)
+        assert respawn_service.get_pending_respawns_count() == 1
 
-        # Esperar un poco
-        await asyncio.sleep(0.1)
+        clock.now += RESPAWN_RETRY_SECONDS
+        await scheduler.run_due()
 
-        # Cancelar
-        task.cancel()
-
-        with contextlib.suppress(asyncio.CancelledError):
-            await task
-
-        # Debe haber intentado spawnear
-        assert mock_npc_service.spawn_npc.called
-
-    @pytest.mark.asyncio
-    async def test_respawn_after_delay_cancelled(
-        self,
-        respawn_service: NPCRespawnService,
-        sample_npc: NPC,
-    ) -> None:
-        """Test respawn cancelado."""
-        # Crear tarea
-        task = asyncio.create_task(
-            respawn_service._respawn_after_delay(sample_npc, delay_seconds=10)
-        )
-
-        # Cancelar inmediatamente
-        task.cancel()
-
-        with contextlib.suppress(asyncio.CancelledError):
-            await task
-
-        # La tarea debe limpiarse
-        assert sample_npc.instance_id not in respawn_service._respawn_tasks
+        assert mock_npc_service.spawn_npc.call_count == 2
+        assert respawn_service.get_pending_respawns_count() == 0
 
 
 class TestCancelRespawn:
@@ -311,8 +283,8 @@ class TestCancelRespawn:
         # Cancelar
         respawn_service.cancel_respawn(sample_npc.instance_id)
 
-        # La tarea debe estar cancelada y removida
-        assert sample_npc.instance_id not in respawn_service._respawn_tasks
+        # El timer debe quedar cancelado y removido
+        assert sample_npc.instance_id not in respawn_service._respawn_timers
 
     def test_cancel_respawn_nonexistent(
         self,
@@ -364,8 +336,50 @@ class TestCancelAllRespawns:
         # Cancelar todos
         respawn_service.cancel_all_respawns()
 
-        # Todas las tareas deben estar canceladas
-        assert len(respawn_service._respawn_tasks) == 0
+        # Todos los timers deben estar cancelados
+        assert len(respawn_service._respawn_timers) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_map_respawns_only_affects_that_map(
+        self,
+        respawn_service: NPCRespawnService,
+        mock_npc_service: MagicMock,
+        clock: FakeClock,
+        scheduler: TimerScheduler,
+        sample_npc: NPC,
+    ) -> None:
+        """Descargar un mapa cancela sus respawns: al volver no se duplican NPCs."""
+        other_map_npc = NPC(
+            npc_id=2,
+            char_index=10002,
+            instance_id="test-instance-2",
+            map_id=2,
+            x=50,
+            y=50,
+            heading=3,
+            name="Lobo",
+            description="Un lobo",
+            body_id=101,
+            head_id=0,
+            hp=30,
+            max_hp=60,
+            level=3,
+            is_hostile=True,
+            is_attackable=True,
+            respawn_time=3,
+            respawn_time_max=6,
+        )
+        await respawn_service.schedule_respawn(sample_npc)
+        await respawn_service.schedule_respawn(other_map_npc)
+
+        await respawn_service.cancel_map_respawns(1)
+
+        assert list(respawn_service._respawn_timers) == ["test-instance-2"]
+        mock_npc_service.map_manager.can_move_to.return_value = True
+        clock.now += 60
+        await scheduler.run_due()
+        mock_npc_service.spawn_npc.assert_awaited_once()
+        assert mock_npc_service.spawn_npc.await_args.kwargs["map_id"] == 2
 
 
 class TestGetPendingRespawnsCount:
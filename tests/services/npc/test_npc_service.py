@@ -0,0 +1,62 @@
+"""Tests para NPCService (hooks de eliminación de NPCs)."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.services.map.pathfinding_service import PathfindingService
+from src.services.npc.npc_service import NPCService
+
+
+@pytest.fixture
+def npc_service() -> Iterator[NPCService]:
+    """NPCService con dependencias mock (singleton reiniciado).
+
+    Yields:
+        NPCService: Servicio listo para usar.
+    """
+    NPCService.reset_instance()
+    broadcast_service = MagicMock()
+    broadcast_service.broadcast_character_remove = AsyncMock()
+    npc_repository = MagicMock()
+    npc_repository.remove_npc = AsyncMock()
+    yield NPCService(npc_repository, MagicMock(), MagicMock(), broadcast_service)
+    NPCService.reset_instance()
+
+
+@pytest.mark.asyncio
+async def test_remove_npc_runs_removal_hooks(npc_service: NPCService) -> None:
+    """Al eliminar un NPC se ejecutan los hooks con su instance_id."""
+    hook = MagicMock()
+    npc_service.add_removal_hook(hook)
+    npc = MagicMock(instance_id="npc-1", map_id=1, char_index=10)
+
+    await npc_service.remove_npc(npc)
+
+    hook.assert_called_once_with("npc-1")
+    npc_service.map_manager.remove_npc.assert_called_once_with(1, "npc-1")
+
+
+@pytest.mark.asyncio
+async def test_remove_npc_forgets_cached_path(npc_service: NPCService) -> None:
+    """La ruta cacheada del NPC no sobrevive a su eliminación."""
+    pathfinding = PathfindingService(MagicMock())
+    pathfinding._paths["npc-1"] = MagicMock()
+    npc_service.add_removal_hook(pathfinding.forget)
+
+    await npc_service.remove_npc(MagicMock(instance_id="npc-1", map_id=1, char_index=10))
+
+    assert "npc-1" not in pathfinding._paths
+
+
+@pytest.mark.asyncio
+async def test_failing_hook_does_not_block_the_rest(npc_service: NPCService) -> None:
+    """Un hook que falla no impide ejecutar los siguientes."""
+    second = MagicMock()
+    npc_service.add_removal_hook(MagicMock(side_effect=RuntimeError("boom")))
+    npc_service.add_removal_hook(second)
+
+    npc_service.notify_npc_removed("npc-1")
+
+    second.assert_called_once_with("npc-1")
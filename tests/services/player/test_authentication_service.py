@@ -8,6 +8,7 @@ from src.messaging.message_sender import MessageSender
 from src.network.client_connection import ClientConnection
 from src.repositories.account_repository import AccountRepository
 from src.services.player.authentication_service import AuthenticationService
+from src.utils.password_utils import PasswordPoolBusyError
 
 
 @pytest.mark.asyncio
@@ -106,6 +107,29 @@ async def test_authenticate_wrong_password():
     assert writer.write.call_count == 1
 
 
+@pytest.mark.asyncio
+async def test_authenticate_password_pool_busy():
+    """Verifica que un pool de contraseñas saturado rechace el login con un error."""
+    writer = MagicMock()
+    writer.get_extra_info.return_value = ("127.0.0.1", 12345)
+    writer.drain = AsyncMock()
+
+    account_repo = MagicMock(spec=AccountRepository)
+    account_repo.get_account = AsyncMock(return_value={"user_id": 123, "char_job": 2})
+    account_repo.verify_password = AsyncMock(side_effect=PasswordPoolBusyError("saturado"))
+
+    reader = MagicMock()
+    connection = ClientConnection(reader, writer)
+    message_sender = MessageSender(connection)
+
+    auth_service = AuthenticationService(account_repo, message_sender)
+
+    result = await auth_service.authenticate("testuser", "password123")
+
+    assert result is None
+    assert writer.write.call_count == 1
+
+
 @pytest.mark.asyncio
 async def test_authenticate_repo_not_available():
     """Verifica manejo cuando el repositorio no está disponible."""
@@ -0,0 +1,111 @@
+"""Tests para MorphExpiryService."""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.game.timer_scheduler import TimerScheduler
+from src.services.player.morph_expiry_service import MorphExpiryService
+
+
+@pytest.fixture
+def mock_player_repo() -> MagicMock:
+    """Mock de PlayerRepository."""
+    repo = MagicMock()
+    repo.get_morphed_appearance = AsyncMock(return_value=None)
+    repo.clear_morphed_appearance = AsyncMock()
+    repo.get_position = AsyncMock(return_value={"map": 1, "heading": 3})
+    return repo
+
+
+@pytest.fixture
+def mock_map_manager() -> MagicMock:
+    """Mock de MapManager."""
+    manager = MagicMock()
+    manager.get_message_sender = MagicMock(return_value=None)
+    manager.get_all_message_senders_in_map = MagicMock(return_value=[])
+    return manager
+
+
+@pytest.fixture
+def mock_account_repo() -> MagicMock:
+    """Mock de AccountRepository."""
+    repo = MagicMock()
+    repo.get_account_appearance = AsyncMock(return_value={"char_race": 2, "char_head": 3})
+    return repo
+
+
+@pytest.fixture
+def service(
+    mock_player_repo: MagicMock, mock_map_manager: MagicMock, mock_account_repo: MagicMock
+) -> MorphExpiryService:
+    """Servicio con scheduler real."""
+    return MorphExpiryService(
+        mock_player_repo, mock_map_manager, TimerScheduler(), mock_account_repo
+    )
+
+
+@pytest.mark.asyncio
+async def test_restore_not_morphed(
+    service: MorphExpiryService, mock_player_repo: MagicMock
+) -> None:
+    """Sin apariencia morfeada no se restaura nada."""
+    assert not await service.restore_if_expired(1)
+
+    mock_player_repo.clear_morphed_appearance.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_restore_not_expired_reschedules(
+    service: MorphExpiryService, mock_player_repo: MagicMock
+) -> None:
+    """Un mimetismo renovado se reagenda para su nuevo vencimiento."""
+    future_time = time.time() + 60
+    mock_player_repo.get_morphed_appearance = AsyncMock(
+        return_value={"morphed_until": future_time, "morphed_body": 10, "morphed_head": 11}
+    )
+
+    assert not await service.restore_if_expired(1)
+
+    mock_player_repo.clear_morphed_appearance.assert_not_called()
+    assert service.get_pending_count() == 1
+    assert service.timer_scheduler.get_metrics()["pending"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timer_restores_expired_morph(
+    service: MorphExpiryService,
+    mock_player_repo: MagicMock,
+    mock_map_manager: MagicMock,
+) -> None:
+    """Al vencer el timer se limpia el morph y se avisa al jugador y al mapa."""
+    mock_player_repo.get_morphed_appearance = AsyncMock(
+        return_value={"morphed_until": time.time() - 1, "morphed_body": 10, "morphed_head": 11}
+    )
+    own_sender = MagicMock()
+    own_sender.send_character_change = AsyncMock()
+    other_sender = MagicMock()
+    other_sender.send_character_change = AsyncMock()
+    mock_map_manager.get_message_sender.return_value = own_sender
+    mock_map_manager.get_all_message_senders_in_map.return_value = [other_sender]
+
+    service.schedule(1, time.time() - 1)
+    assert await service.timer_scheduler.run_due() == 1
+
+    mock_player_repo.clear_morphed_appearance.assert_called_once_with(1)
+    own_sender.send_character_change.assert_called_once_with(
+        char_index=1, body=2, head=3, heading=3
+    )
+    other_sender.send_character_change.assert_called_once()
+    assert service.get_pending_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_schedule_replaces_previous_timer(service: MorphExpiryService) -> None:
+    """Un mimetismo nuevo cancela el timer del anterior."""
+    service.schedule(1, time.time() + 10)
+    service.schedule(1, time.time() + 20)
+
+    assert service.get_pending_count() == 1
+    assert len(service.timer_scheduler) == 1
@@ -4,9 +4,30 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from src.game.map_manager import MapManager
+from src.network.msg_audio import build_play_wave_response
+from src.network.msg_character import (
+    build_character_change_response,
+    build_character_create_response,
+    build_character_move_response,
+    build_character_remove_response,
+)
+from src.network.msg_map import (
+    build_block_position_response,
+    build_object_create_response,
+    build_object_delete_response,
+)
+from src.network.msg_visual_effects import build_create_fx_response
 from src.services.multiplayer_broadcast_service import MultiplayerBroadcastService
 
 
+def _make_sender() -> MagicMock:
+    """MessageSender simulado cuya conexión encola (coalesce_writes)."""
+    sender = MagicMock()
+    sender.connection = MagicMock(coalesce_writes=True)
+    return sender
+
+
 @pytest.fixture
 def mock_map_manager() -> MagicMock:
     """Crea un mock de MapManager."""
@@ -26,7 +47,7 @@ def mock_account_repo() -> MagicMock:
     """Crea un mock de AccountRepository."""
     repo = MagicMock()
     repo.get_account = AsyncMock()
-    repo.get_account_by_user_id = AsyncMock()
+    repo.get_account_appearance = AsyncMock()
     return repo
 
 
@@ -91,7 +112,7 @@ class TestNotifyPlayerSpawn:
                 {"x": 20, "y": 20, "map": 1, "heading": 2},
             ]
         )
-        mock_account_repo.get_account_by_user_id = AsyncMock(
+        mock_account_repo.get_account_appearance = AsyncMock(
             side_effect=[
                 {"char_race": 1, "char_head": 1, "username": "player2"},
                 {"char_race": 2, "char_head": 2, "username": "player3"},
@@ -164,7 +185,7 @@ class TestSendExistingPlayersToNewPlayer:
                 {"x": 20, "y": 20, "map": 1, "heading": 2},
             ]
         )
-        mock_account_repo.get_account_by_user_id = AsyncMock(
+        mock_account_repo.get_account_appearance = AsyncMock(
             side_effect=[
                 {"char_race": 1, "char_head": 1, "username": "player2"},
                 {"char_race": 2, "char_head": 2, "username": "player3"},
@@ -215,7 +236,7 @@ class TestSendExistingPlayersToNewPlayer:
         mock_player_repo.get_position = AsyncMock(
             return_value={"x": 10, "y": 10, "map": 1, "heading": 1}
         )
-        mock_account_repo.get_account_by_user_id = AsyncMock(return_value=None)  # Sin cuenta
+        mock_account_repo.get_account_appearance = AsyncMock(return_value=None)  # Sin cuenta
 
         # Execute
         await broadcast_service._send_existing_players_to_new_player(1, message_sender)
@@ -240,7 +261,7 @@ class TestSendExistingPlayersToNewPlayer:
         mock_player_repo.get_position = AsyncMock(
             return_value={"x": 10, "y": 10, "map": 1, "heading": 1}
         )
-        mock_account_repo.get_account_by_user_id = AsyncMock(
+        mock_account_repo.get_account_appearance = AsyncMock(
             return_value={"char_race": 0, "char_head": 1, "username": "player2"}
         )
 
@@ -265,8 +286,8 @@ class TestBroadcastNewPlayerToOthers:
     ) -> None:
         """Test broadcast de nuevo jugador a otros."""
         # Setup
-        sender1 = MagicMock(send_character_create=AsyncMock())
-        sender2 = MagicMock(send_character_create=AsyncMock())
+        sender1 = _make_sender()
+        sender2 = _make_sender()
 
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender1, sender2]
         mock_account_repo.get_account = AsyncMock(return_value={"char_race": 1, "char_head": 1})
@@ -281,8 +302,11 @@ class TestBroadcastNewPlayerToOthers:
 
         # Assert
         assert notified == 2
-        assert sender1.send_character_create.call_count == 1
-        assert sender2.send_character_create.call_count == 1
+        expected = build_character_create_response(
+            char_index=1, body=1, head=1, heading=3, x=50, y=50, name="newplayer"
+        )
+        sender1.connection.enqueue.assert_called_once_with(expected)
+        sender2.connection.enqueue.assert_called_once_with(expected)
 
     @pytest.mark.asyncio
     async def test_broadcast_new_player_to_others_no_account_repo(
@@ -293,7 +317,7 @@ class TestBroadcastNewPlayerToOthers:
         """Test broadcast sin account_repo (usa valores por defecto)."""
         # Setup
         broadcast_service.account_repo = None
-        sender = MagicMock(send_character_create=AsyncMock())
+        sender = _make_sender()
 
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
@@ -307,10 +331,12 @@ class TestBroadcastNewPlayerToOthers:
 
         # Assert
         assert notified == 1
-        sender.send_character_create.assert_called_once()
-        call_args = sender.send_character_create.call_args[1]
-        assert call_args["body"] == 1  # Valor por defecto
-        assert call_args["head"] == 1  # Valor por defecto
+        # body y head por defecto (1, 1)
+        sender.connection.enqueue.assert_called_once_with(
+            build_character_create_response(
+                char_index=1, body=1, head=1, heading=3, x=50, y=50, name="newplayer"
+            )
+        )
 
 
 class TestBroadcastCharacterMove:
@@ -326,14 +352,13 @@ class TestBroadcastCharacterMove:
     ) -> None:
         """Test broadcast de movimiento con cambio de heading."""
         # Setup
-        sender = MagicMock()
-        sender.send_character_move = AsyncMock()
-        sender.send_character_change = AsyncMock()
+        sender = _make_sender()
 
-        mock_map_manager.get_players_in_map.return_value = [1]
+        mock_map_manager.get_players_in_range.return_value = [1]
         mock_map_manager.get_message_sender.return_value = sender
         mock_map_manager.get_username.return_value = "testuser"
-        mock_player_repo.get_position = AsyncMock(return_value={"x": 50, "y": 50, "map": 1})
+        mock_map_manager.get_npc_by_char_index.return_value = MagicMock(body_id=100, head_id=10)
+        mock_player_repo.get_position = AsyncMock()
         mock_account_repo.get_account = AsyncMock(return_value={"char_race": 1, "char_head": 1})
 
         # Execute
@@ -350,8 +375,15 @@ class TestBroadcastCharacterMove:
 
         # Assert
         assert notified == 1
-        sender.send_character_move.assert_called_once_with(10001, 51, 50)
-        sender.send_character_change.assert_called_once()
+        # MOVE + CHANGE codificados una vez y entregados en un solo buffer
+        sender.connection.enqueue.assert_called_once_with(
+            build_character_move_response(10001, 51, 50)
+            + build_character_change_response(10001, body=100, head=10, heading=2)
+        )
+        mock_map_manager.get_players_in_range.assert_called_once_with(
+            1, 51, 50, MultiplayerBroadcastService.VISIBLE_RANGE, exclude_user_id=10001
+        )
+        mock_player_repo.get_position.assert_not_called()  # Sin Redis por observador
 
     @pytest.mark.asyncio
     async def test_broadcast_character_move_no_heading_change(
@@ -363,14 +395,12 @@ class TestBroadcastCharacterMove:
     ) -> None:
         """Test broadcast de movimiento sin cambio de heading."""
         # Setup
-        sender = MagicMock()
-        sender.send_character_move = AsyncMock()
-        sender.send_character_change = AsyncMock()
+        sender = _make_sender()
 
-        mock_map_manager.get_players_in_map.return_value = [1]
+        mock_map_manager.get_players_in_range.return_value = [1]
         mock_map_manager.get_message_sender.return_value = sender
         mock_map_manager.get_username.return_value = "testuser"
-        mock_player_repo.get_position = AsyncMock(return_value={"x": 50, "y": 50, "map": 1})
+        mock_player_repo.get_position = AsyncMock()
         mock_account_repo.get_account = AsyncMock(return_value={"char_race": 1, "char_head": 1})
 
         # Execute
@@ -387,25 +417,28 @@ class TestBroadcastCharacterMove:
 
         # Assert
         assert notified == 1
-        sender.send_character_move.assert_called_once()
-        sender.send_character_change.assert_not_called()  # No debe enviar si heading no cambió
+        # Sin CHARACTER_CHANGE si el heading no cambió
+        sender.connection.enqueue.assert_called_once_with(
+            build_character_move_response(10001, 51, 50)
+        )
 
     @pytest.mark.asyncio
     async def test_broadcast_character_move_out_of_range(
         self,
-        broadcast_service: MultiplayerBroadcastService,
-        mock_map_manager: MagicMock,
         mock_player_repo: MagicMock,
+        mock_account_repo: MagicMock,
     ) -> None:
-        """Test broadcast de movimiento fuera de rango visible."""
-        # Setup
-        mock_map_manager.get_players_in_map.return_value = [1]
-        mock_player_repo.get_position = AsyncMock(
-            return_value={"x": 100, "y": 100, "map": 1}  # Fuera de rango (15 tiles)
-        )
+        """Test broadcast de movimiento fuera de rango visible (grilla real)."""
+        # Setup: observador a 50 tiles del movimiento
+        map_manager = MapManager()
+        observer_sender = _make_sender()
+        map_manager.add_player(1, 1, observer_sender, "lejano")
+        map_manager.update_player_tile(1, 1, 100, 100, 100, 100)
+        mock_player_repo.get_position = AsyncMock()
+        service = MultiplayerBroadcastService(map_manager, mock_player_repo, mock_account_repo)
 
         # Execute
-        notified = await broadcast_service.broadcast_character_move(
+        notified = await service.broadcast_character_move(
             map_id=1,
             char_index=10001,
             new_x=50,
@@ -417,6 +450,43 @@ class TestBroadcastCharacterMove:
 
         # Assert
         assert notified == 0  # No debe notificar jugadores fuera de rango
+        observer_sender.connection.enqueue.assert_not_called()
+        mock_player_repo.get_position.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_character_move_uses_in_memory_positions(
+        self,
+        mock_player_repo: MagicMock,
+        mock_account_repo: MagicMock,
+    ) -> None:
+        """Solo se notifica a quienes la grilla ubica dentro del rango visible."""
+        map_manager = MapManager()
+        near_sender = _make_sender()
+        far_sender = _make_sender()
+        map_manager.add_player(1, 1, near_sender, "cerca")
+        map_manager.update_player_tile(1, 1, 60, 60, 60, 60)
+        map_manager.add_player(1, 2, far_sender, "lejos")
+        map_manager.update_player_tile(2, 1, 70, 60, 70, 60)
+        # El lejano camina hasta quedar fuera de rango
+        map_manager.update_player_tile(2, 1, 70, 60, 71, 60)
+        service = MultiplayerBroadcastService(map_manager, mock_player_repo, mock_account_repo)
+
+        notified = await service.broadcast_character_move(
+            map_id=1,
+            char_index=10001,
+            new_x=55,
+            new_y=60,
+            new_heading=2,
+            old_x=54,
+            old_y=60,
+            old_heading=2,
+        )
+
+        assert notified == 1
+        near_sender.connection.enqueue.assert_called_once_with(
+            build_character_move_response(10001, 55, 60)
+        )
+        far_sender.connection.enqueue.assert_not_called()
 
 
 class TestGetCharacterAppearance:
@@ -510,8 +580,8 @@ class TestBroadcastCharacterCreate:
     ) -> None:
         """Test broadcast de CHARACTER_CREATE con jugadores."""
         # Setup
-        sender1 = MagicMock(send_character_create=AsyncMock())
-        sender2 = MagicMock(send_character_create=AsyncMock())
+        sender1 = _make_sender()
+        sender2 = _make_sender()
 
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender1, sender2]
 
@@ -529,8 +599,11 @@ class TestBroadcastCharacterCreate:
 
         # Assert
         assert notified == 2
-        assert sender1.send_character_create.call_count == 1
-        assert sender2.send_character_create.call_count == 1
+        expected = build_character_create_response(
+            char_index=10001, body=100, head=10, heading=2, x=50, y=50, name="TestNPC"
+        )
+        sender1.connection.enqueue.assert_called_once_with(expected)
+        sender2.connection.enqueue.assert_called_once_with(expected)
 
     @pytest.mark.asyncio
     async def test_broadcast_character_create_no_players(
@@ -569,8 +642,8 @@ class TestBroadcastCharacterRemove:
     ) -> None:
         """Test broadcast de CHARACTER_REMOVE con jugadores."""
         # Setup
-        sender1 = MagicMock(send_character_remove=AsyncMock())
-        sender2 = MagicMock(send_character_remove=AsyncMock())
+        sender1 = _make_sender()
+        sender2 = _make_sender()
 
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender1, sender2]
 
@@ -579,8 +652,9 @@ class TestBroadcastCharacterRemove:
 
         # Assert
         assert notified == 2
-        assert sender1.send_character_remove.call_count == 1
-        assert sender2.send_character_remove.call_count == 1
+        expected = build_character_remove_response(10001)
+        sender1.connection.enqueue.assert_called_once_with(expected)
+        sender2.connection.enqueue.assert_called_once_with(expected)
 
     @pytest.mark.asyncio
     async def test_broadcast_character_remove_no_players(
@@ -610,7 +684,7 @@ class TestBroadcastBlockPosition:
     ) -> None:
         """Test broadcast de BLOCK_POSITION bloqueado."""
         # Setup
-        sender = MagicMock(send_block_position=AsyncMock())
+        sender = _make_sender()
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
         # Execute
@@ -618,7 +692,9 @@ class TestBroadcastBlockPosition:
 
         # Assert
         assert notified == 1
-        sender.send_block_position.assert_called_once_with(10, 20, True)
+        sender.connection.enqueue.assert_called_once_with(
+            build_block_position_response(10, 20, True)
+        )
 
     @pytest.mark.asyncio
     async def test_broadcast_block_position_unblocked(
@@ -628,7 +704,7 @@ class TestBroadcastBlockPosition:
     ) -> None:
         """Test broadcast de BLOCK_POSITION desbloqueado."""
         # Setup
-        sender = MagicMock(send_block_position=AsyncMock())
+        sender = _make_sender()
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
         # Execute
@@ -636,7 +712,9 @@ class TestBroadcastBlockPosition:
 
         # Assert
         assert notified == 1
-        sender.send_block_position.assert_called_once_with(10, 20, False)
+        sender.connection.enqueue.assert_called_once_with(
+            build_block_position_response(10, 20, False)
+        )
 
 
 class TestBroadcastObjectCreate:
@@ -650,7 +728,7 @@ class TestBroadcastObjectCreate:
     ) -> None:
         """Test broadcast de OBJECT_CREATE con jugadores."""
         # Setup
-        sender = MagicMock(send_object_create=AsyncMock())
+        sender = _make_sender()
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
         # Execute
@@ -658,7 +736,9 @@ class TestBroadcastObjectCreate:
 
         # Assert
         assert notified == 1
-        sender.send_object_create.assert_called_once_with(10, 20, 1001)
+        sender.connection.enqueue.assert_called_once_with(
+            build_object_create_response(10, 20, 1001)
+        )
 
     @pytest.mark.asyncio
     async def test_broadcast_object_create_no_players(
@@ -688,14 +768,14 @@ class TestBroadcastObjectDelete:
     ) -> None:
         """Test broadcast de OBJECT_DELETE con jugadores."""
         # Setup
-        sender = MagicMock(send_object_delete=AsyncMock())
+        sender = _make_sender()
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
         # Execute
         await broadcast_service.broadcast_object_delete(1, 10, 20)
 
         # Assert
-        sender.send_object_delete.assert_called_once_with(10, 20)
+        sender.connection.enqueue.assert_called_once_with(build_object_delete_response(10, 20))
 
     @pytest.mark.asyncio
     async def test_broadcast_object_delete_no_map_manager(
@@ -721,14 +801,14 @@ class TestBroadcastCreateFx:
     ) -> None:
         """Test broadcast de CREATE_FX con jugadores."""
         # Setup
-        sender = MagicMock(send_create_fx=AsyncMock())
+        sender = _make_sender()
         mock_map_manager.get_all_message_senders_in_map.return_value = [sender]
 
         # Execute
         await broadcast_service.broadcast_create_fx(1, 10001, 5, 1)
 
         # Assert
-        sender.send_create_fx.assert_called_once_with(10001, 5, 1)
+        sender.connection.enqueue.assert_called_once_with(build_create_fx_response(10001, 5, 1))
 
     @pytest.mark.asyncio
     async def test_broadcast_create_fx_no_map_manager(
@@ -741,3 +821,26 @@ class TestBroadcastCreateFx:
 
         # Execute - No debe crashear
         await broadcast_service.broadcast_create_fx(1, 10001, 5, 1)
+
+
+class TestBroadcastPlayWave:
+    """Tests para broadcast_play_wave."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_play_wave_direct_connections(
+        self,
+        broadcast_service: MultiplayerBroadcastService,
+        mock_map_manager: MagicMock,
+    ) -> None:
+        """Conexiones sin coalescing reciben el mismo buffer vía send()."""
+        senders = [MagicMock(), MagicMock()]
+        for sender in senders:
+            sender.connection = MagicMock(coalesce_writes=False, send=AsyncMock())
+        mock_map_manager.get_all_message_senders_in_map.return_value = senders
+
+        notified = await broadcast_service.broadcast_play_wave(1, 7, 10, 20)
+
+        assert notified == 2
+        expected = build_play_wave_response(7, 10, 20)
+        for sender in senders:
+            sender.connection.send.assert_awaited_once_with(expected)
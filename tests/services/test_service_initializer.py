@@ -108,5 +108,6 @@ async def test_service_initializer_returns_dict(
         assert isinstance(services, dict)
         # Servicios/catálogos (+1 npc_world_manager, +1 party_service, +1 clan_service,
         # +1 door_service, +1 trade_service, +1 summon_service, +1 random_spawn_service,
-        # +1 player_death_service)
-        assert len(services) == 23
+        # +1 player_death_service, +1 timer_scheduler, +1 npc_poison_service,
+        # +1 morph_expiry_service)
+        assert len(services) == 26
@@ -0,0 +1,114 @@
+"""Tests para PacketDispatcher (fast path de packets frecuentes)."""
+
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.command_handlers.attack_handler import AttackCommandHandler
+from src.command_handlers.walk_handler import WalkCommandHandler
+from src.commands.attack_command import AttackCommand
+from src.commands.base import CommandResult
+from src.commands.walk_command import WalkCommand
+from src.network.packet_id import ClientPacketID
+from src.tasks.task_factory import TaskFactory
+
+if TYPE_CHECKING:
+    from src.tasks.packet_dispatcher import PacketDispatcher
+
+WALK_NORTH = bytes([ClientPacketID.WALK, 1])
+
+
+def _factory() -> TaskFactory:
+    """Factory con dependencias mock (los handlers se construyen con MagicMock)."""
+    return TaskFactory(MagicMock())
+
+
+def _dispatcher(
+    factory: TaskFactory, session_data: dict[str, int] | None = None
+) -> PacketDispatcher:
+    sender = MagicMock()
+    sender.address = "127.0.0.1:1234"
+    return factory.create_dispatcher(
+        sender, {"user_id": 7} if session_data is None else session_data
+    )
+
+
+@pytest.mark.asyncio
+async def test_walk_goes_to_handler_without_creating_task() -> None:
+    """WALK válido ejecuta el comando directamente, sin pasar por create_task."""
+    factory = _factory()
+    dispatcher = _dispatcher(factory)
+    factory.create_task = MagicMock(side_effect=AssertionError("no debe crear Task"))
+
+    with patch.object(
+        WalkCommandHandler, "handle", AsyncMock(return_value=CommandResult.ok())
+    ) as handle:
+        await dispatcher.dispatch(WALK_NORTH)
+
+    command = handle.await_args.args[0]
+    assert isinstance(command, WalkCommand)
+    assert (command.user_id, command.heading) == (7, 1)
+    metrics = factory.get_dispatch_metrics()
+    assert metrics["fast_path_hits"] == 1
+    assert metrics["latency"]["WALK"]["count"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("data", "session_data"),
+    [
+        (bytes([ClientPacketID.WALK, 9]), {"user_id": 7}),  # dirección inválida
+        (bytes([ClientPacketID.CHANGE_HEADING]), {"user_id": 7}),  # packet truncado
+        (WALK_NORTH, {}),  # sin loguear
+        (bytes([ClientPacketID.LOGIN]), {}),  # sin fast path
+    ],
+)
+async def test_other_packets_fall_back_to_task(data: bytes, session_data: dict[str, int]) -> None:
+    """Los packets sin fast path o que no pasan el chequeo inline crean su Task."""
+    factory = _factory()
+    dispatcher = _dispatcher(factory, session_data)
+    task = MagicMock(execute=AsyncMock())
+    factory.create_task = MagicMock(return_value=task)
+
+    await dispatcher.dispatch(data)
+
+    factory.create_task.assert_called_once_with(
+        data, dispatcher.message_sender, dispatcher.session_data
+    )
+    task.execute.assert_awaited_once()
+    assert factory.get_dispatch_metrics()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_attack_targets_tile_in_front_of_player() -> None:
+    """ATTACK calcula el objetivo con la posición y dirección del jugador."""
+    factory = _factory()
+    dispatcher = _dispatcher(factory)
+    handler = dispatcher.handlers.get("attack", dispatcher.message_sender)
+    handler.player_repo.get_position = AsyncMock(
+        return_value={"x": 50, "y": 50, "map": 1, "heading": 2}
+    )
+
+    with patch.object(
+        AttackCommandHandler, "handle", AsyncMock(return_value=CommandResult.ok())
+    ) as handle:
+        await dispatcher.dispatch(bytes([ClientPacketID.ATTACK]))
+
+    command = handle.await_args.args[0]
+    assert isinstance(command, AttackCommand)
+    assert (command.user_id, command.target_x, command.target_y, command.map_id) == (7, 51, 50, 1)
+
+
+def test_handlers_are_bound_per_connection() -> None:
+    """Cada conexión tiene sus handlers: no se pisa el message_sender de otra."""
+    factory = _factory()
+    first = _dispatcher(factory)
+    second = _dispatcher(factory)
+
+    first_walk = first.handlers.get("walk", first.message_sender, first.session_data)
+    second_walk = second.handlers.get("walk", second.message_sender, second.session_data)
+
+    assert first_walk is not second_walk
+    assert first_walk.message_sender is first.message_sender
+    assert second_walk.message_sender is second.message_sender
@@ -419,3 +419,89 @@ class TestPartyRepository:
         pipeline.set.assert_called_once_with("party:1", expected_data)
         pipeline.hset.assert_called_once()
         pipeline.execute.assert_called_once()
+
+
+class TestPartyIdentityMap:
+    """Test the in-memory identity map of parties and memberships."""
+
+    @pytest.mark.asyncio
+    async def test_saved_party_is_served_from_memory(self, party_repository, mock_redis):
+        """After saving, online members' lookups do not touch Redis."""
+        mock_redis.get.return_value = None
+        assert await party_repository.get_user_party(1) is None
+        assert await party_repository.get_user_party(2) is None
+        party = Party(party_id=1, leader_id=1, leader_username="Leader")
+        party.add_member(2, "Member", 10)
+        await party_repository.save_party(party)
+        mock_redis.get.reset_mock()
+
+        assert await party_repository.get_user_party(2) is party
+        assert await party_repository.get_party(1) is party
+        mock_redis.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_user_without_party_is_cached(self, party_repository, mock_redis):
+        """A user without party is looked up in Redis only once."""
+        mock_redis.get.return_value = None
+
+        assert await party_repository.get_user_party(5) is None
+        assert await party_repository.get_user_party(5) is None
+        mock_redis.get.assert_called_once_with("user:5:party")
+
+    @pytest.mark.asyncio
+    async def test_membership_changes_update_the_map(self, party_repository, mock_redis):
+        """Leaving, disbanding and forgetting users update the cached memberships."""
+        mock_redis.get.return_value = None
+        await party_repository.get_user_party(1)
+        await party_repository.get_user_party(2)
+        party = Party(party_id=1, leader_id=1, leader_username="Leader")
+        party.add_member(2, "Member", 10)
+        await party_repository.save_party(party)
+
+        await party_repository.remove_member_from_party(1, 2)
+        assert await party_repository.get_user_party(2) is None
+        assert 2 not in party.members
+
+        mock_redis.hgetall.return_value = {}
+        await party_repository.delete_party(1)
+        assert await party_repository.get_user_party(1) is None
+
+        party_repository.forget_user(1)
+        mock_redis.get.return_value = None
+        assert await party_repository.get_user_party(1) is None
+        mock_redis.get.assert_called_with("user:1:party")
+
+    @pytest.mark.asyncio
+    async def test_party_is_evicted_after_last_online_member_logs_out(
+        self, party_repository, mock_redis
+    ):
+        """Offline members are not indexed: the party goes when its last online member does."""
+        mock_redis.get.return_value = None
+        await party_repository.get_user_party(1)
+        await party_repository.get_user_party(2)
+        party = Party(party_id=1, leader_id=1, leader_username="Leader")
+        party.add_member(2, "Member", 10)
+        party.add_member(3, "Offline", 10)
+        await party_repository.save_party(party)
+        assert 3 not in party_repository._user_parties
+
+        party_repository.forget_user(1)
+        assert await party_repository.get_party(1) is party
+        party_repository.forget_user(2)
+
+        assert party_repository._parties == {}
+        assert party_repository._user_parties == {}
+        assert party_repository._online_members == {}
+
+    @pytest.mark.asyncio
+    async def test_update_members_uses_one_pipeline(self, party_repository, mock_redis):
+        """Metadata and members are written in a single pipeline."""
+        party = Party(party_id=1, leader_id=1, leader_username="Leader")
+        party.add_member(2, "Member", 10)
+
+        await party_repository.update_members(party, list(party.members.values()))
+
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.set.assert_called_once()
+        assert pipeline.hset.call_count == 3
+        pipeline.execute.assert_called_once()
@@ -24,6 +24,7 @@ def mock_party_repo():
     repo.get_party = AsyncMock(return_value=None)
     repo.update_party_metadata = AsyncMock()
     repo.update_member = AsyncMock()
+    repo.update_members = AsyncMock()
     return repo
 
 
@@ -84,7 +85,7 @@ def mock_account_repo():
     """Create a mock account repository."""
     # Use MagicMock as base, then configure async methods
     repo = MagicMock()
-    repo.get_account_by_user_id = AsyncMock(return_value={"username": "TestUser"})
+    repo.get_account_appearance = AsyncMock(return_value={"username": "TestUser"})
     return repo
 
 
@@ -437,7 +438,7 @@ class TestPartyManagement:
             mock_sender_3,
         ]
 
-        mock_account_repo.get_account_by_user_id = AsyncMock(return_value={"username": "TestUser"})
+        mock_account_repo.get_account_appearance = AsyncMock(return_value={"username": "TestUser"})
 
         result = await party_service.send_party_message(1, "Hello party!")
 
@@ -475,4 +476,6 @@ class TestExperienceDistribution:
         distributed = await party_service.distribute_experience(1, 100, 1, 10, 10)
 
         assert distributed == {2: 50.0, 3: 50.0}
-        mock_party_repo.update_party_metadata.assert_called_once()
+        mock_party_repo.update_members.assert_called_once()
+        _, members = mock_party_repo.update_members.call_args.args
+        assert [member.user_id for member in members] == [2, 3]
@@ -1,6 +1,5 @@
 """Tests para MapManager."""
 
-import asyncio
 import json
 import tempfile
 from pathlib import Path
@@ -785,7 +784,7 @@ def test_remove_ground_item_clears_when_empty(map_manager: MapManager) -> None:
 async def test_remove_ground_item_persists_when_repo_exists(map_manager: MapManager) -> None:
     """Test remove_ground_item persiste cuando hay repositorio."""
     mock_repo = MagicMock()
-    mock_repo.save_ground_items = AsyncMock()
+    mock_repo.save_tiles = AsyncMock()
     map_manager.ground_items_repo = mock_repo
 
     item = {"item_id": 1, "quantity": 1, "grh_index": 100}
@@ -795,10 +794,9 @@ async def test_remove_ground_item_persists_when_repo_exists(map_manager: MapMana
     removed = map_manager.remove_ground_item(1, 10, 20)
 
     assert removed == item
-    # Dar tiempo para que la tarea asíncrona se ejecute
-    await asyncio.sleep(0.1)
-    # Verificar que se intentó persistir
-    assert mock_repo.save_ground_items.called
+    # El tile vacío se persiste (HDEL) en el próximo flush
+    await map_manager.flush_ground_items()
+    mock_repo.save_tiles.assert_called_once_with(1, {(10, 20): []})
 
 
 # Tests para carga de datos de mapas
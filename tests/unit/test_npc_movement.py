@@ -221,7 +221,7 @@ class TestNPCMovementEffect:
 
     @pytest.mark.asyncio
     async def test_movement_effect_executes_once_per_tick(self) -> None:
-        """Test que el efecto se ejecuta solo una vez por tick."""
+        """Test que el efecto se ejecuta solo una vez por tick (lote de jugadores)."""
         # Setup
         npc_service = MagicMock()
         npc_service.map_manager.get_all_npcs.return_value = []
@@ -231,9 +231,8 @@ class TestNPCMovementEffect:
 
         effect = NPCMovementEffect(npc_service, interval_seconds=5.0)
 
-        # Execute - llamar dos veces seguidas
-        await effect.apply(1, player_repo, message_sender)
-        await effect.apply(2, player_repo, message_sender)
+        # Execute - un tick con dos jugadores conectados
+        await effect.apply_batch([1, 2], player_repo, {1: message_sender, 2: message_sender})
 
         # Assert - get_all_npcs solo debe llamarse una vez
         assert npc_service.map_manager.get_all_npcs.call_count == 1
@@ -54,6 +54,7 @@ def mock_deps() -> DependencyContainer:
         door_service=Mock(),
         session_manager=Mock(),
         summon_service=Mock(),
+        timer_scheduler=Mock(),
     )
 
 
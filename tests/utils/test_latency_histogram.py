@@ -0,0 +1,49 @@
+"""Tests para LatencyHistogram."""
+
+import pytest
+
+from src.utils.latency_histogram import LatencyHistogram
+
+
+def test_empty_histogram_reports_zero() -> None:
+    """Sin muestras todos los percentiles son 0."""
+    histogram = LatencyHistogram()
+
+    assert histogram.count == 0
+    assert histogram.percentile(99) == pytest.approx(0.0)
+    assert histogram.summary()["avg_time_ms"] == pytest.approx(0.0)
+
+
+def test_percentiles_within_relative_error() -> None:
+    """Los percentiles de 1..1000 ms quedan dentro del error relativo del bucket."""
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(float(value))
+
+    assert histogram.count == 1000
+    assert histogram.percentile(50) == pytest.approx(500.0, rel=2 / 64)
+    assert histogram.percentile(95) == pytest.approx(950.0, rel=2 / 64)
+    assert histogram.percentile(99) == pytest.approx(990.0, rel=2 / 64)
+    assert histogram.max_ms == pytest.approx(1000.0)
+    assert histogram.mean_ms == pytest.approx(500.5)
+
+
+def test_tail_latency_is_visible() -> None:
+    """Una cola lenta aparece en p99 aunque el promedio sea bajo."""
+    histogram = LatencyHistogram()
+    for _ in range(98):
+        histogram.record(1.0)
+    histogram.record(250.0)
+    histogram.record(250.0)
+
+    summary = histogram.summary()
+
+    assert summary["p50_ms"] == pytest.approx(1.0, rel=2 / 64)
+    assert summary["p99_ms"] == pytest.approx(250.0, rel=2 / 64)
+    assert summary["avg_time_ms"] < 10.0
+
+
+def test_invalid_sub_buckets() -> None:
+    """sub_buckets debe ser potencia de dos."""
+    with pytest.raises(ValueError, match="potencia de dos"):
+        LatencyHistogram(sub_buckets=48)
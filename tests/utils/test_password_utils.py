@@ -1,6 +1,20 @@
 """Tests para password_utils."""
 
-from src.utils.password_utils import hash_password, verify_password
+import asyncio
+import threading
+
+import pytest
+from argon2 import PasswordHasher
+
+from src.utils.password_utils import (
+    PasswordHashPool,
+    PasswordPoolBusyError,
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
 
 
 def test_hash_password_generates_argon2_hash() -> None:
@@ -100,3 +114,44 @@ def test_hash_password_special_characters() -> None:
 
     assert hashed.startswith("$argon2id$")
     assert verify_password(password, hashed) is True
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip() -> None:
+    """Las variantes async hashean y verifican en el pool."""
+    hashed = await hash_password_async("secreto")
+
+    assert await verify_password_async("secreto", hashed) is True
+    assert await verify_password_async("otro", hashed) is False
+
+
+def test_needs_rehash_detects_old_parameters() -> None:
+    """Un hash con parámetros distintos a los actuales debe regenerarse."""
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8_192, parallelism=1).hash("secreto")
+
+    assert needs_rehash(old_hash) is True
+    assert needs_rehash(hash_password("secreto")) is False
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_when_saturated() -> None:
+    """Con los hilos ocupados y la cola llena, las nuevas operaciones se rechazan."""
+    pool = PasswordHashPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    def blocking(_value: str) -> str:
+        release.wait(timeout=5)
+        return "ok"
+
+    running = asyncio.ensure_future(pool.run(blocking, "a"))
+    queued = asyncio.ensure_future(pool.run(blocking, "b"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordPoolBusyError):
+        await pool.run(blocking, "c")
+
+    release.set()
+    assert await asyncio.gather(running, queued) == ["ok", "ok"]
+    assert pool.rejected == 1
+    assert pool.in_flight == 0
+    pool.shutdown()
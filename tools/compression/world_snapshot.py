@@ -0,0 +1,119 @@
+"""Herramienta para generar el snapshot binario del mundo (``mmap``).
+
+Vuelca ``map_data`` (metadata, blocked, objects y transiciones) a un único
+archivo con bitplanes por mapa que el servidor abre en el arranque sin
+parsear JSON. Ver ``src/services/map/world_snapshot.py`` para el formato.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from src.services.map.world_snapshot import (
+    WORLD_SNAPSHOT_PATH,
+    collect_world,
+    load_world_snapshot,
+    source_fingerprint,
+    write_world_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAP_DATA = Path("map_data")
+
+
+def build_world_snapshot(
+    map_data_dir: Path = DEFAULT_MAP_DATA, output: Path = WORLD_SNAPSHOT_PATH
+) -> bool:
+    """Genera el snapshot del mundo a partir de ``map_data``.
+
+    Returns:
+        True si el snapshot se escribió.
+    """
+    if not map_data_dir.exists():
+        logger.error("map_data/ no existe: %s", map_data_dir)
+        return False
+
+    start_time = time.perf_counter()
+    # La huella se toma antes de leer: si un archivo cambia durante el build,
+    # el snapshot queda marcado como desactualizado
+    fingerprint = source_fingerprint(map_data_dir)
+    maps = collect_world(map_data_dir)
+    if not maps:
+        logger.error("No se encontraron mapas en %s", map_data_dir)
+        return False
+
+    size = write_world_snapshot(output, maps, fingerprint)
+    logger.info(
+        "Snapshot generado: %s (%d mapas, %.2f MB) en %.2fs",
+        output,
+        len(maps),
+        size / 1024 / 1024,
+        time.perf_counter() - start_time,
+    )
+    return True
+
+
+def cmd_build(args: argparse.Namespace) -> int:
+    """Comando: genera el snapshot.
+
+    Returns:
+        Código de salida.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    return 0 if build_world_snapshot(Path(args.map_data), Path(args.output)) else 1
+
+
+def cmd_status(args: argparse.Namespace) -> int:
+    """Comando: verifica que el snapshot exista y esté al día.
+
+    Returns:
+        Código de salida (1 si falta, es inválido o está desactualizado).
+    """
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    output = Path(args.output)
+    if not output.exists():
+        print(f"{output}: NO EXISTE")
+        print("Ejecuta: uv run python -m tools.compression.world_snapshot build")
+        return 1
+
+    snapshot = load_world_snapshot(Path(args.map_data), output)
+    if snapshot is None:
+        print(f"{output}: DESACTUALIZADO o inválido")
+        print("Ejecuta: uv run python -m tools.compression.world_snapshot build")
+        return 1
+
+    print(f"{output}: actualizado ({len(snapshot)} mapas)")
+    return 0
+
+
+def main() -> None:
+    """Punto de entrada CLI."""
+    parser = argparse.ArgumentParser(
+        description="Genera el snapshot binario del mundo desde map_data",
+    )
+    parser.add_argument("--map-data", default=str(DEFAULT_MAP_DATA))
+    parser.add_argument("--output", default=str(WORLD_SNAPSHOT_PATH))
+
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("build", help="Genera el snapshot")
+    subparsers.add_parser("status", help="Verifica si está actualizado")
+
+    args = parser.parse_args()
+
+    if args.command is None:
+        parser.print_help()
+        sys.exit(1)
+
+    if args.command == "build":
+        sys.exit(cmd_build(args))
+    elif args.command == "status":
+        sys.exit(cmd_status(args))
+
+
+if __name__ == "__main__":
+    main()
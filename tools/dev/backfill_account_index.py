@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Script para reconstruir el índice user_id -> username de las cuentas.
+
+El servidor ya lo reconstruye al iniciar; este script permite repararlo sin
+reiniciar. Es idempotente y puede correrse con el servidor levantado.
+"""
+
+import asyncio
+
+from src.repositories.account_repository import AccountRepository
+from src.utils.redis_client import RedisClient
+
+
+async def backfill_account_index() -> None:
+    """Indexa todas las cuentas existentes por user_id."""
+    redis_client = RedisClient()
+    await redis_client.connect()
+
+    try:
+        account_repo = AccountRepository(redis_client)
+
+        print("Reconstruyendo índice user_id -> username...")
+        indexed = await account_repo.backfill_user_id_index()
+        print(f"✅ {indexed} cuentas indexadas")
+
+    finally:
+        await redis_client.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_account_index())
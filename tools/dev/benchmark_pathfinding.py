@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark del pathfinding de NPCs.
+
+Compara el A* anterior (tuplas + ``MapManager.can_move_to`` por vecino) con el
+A* sobre la grilla plana, sin y con cache de rutas por NPC. Simula NPCs que
+persiguen objetivos en un mapa de 100x100 con obstáculos aleatorios y avanzan
+un tile por llamada, como en la IA.
+
+Uso:
+    uv run python tools/dev/benchmark_pathfinding.py [npcs] [pasos] [max_depth]
+"""
+
+import heapq
+import random
+import sys
+import time
+from collections.abc import Callable
+
+from src.game.map_manager import MapManager
+from src.services.map.pathfinding_service import PathfindingService
+
+MAP_ID = 1
+MAP_SIZE = 100
+BLOCKED_RATIO = 0.15
+SEED = 1234
+
+
+def legacy_next_step(
+    map_manager: MapManager, start: tuple[int, int], target: tuple[int, int], max_depth: int
+) -> tuple[int, int] | None:
+    """A* previo: dicts con claves tupla y can_move_to por vecino.
+
+    Returns:
+        Siguiente tile (x, y) o None si no hay camino.
+    """
+    counter = 0
+    open_set: list[tuple[int, int, tuple[int, int]]] = [(0, counter, start)]
+    came_from: dict[tuple[int, int], tuple[int, int]] = {}
+    g_score = {start: 0}
+    closed: set[tuple[int, int]] = set()
+    while open_set:
+        _, _, current = heapq.heappop(open_set)
+        if current == target:
+            while came_from.get(current) != start:
+                current = came_from[current]
+            return current
+        closed.add(current)
+        if len(closed) > max_depth:
+            return None
+        for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+            neighbor = (current[0] + dx, current[1] + dy)
+            if neighbor in closed or not map_manager.can_move_to(MAP_ID, *neighbor):
+                continue
+            tentative = g_score[current] + 1
+            if tentative < g_score.get(neighbor, tentative + 1):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative
+                counter += 1
+                h = abs(neighbor[0] - target[0]) + abs(neighbor[1] - target[1])
+                heapq.heappush(open_set, (tentative + h, counter, neighbor))
+    return None
+
+
+def build_map() -> MapManager:
+    """Arma un mapa con obstáculos aleatorios.
+
+    Returns:
+        MapManager con el mapa de prueba cargado.
+    """
+    rng = random.Random(SEED)
+    map_manager = MapManager()
+    map_manager._map_sizes[MAP_ID] = (MAP_SIZE, MAP_SIZE)  # noqa: SLF001
+    map_manager._blocked_tiles[MAP_ID] = {  # noqa: SLF001
+        (x, y)
+        for x in range(1, MAP_SIZE + 1)
+        for y in range(1, MAP_SIZE + 1)
+        if rng.random() < BLOCKED_RATIO
+    }
+    return map_manager
+
+
+def scenarios(map_manager: MapManager, npcs: int) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """Pares (inicio, objetivo) transitables a distancia de persecución.
+
+    Returns:
+        Lista de pares de tiles.
+    """
+    rng = random.Random(SEED + 1)
+    pairs: list[tuple[tuple[int, int], tuple[int, int]]] = []
+    while len(pairs) < npcs:
+        start = (rng.randint(10, MAP_SIZE - 10), rng.randint(10, MAP_SIZE - 10))
+        target = (start[0] + rng.randint(-8, 8), start[1] + rng.randint(-8, 8))
+        if start != target and all(
+            map_manager.can_move_to(MAP_ID, *tile) for tile in (start, target)
+        ):
+            pairs.append((start, target))
+    return pairs
+
+
+def run(
+    name: str,
+    pairs: list[tuple[tuple[int, int], tuple[int, int]]],
+    steps: int,
+    next_step: Callable[[int, tuple[int, int], tuple[int, int]], tuple[int, int] | None],
+) -> None:
+    """Ejecuta ``steps`` pasos de persecución por NPC e imprime el throughput."""
+    positions = [start for start, _ in pairs]
+    calls = 0
+    begin = time.perf_counter()
+    for _ in range(steps):
+        for npc, (_, target) in enumerate(pairs):
+            if positions[npc] == target:
+                continue
+            calls += 1
+            step = next_step(npc, positions[npc], target)
+            if step is not None:
+                positions[npc] = step
+    elapsed = time.perf_counter() - begin
+    print(f"{name:<28} {calls:>7} llamadas  {elapsed * 1000:>9.1f} ms  {calls / elapsed:>10.0f} /s")
+
+
+def main() -> None:
+    """Corre los tres escenarios."""
+    npcs = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 10  # noqa: PLR2004
+    max_depth = int(sys.argv[3]) if len(sys.argv) > 3 else 200  # noqa: PLR2004
+
+    map_manager = build_map()
+    pairs = scenarios(map_manager, npcs)
+    service = PathfindingService(map_manager)
+    print(f"{npcs} NPCs x {steps} pasos, mapa {MAP_SIZE}x{MAP_SIZE}, max_depth={max_depth}")
+
+    run(
+        "A* anterior (tuplas)",
+        pairs,
+        steps,
+        lambda _npc, start, target: legacy_next_step(map_manager, start, target, max_depth),
+    )
+
+    def flat(
+        npc: int, start: tuple[int, int], target: tuple[int, int], *, cache: bool
+    ) -> tuple[int, int] | None:
+        result = service.get_next_step(
+            MAP_ID, *start, *target, max_depth=max_depth, agent_id=f"npc-{npc}" if cache else None
+        )
+        return result[:2] if result else None
+
+    run("A* grilla plana", pairs, steps, lambda n, s, t: flat(n, s, t, cache=False))
+    run("A* grilla plana + cache", pairs, steps, lambda n, s, t: flat(n, s, t, cache=True))
+    print(f"cache: {service.cache_hits} hits, {service.cache_misses} misses")
+
+
+if __name__ == "__main__":
+    main()